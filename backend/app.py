@@ -9,14 +9,22 @@ from flask_talisman import Talisman
 from config import config
 from utils.cache import cache
 from utils.cache_factory import get_cache_config
+from utils.cache_snapshot import init_cache_snapshots
+from utils.compression import init_compression
 from utils.error_handlers import register_error_handlers
 from utils.request_context import init_request_context
+from utils.metrics import init_metrics
+from utils.server_timing import init_server_timing
+from utils.upstream_pacing import init_upstream_pacing
+from services.news_poller import init_news_poller
 from utils.logger import configure_logging, get_logger
 from utils.config_validator import validate_config
 from routes.stock_routes import stock_bp
 from routes.health_routes import health_bp
 from routes.legacy_routes import legacy_bp
-from routes.news_routes import news_bp
+from routes.news_routes import news_bp, get_news_service, init_news_service
+from routes.admin_routes import admin_bp
+from routes.metrics_routes import metrics_bp
 
 # Initial basic logging (will be reconfigured in create_app)
 logging.basicConfig(
@@ -56,6 +64,12 @@ def create_app(config_name='default'):
     # Initialize request context middleware (adds request_id)
     init_request_context(app)
 
+    # Record route latency and in-flight requests (see /metrics)
+    init_metrics(app)
+
+    # Per-stage Server-Timing header and timing log line
+    init_server_timing(app)
+
     # Add request timing
     @app.before_request
     def start_timer():
@@ -76,6 +90,18 @@ def create_app(config_name='default'):
     cache_config = get_cache_config(app)
     cache.init_app(app, config=cache_config)
 
+    # Warm the in-memory cache from the last snapshot before serving traffic
+    init_cache_snapshots(app)
+
+    # Pace Google News fetches (shared across workers with UPSTREAM_PACING_REDIS)
+    init_upstream_pacing(app)
+
+    # US news ingestion mode (per-symbol calls or the market news index)
+    init_news_service(app)
+
+    # Refresh news of recently requested symbols ahead of cache expiry
+    init_news_poller(app, get_news_service)
+
     # Initialize rate limiter
     limiter = Limiter(
         app=app,
@@ -90,6 +116,9 @@ def create_app(config_name='default'):
     limiter.limit("1000 per hour")(stock_bp)
     limiter.limit("100 per minute")(stock_bp)
 
+    # Admin endpoints: low limit to slow token guessing
+    limiter.limit("30 per minute")(admin_bp)
+
     # Security headers
     if not app.config['DEBUG']:
         # Production: Use Talisman for comprehensive security headers
@@ -141,13 +170,18 @@ def create_app(config_name='default'):
     # API v1 routes (primary)
     app.register_blueprint(stock_bp)      # /api/v1/stock-data, /api/v1/batch-stocks
     app.register_blueprint(health_bp)     # /api/v1/health, /api/v1/health/detailed
-    app.register_blueprint(news_bp)       # /api/v1/news/<symbol>
+    app.register_blueprint(news_bp)       # /api/v1/news/<symbol>, /api/v1/news/batch
+    app.register_blueprint(admin_bp)      # /api/v1/admin/* (token required)
+    app.register_blueprint(metrics_bp)    # /metrics (Prometheus)
     # Legacy routes for backward compatibility (deprecated)
     app.register_blueprint(legacy_bp)     # /api/stock-data, /api/batch-stocks, /api/health
 
     # Register error handlers
     register_error_handlers(app)
 
+    # Compress JSON responses negotiated via Accept-Encoding
+    init_compression(app)
+
     # Root route
     @app.route('/')
     def index():
@@ -160,8 +194,11 @@ def create_app(config_name='default'):
                     'stock_data': '/api/v1/stock-data',
                     'batch_stocks': '/api/v1/batch-stocks',
                     'news': '/api/v1/news/<symbol>',
+                    'news_batch': '/api/v1/news/batch',
                     'health': '/api/v1/health',
                     'health_detailed': '/api/v1/health/detailed',
+                    'health_cache': '/api/v1/health/cache',
+                    'metrics': '/metrics',
                     'health_ready': '/api/v1/health/ready',
                     'health_live': '/api/v1/health/live',
                 },
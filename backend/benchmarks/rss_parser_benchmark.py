@@ -0,0 +1,80 @@
+"""
+RSS parser benchmark.
+
+Compares the streaming RSS parser with feedparser on synthetic Google
+News-style feeds, both with every item inside the news window and with the
+window covering only the newest tenth of the feed (early stop).
+
+Usage (from backend/):
+    python -m benchmarks.rss_parser_benchmark [--items 100 1000 5000] [--repeat 5]
+
+Single responsibility: Measure RSS parse time per implementation.
+"""
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import List
+
+import feedparser
+
+from constants import NEWS_TIME_WINDOW_HOURS
+from utils.rss_parser import parse_rss_items
+
+
+def build_feed(items: int, stale_after: int) -> bytes:
+    """
+    Build a synthetic RSS feed, newest item first.
+
+    Args:
+        items: Number of <item> elements
+        stale_after: Items at this index and beyond fall outside the news window
+
+    Returns:
+        Feed bytes
+    """
+    now = datetime.now(timezone.utc)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+             '<title>"2330" - Google News</title><link>https://news.google.com</link>']
+    for i in range(items):
+        age = timedelta(minutes=i) if i < stale_after else timedelta(hours=NEWS_TIME_WINDOW_HOURS + i)
+        parts.append(
+            f'<item><title>台積電 headline {i} - 鉅亨網</title>'
+            f'<link>https://news.google.com/rss/articles/CBMi{i:08d}?oc=5</link>'
+            f'<guid isPermaLink="false">CBMi{i:08d}</guid>'
+            f'<pubDate>{format_datetime(now - age, usegmt=True)}</pubDate>'
+            f'<description>&lt;a href="https://news.google.com/rss/articles/CBMi{i:08d}"&gt;'
+            f'台積電 headline {i}&lt;/a&gt;&amp;nbsp;&amp;nbsp;&lt;font color="#6f6f6f"&gt;'
+            f'鉅亨網&lt;/font&gt;</description>'
+            f'<source url="https://news.cnyes.com">鉅亨網</source></item>'
+        )
+    parts.append('</channel></rss>')
+    return ''.join(parts).encode('utf-8')
+
+
+def _best_ms(fn, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    """Print parse times for each feed size and scenario."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=NEWS_TIME_WINDOW_HOURS)
+    print(f"{'items':>6} {'scenario':<12} {'feedparser ms':>14} {'streaming ms':>13} {'speedup':>8}")
+    for size in sizes:
+        for scenario, stale_after in (('all fresh', size), ('10% fresh', max(1, size // 10))):
+            content = build_feed(size, stale_after)
+            slow = _best_ms(lambda: feedparser.parse(content), repeat)
+            fast = _best_ms(lambda: parse_rss_items(content, cutoff=cutoff), repeat)
+            print(f"{size:>6} {scenario:<12} {slow:>14.2f} {fast:>13.2f} {slow / fast:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--items', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.items, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
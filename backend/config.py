@@ -24,12 +24,42 @@ class Config:
         CACHE_TYPE: Type of cache backend to use
         CACHE_DEFAULT_TIMEOUT: Default cache timeout in seconds
         CACHE_NEWS_TIMEOUT: News-specific cache timeout in seconds
+        CACHE_MAX_BYTES: Byte budget of the in-memory cache backend
+        CACHE_MAX_ENTRIES: Safety cap on in-memory cache entries (far above the byte budget)
+        CACHE_L1_ENABLED: Enable the in-process tier in front of Redis
+        CACHE_L1_MAX_BYTES: Byte budget of the in-process tier
+        CACHE_L1_TTL: Lifetime in seconds of in-process entries
+        CACHE_L1_PUBSUB: Broadcast invalidations to other workers via Redis pub/sub
+        CACHE_COMPRESSION: Codec for Redis values ('zlib', 'lzma' or 'none')
+        CACHE_COMPRESSION_MIN_SIZE: Minimum value size in bytes before compressing
+        CACHE_FAILOVER_ENABLED: Fail over to process memory while Redis is down
+        CACHE_FAILOVER_THRESHOLD: Consecutive Redis errors before failing over
+        CACHE_FAILOVER_PROBE_INTERVAL: Seconds between Redis probes while failed over
+        CACHE_SNAPSHOT_PATH: File for warm in-memory cache snapshots (unset disables them)
+        CACHE_SNAPSHOT_INTERVAL: Seconds between snapshots (0 = at shutdown only)
+        CACHE_SNAPSHOT_MIN_TTL: Minimum remaining lifetime in seconds of persisted entries
+        CACHE_SNAPSHOT_MAX_BYTES: Maximum total size of values in a snapshot
+        COMPRESSION_ENABLED: Enable gzip/brotli response compression
+        COMPRESSION_MIN_SIZE: Minimum response size in bytes to compress
         RATELIMIT_STORAGE_URL: Storage backend for rate limiting
         RATELIMIT_DEFAULT: Default rate limit per endpoint
         RATELIMIT_HEADERS_ENABLED: Enable rate limit headers in responses
         MAX_BATCH_STOCKS: Maximum number of stocks in batch request
         DEFAULT_STOCK_PERIOD: Default period for stock data
         LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        METRICS_ENABLED: Record request/upstream metrics and serve /metrics
+        SERVER_TIMING_ENABLED: Emit per-stage Server-Timing headers and timing logs
+        METRICS_MULTIPROC_DIR: Directory shared by workers for aggregated metrics
+        METRICS_FLUSH_INTERVAL: Seconds between per-worker metric flushes
+        ADMIN_API_TOKEN: Bearer token for /api/v1/admin endpoints (unset disables them)
+        PROFILER_ENABLED: Allow on-demand sampling profiles via the admin API
+        GOOGLE_NEWS_RATE_LIMIT: Sustained Google News RSS fetches per second
+        GOOGLE_NEWS_BURST: Google News fetches allowed back to back when idle
+        UPSTREAM_PACING_REDIS: Share upstream pacing across workers via REDIS_URL
+        NEWS_POLLER_ENABLED: Refresh news of recently requested symbols in the background
+        NEWS_POLLER_INTERVAL: Seconds between news poller cycles
+        NEWS_POLLER_LEAD: Seconds before cache expiry at which news is refreshed
+        NEWS_INGESTION_MODE: US news ingestion, 'symbol' (per-symbol calls) or 'market' (local index)
     """
     # Flask settings
     DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
@@ -42,11 +72,38 @@ class Config:
     CACHE_TYPE = os.getenv('CACHE_TYPE', 'SimpleCache')
     CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', '300'))  # 5 minutes
     CACHE_NEWS_TIMEOUT = int(os.getenv('CACHE_NEWS_TIMEOUT', '900'))  # 15 minutes
+    CACHE_MAX_BYTES = int(os.getenv('CACHE_MAX_BYTES', str(64 * 1024 * 1024)))  # in-memory backend
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '100000'))  # safety cap, bytes evict first
 
     # Redis settings (used when CACHE_TYPE='redis')
     CACHE_REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
     CACHE_KEY_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'marketvue:')
 
+    # In-process L1 tier in front of Redis (used when CACHE_TYPE='redis')
+    CACHE_L1_ENABLED = os.getenv('CACHE_L1_ENABLED', 'True').lower() == 'true'
+    CACHE_L1_MAX_BYTES = int(os.getenv('CACHE_L1_MAX_BYTES', str(32 * 1024 * 1024)))
+    CACHE_L1_TTL = int(os.getenv('CACHE_L1_TTL', '10'))  # seconds
+    CACHE_L1_PUBSUB = os.getenv('CACHE_L1_PUBSUB', 'True').lower() == 'true'
+
+    # Compression of values stored in Redis (used when CACHE_TYPE='redis')
+    CACHE_COMPRESSION = os.getenv('CACHE_COMPRESSION', 'zlib').lower()
+    CACHE_COMPRESSION_MIN_SIZE = int(os.getenv('CACHE_COMPRESSION_MIN_SIZE', '1024'))  # bytes
+
+    # Runtime failover from Redis to process memory (used when CACHE_TYPE='redis')
+    CACHE_FAILOVER_ENABLED = os.getenv('CACHE_FAILOVER_ENABLED', 'True').lower() == 'true'
+    CACHE_FAILOVER_THRESHOLD = int(os.getenv('CACHE_FAILOVER_THRESHOLD', '3'))
+    CACHE_FAILOVER_PROBE_INTERVAL = int(os.getenv('CACHE_FAILOVER_PROBE_INTERVAL', '5'))  # seconds
+
+    # Warm snapshots of the in-memory cache (used when CACHE_TYPE='SimpleCache')
+    CACHE_SNAPSHOT_PATH = os.getenv('CACHE_SNAPSHOT_PATH', '')
+    CACHE_SNAPSHOT_INTERVAL = int(os.getenv('CACHE_SNAPSHOT_INTERVAL', '300'))  # seconds
+    CACHE_SNAPSHOT_MIN_TTL = int(os.getenv('CACHE_SNAPSHOT_MIN_TTL', '30'))  # seconds
+    CACHE_SNAPSHOT_MAX_BYTES = int(os.getenv('CACHE_SNAPSHOT_MAX_BYTES', str(16 * 1024 * 1024)))
+
+    # Response compression settings
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'True').lower() == 'true'
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))  # bytes
+
     # Rate limiting settings
     RATELIMIT_STORAGE_URL = os.getenv('RATELIMIT_STORAGE_URL', 'memory://')
     RATELIMIT_DEFAULT = os.getenv('RATELIMIT_DEFAULT', '1000 per hour')  # Increased for development
@@ -59,6 +116,33 @@ class Config:
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+    # Metrics (/metrics); set METRICS_MULTIPROC_DIR to aggregate gunicorn workers
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+    METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR', '')
+    METRICS_FLUSH_INTERVAL = int(os.getenv('METRICS_FLUSH_INTERVAL', '5'))  # seconds
+
+    # Per-stage request timing (Server-Timing header)
+    SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'True').lower() == 'true'
+
+    # Admin API (disabled unless a token is set)
+    ADMIN_API_TOKEN = os.getenv('ADMIN_API_TOKEN', '')
+
+    # On-demand sampling profiler (admin API; off by default)
+    PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', 'False').lower() == 'true'
+
+    # Upstream pacing (Google News RSS); per worker unless shared via Redis
+    GOOGLE_NEWS_RATE_LIMIT = float(os.getenv('GOOGLE_NEWS_RATE_LIMIT', '5'))  # fetches/second
+    GOOGLE_NEWS_BURST = int(os.getenv('GOOGLE_NEWS_BURST', '2'))
+    UPSTREAM_PACING_REDIS = os.getenv('UPSTREAM_PACING_REDIS', 'False').lower() == 'true'
+
+    # Background news poller (off by default)
+    NEWS_POLLER_ENABLED = os.getenv('NEWS_POLLER_ENABLED', 'False').lower() == 'true'
+    NEWS_POLLER_INTERVAL = int(os.getenv('NEWS_POLLER_INTERVAL', '60'))  # seconds
+    NEWS_POLLER_LEAD = int(os.getenv('NEWS_POLLER_LEAD', '180'))  # seconds
+
+    # US news ingestion: per-symbol Finnhub calls or the market news index
+    NEWS_INGESTION_MODE = os.getenv('NEWS_INGESTION_MODE', 'symbol').lower()
+
 
 class DevelopmentConfig(Config):
     """
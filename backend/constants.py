@@ -9,6 +9,22 @@ configure globally.
 # Cache configuration
 CACHE_TIMEOUT_SECONDS = 300  # 5 minutes - How long to cache stock data responses
 CACHE_DEFAULT_TIMEOUT = 300  # Default timeout for all cached endpoints
+CACHE_LOCAL_MAX_BYTES = 64 * 1024 * 1024  # 64 MB - Byte budget of the in-memory backend (single node)
+CACHE_LOCAL_MAX_ENTRIES = 100000  # Safety cap on in-memory entries; the byte budget normally evicts first
+CACHE_L1_MAX_BYTES = 32 * 1024 * 1024  # 32 MB - In-process tier budget in front of Redis
+CACHE_L1_TTL_SECONDS = 10  # Max lifetime of an in-process entry (bounds cross-worker staleness)
+CACHE_COMPRESSION_MIN_SIZE_BYTES = 1024  # Redis values smaller than this are stored uncompressed
+CACHE_COMPRESSION_LEVEL = 6  # zlib level for Redis values (speed/size balance)
+CACHE_STALE_GRACE_SECONDS = 60  # Expired responses may be served this long while one request refreshes
+CACHE_REFRESH_LOCK_SECONDS = 30  # Refresh lock lifetime (bounds a crashed refresher)
+XFETCH_BETA = 1.0  # XFetch eagerness (>1 refreshes earlier, <1 later)
+CACHE_TAG_TTL_SECONDS = 86400  # 1 day - Lifetime of Redis tag sets (outlives every tagged key)
+CACHE_FAILOVER_FAILURE_THRESHOLD = 3  # Consecutive Redis errors before serving from process memory
+CACHE_FAILOVER_PROBE_INTERVAL_SECONDS = 5  # How often to ping Redis while failed over
+CACHE_SNAPSHOT_INTERVAL_SECONDS = 300  # How often the in-memory cache is snapshotted to disk (0 = on shutdown only)
+CACHE_SNAPSHOT_MIN_TTL_SECONDS = 30  # Entries expiring sooner are not worth persisting or restoring
+CACHE_SNAPSHOT_MAX_BYTES = 16 * 1024 * 1024  # 16 MB - Hottest entries kept per snapshot
+CACHE_LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)  # Cache get/set histogram bounds
 
 # yfinance fallback configuration
 FALLBACK_PERIOD = '3mo'  # Fallback period when date range returns no data
@@ -25,8 +41,10 @@ DEFAULT_DATE_RANGE_DAYS = 30  # Default date range when not specified in request
 
 # HTTP status codes (for code clarity and consistency)
 HTTP_OK = 200  # Successful request
+HTTP_ACCEPTED = 202  # Request accepted, result not ready yet
 HTTP_BAD_REQUEST = 400  # Client error - invalid input
 HTTP_NOT_FOUND = 404  # Resource not found
+HTTP_CONFLICT = 409  # Request conflicts with current state
 HTTP_INTERNAL_ERROR = 500  # Server error
 
 # News feature configuration
@@ -34,6 +52,75 @@ NEWS_CACHE_TIMEOUT = 900  # 15 minutes - How long to cache news responses
 NEWS_TIME_WINDOW_HOURS = 72  # Only show news from the past 72 hours
 NEWS_REQUEST_TIMEOUT = 10  # Seconds - timeout for external news API requests
 NEWS_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'  # ISO 8601 UTC format for news timestamps
+RSS_STALE_RUN_LIMIT = 20  # Stop reading a feed after this many consecutive items older than the window
+NEWS_ID_HASH_LENGTH = 16  # Hex digits of the canonical-URL hash used in article IDs
+NEWS_URL_TRACKING_PARAMS = frozenset({  # Query parameters dropped from article URLs (besides utm_*)
+    'oc', 'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'cmpid', 'ref', 'ocid',
+})
+NEWS_DEDUP_MIN_SIMILARITY = 0.7  # Headline token Jaccard similarity at which two articles are one story
+NEWS_DEDUP_MIN_FEATURES = 3  # Headlines with fewer tokens are only collapsed by URL
+NEWS_MINHASH_BANDS = 10  # MinHash LSH bands (candidate pairs share at least one band)
+NEWS_MINHASH_ROWS = 3  # Signature rows per band
+NEWS_MINHASH_TOKEN_CACHE_SIZE = 65536  # Memoized per-token MinHash values
+NEWS_STORE_MAX_SYMBOLS = 512  # Symbols whose merged news window is kept per worker (LRU)
+NEWS_SINCE_ID_MAX_LENGTH = 64  # Longest accepted since_id query parameter
+NEWS_BATCH_MAX_SYMBOLS = 18  # Maximum number of symbols in one batch news request
+NEWS_SOURCE_FINNHUB = 'finnhub'  # News source for US and other non-Asian symbols
+NEWS_SOURCE_GOOGLE = 'google_news'  # News source for TW/HK/JP symbols
+NEWS_INGESTION_MODE_SYMBOL = 'symbol'  # One Finnhub /company-news call per symbol
+NEWS_INGESTION_MODE_MARKET = 'market'  # Bulk Finnhub /news feed, indexed locally by symbol
+NEWS_MARKET_REFRESH_SECONDS = 300  # Minimum seconds between bulk market news pulls
+NEWS_MARKET_CATEGORIES = ('general', 'merger')  # Finnhub market news categories ingested
+NEWS_MARKET_MAX_ARTICLES = 5000  # Market news articles held per worker
+NEWS_SOURCE_CONCURRENCY = {  # Concurrent fetches per source within one batch request
+    NEWS_SOURCE_FINNHUB: 4,  # Free tier allows 30 calls/second, 60/minute
+    NEWS_SOURCE_GOOGLE: 3,  # Unauthenticated RSS; keep it gentle to avoid throttling
+}
+
+# Pooled HTTP client for news fetchers (services/http_client.py)
+HTTP_CONNECT_TIMEOUT = 3.05  # Seconds - TCP connect timeout (reads use NEWS_REQUEST_TIMEOUT)
+HTTP_POOL_CONNECTIONS = 4  # Hosts with a kept-alive connection pool
+HTTP_POOL_MAXSIZE = 8  # Kept-alive connections per host (>= concurrent fetch threads)
+HTTP_RETRY_TOTAL = 2  # Retries on connection errors, 429 and 5xx
+HTTP_RETRY_BACKOFF_FACTOR = 0.3  # Seconds - backoff base (0.3s, 0.6s, ...)
+HTTP_RETRY_BACKOFF_JITTER = 0.2  # Seconds - random jitter added to each backoff
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)  # Statuses worth retrying
+HTTP_CONDITIONAL_CACHE_MAX_ENTRIES = 512  # Resources whose ETag/Last-Modified and parsed result are kept per fetcher
+HTTP_USER_AGENT = 'MarketVue/1.0 (+https://github.com/Clementtang/marketvue)'  # Sent to upstream APIs
+
+# Upstream pacing (utils/upstream_pacing.py)
+GOOGLE_NEWS_RATE_PER_SECOND = 5.0  # Sustained Google News RSS fetches per second
+GOOGLE_NEWS_BURST = 2  # RSS fetches allowed back to back after an idle period
+UPSTREAM_PACING_WORKERS = 4  # Threads running paced upstream calls per provider
+UPSTREAM_PACING_MAX_WAIT_SECONDS = 10  # Calls that would queue longer are rejected
+UPSTREAM_PACING_KEY_PREFIX = 'marketvue:pacing:'  # Redis key prefix of shared buckets
+
+# Background news poller
+NEWS_POLLER_INTERVAL_SECONDS = 60  # Seconds between polling cycles
+NEWS_POLLER_LEAD_SECONDS = 180  # Refresh cached news expiring within this window (> interval)
+NEWS_POLLER_IDLE_SECONDS = 3600  # Stop refreshing symbols not requested for an hour
+NEWS_POLLER_MAX_SYMBOLS = 200  # Symbols tracked per worker (least recently requested dropped)
+NEWS_POLLER_REFRESH_BUDGET = {  # Background refreshes per source per cycle
+    NEWS_SOURCE_FINNHUB: 20,  # A third of the free tier's 60 calls/minute
+    NEWS_SOURCE_GOOGLE: 20,  # Also paced by the Google News token bucket
+}
+
+# Response compression configuration
+COMPRESSION_MIN_SIZE_BYTES = 1024  # Responses smaller than this are sent uncompressed
+GZIP_COMPRESSION_LEVEL = 6  # 1 (fastest) - 9 (smallest)
+BROTLI_QUALITY = 5  # 0 (fastest) - 11 (smallest); only used if brotli is installed
+
+# Metrics configuration
+REQUEST_LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # Route latency histogram bounds
+UPSTREAM_LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)  # yfinance/Finnhub/RSS latency histogram bounds
+METRICS_FLUSH_INTERVAL_SECONDS = 5  # How often each worker writes its metrics to the shared directory
+
+# Sampling profiler (admin endpoint)
+PROFILER_DEFAULT_DURATION_SECONDS = 10  # Default profile length
+PROFILER_MAX_DURATION_SECONDS = 60  # Upper bound on one profile (sampled in a background thread)
+PROFILER_DEFAULT_INTERVAL_MS = 10  # Default time between stack samples
+PROFILER_MIN_INTERVAL_MS = 5  # Lower bound on the sampling interval (bounds overhead)
+PROFILER_MAX_STACK_DEPTH = 64  # Frames kept per sampled stack
 
 # Logging configuration
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'  # Standard log format
@@ -0,0 +1,193 @@
+"""
+Admin Routes - Authenticated operational endpoints.
+
+Provides:
+- POST /api/v1/admin/cache/purge - Purge cache entries by symbol, key family or prefix
+- POST /api/v1/admin/profile - Start sampling the stacks of the serving worker (PROFILER_ENABLED)
+- GET /api/v1/admin/profile - Download that worker's latest profile
+
+All endpoints require ``Authorization: Bearer <ADMIN_API_TOKEN>`` and are
+disabled (404) when ADMIN_API_TOKEN is not configured.
+"""
+
+import logging
+import math
+import os
+
+from flask import Blueprint, Response, current_app, request, jsonify
+
+from schemas.admin_schemas import (
+    CachePurgeRequestSchema,
+    ProfileDownloadSchema,
+    ProfileRequestSchema,
+)
+from utils.cache_tags import tag_index
+from utils.decorators import handle_errors, log_request, require_admin_token
+from utils.sampling_profiler import ProfilerBusyError, SamplingProfiler
+from constants import HTTP_OK, HTTP_ACCEPTED, HTTP_NOT_FOUND, HTTP_CONFLICT
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint with versioned API prefix
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/v1/admin')
+
+# Initialize schemas
+cache_purge_request_schema = CachePurgeRequestSchema()
+profile_request_schema = ProfileRequestSchema()
+profile_download_schema = ProfileDownloadSchema()
+
+
+@admin_bp.route('/cache/purge', methods=['POST'])
+@require_admin_token
+@handle_errors
+@log_request
+def purge_cache():
+    """
+    POST /api/v1/admin/cache/purge
+    Evict cache entries without flushing the whole cache
+
+    Request body (exactly one selector):
+        {"symbol": "AAPL"}          // every key tagged with the symbol
+        {"family": "news"}          // every key of a CacheKeyBuilder family
+        {"prefix": "stock_data:AAPL:2024-"}
+
+    Returns:
+        {
+            "purged": 4,
+            "selector": "symbol",
+            "value": "AAPL"
+        }
+    """
+    data = cache_purge_request_schema.load(request.get_json(silent=True) or {})
+
+    if data.get('symbol'):
+        selector, value = 'symbol', data['symbol'].strip().upper()
+        purged = tag_index.purge_symbol(value)
+    elif data.get('family'):
+        selector, value = 'family', data['family']
+        purged = tag_index.purge_family(value)
+    else:
+        selector, value = 'prefix', data['prefix']
+        purged = tag_index.purge_prefix(value)
+
+    logger.info(f"Admin cache purge by {selector} '{value}': {purged} keys")
+    return jsonify({
+        'purged': purged,
+        'selector': selector,
+        'value': value,
+    }), HTTP_OK
+
+
+def _profiler_disabled():
+    """Answer 404 for profile endpoints unless PROFILER_ENABLED is set."""
+    if current_app.config.get('PROFILER_ENABLED', False):
+        return None
+    return jsonify({
+        'error': 'Not found',
+        'message': 'Resource not found'
+    }), HTTP_NOT_FOUND
+
+
+@admin_bp.route('/profile', methods=['POST'])
+@require_admin_token
+@handle_errors
+@log_request
+def start_profile():
+    """
+    POST /api/v1/admin/profile
+    Start sampling the Python stacks of every thread in the worker serving this request
+
+    Sampling runs in a background thread, so this worker keeps serving the
+    load being profiled; download the result with GET /api/v1/admin/profile
+    once ``duration`` has passed. Only the worker that answers is profiled
+    (its pid is returned); the download must reach the same worker.
+
+    Request body (all optional):
+        {
+            "duration": 10,          // seconds, at most 60
+            "interval_ms": 10        // between samples, at least 5
+        }
+
+    Returns:
+        202 with {"status": "running", "pid", "duration", "interval_ms"}
+        404 when PROFILER_ENABLED is false, 409 if a profile is already running
+    """
+    disabled = _profiler_disabled()
+    if disabled:
+        return disabled
+
+    data = profile_request_schema.load(request.get_json(silent=True) or {})
+
+    try:
+        profile = SamplingProfiler().start(data['duration'], data['interval_ms'])
+    except ProfilerBusyError as e:
+        return jsonify({
+            'error': 'Conflict',
+            'message': str(e)
+        }), HTTP_CONFLICT
+
+    pid = os.getpid()
+    logger.info(f"Admin profile of worker {pid} started for {profile.duration:.1f}s")
+    response = jsonify({
+        'status': 'running',
+        'pid': pid,
+        'duration': profile.duration,
+        'interval_ms': profile.interval * 1000,
+    })
+    response.status_code = HTTP_ACCEPTED
+    response.headers['Location'] = '/api/v1/admin/profile'
+    response.headers['Retry-After'] = str(math.ceil(profile.duration))
+    return response
+
+
+@admin_bp.route('/profile', methods=['GET'])
+@require_admin_token
+@handle_errors
+@log_request
+def download_profile():
+    """
+    GET /api/v1/admin/profile?format=collapsed
+    Download the latest profile of the worker serving this request
+
+    Query parameters:
+        format: "collapsed" (default) or "pstats"
+
+    Returns:
+        collapsed: text/plain, one "thread;file:func:line;... count" per line
+        pstats: application/octet-stream, loadable with pstats.Stats
+        202 with {"status": "running", "remaining"} while sampling
+        404 when PROFILER_ENABLED is false or this worker has no profile
+    """
+    disabled = _profiler_disabled()
+    if disabled:
+        return disabled
+
+    data = profile_download_schema.load(request.args)
+    pid = os.getpid()
+
+    profile = SamplingProfiler.latest()
+    if profile is None:
+        return jsonify({
+            'error': 'Not found',
+            'message': f'No profile in worker {pid}'
+        }), HTTP_NOT_FOUND
+
+    if not profile.done():
+        remaining = profile.remaining()
+        response = jsonify({'status': 'running', 'pid': pid, 'remaining': round(remaining, 3)})
+        response.status_code = HTTP_ACCEPTED
+        response.headers['Retry-After'] = str(max(math.ceil(remaining), 1))
+        return response
+
+    result = profile.result
+    if data['format'] == 'pstats':
+        body, mimetype, filename = result.to_pstats(), 'application/octet-stream', f'profile-{pid}.pstats'
+    else:
+        body, mimetype, filename = result.to_collapsed(), 'text/plain', f'profile-{pid}.collapsed.txt'
+
+    response = Response(body, status=HTTP_OK, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    response.headers['X-Profile-Pid'] = str(pid)
+    response.headers['X-Profile-Samples'] = str(result.sample_count)
+    response.headers['X-Profile-Duration'] = f'{result.duration:.3f}'
+    return response
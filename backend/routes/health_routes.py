@@ -5,6 +5,7 @@ Provides comprehensive health check endpoints for monitoring:
 - Basic health status
 - Detailed system information
 - Dependency status (cache, external services)
+- Per-family cache metrics
 """
 
 import os
@@ -13,6 +14,7 @@ import time
 from datetime import datetime
 from flask import Blueprint, jsonify, current_app
 from utils.cache import cache
+from utils.cache_metrics import cache_metrics
 from constants import HTTP_OK
 
 # Application start time for uptime calculation
@@ -36,10 +38,20 @@ def get_cache_status() -> dict:
         result = cache.get(test_key)
         cache.delete(test_key)
 
-        return {
+        status = {
             'status': 'healthy' if result == 'ok' else 'degraded',
             'backend': current_app.config.get('CACHE_TYPE', 'unknown'),
         }
+
+        # Occupancy stats from backends that track them (SizeAwareCache, L1 tier)
+        backend = getattr(cache, 'cache', None)
+        if callable(getattr(backend, 'stats', None)):
+            status['stats'] = backend.stats()
+            # Serving from the local fallback while Redis is down
+            if status['stats'].get('circuit', {}).get('state') == 'open':
+                status['status'] = 'degraded'
+
+        return status
     except Exception as e:
         return {
             'status': 'unhealthy',
@@ -134,6 +146,29 @@ def detailed_health_check():
     }), HTTP_OK
 
 
+@health_bp.route('/health/cache', methods=['GET'])
+def cache_metrics_check():
+    """
+    Cache metrics endpoint.
+
+    Reports hits, misses, hit ratio, sets, deletes, evictions and get/set
+    latency histograms per key family (stock_data, stock_fragment,
+    batch_stocks, news, other), plus entries and bytes stored per family
+    for the in-memory backend. Metrics cover the answering worker process.
+
+    Returns:
+        JSON response with per-family cache metrics
+    """
+    backend = getattr(cache, 'cache', None)
+    backend_stats = getattr(backend, 'stats', None)
+
+    return jsonify({
+        'backend': current_app.config.get('CACHE_TYPE', 'unknown'),
+        **cache_metrics.snapshot(backend),
+        'stats': backend_stats() if callable(backend_stats) else None,
+    }), HTTP_OK
+
+
 @health_bp.route('/health/ready', methods=['GET'])
 def readiness_check():
     """
@@ -0,0 +1,37 @@
+"""
+Metrics Routes - Prometheus scrape endpoint.
+
+Provides:
+- GET /metrics - Application metrics in the Prometheus text format
+"""
+
+from flask import Blueprint, Response, current_app
+
+from utils.metrics import render_metrics
+from constants import HTTP_OK, HTTP_NOT_FOUND
+
+# Unversioned: Prometheus scrapes /metrics by convention
+metrics_bp = Blueprint('metrics', __name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    GET /metrics
+    Route latency histograms, upstream provider latency and errors, in-flight
+    gauges, batch thread-pool depth and per-family cache counters
+
+    Returns:
+        Prometheus exposition text, aggregated across gunicorn workers when
+        METRICS_MULTIPROC_DIR is set (404 when METRICS_ENABLED is false)
+    """
+    if not current_app.config.get('METRICS_ENABLED', True):
+        return Response('Not found\n', status=HTTP_NOT_FOUND, mimetype='text/plain')
+
+    return Response(
+        render_metrics(current_app),
+        status=HTTP_OK,
+        content_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -2,19 +2,25 @@
 News Routes - API endpoints for stock news.
 
 Provides:
-- GET /api/v1/news/<symbol> - Fetch news for a stock symbol
+- GET /api/v1/news/<symbol> - Fetch news for a stock symbol (delta with ?since_id=)
+- POST /api/v1/news/batch - Fetch news for several symbols in one call
 """
 
+import json
 import logging
 import re
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 
+from schemas.news_schemas import NewsBatchRequestSchema, NewsQuerySchema
+from services.news_poller import record_news_request
 from services.news_service import NewsService
-from utils.cache import cache
+from services.news_store import articles_since
+from utils.response_cache import cached_response, get_fresh_payloads, store_responses
 from utils.cache_keys import CacheKeyBuilder
 from utils.decorators import handle_errors, log_request
-from constants import NEWS_CACHE_TIMEOUT, HTTP_OK
+from utils.json_fragments import splice_object
+from constants import NEWS_CACHE_TIMEOUT, NEWS_INGESTION_MODE_SYMBOL, HTTP_OK
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,9 @@ news_bp = Blueprint('news', __name__, url_prefix='/api/v1')
 # News service instance (injected via set_news_service or default)
 _news_service = None
 
+# Ingestion mode of the default NewsService (set by init_news_service)
+_ingestion_mode = NEWS_INGESTION_MODE_SYMBOL
+
 # Valid symbol pattern: alphanumeric, dots, hyphens, carets
 SYMBOL_PATTERN = re.compile(r'^[A-Za-z0-9.\-^]{1,10}$')
 
@@ -32,19 +41,51 @@ def get_news_service() -> NewsService:
     """Get the NewsService instance for dependency injection."""
     global _news_service
     if _news_service is None:
-        _news_service = NewsService()
+        _news_service = NewsService(ingestion_mode=_ingestion_mode)
     return _news_service
 
 
+def init_news_service(app) -> None:
+    """
+    Configure the default NewsService from the app config.
+
+    The service is still created lazily; it is also used outside requests
+    (by the news poller), so the mode is read here rather than from
+    current_app.
+
+    Args:
+        app: Flask application
+    """
+    global _news_service, _ingestion_mode
+    mode = app.config.get('NEWS_INGESTION_MODE', NEWS_INGESTION_MODE_SYMBOL)
+    if mode != _ingestion_mode:
+        _news_service = None  # rebuilt with the new mode on next use
+    _ingestion_mode = mode
+
+
 def set_news_service(service: NewsService):
     """Set the NewsService instance for dependency injection (used in testing)."""
     global _news_service
     _news_service = service
 
 
+news_batch_request_schema = NewsBatchRequestSchema()
+news_query_schema = NewsQuerySchema()
+
+
+@news_bp.before_request
+def record_requested_symbol():
+    """Track symbols read through GET /news/<symbol> (cache hits included) for the news poller."""
+    symbol = (request.view_args or {}).get('symbol')
+    if symbol and SYMBOL_PATTERN.match(symbol):
+        record_news_request([symbol])
+
+
 def make_news_cache_key(*args, **kwargs):
-    """Generate cache key for news requests."""
+    """Generate cache key for news requests (None for delta requests, served by the view)."""
     try:
+        if request.args.get('since_id'):
+            return None
         symbol = kwargs.get('symbol', '') or request.view_args.get('symbol', '')
         return CacheKeyBuilder.build_news_key(symbol)
     except Exception as e:
@@ -53,7 +94,7 @@ def make_news_cache_key(*args, **kwargs):
 
 
 @news_bp.route('/news/<symbol>', methods=['GET'])
-@cache.cached(timeout=NEWS_CACHE_TIMEOUT, make_cache_key=make_news_cache_key)
+@cached_response(timeout=NEWS_CACHE_TIMEOUT, make_cache_key=make_news_cache_key)
 @handle_errors
 @log_request
 def get_news(symbol):
@@ -65,11 +106,18 @@ def get_news(symbol):
     Path params:
         symbol: Stock ticker symbol (e.g., 'AAPL', '2330.TW')
 
+    Query params:
+        since_id: ID of the newest article the client already has. The
+            response then holds only the articles ahead of it, with
+            "delta": true, or the full window with "delta": false if the
+            ID has expired from the window.
+
     Returns:
         JSON with news articles in unified format
 
     Cache:
-        Cached for 15 minutes (900 seconds) by symbol
+        Cached for 15 minutes (900 seconds) by symbol. Delta responses are
+        cut from the same cache entry.
     """
     # Validate symbol format
     if not SYMBOL_PATTERN.match(symbol):
@@ -78,8 +126,97 @@ def get_news(symbol):
             'Only letters, numbers, dots, hyphens, and carets allowed (max 10 chars).'
         )
 
+    since_id = news_query_schema.load(request.args)['since_id']
+    if since_id:
+        return _news_delta(symbol.upper(), since_id)
+
     # Fetch news
     news_service = get_news_service()
     result = news_service.get_news(symbol=symbol.upper())
 
     return jsonify(result), HTTP_OK
+
+
+def _news_delta(symbol: str, since_id: str):
+    """Answer a since_id request from the symbol's cached (or fresh) full response."""
+    key = CacheKeyBuilder.build_news_key(symbol)
+    payload = get_fresh_payloads([key]).get(key)
+    if payload is not None:
+        result = json.loads(payload['body'])
+        cache_status = 'HIT'
+    else:
+        result = get_news_service().get_news(symbol=symbol)
+        store_responses({key: jsonify(result)}, timeout=NEWS_CACHE_TIMEOUT)
+        cache_status = 'MISS'
+
+    newer = articles_since(result['news'], since_id)
+    if newer is not None:
+        result['news'] = newer
+        result['total'] = len(newer)
+    result['since_id'] = since_id
+    result['delta'] = newer is not None
+
+    response = jsonify(result)
+    response.headers['X-Cache'] = cache_status
+    return response, HTTP_OK
+
+
+@news_bp.route('/news/batch', methods=['POST'])
+@handle_errors
+@log_request
+def get_news_batch():
+    """
+    POST /api/v1/news/batch
+
+    Fetch news for several symbols in one call.
+
+    Each symbol is looked up under the same cache key as GET /news/<symbol>,
+    and only the misses are fetched (concurrently, within each source's
+    budget) and written back, so both endpoints share one cache.
+
+    Request body:
+        {"symbols": ["AAPL", "2330.TW", "0700.HK"]}
+
+    Returns:
+        {
+            "news": {
+                "AAPL": {"symbol": "AAPL", "news": [...], "total": 3, "cached_at": "..."},
+                ...
+            },
+            "cache_hits": 1,
+            "cache_misses": 2
+        }
+
+    Headers:
+        X-Cache: HIT (all cached), MISS (none cached) or PARTIAL
+    """
+    data = news_batch_request_schema.load(request.get_json(silent=True) or {})
+    symbols = [symbol.upper() for symbol in data['symbols']]
+    record_news_request(symbols)
+    keys = {symbol: CacheKeyBuilder.build_news_key(symbol) for symbol in symbols}
+
+    payloads = get_fresh_payloads(list(keys.values()))
+    bodies = {
+        symbol: payloads[key]['body'] for symbol, key in keys.items() if key in payloads
+    }
+    misses = [symbol for symbol in symbols if symbol not in bodies]
+
+    if misses:
+        results = get_news_service().get_news_batch(misses)
+        responses = {keys[symbol]: jsonify(result) for symbol, result in results.items()}
+        store_responses(responses, timeout=NEWS_CACHE_TIMEOUT)
+        for symbol in misses:
+            bodies[symbol] = responses[keys[symbol]].get_data()
+
+    body = splice_object(
+        {'news': splice_object({symbol: bodies[symbol] for symbol in symbols})},
+        {'cache_hits': len(symbols) - len(misses), 'cache_misses': len(misses)}
+    )
+    response = Response(body, status=HTTP_OK, mimetype='application/json')
+    if not misses:
+        response.headers['X-Cache'] = 'HIT'
+    elif len(misses) == len(symbols):
+        response.headers['X-Cache'] = 'MISS'
+    else:
+        response.headers['X-Cache'] = 'PARTIAL'
+    return response
@@ -1,14 +1,10 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, current_app
 from marshmallow import ValidationError
 from services.stock_service import StockService
-from schemas.stock_schemas import (
-    StockDataRequestSchema,
-    BatchStocksRequestSchema,
-    StockDataResponseSchema,
-    BatchStocksResponseSchema
-)
-from utils.cache import cache
+from schemas.stock_schemas import StockDataRequestSchema, BatchStocksRequestSchema
+from utils.response_cache import cached_response
 from utils.cache_keys import CacheKeyBuilder
+from utils.request_canonicalization import canonicalize_date_range, canonicalize_symbols
 from utils.decorators import handle_errors, log_request
 from constants import CACHE_TIMEOUT_SECONDS, HTTP_OK
 import logging
@@ -51,25 +47,26 @@ def make_stock_data_cache_key():
     """
     Generate cache key for stock data requests.
 
-    Wrapper function that extracts parameters from Flask request context
-    and delegates to CacheKeyBuilder for key generation.
+    Wrapper function that extracts parameters from Flask request context,
+    canonicalizes them and delegates to CacheKeyBuilder for key generation.
 
     Returns:
         str: Cache key in format "stock_data:{SYMBOL}:{start_date}:{end_date}"
         None: If request data is invalid
 
     Examples:
-        >>> # For request: {"symbol": "AAPL", "start_date": "2024-01-01", "end_date": "2024-01-31"}
-        >>> # Returns: "stock_data:AAPL:2024-01-01:2024-01-31"
+        >>> # For request: {"symbol": "aapl", "start_date": "2024-01-01", "end_date": "2024-01-07"}
+        >>> # Returns: "stock_data:AAPL:2024-01-01:2024-01-06" (Sunday end snaps to Saturday)
     """
     try:
         data = request.get_json()
         if not data:
             return None
 
-        symbol = data.get('symbol', '')
-        start_date = data.get('start_date', '')
-        end_date = data.get('end_date', '')
+        symbol = data.get('symbol', '').strip().upper()
+        start_date, end_date = canonicalize_date_range(
+            data.get('start_date'), data.get('end_date'), [symbol]
+        )
 
         # Delegate to CacheKeyBuilder for consistent key generation
         cache_key = CacheKeyBuilder.build_stock_key(symbol, start_date, end_date)
@@ -84,25 +81,28 @@ def make_batch_stocks_cache_key():
     """
     Generate cache key for batch stocks requests.
 
-    Wrapper function that extracts parameters from Flask request context
-    and delegates to CacheKeyBuilder for key generation.
+    Wrapper function that extracts parameters from Flask request context,
+    canonicalizes them and delegates to CacheKeyBuilder for key generation.
+    Missing dates resolve to the default range, so requests omitting them
+    share entries with requests sending the equivalent explicit dates.
 
     Returns:
         str: Cache key in format "batch_stocks:{SYMBOL1,SYMBOL2}:{start_date}:{end_date}"
         None: If request data is invalid
 
     Examples:
-        >>> # For request: {"symbols": ["GOOGL", "AAPL"], "start_date": "2024-01-01"}
-        >>> # Returns: "batch_stocks:AAPL,GOOGL:2024-01-01:none"
+        >>> # For request: {"symbols": ["googl", "AAPL", "aapl"], "start_date": "2024-01-01"}
+        >>> # Returns: "batch_stocks:AAPL,GOOGL:2024-01-01:<canonical end>"
     """
     try:
         data = request.get_json()
         if not data:
             return None
 
-        symbols = data.get('symbols', [])
-        start_date = data.get('start_date', 'none')
-        end_date = data.get('end_date', 'none')
+        symbols = canonicalize_symbols(data.get('symbols', []))
+        start_date, end_date = canonicalize_date_range(
+            data.get('start_date'), data.get('end_date'), symbols
+        )
 
         # Delegate to CacheKeyBuilder for consistent key generation
         cache_key = CacheKeyBuilder.build_batch_key(symbols, start_date, end_date)
@@ -115,12 +115,10 @@ def make_batch_stocks_cache_key():
 # Initialize schemas
 stock_data_request_schema = StockDataRequestSchema()
 batch_stocks_request_schema = BatchStocksRequestSchema()
-stock_data_response_schema = StockDataResponseSchema()
-batch_stocks_response_schema = BatchStocksResponseSchema()
 
 
 @stock_bp.route('/stock-data', methods=['POST'])
-@cache.cached(timeout=CACHE_TIMEOUT_SECONDS, make_cache_key=make_stock_data_cache_key)
+@cached_response(timeout=CACHE_TIMEOUT_SECONDS, make_cache_key=make_stock_data_cache_key)
 @handle_errors
 @log_request
 def get_stock_data():
@@ -148,23 +146,27 @@ def get_stock_data():
     if data['end_date'] < data['start_date']:
         raise ValueError('end_date must be after start_date')
 
-    # Convert dates to strings
-    start_date = data['start_date'].strftime('%Y-%m-%d')
-    end_date = data['end_date'].strftime('%Y-%m-%d')
+    # Canonicalize so the data matches the cache key
+    symbol = data['symbol'].strip().upper()
+    start_date, end_date = canonicalize_date_range(
+        data['start_date'].strftime('%Y-%m-%d'),
+        data['end_date'].strftime('%Y-%m-%d'),
+        [symbol]
+    )
 
     # Fetch stock data using injected service
     stock_service = get_stock_service()
-    result = stock_service.get_stock_data(
-        symbol=data['symbol'].upper(),
+    body = stock_service.get_stock_data_encoded(
+        symbol=symbol,
         start_date=start_date,
         end_date=end_date
     )
 
-    return jsonify(result), HTTP_OK
+    return Response(body, status=HTTP_OK, mimetype='application/json')
 
 
 @stock_bp.route('/batch-stocks', methods=['POST'])
-@cache.cached(timeout=CACHE_TIMEOUT_SECONDS, make_cache_key=make_batch_stocks_cache_key)
+@cached_response(timeout=CACHE_TIMEOUT_SECONDS, make_cache_key=make_batch_stocks_cache_key)
 @handle_errors
 @log_request
 def get_batch_stocks():
@@ -188,7 +190,7 @@ def get_batch_stocks():
     # Validate request data
     data = batch_stocks_request_schema.load(request.json)
 
-    symbols = [s.upper() for s in data['symbols']]
+    symbols = canonicalize_symbols(data['symbols'])
 
     # Convert dates if provided
     start_date = None
@@ -203,19 +205,22 @@ def get_batch_stocks():
     if start_date and end_date and end_date < start_date:
         raise ValueError('end_date must be after start_date')
 
+    # Resolve defaults and snap to trading sessions so the data matches the cache key
+    start_date, end_date = canonicalize_date_range(start_date, end_date, symbols)
+
     # Fetch batch data using injected service
     stock_service = get_stock_service()
-    result = stock_service.get_batch_stocks(
+    body = stock_service.get_batch_stocks_encoded(
         symbols=symbols,
         start_date=start_date,
         end_date=end_date
     )
 
-    return jsonify(result), HTTP_OK
+    return Response(body, status=HTTP_OK, mimetype='application/json')
 
 
 @stock_bp.route('/batch-stocks-parallel', methods=['POST'])
-@cache.cached(timeout=CACHE_TIMEOUT_SECONDS, make_cache_key=make_batch_stocks_cache_key)
+@cached_response(timeout=CACHE_TIMEOUT_SECONDS, make_cache_key=make_batch_stocks_cache_key)
 @handle_errors
 @log_request
 def get_batch_stocks_parallel():
@@ -253,7 +258,7 @@ def get_batch_stocks_parallel():
     # Validate request data
     data = batch_stocks_request_schema.load(request.json)
 
-    symbols = [s.upper() for s in data['symbols']]
+    symbols = canonicalize_symbols(data['symbols'])
 
     # Convert dates if provided
     start_date = None
@@ -268,6 +273,9 @@ def get_batch_stocks_parallel():
     if start_date and end_date and end_date < start_date:
         raise ValueError('end_date must be after start_date')
 
+    # Resolve defaults and snap to trading sessions so the data matches the cache key
+    start_date, end_date = canonicalize_date_range(start_date, end_date, symbols)
+
     # Get max_workers from request (default: 5)
     max_workers = request.json.get('max_workers', 5) if request.json else 5
     if not isinstance(max_workers, int) or max_workers < 1 or max_workers > 10:
@@ -275,14 +283,14 @@ def get_batch_stocks_parallel():
 
     # Fetch batch data using parallel method
     stock_service = get_stock_service()
-    result = stock_service.get_batch_stocks_parallel(
+    body = stock_service.get_batch_stocks_parallel_encoded(
         symbols=symbols,
         start_date=start_date,
         end_date=end_date,
         max_workers=max_workers
     )
 
-    return jsonify(result), HTTP_OK
+    return Response(body, status=HTTP_OK, mimetype='application/json')
 
 
 # Note: Health check endpoint moved to health_routes.py for API v1
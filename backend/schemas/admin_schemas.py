@@ -0,0 +1,49 @@
+"""
+Admin Schemas - Marshmallow validation for admin API requests.
+"""
+
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
+
+from constants import (
+    PROFILER_DEFAULT_DURATION_SECONDS,
+    PROFILER_DEFAULT_INTERVAL_MS,
+    PROFILER_MAX_DURATION_SECONDS,
+    PROFILER_MIN_INTERVAL_MS,
+)
+from utils.cache_keys import KEY_FAMILIES
+
+PROFILE_FORMATS = ('collapsed', 'pstats')
+
+
+class CachePurgeRequestSchema(Schema):
+    """Schema for cache purge requests (exactly one selector)"""
+    symbol = fields.Str(validate=validate.Length(min=1, max=10))
+    family = fields.Str(validate=validate.OneOf(KEY_FAMILIES))
+    prefix = fields.Str(validate=validate.Length(min=1, max=200))
+
+    @validates_schema
+    def validate_single_selector(self, data, **kwargs):
+        """Require exactly one of symbol, family or prefix"""
+        selectors = [name for name in ('symbol', 'family', 'prefix') if data.get(name)]
+        if len(selectors) != 1:
+            raise ValidationError('Provide exactly one of symbol, family or prefix')
+
+
+class ProfileRequestSchema(Schema):
+    """Schema for starting a sampling profile"""
+    duration = fields.Float(
+        load_default=PROFILER_DEFAULT_DURATION_SECONDS,
+        validate=validate.Range(min=0.1, max=PROFILER_MAX_DURATION_SECONDS)
+    )
+    interval_ms = fields.Float(
+        load_default=PROFILER_DEFAULT_INTERVAL_MS,
+        validate=validate.Range(min=PROFILER_MIN_INTERVAL_MS, max=1000)
+    )
+
+
+class ProfileDownloadSchema(Schema):
+    """Schema for sampling profile download query parameters"""
+    format = fields.Str(
+        load_default='collapsed',
+        validate=validate.OneOf(PROFILE_FORMATS)
+    )
@@ -2,7 +2,9 @@
 News Schemas - Marshmallow validation for news API requests and responses.
 """
 
-from marshmallow import Schema, fields
+from marshmallow import EXCLUDE, Schema, fields, validate, validates, ValidationError
+
+from constants import NEWS_BATCH_MAX_SYMBOLS, NEWS_SINCE_ID_MAX_LENGTH
 
 
 class NewsArticleSchema(Schema):
@@ -14,7 +16,9 @@ class NewsArticleSchema(Schema):
     url = fields.Str(required=True)
     image = fields.Str(allow_none=True, load_default=None)
     published_at = fields.Str(required=True)
+    published_ts = fields.Int(allow_none=True, load_default=None)
     language = fields.Str(load_default="en-US")
+    duplicates = fields.Int(load_default=0)
 
 
 class NewsResponseSchema(Schema):
@@ -23,3 +27,34 @@ class NewsResponseSchema(Schema):
     news = fields.List(fields.Nested(NewsArticleSchema), required=True)
     total = fields.Int(required=True)
     cached_at = fields.Str(allow_none=True, load_default=None)
+
+
+class NewsQuerySchema(Schema):
+    """Schema for GET /news/<symbol> query parameters"""
+
+    class Meta:
+        unknown = EXCLUDE
+
+    since_id = fields.Str(
+        load_default=None,
+        validate=validate.Regexp(rf'^[A-Za-z0-9_\-]{{1,{NEWS_SINCE_ID_MAX_LENGTH}}}$'),
+    )
+
+
+class NewsBatchRequestSchema(Schema):
+    """Schema for batch news request validation"""
+    symbols = fields.List(
+        fields.Str(validate=validate.Regexp(r'^[A-Za-z0-9.\-^]{1,10}$')),
+        required=True,
+        validate=validate.Length(min=1, max=NEWS_BATCH_MAX_SYMBOLS),
+        error_messages={
+            'required': 'Symbols list is required',
+        }
+    )
+
+    @validates('symbols')
+    def validate_symbols(self, value):
+        """Reject duplicate symbols (case-insensitive)"""
+        upper_symbols = [s.upper() for s in value]
+        if len(upper_symbols) != len(set(upper_symbols)):
+            raise ValidationError('Duplicate symbols not allowed')
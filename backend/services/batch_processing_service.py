@@ -9,10 +9,14 @@ Single responsibility: Coordinate batch processing of multiple stock data reques
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from constants import DEFAULT_DATE_RANGE_DAYS
+from utils.cache_keys import CacheKeyBuilder
+from utils.fragment_cache import FragmentCache
+from utils.json_fragments import encode_fragment, splice_array, splice_object
+from utils.metrics import instrument_task
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,7 @@ class BatchProcessingService:
     Attributes:
         _stock_service: StockService instance for fetching individual stocks
         _default_max_workers: Default number of parallel workers
+        _fragment_cache: Cache of per-symbol pre-encoded JSON fragments
 
     Examples:
         >>> from services.stock_service import StockService
@@ -37,16 +42,37 @@ class BatchProcessingService:
         ... )
     """
 
-    def __init__(self, stock_service, default_max_workers: int = 5):
+    def __init__(
+        self,
+        stock_service,
+        default_max_workers: int = 5,
+        fragment_cache: Optional[FragmentCache] = None
+    ):
         """
         Initialize BatchProcessingService with dependencies.
 
         Args:
             stock_service: StockService instance for fetching individual stocks
             default_max_workers: Default max workers for parallel processing
+            fragment_cache: Per-symbol fragment cache (default: new instance)
         """
         self._stock_service = stock_service
         self._default_max_workers = default_max_workers
+        self._fragment_cache = fragment_cache or FragmentCache()
+
+    @staticmethod
+    def _resolve_date_range(
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Tuple[str, str]:
+        """Fill in the default date range for missing dates."""
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        if not start_date:
+            start_date = (
+                datetime.now() - timedelta(days=DEFAULT_DATE_RANGE_DAYS)
+            ).strftime('%Y-%m-%d')
+        return start_date, end_date
 
     def process_batch_sequential(
         self,
@@ -83,12 +109,7 @@ class BatchProcessingService:
             logger.info(f"Processing batch data for {len(symbols)} stocks (sequential mode)")
 
             # Use default date range if not provided
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-            if not start_date:
-                start_date = (
-                    datetime.now() - timedelta(days=DEFAULT_DATE_RANGE_DAYS)
-                ).strftime('%Y-%m-%d')
+            start_date, end_date = self._resolve_date_range(start_date, end_date)
 
             stocks_data = []
             errors = []
@@ -171,12 +192,7 @@ class BatchProcessingService:
             )
 
             # Use default date range if not provided
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-            if not start_date:
-                start_date = (
-                    datetime.now() - timedelta(days=DEFAULT_DATE_RANGE_DAYS)
-                ).strftime('%Y-%m-%d')
+            start_date, end_date = self._resolve_date_range(start_date, end_date)
 
             stocks_data = []
             errors = []
@@ -186,7 +202,7 @@ class BatchProcessingService:
                 # Submit all tasks
                 future_to_symbol = {
                     executor.submit(
-                        self._stock_service.get_stock_data,
+                        instrument_task(self._stock_service.get_stock_data),
                         symbol,
                         start_date,
                         end_date
@@ -232,3 +248,219 @@ class BatchProcessingService:
         except Exception as e:
             logger.error(f"Error processing batch stocks (parallel): {str(e)}")
             raise ValueError(f"Failed to process batch stocks: {str(e)}")
+
+    def process_batch_sequential_encoded(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> bytes:
+        """
+        Process multiple stocks sequentially into an encoded JSON body.
+
+        Same response shape as process_batch_sequential, but stocks are
+        spliced in from cached per-symbol fragments. Only cache misses are
+        fetched and encoded; hits are never decoded or re-serialized.
+
+        Args:
+            symbols: List of stock ticker symbols (max 18 per request)
+            start_date: Optional start date in YYYY-MM-DD format
+            end_date: Optional end date in YYYY-MM-DD format
+
+        Returns:
+            UTF-8 JSON bytes with stocks (in request order), timestamp, errors
+
+        Raises:
+            ValueError: If batch data cannot be fetched
+        """
+        try:
+            start_date, end_date = self._resolve_date_range(start_date, end_date)
+            fragments, errors = self._collect_fragments(
+                symbols, start_date, end_date, workers=None
+            )
+
+            logger.info(
+                f"Successfully processed {len(fragments)}/{len(symbols)} stocks "
+                "(sequential mode, encoded)"
+            )
+            return splice_object(
+                {'stocks': splice_array(fragments)},
+                {
+                    'timestamp': datetime.now().isoformat(),
+                    'errors': errors if errors else None
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing batch stocks (sequential): {str(e)}")
+            raise ValueError(f"Failed to process batch stocks: {str(e)}")
+
+    def process_batch_parallel_encoded(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> bytes:
+        """
+        Process multiple stocks in parallel into an encoded JSON body.
+
+        Same response shape as process_batch_parallel. Cached symbols are
+        spliced in as fragments; only misses are submitted to the pool.
+
+        Args:
+            symbols: List of stock ticker symbols (max 18 per request)
+            start_date: Optional start date in YYYY-MM-DD format
+            end_date: Optional end date in YYYY-MM-DD format
+            max_workers: Maximum number of parallel workers (default: 5)
+
+        Returns:
+            UTF-8 JSON bytes with stocks (in request order), timestamp,
+            errors and processing_time_ms
+
+        Raises:
+            ValueError: If batch data cannot be fetched
+        """
+        try:
+            start_time = datetime.now()
+            workers = max_workers or self._default_max_workers
+            start_date, end_date = self._resolve_date_range(start_date, end_date)
+
+            fragments, errors = self._collect_fragments(
+                symbols, start_date, end_date, workers=workers
+            )
+
+            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+
+            logger.info(
+                f"Successfully processed {len(fragments)}/{len(symbols)} stocks "
+                f"in {processing_time:.2f}ms (parallel mode, encoded)"
+            )
+            return splice_object(
+                {'stocks': splice_array(fragments)},
+                {
+                    'timestamp': datetime.now().isoformat(),
+                    'errors': errors if errors else None,
+                    'processing_time_ms': round(processing_time, 2)
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing batch stocks (parallel): {str(e)}")
+            raise ValueError(f"Failed to process batch stocks: {str(e)}")
+
+    def _collect_fragments(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        workers: Optional[int]
+    ) -> Tuple[List[bytes], List[Dict]]:
+        """
+        Gather per-symbol fragments, fetching and caching only the misses.
+
+        Cache reads and writes happen on the calling (request) thread; worker
+        threads only fetch and encode.
+
+        Args:
+            symbols: Stock ticker symbols
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            workers: Pool size for fetching misses, or None to fetch sequentially
+
+        Returns:
+            Tuple of (fragments in request order, error dictionaries)
+        """
+        keys = {
+            symbol: CacheKeyBuilder.build_stock_fragment_key(symbol, start_date, end_date)
+            for symbol in symbols
+        }
+        cached = self._fragment_cache.get_many(list(keys.values()))
+        fragments = {
+            symbol: cached[key] for symbol, key in keys.items() if key in cached
+        }
+        misses = [symbol for symbol in symbols if symbol not in fragments]
+
+        if misses:
+            logger.debug(f"Fragment cache: {len(fragments)} hits, {len(misses)} misses")
+            if workers:
+                fetched, errors = self._fetch_fragments_parallel(
+                    misses, start_date, end_date, workers
+                )
+            else:
+                fetched, errors = self._fetch_fragments_sequential(
+                    misses, start_date, end_date
+                )
+            fragments.update(fetched)
+            self._fragment_cache.set_many({
+                keys[symbol]: fragment for symbol, fragment in fetched.items()
+            })
+        else:
+            errors = []
+
+        ordered = [fragments[symbol] for symbol in symbols if symbol in fragments]
+        return ordered, errors
+
+    def _fetch_fragment(self, symbol: str, start_date: str, end_date: str) -> bytes:
+        """Fetch a single stock and encode it as a JSON fragment."""
+        return encode_fragment(
+            self._stock_service.get_stock_data(symbol, start_date, end_date)
+        )
+
+    def _fetch_fragments_sequential(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str
+    ) -> Tuple[Dict[str, bytes], List[Dict]]:
+        """Fetch and encode missing symbols one at a time."""
+        fetched = {}
+        errors = []
+
+        for symbol in symbols:
+            try:
+                fetched[symbol] = self._fetch_fragment(symbol, start_date, end_date)
+            except ValueError as e:
+                logger.warning(f"Failed to fetch data for {symbol}: {str(e)}")
+                errors.append({
+                    'symbol': symbol.upper(),
+                    'error': str(e)
+                })
+
+        return fetched, errors
+
+    def _fetch_fragments_parallel(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        workers: int
+    ) -> Tuple[Dict[str, bytes], List[Dict]]:
+        """Fetch and encode missing symbols concurrently."""
+        fetched = {}
+        errors = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_symbol = {
+                executor.submit(instrument_task(self._fetch_fragment), symbol, start_date, end_date): symbol
+                for symbol in symbols
+            }
+
+            for future in as_completed(future_to_symbol):
+                symbol = future_to_symbol[future]
+                try:
+                    fetched[symbol] = future.result()
+                except ValueError as e:
+                    logger.warning(f"Failed to fetch data for {symbol}: {str(e)}")
+                    errors.append({
+                        'symbol': symbol.upper(),
+                        'error': str(e)
+                    })
+                except Exception as e:
+                    logger.error(f"Unexpected error for {symbol}: {str(e)}")
+                    errors.append({
+                        'symbol': symbol.upper(),
+                        'error': f"Unexpected error: {str(e)}"
+                    })
+
+        return fetched, errors
@@ -1,18 +1,23 @@
 """
 Finnhub News Fetcher
 
-Fetches company news from the Finnhub API for US stocks.
+Fetches company news (per symbol) and market news (bulk, by category) from
+the Finnhub API for US stocks.
 Single responsibility: Retrieve and transform Finnhub news data.
 """
 
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
-from constants import NEWS_DATE_FORMAT, NEWS_REQUEST_TIMEOUT, NEWS_TIME_WINDOW_HOURS
+from constants import NEWS_DATE_FORMAT, NEWS_TIME_WINDOW_HOURS
+from utils.metrics import PROVIDER_FINNHUB, track_upstream
+from utils.news_identity import article_id
+
+from .http_client import ConditionalCache, HttpClient, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +26,15 @@ class FinnhubNewsFetcher:
     """
     Fetches company news from the Finnhub API.
 
-    Supports dependency injection for testing via api_key and base_url params.
+    Requests go through the shared pooled HttpClient (keep-alive, retries)
+    and are conditional when Finnhub returns ETag / Last-Modified validators.
+    Supports dependency injection for testing via api_key, base_url and
+    http_client params.
 
     Examples:
         >>> fetcher = FinnhubNewsFetcher()
         >>> articles = fetcher.fetch('AAPL')
+        >>> tagged = fetcher.fetch_market_news('general', min_id=7345000)
     """
 
     BASE_URL = "https://finnhub.io/api/v1"
@@ -34,11 +43,15 @@ class FinnhubNewsFetcher:
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        timeout: int = NEWS_REQUEST_TIMEOUT
+        timeout: Optional[float] = None,
+        http_client: Optional[HttpClient] = None,
+        validators: Optional[ConditionalCache] = None
     ):
         self._api_key = api_key or os.getenv('FINNHUB_API_KEY')
         self._base_url = base_url or self.BASE_URL
         self._timeout = timeout
+        self._http_client = http_client
+        self._validators = validators or ConditionalCache()
 
     def fetch(self, symbol: str) -> List[Dict]:
         """
@@ -68,22 +81,27 @@ class FinnhubNewsFetcher:
                 'token': self._api_key
             }
 
-            response = requests.get(url, params=params, timeout=self._timeout)
-            response.raise_for_status()
-
-            raw_articles = response.json()
-
-            if not isinstance(raw_articles, list):
-                logger.warning(f"Unexpected Finnhub response format for {symbol}")
+            with track_upstream(PROVIDER_FINNHUB) as call:
+                http_client = self._http_client or get_http_client()
+                articles, not_modified = http_client.get_conditional(
+                    url,
+                    lambda response: self._parse_articles(response, symbol),
+                    self._validators,
+                    params=params,
+                    timeout=self._timeout,
+                    # Keyed without the API token
+                    key=f"finnhub:{params['symbol']}:{start_date}:{today}",
+                )
+                if not_modified:
+                    call.mark_not_modified()
+
+            if articles is None:
                 return []
 
-            articles = [
-                self._transform_article(article)
-                for article in raw_articles
-                if self._is_valid_article(article)
-            ]
-
-            logger.info(f"Fetched {len(articles)} articles from Finnhub for {symbol}")
+            if not_modified:
+                logger.info(f"Finnhub news unchanged for {symbol}, reused {len(articles)} articles")
+            else:
+                logger.info(f"Fetched {len(articles)} articles from Finnhub for {symbol}")
             return articles
 
         except requests.exceptions.Timeout:
@@ -96,25 +114,104 @@ class FinnhubNewsFetcher:
             logger.error(f"Unexpected error fetching Finnhub news for {symbol}: {str(e)}")
             return []
 
+    def fetch_market_news(
+        self,
+        category: str = 'general',
+        min_id: int = 0
+    ) -> List[Tuple[Dict, List[str]]]:
+        """
+        Fetch the latest market news for a category in one call.
+
+        Args:
+            category: Finnhub news category ('general', 'forex', 'crypto', 'merger')
+            min_id: Only return articles with a larger Finnhub ID (0 for all)
+
+        Returns:
+            List of (article in unified format, related symbols) pairs, where
+            related symbols are Finnhub's uppercased ``related`` tickers
+        """
+        if not self._api_key:
+            logger.warning("FINNHUB_API_KEY not set, returning empty market news")
+            return []
+
+        params = {'category': category, 'token': self._api_key}
+        if min_id:
+            params['minId'] = min_id
+
+        try:
+            with track_upstream(PROVIDER_FINNHUB) as call:
+                http_client = self._http_client or get_http_client()
+                response = http_client.get(
+                    f"{self._base_url}/news", params=params, timeout=self._timeout
+                )
+                response.raise_for_status()
+                raw_articles = response.json()
+                if not isinstance(raw_articles, list):
+                    call.mark_failed()
+                    logger.warning(f"Unexpected Finnhub market news format for '{category}'")
+                    return []
+
+            tagged = [
+                (self._transform_article(article), self._related_symbols(article))
+                for article in raw_articles
+                if self._is_valid_article(article)
+            ]
+            logger.info(f"Fetched {len(tagged)} '{category}' market news articles from Finnhub")
+            return tagged
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Finnhub market news request failed for '{category}': {str(e)}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error fetching Finnhub market news for '{category}': {str(e)}")
+            return []
+
+    @staticmethod
+    def _related_symbols(article: Dict) -> List[str]:
+        """Split Finnhub's comma-separated ``related`` field into symbols."""
+        related = article.get('related') or ''
+        return [symbol.strip().upper() for symbol in related.split(',') if symbol.strip()]
+
+    def _parse_articles(self, response: requests.Response, symbol: str) -> Optional[List[Dict]]:
+        """Parse a Finnhub response into articles, or None for an unexpected format."""
+        raw_articles = response.json()
+
+        if not isinstance(raw_articles, list):
+            logger.warning(f"Unexpected Finnhub response format for {symbol}")
+            return None
+
+        return [
+            self._transform_article(article)
+            for article in raw_articles
+            if self._is_valid_article(article)
+        ]
+
     def _transform_article(self, article: Dict) -> Dict:
         """Transform a Finnhub article to the unified format."""
         published_at = ""
+        published_ts = None
         if article.get('datetime'):
             try:
+                published_ts = int(article['datetime'])
                 published_at = datetime.fromtimestamp(
-                    article['datetime'], tz=timezone.utc
+                    published_ts, tz=timezone.utc
                 ).strftime(NEWS_DATE_FORMAT)
-            except (ValueError, OSError):
+            except (TypeError, ValueError, OSError, OverflowError):
                 published_at = ""
+                published_ts = None
 
         return {
-            'id': f"finnhub_{article.get('id', '')}",
+            'id': (
+                f"finnhub_{article['id']}" if article.get('id')
+                else article_id('finnhub', article.get('url', ''))
+            ),
             'headline': article.get('headline', ''),
             'summary': article.get('summary', None),
             'source': article.get('source', None),
             'url': article.get('url', ''),
             'image': article.get('image', None),
             'published_at': published_at,
+            'published_ts': published_ts,
             'language': 'en-US'
         }
 
@@ -7,14 +7,20 @@ Single responsibility: Retrieve and transform Google News RSS data.
 
 import logging
 import time
-from datetime import datetime
-from email.utils import parsedate_to_datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 import feedparser
+import requests
 
-from constants import NEWS_DATE_FORMAT, NEWS_REQUEST_TIMEOUT
+from constants import NEWS_DATE_FORMAT, NEWS_TIME_WINDOW_HOURS
+from utils.metrics import PROVIDER_GOOGLE_RSS, track_upstream
+from utils.news_identity import article_id
+from utils.rss_parser import RssParseError, parse_rfc822_timestamp, parse_rss_items
+from utils.upstream_pacing import PacingOverloadError, PacingScheduler, get_pacing_scheduler
+
+from .http_client import ConditionalCache, HttpClient, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +29,16 @@ class GoogleNewsFetcher:
     """
     Fetches news from Google News RSS feeds.
 
-    Supports dependency injection for testing.
+    The feed is downloaded over the shared pooled HttpClient (keep-alive,
+    retries) and read with the streaming RSS parser, which extracts only the
+    fields used here and stops once items fall outside the news window;
+    feedparser is the fallback for feeds that are not well-formed RSS 2.0.
+    Refreshes are conditional (ETag /
+    Last-Modified), so an unchanged feed is neither downloaded nor parsed
+    again. Fetches are paced by the shared Google News PacingScheduler
+    (token bucket, optionally shared across workers via Redis): the calling
+    thread waits on a future instead of sleeping. Supports dependency
+    injection for testing.
 
     Examples:
         >>> fetcher = GoogleNewsFetcher()
@@ -31,18 +46,20 @@ class GoogleNewsFetcher:
     """
 
     BASE_URL = "https://news.google.com/rss/search"
-    REQUEST_DELAY = 0.2  # 200ms between requests to be respectful
 
     def __init__(
         self,
         base_url: Optional[str] = None,
-        timeout: int = NEWS_REQUEST_TIMEOUT,
-        request_delay: float = 0.2
+        timeout: Optional[float] = None,
+        http_client: Optional[HttpClient] = None,
+        validators: Optional[ConditionalCache] = None,
+        scheduler: Optional[PacingScheduler] = None
     ):
         self._base_url = base_url or self.BASE_URL
         self._timeout = timeout
-        self._request_delay = request_delay
-        self._last_request_time = 0.0
+        self._http_client = http_client
+        self._validators = validators or ConditionalCache()
+        self._scheduler = scheduler
 
     def fetch(
         self,
@@ -58,7 +75,7 @@ class GoogleNewsFetcher:
 
         Args:
             query: Search query (company name + optional keywords)
-            symbol: Stock symbol for ID generation
+            symbol: Stock symbol the query is for (used in log messages)
             hl: Language/locale parameter (e.g., 'zh-TW', 'en')
             gl: Country/region parameter (e.g., 'TW', 'HK', 'JP')
 
@@ -66,83 +83,129 @@ class GoogleNewsFetcher:
             List of news article dictionaries in unified format
         """
         try:
-            self._respect_rate_limit()
-
             encoded_query = quote(query)
             url = f"{self._base_url}?q={encoded_query}&hl={hl}&gl={gl}"
+            language = self._determine_language(hl)
 
-            feed = feedparser.parse(url)
+            scheduler = self._scheduler or get_pacing_scheduler(PROVIDER_GOOGLE_RSS)
+            articles, not_modified = scheduler.submit(
+                self._download, url, query, language
+            ).result()
 
-            if feed.bozo and not feed.entries:
-                logger.warning(f"Google News RSS parse error for '{query}': {feed.bozo_exception}")
+            if articles is None:
                 return []
 
-            language = self._determine_language(hl)
-            articles = []
-
-            for i, entry in enumerate(feed.entries):
-                try:
-                    article = self._transform_entry(entry, symbol, i, language)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.warning(f"Failed to parse RSS entry for '{query}': {str(e)}")
-                    continue
-
-            logger.info(f"Fetched {len(articles)} articles from Google News for '{query}'")
+            if not_modified:
+                logger.info(
+                    f"Google News feed unchanged for {symbol} ('{query}'), reused {len(articles)} articles"
+                )
+            else:
+                logger.info(f"Fetched {len(articles)} articles from Google News for {symbol} ('{query}')")
             return articles
 
+        except PacingOverloadError as e:
+            logger.warning(f"Skipped Google News fetch for '{query}': {str(e)}")
+            return []
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Google News request failed for '{query}': {str(e)}")
+            return []
         except Exception as e:
             logger.error(f"Unexpected error fetching Google News for '{query}': {str(e)}")
             return []
 
-    def _respect_rate_limit(self):
-        """Enforce minimum delay between requests."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._request_delay:
-            time.sleep(self._request_delay - elapsed)
-        self._last_request_time = time.time()
+    def _download(
+        self,
+        url: str,
+        query: str,
+        language: str
+    ) -> Tuple[Optional[List[Dict]], bool]:
+        """Fetch and parse a feed (runs on a pacing worker thread)."""
+        with track_upstream(PROVIDER_GOOGLE_RSS) as call:
+            http_client = self._http_client or get_http_client()
+            articles, not_modified = http_client.get_conditional(
+                url,
+                lambda response: self._parse_feed(response.content, query, language),
+                self._validators,
+                timeout=self._timeout,
+            )
+            if not_modified:
+                call.mark_not_modified()
+            elif articles is None:
+                call.mark_failed()
+        return articles, not_modified
+
+    def _parse_feed(
+        self,
+        content: bytes,
+        query: str,
+        language: str
+    ) -> Optional[List[Dict]]:
+        """Parse RSS bytes into articles, or None if the feed is unreadable."""
+        entries = self._read_entries(content, query)
+        if entries is None:
+            return None
+
+        articles = []
+        for entry in entries:
+            try:
+                article = self._transform_entry(entry, language)
+                if article:
+                    articles.append(article)
+            except Exception as e:
+                logger.warning(f"Failed to parse RSS entry for '{query}': {str(e)}")
+                continue
+        return articles
+
+    def _read_entries(self, content: bytes, query: str) -> Optional[List[Dict]]:
+        """Read feed entries, streaming first and falling back to feedparser."""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=NEWS_TIME_WINDOW_HOURS)
+        try:
+            return parse_rss_items(content, cutoff=cutoff)
+        except RssParseError as e:
+            logger.debug(f"Streaming RSS parse failed for '{query}', using feedparser: {e}")
+
+        feed = feedparser.parse(content)
+        if feed.bozo and not feed.entries:
+            logger.warning(f"Google News RSS parse error for '{query}': {feed.bozo_exception}")
+            return None
+        return feed.entries
 
     def _transform_entry(
         self,
         entry: Dict,
-        symbol: str,
-        index: int,
         language: str
     ) -> Optional[Dict]:
-        """Transform an RSS feed entry to the unified format."""
+        """Transform an RSS feed entry to the unified format (ID derived from the URL)."""
         title = entry.get('title', '')
         link = entry.get('link', '')
 
         if not title or not link:
             return None
 
-        published_at = self._parse_published_date(entry)
+        published_ts = self._published_timestamp(entry)
         source = self._extract_source(entry)
 
         return {
-            'id': f"google_{symbol}_{index}",
+            'id': article_id('google', link),
             'headline': title,
             'summary': None,
             'source': source,
             'url': link,
             'image': None,
-            'published_at': published_at,
+            'published_at': datetime.fromtimestamp(published_ts, tz=timezone.utc).strftime(NEWS_DATE_FORMAT),
+            'published_ts': published_ts,
             'language': language
         }
 
-    def _parse_published_date(self, entry: Dict) -> str:
-        """Parse the published date from an RSS entry."""
-        published = entry.get('published', '')
-        if not published:
-            return datetime.now().strftime(NEWS_DATE_FORMAT)
-
-        try:
-            dt = parsedate_to_datetime(published)
-            return dt.strftime(NEWS_DATE_FORMAT)
-        except (ValueError, TypeError):
-            return datetime.now().strftime(NEWS_DATE_FORMAT)
+    def _published_timestamp(self, entry: Dict) -> int:
+        """Get an RSS entry's publish time in epoch seconds (now if unknown)."""
+        published_ts = entry.get('published_ts', None)
+        if isinstance(published_ts, int):
+            return published_ts
+        published_ts = parse_rfc822_timestamp(entry.get('published', ''))
+        if published_ts is None:
+            return int(time.time())
+        return published_ts
 
     def _extract_source(self, entry: Dict) -> Optional[str]:
         """Extract the source name from an RSS entry."""
@@ -0,0 +1,326 @@
+"""
+HTTP Client
+
+Shared, pooled HTTP client for upstream news APIs and feeds.
+
+One ``requests.Session`` per process keeps TCP/TLS connections alive between
+fetches, so only the first request to a host pays for DNS, the TCP handshake
+and the TLS handshake. The session's urllib3 pool is thread-safe and bounded,
+so batch fetch threads share connections instead of opening their own.
+Transient failures (connection errors, 429 and 5xx) are retried with
+jittered exponential backoff, honoring ``Retry-After``.
+
+Conditional GET: ``get_conditional`` remembers the ``ETag`` and
+``Last-Modified`` validators of each resource together with its parsed
+result, and revalidates with ``If-None-Match`` / ``If-Modified-Since``. On a
+``304 Not Modified`` the previous result is reused, skipping both the body
+download and parsing.
+
+Single responsibility: Pooled, retrying HTTP transport for upstream fetchers.
+"""
+
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import (
+    HTTP_CONDITIONAL_CACHE_MAX_ENTRIES,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_BACKOFF_FACTOR,
+    HTTP_RETRY_BACKOFF_JITTER,
+    HTTP_RETRY_STATUSES,
+    HTTP_RETRY_TOTAL,
+    HTTP_USER_AGENT,
+    NEWS_REQUEST_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+T = TypeVar('T')
+
+HTTP_NOT_MODIFIED = 304
+
+
+class ConditionalCache:
+    """
+    Bounded LRU of validators and parsed results for conditional GETs.
+
+    Entries only exist for responses that carried an ``ETag`` or
+    ``Last-Modified`` header. Reused results are deep-copied, so callers may
+    mutate what they get back.
+
+    Examples:
+        >>> validators = ConditionalCache(max_entries=256)
+        >>> articles, not_modified = client.get_conditional(url, parse, validators)
+    """
+
+    def __init__(self, max_entries: int = HTTP_CONDITIONAL_CACHE_MAX_ENTRIES):
+        """
+        Initialize ConditionalCache.
+
+        Args:
+            max_entries: Maximum number of resources remembered (LRU)
+        """
+        self._max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[Dict[str, str], Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def request_headers(self, key: str) -> Dict[str, str]:
+        """
+        Get the conditional request headers for a resource.
+
+        Args:
+            key: Resource key
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if unknown)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return dict(entry[0]) if entry else {}
+
+    def reuse(self, key: str) -> Optional[Any]:
+        """
+        Get a copy of the stored result after a 304, or None if unknown.
+
+        Args:
+            key: Resource key
+
+        Returns:
+            Deep copy of the result stored with the validators
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def store(self, key: str, response: requests.Response, value: Any) -> None:
+        """
+        Remember a response's validators with its parsed result.
+
+        Responses without validators, or results of None (nothing worth
+        reusing), drop any previous entry.
+
+        Args:
+            key: Resource key
+            response: 200 response carrying the validators
+            value: Result parsed from the response body
+        """
+        headers = {}
+        if response.headers.get('ETag'):
+            headers['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+
+        with self._lock:
+            if not headers or value is None:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (headers, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class HttpClient:
+    """
+    Pooled HTTP client with keep-alive and retries.
+
+    Attributes:
+        _session: Session holding the connection pools
+        _timeout: Default (connect, read) timeout in seconds
+
+    Examples:
+        >>> client = HttpClient()
+        >>> response = client.get('https://finnhub.io/api/v1/company-news', params={...})
+        >>> response.raise_for_status()
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = NEWS_REQUEST_TIMEOUT,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        retries: int = HTTP_RETRY_TOTAL,
+        backoff_factor: float = HTTP_RETRY_BACKOFF_FACTOR,
+        backoff_jitter: float = HTTP_RETRY_BACKOFF_JITTER,
+    ):
+        """
+        Initialize HttpClient.
+
+        Args:
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait between bytes of the response
+            pool_connections: Number of hosts with a cached connection pool
+            pool_maxsize: Maximum kept-alive connections per host
+            retries: Retries for connection errors and retryable statuses
+            backoff_factor: Base of the exponential backoff in seconds
+            backoff_jitter: Maximum random seconds added to each backoff
+        """
+        self._timeout = (connect_timeout, read_timeout)
+        self._session = self._build_session(
+            pool_connections, pool_maxsize, retries, backoff_factor, backoff_jitter
+        )
+
+    @staticmethod
+    def _build_session(
+        pool_connections: int,
+        pool_maxsize: int,
+        retries: int,
+        backoff_factor: float,
+        backoff_jitter: float
+    ) -> requests.Session:
+        """Create a session with bounded pools and a retry policy."""
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            respect_retry_after_header=True,
+            # Hand the final retryable response back instead of raising
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+            # Threads beyond pool_maxsize wait for a connection instead of opening extras
+            pool_block=True,
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['User-Agent'] = HTTP_USER_AGENT
+        return session
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Timeout] = None
+    ) -> requests.Response:
+        """
+        Send a GET request over the pooled session.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            headers: Optional extra request headers
+            timeout: Seconds, or (connect, read) seconds (default: the client's)
+
+        Returns:
+            Response (retryable errors exhausted their retries)
+
+        Raises:
+            requests.exceptions.RequestException: On connection failures or timeouts
+        """
+        return self._session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout if timeout is not None else self._timeout,
+        )
+
+    def get_conditional(
+        self,
+        url: str,
+        parse: Callable[[requests.Response], T],
+        validators: ConditionalCache,
+        params: Optional[Dict] = None,
+        timeout: Optional[Timeout] = None,
+        key: Optional[str] = None
+    ) -> Tuple[T, bool]:
+        """
+        GET a resource, revalidating the previous result when possible.
+
+        Args:
+            url: Request URL
+            parse: Turns a 200 response into the result to return and remember
+            validators: Cache of validators and results for this caller
+            params: Optional query parameters
+            timeout: Seconds, or (connect, read) seconds (default: the client's)
+            key: Resource key (default: the URL); pass one to keep secrets
+                such as API tokens in ``params`` out of the cache
+
+        Returns:
+            Tuple of (result, True if reused after 304 Not Modified)
+
+        Raises:
+            requests.exceptions.RequestException: On failures and error statuses
+        """
+        key = key or url
+        response = self.get(
+            url,
+            params=params,
+            headers=validators.request_headers(key) or None,
+            timeout=timeout,
+        )
+
+        if response.status_code == HTTP_NOT_MODIFIED:
+            value = validators.reuse(key)
+            if value is not None:
+                return value, True
+            # Lost the stored result (evicted meanwhile); fetch unconditionally
+            response = self.get(url, params=params, timeout=timeout)
+
+        response.raise_for_status()
+        value = parse(response)
+        validators.store(key, response, value)
+        return value, False
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the process-wide HttpClient, creating it on first use.
+
+    A client inherited across ``fork()`` (e.g. gunicorn ``--preload``) is
+    replaced, so workers never share sockets with their parent. Timeouts can
+    be overridden with HTTP_CONNECT_TIMEOUT and HTTP_READ_TIMEOUT.
+
+    Returns:
+        Shared HttpClient instance
+    """
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                _client = HttpClient(
+                    connect_timeout=float(os.getenv('HTTP_CONNECT_TIMEOUT', HTTP_CONNECT_TIMEOUT)),
+                    read_timeout=float(os.getenv('HTTP_READ_TIMEOUT', NEWS_REQUEST_TIMEOUT)),
+                )
+                _client_pid = pid
+    return _client
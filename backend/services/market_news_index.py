@@ -0,0 +1,289 @@
+"""
+Market News Index
+
+Answers per-symbol news queries from Finnhub's market-wide news feed
+instead of one ``/company-news`` call per symbol. The feed is pulled in
+bulk at most once per ``refresh_interval`` (incrementally, with ``minId``),
+and every article is indexed under the symbols it mentions:
+
+- the tickers in Finnhub's ``related`` field
+- tickers (``AAPL``, ``$AAPL``) and company names (``Apple``) found in the
+  headline or summary, for the symbols in CompanyNameService plus any
+  symbol that has been queried
+
+Upstream calls therefore grow with time, not with the number of symbols
+watched. Articles expire with the news time window.
+
+Single responsibility: Index market-wide news by the symbols it mentions.
+"""
+
+import logging
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+from constants import (
+    NEWS_MARKET_CATEGORIES,
+    NEWS_MARKET_MAX_ARTICLES,
+    NEWS_MARKET_REFRESH_SECONDS,
+    NEWS_TIME_WINDOW_HOURS,
+)
+
+from .company_name_service import CompanyNameService
+from .finnhub_news_fetcher import FinnhubNewsFetcher
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolMatcher:
+    """
+    Finds the watched symbols mentioned in a piece of text.
+
+    Tickers match as whole upper-case words, optionally with a ``$``
+    prefix; company names match as whole words, case-sensitively (so
+    "Apple" matches but "apple" does not). Thread-safe.
+
+    Examples:
+        >>> matcher = SymbolMatcher({'AAPL': ['Apple']})
+        >>> matcher.match('Apple and $MSFT rally')
+        {'AAPL'}
+    """
+
+    def __init__(self, terms: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Initialize SymbolMatcher.
+
+        Args:
+            terms: Mapping of symbol to company names to match besides the ticker
+        """
+        self._terms: Dict[str, Set[str]] = {}
+        self._symbols: Set[str] = set()
+        self._pattern: Optional[Pattern] = None
+        self._lock = threading.Lock()
+        for symbol, names in (terms or {}).items():
+            self.add(symbol, names)
+
+    def add(self, symbol: str, names: Iterable[str] = ()) -> None:
+        """
+        Watch a symbol.
+
+        Args:
+            symbol: Ticker (e.g. 'AAPL')
+            names: Company names that also identify it
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            for term in (symbol, *names):
+                term = (term or '').strip()
+                if term:
+                    self._terms.setdefault(term, set()).add(symbol)
+            self._symbols.add(symbol)
+            self._pattern = None
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self._symbols
+
+    def match(self, text: str) -> Set[str]:
+        """
+        Get the watched symbols mentioned in a text.
+
+        Args:
+            text: Headline and/or summary
+
+        Returns:
+            Set of symbols
+        """
+        if not text:
+            return set()
+        with self._lock:
+            if not self._terms:
+                return set()
+            if self._pattern is None:
+                # Longest first, so "Meta Platforms" wins over "Meta"
+                alternation = '|'.join(
+                    re.escape(term) for term in sorted(self._terms, key=len, reverse=True)
+                )
+                self._pattern = re.compile(rf'(?<![\w$])\$?({alternation})(?!\w)')
+
+            symbols: Set[str] = set()
+            for term in self._pattern.findall(text):
+                symbols |= self._terms[term]
+            return symbols
+
+
+class MarketNewsIndex:
+    """
+    Per-symbol view over Finnhub market news.
+
+    Thread-safe; one refresh runs at a time, and callers arriving while it
+    runs wait for it instead of fetching again.
+
+    Examples:
+        >>> index = MarketNewsIndex()
+        >>> articles = index.articles_for('AAPL')
+    """
+
+    def __init__(
+        self,
+        fetcher: Optional[FinnhubNewsFetcher] = None,
+        name_service: Optional[CompanyNameService] = None,
+        refresh_interval: float = NEWS_MARKET_REFRESH_SECONDS,
+        categories: Tuple[str, ...] = NEWS_MARKET_CATEGORIES,
+        window_hours: int = NEWS_TIME_WINDOW_HOURS,
+        max_articles: int = NEWS_MARKET_MAX_ARTICLES,
+        us_symbol: Callable[[str], bool] = lambda symbol: '.' not in symbol,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize MarketNewsIndex.
+
+        Args:
+            fetcher: Finnhub fetcher providing fetch_market_news
+            name_service: Source of company names for the matcher
+            refresh_interval: Minimum seconds between upstream pulls
+            categories: Finnhub news categories to ingest
+            window_hours: Articles older than this are dropped
+            max_articles: Most articles kept (oldest dropped first)
+            us_symbol: Selects the mapped symbols whose names are matched
+            clock: Time source (injectable for tests)
+        """
+        self._fetcher = fetcher or FinnhubNewsFetcher()
+        self._name_service = name_service or CompanyNameService()
+        self._refresh_interval = refresh_interval
+        self._categories = categories
+        self._window = window_hours * 3600
+        self._max_articles = max_articles
+        self._us_symbol = us_symbol
+        self._clock = clock
+
+        self._articles: Dict[str, Dict] = {}
+        self._symbols_by_article: Dict[str, Set[str]] = {}
+        self._min_ids: Dict[str, int] = {}
+        self._matcher: Optional[SymbolMatcher] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def articles_for(self, symbol: str) -> List[Dict]:
+        """
+        Get the indexed articles mentioning a symbol.
+
+        Refreshes the index first when it is older than the refresh
+        interval, and starts watching symbols seen for the first time
+        (matching them against the articles already held).
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Articles in unified format, in no particular order (NewsService
+            filters and sorts them)
+        """
+        symbol = symbol.upper()
+        self.refresh_if_stale()
+        self._watch(symbol)
+
+        cutoff = self._clock() - self._window
+        with self._lock:
+            return [
+                self._articles[article_id]
+                for article_id, symbols in self._symbols_by_article.items()
+                if symbol in symbols
+                and (self._articles[article_id].get('published_ts') or 0) >= cutoff
+            ]
+
+    def refresh_if_stale(self) -> bool:
+        """
+        Pull new market news if the last pull is older than the interval.
+
+        Returns:
+            True if this call pulled from upstream
+        """
+        if not self._stale():
+            return False
+        with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            if not self._stale():
+                return False
+            self.refresh()
+            return True
+
+    def refresh(self) -> int:
+        """
+        Pull new market news now and index it.
+
+        Returns:
+            Number of articles added
+        """
+        matcher = self._get_matcher()
+        added = 0
+        for category in self._categories:
+            tagged = self._fetcher.fetch_market_news(category, min_id=self._min_ids.get(category, 0))
+            with self._lock:
+                for article, related in tagged:
+                    if article['id'] in self._articles:
+                        continue
+                    text = f"{article.get('headline') or ''}\n{article.get('summary') or ''}"
+                    self._articles[article['id']] = article
+                    self._symbols_by_article[article['id']] = set(related) | matcher.match(text)
+                    added += 1
+                upstream_ids = [
+                    int(article['id'].split('_', 1)[1]) for article, _ in tagged
+                    if article['id'].split('_', 1)[1].isdigit()
+                ]
+                if upstream_ids:
+                    self._min_ids[category] = max(self._min_ids.get(category, 0), *upstream_ids)
+
+        with self._lock:
+            self._expire()
+            self._refreshed_at = self._clock()
+        logger.info(f"Market news index added {added} articles ({len(self._articles)} held)")
+        return added
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def _stale(self) -> bool:
+        return self._refreshed_at is None or self._clock() - self._refreshed_at >= self._refresh_interval
+
+    def _get_matcher(self) -> SymbolMatcher:
+        """Get the matcher, building it from CompanyNameService on first use."""
+        with self._lock:
+            if self._matcher is None:
+                names = {
+                    symbol: [self._name_service.get_company_name(symbol).get('en-US')]
+                    for symbol in self._name_service.get_all_mapped_symbols()
+                    if self._us_symbol(symbol)
+                }
+                self._matcher = SymbolMatcher({s: [n for n in ns if n] for s, ns in names.items()})
+            return self._matcher
+
+    def _watch(self, symbol: str) -> None:
+        """Add a queried symbol to the matcher and tag the articles already held."""
+        matcher = self._get_matcher()
+        solo = SymbolMatcher({symbol: []})
+        with self._lock:
+            if symbol in matcher:
+                return
+            matcher.add(symbol)
+            for article_id, article in self._articles.items():
+                text = f"{article.get('headline') or ''}\n{article.get('summary') or ''}"
+                if solo.match(text):
+                    self._symbols_by_article[article_id].add(symbol)
+
+    def _expire(self) -> None:
+        """Drop articles outside the window, then the oldest beyond the size bound."""
+        cutoff = self._clock() - self._window
+        keep = sorted(
+            (
+                (article.get('published_ts') or 0, article_id)
+                for article_id, article in self._articles.items()
+                if (article.get('published_ts') or 0) >= cutoff
+            ),
+            reverse=True,
+        )[:self._max_articles]
+        kept = {article_id for _, article_id in keep}
+        for article_id in [a for a in self._articles if a not in kept]:
+            del self._articles[article_id]
+            del self._symbols_by_article[article_id]
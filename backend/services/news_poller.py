@@ -0,0 +1,253 @@
+"""
+News Poller
+
+Refreshes the news of recently requested symbols in the background, ahead
+of their cache expiry, and writes the results into the same ``news:{SYMBOL}``
+entries the news routes serve. Interactive reads then find a fresh entry
+instead of waiting on Finnhub or Google News.
+
+Symbols are tracked per worker when they are requested and dropped after
+``idle`` seconds without a request. Every ``interval`` seconds the poller
+reads the tracked entries in one cache call and refreshes those missing or
+within ``lead`` seconds of expiry, soonest first, up to a per-source budget
+per cycle. Refreshes go through NewsService.get_news_batch, so they stay
+within each source's concurrency budget and the Google News pacing
+scheduler. With a shared (Redis) cache, an entry refreshed by one worker
+is fresh for all others, so workers tracking the same symbol do not
+refresh it twice.
+
+Single responsibility: Keep cached news for active symbols fresh.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from flask import jsonify
+
+from constants import (
+    NEWS_CACHE_TIMEOUT,
+    NEWS_POLLER_IDLE_SECONDS,
+    NEWS_POLLER_INTERVAL_SECONDS,
+    NEWS_POLLER_LEAD_SECONDS,
+    NEWS_POLLER_MAX_SYMBOLS,
+    NEWS_POLLER_REFRESH_BUDGET,
+)
+from utils.cache import cache
+from utils.cache_keys import CacheKeyBuilder
+from utils.metrics import registry
+from utils.response_cache import is_valid_payload, store_responses
+
+from .news_service import NewsService
+
+logger = logging.getLogger(__name__)
+
+# Poller of this process (None unless enabled by init_news_poller)
+_poller: Optional['NewsPoller'] = None
+
+
+class NewsPoller:
+    """
+    Background refresher for the news cache of active symbols.
+
+    Examples:
+        >>> poller = NewsPoller(app, get_news_service)
+        >>> poller.record(['AAPL', '2330.TW'])
+        >>> poller.poll_once()
+    """
+
+    def __init__(
+        self,
+        app,
+        news_service_provider: Callable[[], NewsService],
+        interval: float = NEWS_POLLER_INTERVAL_SECONDS,
+        lead: float = NEWS_POLLER_LEAD_SECONDS,
+        idle: float = NEWS_POLLER_IDLE_SECONDS,
+        max_symbols: int = NEWS_POLLER_MAX_SYMBOLS,
+        budget: Optional[Dict[str, int]] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize NewsPoller.
+
+        Args:
+            app: Flask application (for cache access outside requests)
+            news_service_provider: Returns the NewsService used by the routes
+            interval: Seconds between polling cycles
+            lead: Refresh entries expiring within this many seconds
+            idle: Stop tracking symbols not requested for this many seconds
+            max_symbols: Most symbols tracked (least recently requested dropped)
+            budget: Most refreshes per source per cycle
+            clock: Time source (injectable for tests)
+        """
+        self._app = app
+        self._news_service_provider = news_service_provider
+        self.interval = interval
+        self._lead = lead
+        self._idle = idle
+        self._max_symbols = max_symbols
+        self._budget = budget or NEWS_POLLER_REFRESH_BUDGET
+        self._clock = clock
+        self._requested: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pid: Optional[int] = None
+
+    def record(self, symbols: List[str]) -> None:
+        """
+        Track symbols that were just requested.
+
+        Starts the polling thread on first use in each process (threads do
+        not survive a gunicorn fork).
+
+        Args:
+            symbols: Requested stock symbols
+        """
+        now = self._clock()
+        with self._lock:
+            for symbol in symbols:
+                symbol = symbol.upper()
+                self._requested.pop(symbol, None)
+                self._requested[symbol] = now
+            while len(self._requested) > self._max_symbols:
+                self._requested.popitem(last=False)
+        self._ensure_running()
+
+    def tracked(self) -> List[str]:
+        """Get the tracked symbols, dropping those idle for too long."""
+        cutoff = self._clock() - self._idle
+        with self._lock:
+            for symbol in [s for s, seen in self._requested.items() if seen < cutoff]:
+                del self._requested[symbol]
+            return list(self._requested)
+
+    def poll_once(self) -> int:
+        """
+        Run one polling cycle.
+
+        Returns:
+            Number of symbols refreshed
+        """
+        symbols = self.tracked()
+        if not symbols:
+            return 0
+
+        keys = {symbol: CacheKeyBuilder.build_news_key(symbol) for symbol in symbols}
+        due = self._due(keys)
+        if not due:
+            return 0
+
+        service = self._news_service_provider()
+        selected: List[str] = []
+        per_source: Dict[str, int] = {}
+        for symbol in due:
+            source = service.source_for_symbol(symbol)
+            if per_source.get(source, 0) < self._budget.get(source, 0):
+                per_source[source] = per_source.get(source, 0) + 1
+                selected.append(symbol)
+        if not selected:
+            return 0
+
+        results = service.get_news_batch(selected)
+        with self._app.app_context():
+            store_responses(
+                {keys[symbol]: jsonify(result) for symbol, result in results.items()},
+                timeout=NEWS_CACHE_TIMEOUT,
+            )
+
+        for source, count in per_source.items():
+            registry.inc('news_poller_refreshes_total', {'source': source}, count)
+        if len(selected) < len(due):
+            registry.inc('news_poller_deferred_total', None, len(due) - len(selected))
+        logger.info(
+            f"News poller refreshed {len(selected)} of {len(due)} due symbols "
+            f"({', '.join(f'{source}={count}' for source, count in per_source.items())})"
+        )
+        return len(selected)
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+
+    def _due(self, keys: Dict[str, str]) -> List[str]:
+        """Get the symbols whose entries are missing or about to expire, soonest first."""
+        with self._app.app_context():
+            try:
+                values = cache.get_many(*keys.values())
+            except Exception as e:
+                logger.warning(f"News poller cache read failed: {e}")
+                return []
+
+        horizon = self._clock() + self._lead
+        due = []
+        for symbol, payload in zip(keys, values):
+            if not is_valid_payload(payload):
+                due.append((0.0, symbol))
+            elif payload['expires_at'] is not None and payload['expires_at'] <= horizon:
+                due.append((payload['expires_at'], symbol))
+        return [symbol for _, symbol in sorted(due)]
+
+    def _ensure_running(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+        threading.Thread(target=self._run, name='news-poller', daemon=True).start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"News poller cycle failed: {e}")
+
+
+def init_news_poller(app, news_service_provider: Callable[[], NewsService]) -> Optional[NewsPoller]:
+    """
+    Enable the background news poller when NEWS_POLLER_ENABLED is set.
+
+    Args:
+        app: Flask application instance (cache already initialized)
+        news_service_provider: Returns the NewsService used by the routes
+
+    Returns:
+        The NewsPoller, or None when polling is disabled
+    """
+    global _poller
+    if _poller is not None:
+        _poller.stop()
+        _poller = None
+
+    if not app.config.get('NEWS_POLLER_ENABLED', False):
+        return None
+
+    _poller = NewsPoller(
+        app,
+        news_service_provider,
+        interval=app.config.get('NEWS_POLLER_INTERVAL', NEWS_POLLER_INTERVAL_SECONDS),
+        lead=app.config.get('NEWS_POLLER_LEAD', NEWS_POLLER_LEAD_SECONDS),
+    )
+    atexit.register(_poller.stop)
+    logger.info(
+        f"News poller enabled (every {_poller.interval}s, "
+        f"{app.config.get('NEWS_POLLER_LEAD', NEWS_POLLER_LEAD_SECONDS)}s before expiry)"
+    )
+    return _poller
+
+
+def record_news_request(symbols: List[str]) -> None:
+    """
+    Track requested symbols for background refresh (no-op when disabled).
+
+    Args:
+        symbols: Requested stock symbols
+    """
+    if _poller is not None:
+        _poller.record(symbols)
@@ -8,17 +8,39 @@ Single responsibility: Coordinate news fetching across different sources.
 """
 
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
-from constants import NEWS_DATE_FORMAT, NEWS_TIME_WINDOW_HOURS
+from constants import (
+    NEWS_DATE_FORMAT,
+    NEWS_INGESTION_MODE_MARKET,
+    NEWS_INGESTION_MODE_SYMBOL,
+    NEWS_SOURCE_CONCURRENCY,
+    NEWS_SOURCE_FINNHUB,
+    NEWS_SOURCE_GOOGLE,
+    NEWS_TIME_WINDOW_HOURS,
+)
+from utils.metrics import instrument_task
+from utils.news_dedup import collapse_duplicates
+from utils.server_timing import stage
 
 from .company_name_service import CompanyNameService
 from .finnhub_news_fetcher import FinnhubNewsFetcher
 from .google_news_fetcher import GoogleNewsFetcher
+from .market_news_index import MarketNewsIndex
+from .news_store import NewsStore, timestamp_from_news_date
 
 logger = logging.getLogger(__name__)
 
+# Google News locale (hl, gl, lang_key) by symbol suffix; other symbols use Finnhub
+GOOGLE_NEWS_LOCALES = (
+    (('.TW', '.TWO'), ('zh-TW', 'TW', 'zh-TW')),
+    (('.HK',), ('zh-TW', 'HK', 'zh-TW')),
+    (('.T',), ('en', 'JP', 'en-US')),
+)
+
 
 class NewsService:
     """
@@ -28,32 +50,55 @@ class NewsService:
     - .TW / .TWO suffix -> Google News (zh-TW, gl=TW)
     - .HK suffix -> Google News (zh-TW, gl=HK)
     - .T suffix -> Google News (en, gl=JP)
-    - Everything else -> Finnhub API
+    - Everything else -> Finnhub API (per-symbol /company-news, or, with
+      NEWS_INGESTION_MODE=market, the locally indexed market news feed)
 
-    Supports dependency injection for testing.
+    Each fetch is merged into the symbol's NewsStore window, so articles
+    keep their stable IDs across refreshes and a failed fetch still
+    returns the articles already held. Near-duplicate articles (the same
+    story syndicated by several outlets) are collapsed into one with a
+    ``duplicates`` count. Supports dependency injection for testing.
 
     Examples:
         >>> service = NewsService()
         >>> result = service.get_news('AAPL')
         >>> result = service.get_news('2330.TW')
+        >>> results = service.get_news_batch(['AAPL', '2330.TW'])
     """
 
     def __init__(
         self,
         finnhub_fetcher: Optional[FinnhubNewsFetcher] = None,
         google_fetcher: Optional[GoogleNewsFetcher] = None,
-        name_service: Optional[CompanyNameService] = None
+        name_service: Optional[CompanyNameService] = None,
+        source_concurrency: Optional[Dict[str, int]] = None,
+        news_store: Optional[NewsStore] = None,
+        market_index: Optional[MarketNewsIndex] = None,
+        ingestion_mode: str = NEWS_INGESTION_MODE_SYMBOL
     ):
         self._finnhub_fetcher = finnhub_fetcher or FinnhubNewsFetcher()
         self._google_fetcher = google_fetcher or GoogleNewsFetcher()
         self._name_service = name_service or CompanyNameService()
+        self._source_concurrency = source_concurrency or NEWS_SOURCE_CONCURRENCY
+        self._store = news_store or NewsStore()
+
+        if ingestion_mode not in (NEWS_INGESTION_MODE_SYMBOL, NEWS_INGESTION_MODE_MARKET):
+            logger.warning(f"Unknown NEWS_INGESTION_MODE '{ingestion_mode}', using per-symbol fetches")
+        if market_index is None and ingestion_mode == NEWS_INGESTION_MODE_MARKET:
+            market_index = MarketNewsIndex(
+                fetcher=self._finnhub_fetcher,
+                name_service=self._name_service,
+                us_symbol=self.is_us_stock,
+            )
+        self._market_index = market_index
 
     def get_news(self, symbol: str) -> Dict:
         """
         Fetch news for a given stock symbol.
 
-        Routes to the appropriate fetcher based on symbol suffix,
-        returns all articles from the past 72 hours sorted by date.
+        Routes to the appropriate fetcher based on symbol suffix, merges
+        the new articles into the symbol's window and returns all articles
+        from the past 72 hours sorted by date, one per story.
 
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL', '2330.TW')
@@ -64,8 +109,14 @@ class NewsService:
         symbol = symbol.upper()
 
         try:
-            articles = self._fetch_from_source(symbol)
-            articles = self._sort_and_filter(articles)
+            with stage('fetch_news'):
+                articles = self._fetch_from_source(symbol)
+            with stage('sort_and_filter'):
+                articles = self._sort_and_filter(articles)
+            with stage('merge_news'):
+                articles = self._store.merge(symbol, articles)
+            with stage('dedup_news'):
+                articles = collapse_duplicates(articles)
 
             return {
                 'symbol': symbol,
@@ -76,23 +127,89 @@ class NewsService:
 
         except Exception as e:
             logger.error(f"Error fetching news for {symbol}: {str(e)}")
+            articles = collapse_duplicates(self._store.window(symbol))
             return {
                 'symbol': symbol,
-                'news': [],
-                'total': 0,
+                'news': articles,
+                'total': len(articles),
                 'cached_at': datetime.now(timezone.utc).strftime(NEWS_DATE_FORMAT)
             }
 
+    def get_news_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch news for several symbols concurrently.
+
+        Symbols are grouped by the source _fetch_from_source routes them to,
+        and each source gets its own pool sized by its concurrency budget,
+        so a slow source never holds up the other and no source sees more
+        than its budget of parallel requests.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Mapping of uppercased symbol to the get_news result, in input order
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        groups: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            groups.setdefault(self.source_for_symbol(symbol), []).append(symbol)
+
+        results = {}
+        executors = []
+        try:
+            future_to_symbol = {}
+            for source, group in groups.items():
+                workers = max(1, min(self._source_concurrency.get(source, 1), len(group)))
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'news-{source}')
+                executors.append(executor)
+                for symbol in group:
+                    task = instrument_task(self.get_news, pool='news_batch')
+                    future_to_symbol[executor.submit(task, symbol)] = symbol
+
+            for future in as_completed(future_to_symbol):
+                results[future_to_symbol[future]] = future.result()
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+        logger.info(
+            f"Fetched news for {len(symbols)} symbols from "
+            f"{', '.join(f'{source}={len(group)}' for source, group in groups.items())}"
+        )
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def source_for_symbol(self, symbol: str) -> str:
+        """
+        Get the news source a symbol is routed to.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            NEWS_SOURCE_GOOGLE or NEWS_SOURCE_FINNHUB
+        """
+        if self._google_locale(symbol.upper()) is not None:
+            return NEWS_SOURCE_GOOGLE
+        return NEWS_SOURCE_FINNHUB
+
     def _fetch_from_source(self, symbol: str) -> list:
         """Route to the correct fetcher based on symbol suffix."""
-        if symbol.endswith('.TW') or symbol.endswith('.TWO'):
-            return self._fetch_google_news(symbol, hl='zh-TW', gl='TW', lang_key='zh-TW')
-        elif symbol.endswith('.HK'):
-            return self._fetch_google_news(symbol, hl='zh-TW', gl='HK', lang_key='zh-TW')
-        elif symbol.endswith('.T'):
-            return self._fetch_google_news(symbol, hl='en', gl='JP', lang_key='en-US')
-        else:
-            return self._finnhub_fetcher.fetch(symbol)
+        locale = self._google_locale(symbol)
+        if locale is not None:
+            hl, gl, lang_key = locale
+            return self._fetch_google_news(symbol, hl=hl, gl=gl, lang_key=lang_key)
+        if self._market_index is not None:
+            return self._market_index.articles_for(symbol)
+        return self._finnhub_fetcher.fetch(symbol)
+
+    @staticmethod
+    def _google_locale(symbol: str) -> Optional[Tuple[str, str, str]]:
+        """Get the Google News (hl, gl, lang_key) for a symbol, or None for Finnhub."""
+        for suffixes, locale in GOOGLE_NEWS_LOCALES:
+            if symbol.endswith(suffixes):
+                return locale
+        return None
 
     def _fetch_google_news(
         self,
@@ -131,34 +248,30 @@ class NewsService:
 
     @staticmethod
     def _sort_and_filter(articles: list) -> list:
-        """Sort by date descending and filter to 72h window in a single pass.
+        """Sort by date descending and filter to the 72h window on epoch seconds.
 
-        Parses each article's published_at once, keeps articles within the
-        time window (plus any with unparseable dates), then returns sorted.
+        Fetchers attach ``published_ts`` when they format ``published_at``,
+        so no dates are parsed here; articles without it (from other
+        producers) get it from ``published_at`` once. Articles with no
+        usable date are dropped.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=NEWS_TIME_WINDOW_HOURS)
+        cutoff = int(time.time()) - NEWS_TIME_WINDOW_HOURS * 3600
         dated_articles = []
 
         for article in articles:
-            try:
-                dt = datetime.strptime(
-                    article.get('published_at', ''), NEWS_DATE_FORMAT
-                ).replace(tzinfo=timezone.utc)
-                if dt >= cutoff:
-                    dated_articles.append((dt, article))
-            except (ValueError, TypeError):
-                continue
-
-        dated_articles.sort(key=lambda x: x[0], reverse=True)
-        return [article for _, article in dated_articles]
+            published_ts = article.get('published_ts')
+            if published_ts is None:
+                published_ts = timestamp_from_news_date(article.get('published_at', ''))
+                if published_ts is None:
+                    continue
+                article = {**article, 'published_ts': published_ts}
+            if published_ts >= cutoff:
+                dated_articles.append(article)
+
+        dated_articles.sort(key=lambda a: a['published_ts'], reverse=True)
+        return dated_articles
 
     @staticmethod
     def is_us_stock(symbol: str) -> bool:
         """Check if a symbol represents a US stock."""
-        upper = symbol.upper()
-        return not (
-            upper.endswith('.TW') or
-            upper.endswith('.TWO') or
-            upper.endswith('.HK') or
-            upper.endswith('.T')
-        )
+        return NewsService._google_locale(symbol.upper()) is None
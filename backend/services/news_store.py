@@ -0,0 +1,152 @@
+"""
+News Store
+
+Keeps a merged news window per symbol. Each refresh adds only the articles
+whose (stable) IDs are not already held, and articles published before the
+time window expire, so a story dropped by the upstream feed stays visible
+for as long as it is recent. Windows are per worker and bounded to the most
+recently refreshed symbols.
+
+Single responsibility: Merge news refreshes into per-symbol article windows.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from constants import NEWS_DATE_FORMAT, NEWS_STORE_MAX_SYMBOLS, NEWS_TIME_WINDOW_HOURS
+
+logger = logging.getLogger(__name__)
+
+
+class NewsStore:
+    """
+    Per-symbol news windows merged across refreshes.
+
+    Articles are ordered newest first by their ``published_ts`` epoch
+    seconds, which NewsService attaches before merging.
+
+    Examples:
+        >>> store = NewsStore()
+        >>> window = store.merge('AAPL', articles)
+        >>> newer = articles_since(window, 'finnhub_123')
+    """
+
+    def __init__(
+        self,
+        window_hours: int = NEWS_TIME_WINDOW_HOURS,
+        max_symbols: int = NEWS_STORE_MAX_SYMBOLS
+    ):
+        self._window = window_hours * 3600
+        self._max_symbols = max_symbols
+        self._windows: 'OrderedDict[str, Dict[str, Dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def merge(self, symbol: str, articles: List[Dict]) -> List[Dict]:
+        """
+        Merge freshly fetched articles into a symbol's window.
+
+        Articles already in the window are kept as first seen; expired
+        articles are dropped.
+
+        Args:
+            symbol: Stock ticker symbol
+            articles: Articles from the latest fetch
+
+        Returns:
+            The symbol's window, newest first
+        """
+        cutoff = self._cutoff()
+        with self._lock:
+            window = self._windows.pop(symbol, {})
+            added = 0
+            for article in articles:
+                if article['id'] not in window:
+                    window[article['id']] = article
+                    added += 1
+            window = {
+                article_id: article for article_id, article in window.items()
+                if article.get('published_ts', 0) >= cutoff
+            }
+            self._windows[symbol] = window
+            while len(self._windows) > self._max_symbols:
+                self._windows.popitem(last=False)
+
+        logger.debug(f"Merged {added} new articles for {symbol} ({len(window)} in window)")
+        return _ordered(window.values())
+
+    def window(self, symbol: str) -> List[Dict]:
+        """
+        Get a symbol's current window without merging.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Unexpired articles, newest first (empty if the symbol is unknown)
+        """
+        cutoff = self._cutoff()
+        with self._lock:
+            articles = list(self._windows.get(symbol, {}).values())
+        return _ordered(a for a in articles if a.get('published_ts', 0) >= cutoff)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def _cutoff(self) -> int:
+        return int(time.time() - self._window)
+
+
+def articles_since(articles: List[Dict], since_id: str) -> Optional[List[Dict]]:
+    """
+    Get the articles ahead of a last-seen article.
+
+    Args:
+        articles: Window ordered newest first
+        since_id: ID of the newest article the client already has
+
+    Returns:
+        Articles listed before ``since_id`` (newest first), or None if
+        ``since_id`` is not in the window (expired or never served)
+
+    Examples:
+        >>> articles_since([{'id': 'b'}, {'id': 'a'}], 'a')
+        [{'id': 'b'}]
+    """
+    for index, article in enumerate(articles):
+        if article.get('id') == since_id:
+            return articles[:index]
+    return None
+
+
+def timestamp_from_news_date(published_at: str) -> Optional[int]:
+    """
+    Parse a ``published_at`` string (NEWS_DATE_FORMAT, UTC) into epoch seconds.
+
+    Args:
+        published_at: Formatted publish time
+
+    Returns:
+        Epoch seconds, or None if the string does not match the format
+
+    Examples:
+        >>> timestamp_from_news_date('2026-02-09T10:00:00Z')
+        1770631200
+    """
+    try:
+        return int(
+            datetime.strptime(published_at, NEWS_DATE_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _ordered(articles) -> List[Dict]:
+    return sorted(
+        articles,
+        key=lambda a: (a.get('published_ts', 0), a.get('id', '')),
+        reverse=True
+    )
@@ -10,6 +10,7 @@ import logging
 from typing import Optional, Dict, Any
 
 from constants import FALLBACK_PERIOD
+from utils.metrics import PROVIDER_YFINANCE_HISTORY, PROVIDER_YFINANCE_INFO, track_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -63,11 +64,13 @@ class StockDataFetcher:
         """
         logger.debug(f"Fetching history for {symbol} from {start_date} to {end_date}")
 
-        hist = ticker.history(start=start_date, end=end_date)
+        with track_upstream(PROVIDER_YFINANCE_HISTORY):
+            hist = ticker.history(start=start_date, end=end_date)
 
         if hist.empty:
             logger.warning(f"No data returned for {symbol}, trying with period instead")
-            hist = ticker.history(period=FALLBACK_PERIOD)
+            with track_upstream(PROVIDER_YFINANCE_HISTORY):
+                hist = ticker.history(period=FALLBACK_PERIOD)
 
         if hist.empty:
             raise ValueError(
@@ -94,7 +97,8 @@ class StockDataFetcher:
             Ticker info dict or None if error occurs
         """
         try:
-            return ticker.info
+            with track_upstream(PROVIDER_YFINANCE_INFO):
+                return ticker.info
         except Exception as e:
             logger.warning(f"Could not fetch ticker info for {symbol}: {str(e)}")
             return None
@@ -15,6 +15,10 @@ from .stock_data_transformer import StockDataTransformer
 from .price_calculator import PriceCalculator
 from .company_name_service import CompanyNameService
 from .batch_processing_service import BatchProcessingService
+from utils.cache_keys import CacheKeyBuilder
+from utils.fragment_cache import FragmentCache
+from utils.json_fragments import encode_fragment
+from utils.server_timing import stage
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +51,8 @@ class StockService:
         transformer: Optional[StockDataTransformer] = None,
         calculator: Optional[PriceCalculator] = None,
         name_service: Optional[CompanyNameService] = None,
-        batch_service: Optional[BatchProcessingService] = None
+        batch_service: Optional[BatchProcessingService] = None,
+        fragment_cache: Optional[FragmentCache] = None
     ):
         """
         Initialize StockService with optional dependencies.
@@ -58,13 +63,17 @@ class StockService:
             calculator: Price calculator service (default: new instance)
             name_service: Company name service (default: new instance)
             batch_service: Batch processing service (default: new instance)
+            fragment_cache: Per-symbol JSON fragment cache (default: new instance)
         """
         self._fetcher = fetcher or StockDataFetcher()
         self._transformer = transformer or StockDataTransformer()
         self._calculator = calculator or PriceCalculator()
         self._name_service = name_service or CompanyNameService()
+        self._fragment_cache = fragment_cache or FragmentCache()
         # Initialize batch processing service (inject self for single stock fetches)
-        self._batch_service = batch_service or BatchProcessingService(self)
+        self._batch_service = batch_service or BatchProcessingService(
+            self, fragment_cache=self._fragment_cache
+        )
 
     def get_stock_data(self, symbol: str, start_date: str, end_date: str) -> Dict:
         """
@@ -104,24 +113,29 @@ class StockService:
 
             # Step 1: Create ticker and fetch raw data
             ticker = self._fetcher.create_ticker(symbol)
-            hist = self._fetcher.fetch_history(ticker, symbol, start_date, end_date)
+            with stage('fetch_history'):
+                hist = self._fetcher.fetch_history(ticker, symbol, start_date, end_date)
 
             # Step 2: Get ticker info for company name lookup
-            ticker_info = self._fetcher.fetch_ticker_info(ticker, symbol)
+            with stage('fetch_ticker_info'):
+                ticker_info = self._fetcher.fetch_ticker_info(ticker, symbol)
 
             # Step 3: Transform historical data to data points
-            data_points = self._transformer.convert_to_data_points(hist, symbol)
+            with stage('convert_to_data_points'):
+                data_points = self._transformer.convert_to_data_points(hist, symbol)
 
             # Step 4: Calculate price information
-            current_price, change, change_percent = self._calculator.calculate_price_info(
-                data_points
-            )
+            with stage('calculate_price_info'):
+                current_price, change, change_percent = self._calculator.calculate_price_info(
+                    data_points
+                )
 
             # Step 5: Get company name
-            company_name = self._name_service.get_company_name(
-                symbol.upper(),
-                ticker_info
-            )
+            with stage('company_name'):
+                company_name = self._name_service.get_company_name(
+                    symbol.upper(),
+                    ticker_info
+                )
 
             # Build response
             result = {
@@ -143,6 +157,38 @@ class StockService:
             logger.error(f"Error fetching stock data for {symbol}: {str(e)}")
             raise ValueError(f"Failed to fetch stock data for {symbol}: {str(e)}")
 
+    def get_stock_data_encoded(self, symbol: str, start_date: str, end_date: str) -> bytes:
+        """
+        Fetch stock data as a pre-encoded JSON fragment.
+
+        Reuses the per-symbol fragment shared with the batch endpoints, so a
+        symbol already fetched by a batch request is served without any
+        fetching or encoding. A freshly fetched result is not written back
+        as a fragment: the /stock-data route caches the same bytes as its
+        response payload, and a second copy would only double the memory
+        each single-stock entry uses.
+
+        Args:
+            symbol: Stock ticker symbol (e.g., 'AAPL', 'GOOGL')
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+
+        Returns:
+            UTF-8 JSON bytes of the get_stock_data result
+
+        Raises:
+            ValueError: If stock data cannot be fetched or symbol is invalid
+        """
+        key = CacheKeyBuilder.build_stock_fragment_key(symbol, start_date, end_date)
+        with stage('cache_lookup'):
+            cached = self._fragment_cache.get_many([key])
+        if key in cached:
+            return cached[key]
+
+        data = self.get_stock_data(symbol, start_date, end_date)
+        with stage('serialize'):
+            return encode_fragment(data)
+
     def get_batch_stocks(
         self,
         symbols: List[str],
@@ -230,6 +276,66 @@ class StockService:
             max_workers=max_workers
         )
 
+    def get_batch_stocks_encoded(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> bytes:
+        """
+        Fetch data for multiple stocks as an encoded JSON response body.
+
+        Delegates to BatchProcessingService, which splices cached per-symbol
+        fragments instead of re-serializing every stock.
+
+        Args:
+            symbols: List of stock ticker symbols (max 18 per request)
+            start_date: Optional start date in YYYY-MM-DD format
+            end_date: Optional end date in YYYY-MM-DD format
+
+        Returns:
+            UTF-8 JSON bytes with the same shape as get_batch_stocks
+
+        Raises:
+            ValueError: If batch data cannot be fetched
+        """
+        return self._batch_service.process_batch_sequential_encoded(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    def get_batch_stocks_parallel_encoded(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_workers: int = 5
+    ) -> bytes:
+        """
+        Fetch data for multiple stocks in parallel as an encoded JSON body.
+
+        Delegates to BatchProcessingService; only uncached symbols are fetched.
+
+        Args:
+            symbols: List of stock ticker symbols (max 18 per request)
+            start_date: Optional start date in YYYY-MM-DD format
+            end_date: Optional end date in YYYY-MM-DD format
+            max_workers: Maximum number of parallel workers (default: 5)
+
+        Returns:
+            UTF-8 JSON bytes with the same shape as get_batch_stocks_parallel
+
+        Raises:
+            ValueError: If batch data cannot be fetched
+        """
+        return self._batch_service.process_batch_parallel_encoded(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            max_workers=max_workers
+        )
+
     # Backward compatibility methods (deprecated but maintained)
     def get_company_name(self, symbol: str, ticker_info: Dict = None) -> Dict[str, str]:
         """
@@ -0,0 +1,217 @@
+"""
+Tests for Admin Routes
+
+Tests cover:
+- Admin token enforcement (disabled, missing, wrong, valid)
+- Cache purge by symbol, family and prefix
+- Request validation
+- Background sampling profiles (start, progress, downloads)
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from utils.sampling_profiler import SamplingProfiler
+
+TOKEN = 'test-admin-token'
+
+
+@pytest.fixture
+def admin_app(app):
+    """App with an admin token configured."""
+    app.config['ADMIN_API_TOKEN'] = TOKEN
+    yield app
+    app.config['ADMIN_API_TOKEN'] = ''
+
+
+def _auth(token=TOKEN):
+    return {'Authorization': f'Bearer {token}'}
+
+
+class TestAdminAuth:
+    """Tests for admin token enforcement"""
+
+    def test_disabled_without_token(self, client, app):
+        """should answer 404 when no admin token is configured"""
+        app.config['ADMIN_API_TOKEN'] = ''
+        response = client.post('/api/v1/admin/cache/purge', json={'symbol': 'AAPL'}, headers=_auth())
+        assert response.status_code == 404
+
+    def test_missing_token_rejected(self, admin_app):
+        """should answer 401 without an Authorization header"""
+        response = admin_app.test_client().post('/api/v1/admin/cache/purge', json={'symbol': 'AAPL'})
+        assert response.status_code == 401
+
+    def test_wrong_token_rejected(self, admin_app):
+        """should answer 401 for a wrong token"""
+        response = admin_app.test_client().post(
+            '/api/v1/admin/cache/purge', json={'symbol': 'AAPL'}, headers=_auth('nope')
+        )
+        assert response.status_code == 401
+
+
+class TestCachePurge:
+    """Tests for POST /api/v1/admin/cache/purge"""
+
+    @pytest.fixture
+    def client(self, admin_app):
+        return admin_app.test_client()
+
+    def test_purge_symbol(self, client):
+        """should purge by uppercased symbol"""
+        with patch('routes.admin_routes.tag_index') as mock_index:
+            mock_index.purge_symbol.return_value = 3
+            response = client.post('/api/v1/admin/cache/purge', json={'symbol': 'aapl'}, headers=_auth())
+
+        assert response.status_code == 200
+        assert response.get_json() == {'purged': 3, 'selector': 'symbol', 'value': 'AAPL'}
+        mock_index.purge_symbol.assert_called_once_with('AAPL')
+
+    def test_purge_family(self, client):
+        """should purge a key family"""
+        with patch('routes.admin_routes.tag_index') as mock_index:
+            mock_index.purge_family.return_value = 5
+            response = client.post('/api/v1/admin/cache/purge', json={'family': 'news'}, headers=_auth())
+
+        assert response.status_code == 200
+        assert response.get_json()['purged'] == 5
+        mock_index.purge_family.assert_called_once_with('news')
+
+    def test_purge_prefix(self, client):
+        """should purge by key prefix"""
+        with patch('routes.admin_routes.tag_index') as mock_index:
+            mock_index.purge_prefix.return_value = 1
+            response = client.post(
+                '/api/v1/admin/cache/purge', json={'prefix': 'stock_data:AAPL:'}, headers=_auth()
+            )
+
+        assert response.status_code == 200
+        mock_index.purge_prefix.assert_called_once_with('stock_data:AAPL:')
+
+    def test_unknown_family_rejected(self, client):
+        """should reject families CacheKeyBuilder does not build"""
+        response = client.post('/api/v1/admin/cache/purge', json={'family': 'users'}, headers=_auth())
+        assert response.status_code == 400
+
+    def test_exactly_one_selector_required(self, client):
+        """should reject zero or several selectors"""
+        none = client.post('/api/v1/admin/cache/purge', json={}, headers=_auth())
+        both = client.post(
+            '/api/v1/admin/cache/purge', json={'symbol': 'AAPL', 'family': 'news'}, headers=_auth()
+        )
+        assert none.status_code == 400
+        assert both.status_code == 400
+
+
+class TestProfile:
+    """Tests for POST/GET /api/v1/admin/profile"""
+
+    @pytest.fixture
+    def client(self, admin_app):
+        admin_app.config['PROFILER_ENABLED'] = True
+        yield admin_app.test_client()
+        admin_app.config['PROFILER_ENABLED'] = False
+        profile = SamplingProfiler.latest()
+        if profile is not None:
+            profile.wait(5)
+        SamplingProfiler._latest = None
+
+    def _start(self, client, **body):
+        response = client.post('/api/v1/admin/profile', json=body, headers=_auth())
+        SamplingProfiler.latest().wait(5)
+        return response
+
+    def test_disabled_by_default(self, admin_app):
+        """should answer 404 unless PROFILER_ENABLED is set"""
+        client = admin_app.test_client()
+        assert client.post('/api/v1/admin/profile', json={}, headers=_auth()).status_code == 404
+        assert client.get('/api/v1/admin/profile', headers=_auth()).status_code == 404
+
+    def test_requires_token(self, client):
+        """should answer 401 without the admin token"""
+        assert client.post('/api/v1/admin/profile', json={'duration': 0.1}).status_code == 401
+        assert client.get('/api/v1/admin/profile').status_code == 401
+
+    def test_start_returns_immediately(self, client):
+        """should start sampling in the background and answer 202"""
+        started = time.perf_counter()
+        response = client.post('/api/v1/admin/profile', json={'duration': 0.5}, headers=_auth())
+
+        assert time.perf_counter() - started < 0.4
+        assert response.status_code == 202
+        data = response.get_json()
+        assert data['status'] == 'running'
+        assert data['duration'] == 0.5
+        assert data['pid']
+
+    def test_download_while_running(self, client):
+        """should answer 202 with the remaining time until sampling ends"""
+        client.post('/api/v1/admin/profile', json={'duration': 0.5}, headers=_auth())
+
+        response = client.get('/api/v1/admin/profile', headers=_auth())
+
+        assert response.status_code == 202
+        assert response.get_json()['remaining'] > 0
+        assert response.headers['Retry-After']
+
+    def test_download_without_profile(self, client):
+        """should answer 404 when this worker has not been profiled"""
+        SamplingProfiler._latest = None
+        response = client.get('/api/v1/admin/profile', headers=_auth())
+        assert response.status_code == 404
+
+    def test_profile_includes_request_threads(self, client):
+        """should sample other threads, e.g. requests served while it runs"""
+        stop = threading.Event()
+        worker = threading.Thread(
+            target=lambda: stop.wait(5), name='request-thread'
+        )
+        worker.start()
+        try:
+            self._start(client, duration=0.1, interval_ms=5)
+        finally:
+            stop.set()
+            worker.join()
+
+        response = client.get('/api/v1/admin/profile', headers=_auth())
+
+        assert response.status_code == 200
+        assert 'request-thread;' in response.get_data(as_text=True)
+
+    def test_collapsed_profile(self, client):
+        """should return collapsed stacks as a text download"""
+        self._start(client, duration=0.1, interval_ms=5)
+
+        response = client.get('/api/v1/admin/profile', headers=_auth())
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        assert 'attachment' in response.headers['Content-Disposition']
+        assert int(response.headers['X-Profile-Samples']) > 0
+        assert response.headers['X-Profile-Pid']
+
+    def test_pstats_profile(self, client):
+        """should return a pstats dump as a binary download"""
+        self._start(client, duration=0.1, interval_ms=5)
+
+        response = client.get('/api/v1/admin/profile?format=pstats', headers=_auth())
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/octet-stream'
+        assert response.headers['Content-Disposition'].endswith('.pstats')
+
+    def test_duration_bounded(self, client):
+        """should reject durations above the maximum"""
+        response = client.post('/api/v1/admin/profile', json={'duration': 3600}, headers=_auth())
+        assert response.status_code == 400
+
+    def test_busy(self, client):
+        """should answer 409 while another profile is running"""
+        client.post('/api/v1/admin/profile', json={'duration': 0.3}, headers=_auth())
+
+        response = client.post('/api/v1/admin/profile', json={'duration': 1}, headers=_auth())
+
+        assert response.status_code == 409
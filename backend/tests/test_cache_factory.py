@@ -6,6 +6,7 @@ import pytest
 from flask import Flask
 from unittest.mock import patch, MagicMock
 
+from constants import CACHE_LOCAL_MAX_ENTRIES
 from utils.cache_factory import (
     CacheFactory,
     get_cache_config,
@@ -33,9 +34,19 @@ class TestCacheFactory:
 
         config = self.factory._build_simple_cache_config(self.app)
 
-        assert config['CACHE_TYPE'] == 'SimpleCache'
+        assert config['CACHE_TYPE'] == CacheFactory.LOCAL_BACKEND
         assert config['CACHE_DEFAULT_TIMEOUT'] == 300
-        assert config['CACHE_THRESHOLD'] == 1000
+        assert 'CACHE_THRESHOLD' not in config
+        assert config['CACHE_MAX_ENTRIES'] == CACHE_LOCAL_MAX_ENTRIES
+        assert config['CACHE_MAX_BYTES'] > 0
+
+    def test_build_simple_cache_config_max_bytes(self):
+        """Test the in-memory byte budget comes from app config."""
+        self.app.config['CACHE_MAX_BYTES'] = 4096
+
+        config = self.factory._build_simple_cache_config(self.app)
+
+        assert config['CACHE_MAX_BYTES'] == 4096
 
     def test_build_redis_config(self):
         """Test Redis configuration building."""
@@ -45,19 +56,60 @@ class TestCacheFactory:
 
         config = self.factory._build_redis_config(self.app)
 
-        assert config['CACHE_TYPE'] == 'RedisCache'
+        assert config['CACHE_TYPE'] == CacheFactory.RESILIENT_REDIS_BACKEND
+        assert config['CACHE_REDIS_BACKEND'] == CacheFactory.TIERED_REDIS_BACKEND
         assert config['CACHE_REDIS_URL'] == 'redis://localhost:6379/0'
         assert config['CACHE_DEFAULT_TIMEOUT'] == 600
         assert config['CACHE_KEY_PREFIX'] == 'test:'
         assert 'CACHE_OPTIONS' in config
 
+    def test_build_redis_config_l1_settings(self):
+        """Test L1 tier settings are passed through to the backend."""
+        self.app.config['CACHE_L1_MAX_BYTES'] = 1024
+        self.app.config['CACHE_L1_TTL'] = 5
+        self.app.config['CACHE_L1_PUBSUB'] = False
+
+        config = self.factory._build_redis_config(self.app)
+
+        assert config['CACHE_L1_MAX_BYTES'] == 1024
+        assert config['CACHE_L1_TTL'] == 5
+        assert config['CACHE_L1_PUBSUB'] is False
+
+    def test_build_redis_config_compression(self):
+        """Test compression settings are passed through to the backend."""
+        self.app.config['CACHE_COMPRESSION'] = 'lzma'
+        self.app.config['CACHE_COMPRESSION_MIN_SIZE'] = 2048
+
+        config = self.factory._build_redis_config(self.app)
+
+        assert config['CACHE_COMPRESSION'] == 'lzma'
+        assert config['CACHE_COMPRESSION_MIN_SIZE'] == 2048
+
+    def test_build_redis_config_without_failover(self):
+        """Test the Redis backend is used directly when failover is disabled."""
+        self.app.config['CACHE_FAILOVER_ENABLED'] = False
+
+        config = self.factory._build_redis_config(self.app)
+
+        assert config['CACHE_TYPE'] == CacheFactory.TIERED_REDIS_BACKEND
+        assert 'CACHE_REDIS_BACKEND' not in config
+
+    def test_build_redis_config_without_l1(self):
+        """Test the Redis backend without L1 is used when the tier is disabled."""
+        self.app.config['CACHE_L1_ENABLED'] = False
+
+        config = self.factory._build_redis_config(self.app)
+
+        assert config['CACHE_REDIS_BACKEND'] == CacheFactory.REDIS_BACKEND
+        assert 'CACHE_L1_MAX_BYTES' not in config
+
     def test_build_cache_config_simple(self):
         """Test cache config building for SimpleCache."""
         self.app.config['CACHE_DEFAULT_TIMEOUT'] = 300
 
         config = self.factory._build_cache_config(self.app, 'SimpleCache')
 
-        assert config['CACHE_TYPE'] == 'SimpleCache'
+        assert config['CACHE_TYPE'] == CacheFactory.LOCAL_BACKEND
 
     def test_build_cache_config_redis(self):
         """Test cache config building for Redis."""
@@ -67,7 +119,8 @@ class TestCacheFactory:
 
         config = self.factory._build_cache_config(self.app, 'redis')
 
-        assert config['CACHE_TYPE'] == 'RedisCache'
+        assert config['CACHE_TYPE'] == CacheFactory.RESILIENT_REDIS_BACKEND
+        assert config['CACHE_REDIS_BACKEND'] == CacheFactory.TIERED_REDIS_BACKEND
 
     def test_create_cache_simple(self):
         """Test creating SimpleCache."""
@@ -133,7 +186,7 @@ class TestGetCacheConfig:
 
         config = get_cache_config(self.app)
 
-        assert config['CACHE_TYPE'] == 'SimpleCache'
+        assert config['CACHE_TYPE'] == CacheFactory.LOCAL_BACKEND
         assert config['CACHE_DEFAULT_TIMEOUT'] == 300
 
     def test_get_cache_config_redis(self):
@@ -145,14 +198,15 @@ class TestGetCacheConfig:
 
         config = get_cache_config(self.app)
 
-        assert config['CACHE_TYPE'] == 'RedisCache'
+        assert config['CACHE_TYPE'] == CacheFactory.RESILIENT_REDIS_BACKEND
+        assert config['CACHE_REDIS_BACKEND'] == CacheFactory.TIERED_REDIS_BACKEND
         assert config['CACHE_REDIS_URL'] == 'redis://localhost:6379/0'
 
     def test_get_cache_config_default(self):
         """Test getting config with defaults."""
         config = get_cache_config(self.app)
 
-        assert config['CACHE_TYPE'] == 'SimpleCache'
+        assert config['CACHE_TYPE'] == CacheFactory.LOCAL_BACKEND
 
 
 class TestCreateCacheWithFallback:
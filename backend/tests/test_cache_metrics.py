@@ -0,0 +1,142 @@
+"""
+Tests for per-family cache metrics.
+
+This module tests:
+- Latency histogram bucketing
+- Hit/miss/set/delete/eviction counting by key family
+- Recording through the InstrumentedCache extension
+"""
+
+import pytest
+from flask import Flask
+
+from utils.cache import cache
+from utils.cache_keys import CacheKeyBuilder
+from utils.cache_metrics import CacheMetrics, LatencyHistogram, cache_metrics
+from utils.size_aware_cache import SizeAwareCache
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_buckets_are_cumulative(self):
+        histogram = LatencyHistogram(bounds=(1, 10))
+        histogram.observe(0.5)
+        histogram.observe(5)
+        histogram.observe(50)
+
+        snapshot = histogram.snapshot()
+        assert snapshot['buckets'] == {'1': 1, '10': 2, '+Inf': 3}
+        assert snapshot['count'] == 3
+        assert snapshot['sum_ms'] == 55.5
+
+    def test_bound_is_inclusive(self):
+        histogram = LatencyHistogram(bounds=(1, 10))
+        histogram.observe(1)
+        assert histogram.snapshot()['buckets']['1'] == 1
+
+
+class TestCacheMetrics:
+    """Tests for CacheMetrics."""
+
+    def test_family_for_key(self):
+        assert CacheKeyBuilder.family_for_key('stock_fragment:AAPL:2024-01-01:2024-02-01') == 'stock_fragment'
+        assert CacheKeyBuilder.family_for_key('batch_stocks:AAPL,MSFT:2024-01-01:2024-02-01') == 'batch_stocks'
+        assert CacheKeyBuilder.family_for_key('_health_check_test') == 'other'
+
+    def test_hits_and_misses_by_family(self):
+        metrics = CacheMetrics()
+        metrics.record_get('news:AAPL', hit=True, seconds=0.001)
+        metrics.record_get('news:MSFT', hit=False, seconds=0.001)
+        metrics.record_get('stock_data:AAPL:2024-01-01:2024-02-01', hit=True, seconds=0.001)
+
+        families = metrics.snapshot()['families']
+        assert families['news']['hits'] == 1
+        assert families['news']['misses'] == 1
+        assert families['news']['hit_ratio'] == 0.5
+        assert families['stock_data']['hit_ratio'] == 1.0
+
+    def test_get_many_counts_each_key(self):
+        metrics = CacheMetrics()
+        metrics.record_get_many(
+            ['stock_fragment:AAPL:a:b', 'stock_fragment:MSFT:a:b'], [b'{}', None], seconds=0.002
+        )
+
+        snapshot = metrics.snapshot()
+        fragment = snapshot['families']['stock_fragment']
+        assert (fragment['hits'], fragment['misses']) == (1, 1)
+        assert fragment['get_latency']['count'] == 0
+        assert snapshot['batch']['get_latency']['count'] == 1
+
+    def test_mixed_batch_latency_is_not_charged_to_one_family(self):
+        metrics = CacheMetrics()
+        metrics.record_set(['stock_fragment:AAPL:a:b', 'news:AAPL'], seconds=0.002)
+        metrics.record_set(['news:MSFT'], seconds=0.001)
+
+        snapshot = metrics.snapshot()
+        assert snapshot['families']['stock_fragment']['sets'] == 1
+        assert snapshot['families']['stock_fragment']['set_latency']['count'] == 0
+        assert snapshot['families']['news']['sets'] == 2
+        assert snapshot['families']['news']['set_latency']['count'] == 1
+        assert snapshot['batch']['set_latency']['count'] == 1
+
+    def test_totals(self):
+        metrics = CacheMetrics()
+        metrics.record_set(['news:AAPL', 'news:MSFT'], seconds=0.001)
+        metrics.record_delete(['news:AAPL'])
+        metrics.record_eviction('news:MSFT', 10)
+
+        totals = metrics.snapshot()['totals']
+        assert totals['sets'] == 2
+        assert totals['deletes'] == 1
+        assert totals['evictions'] == 1
+        assert totals['hit_ratio'] is None
+
+    def test_reset(self):
+        metrics = CacheMetrics()
+        metrics.record_get('news:AAPL', hit=True, seconds=0.001)
+        metrics.reset()
+        assert metrics.snapshot()['families'] == {}
+
+
+class TestInstrumentedCache:
+    """Tests for recording through the cache extension."""
+
+    @pytest.fixture
+    def app(self):
+        app = Flask(__name__)
+        cache.init_app(app, config={'CACHE_TYPE': 'utils.size_aware_cache.SizeAwareCache'})
+        cache_metrics.reset()
+        with app.app_context():
+            yield app
+
+    def test_cache_calls_are_recorded(self, app):
+        cache.set('news:AAPL', b'{}')
+        cache.get('news:AAPL')
+        cache.set_many({'stock_fragment:AAPL:a:b': b'{}'})
+        cache.get_many('stock_fragment:AAPL:a:b', 'stock_fragment:MSFT:a:b')
+        cache.delete('news:AAPL')
+
+        families = cache_metrics.snapshot()['families']
+        assert families['news']['sets'] == 1
+        assert families['news']['hits'] == 1
+        assert families['news']['deletes'] == 1
+        assert families['stock_fragment']['hits'] == 1
+        assert families['stock_fragment']['misses'] == 1
+        assert families['stock_fragment']['set_latency']['count'] == 1
+        assert families['stock_fragment']['get_latency']['count'] == 0
+        assert cache_metrics.snapshot()['batch']['get_latency']['count'] == 1
+
+    def test_add_is_recorded_as_a_write(self, app):
+        assert cache.add('news:AAPL', b'{}')
+        assert not cache.add('news:AAPL', b'{}')
+
+        assert cache_metrics.snapshot()['families']['news']['sets'] == 1
+
+    def test_evictions_recorded_by_family(self):
+        cache_metrics.reset()
+        backend = SizeAwareCache(max_bytes=100)
+        backend.set('news:AAPL', b'a' * 60)
+        backend.set('stock_data:AAPL:a:b', b'b' * 60)
+
+        assert cache_metrics.snapshot()['families']['news']['evictions'] == 1
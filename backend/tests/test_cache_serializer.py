@@ -0,0 +1,86 @@
+"""
+Tests for the compressing Redis cache serializer.
+"""
+
+import pickle
+
+import pytest
+from cachelib.serializers import RedisSerializer
+
+from utils.cache_serializer import (
+    COMPRESSED_MAGIC,
+    FORMAT_VERSION,
+    CompressingSerializer,
+)
+
+LARGE_VALUE = {'data': [{'close': 100.25, 'volume': 1000000} for _ in range(500)]}
+
+
+class TestCompressingSerializer:
+    """Tests for CompressingSerializer."""
+
+    @pytest.mark.parametrize('codec', ['zlib', 'lzma'])
+    def test_large_value_round_trip_compressed(self, codec):
+        """Test large values are compressed and decode to the original."""
+        serializer = CompressingSerializer(codec=codec, threshold=1024)
+
+        data = serializer.dumps(LARGE_VALUE)
+
+        assert data.startswith(COMPRESSED_MAGIC)
+        assert data[1] == FORMAT_VERSION
+        assert len(data) < len(pickle.dumps(LARGE_VALUE, pickle.HIGHEST_PROTOCOL))
+        assert serializer.loads(data) == LARGE_VALUE
+
+    def test_small_value_stored_in_cachelib_format(self):
+        """Test values under the threshold are not compressed."""
+        serializer = CompressingSerializer(threshold=1024)
+
+        data = serializer.dumps({'ok': True})
+
+        assert data.startswith(b'!')
+        assert serializer.loads(data) == {'ok': True}
+
+    def test_codec_none_disables_compression(self):
+        """Test the 'none' codec keeps the cachelib format."""
+        serializer = CompressingSerializer(codec='none', threshold=0)
+
+        assert serializer.dumps(LARGE_VALUE).startswith(b'!')
+
+    def test_reads_legacy_values(self):
+        """Test entries written by the default serializer stay readable."""
+        serializer = CompressingSerializer()
+
+        assert serializer.loads(RedisSerializer().dumps(LARGE_VALUE)) == LARGE_VALUE
+        assert serializer.loads(b'42') == 42
+        assert serializer.loads(None) is None
+
+    def test_unknown_version_is_a_miss(self):
+        """Test values from a newer format version are treated as misses."""
+        serializer = CompressingSerializer()
+        data = serializer.dumps(LARGE_VALUE)
+        future = data[:1] + bytes([FORMAT_VERSION + 1]) + data[2:]
+
+        assert serializer.loads(future) is None
+
+    def test_corrupt_value_is_a_miss(self):
+        """Test undecodable compressed values are treated as misses."""
+        serializer = CompressingSerializer()
+
+        assert serializer.loads(COMPRESSED_MAGIC + bytes([FORMAT_VERSION]) + b'zgarbage') is None
+
+    def test_stats_track_ratio(self):
+        """Test compression ratio metrics."""
+        serializer = CompressingSerializer(threshold=1024)
+        serializer.dumps(LARGE_VALUE)
+        serializer.dumps({'ok': True})
+
+        stats = serializer.stats.snapshot()
+        assert stats['values'] == 2
+        assert stats['compressed'] == 1
+        assert stats['stored_bytes'] < stats['raw_bytes']
+        assert 0 < stats['ratio'] < 1
+
+    def test_unknown_codec_rejected(self):
+        """Test constructing with an unknown codec fails."""
+        with pytest.raises(ValueError):
+            CompressingSerializer(codec='snappy')
@@ -0,0 +1,195 @@
+"""
+Tests for warm cache snapshots.
+
+This module tests:
+- Round-tripping entries through a snapshot file
+- TTL filtering and hot-entry selection
+- Rejection of foreign, corrupt and future-version files
+- Startup restore through init_cache_snapshots
+"""
+
+import struct
+import time
+
+import pytest
+from flask import Flask
+
+from utils.cache import cache
+from utils.cache_tags import tag_index
+from utils.cache_snapshot import (
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    CacheSnapshotter,
+    init_cache_snapshots,
+    load_snapshot,
+    save_snapshot,
+)
+from utils.size_aware_cache import SizeAwareCache
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'cache.snapshot')
+
+
+class TestSnapshotRoundTrip:
+    """Tests for save_snapshot/load_snapshot."""
+
+    def test_entries_survive_round_trip(self, path):
+        source = SizeAwareCache(default_timeout=300)
+        source.set('news:AAPL', b'{"news": []}')
+        source.set('stock_data:AAPL:2024-01-02:2024-01-06', {'symbol': 'AAPL'})
+
+        assert save_snapshot(source, path) == 2
+
+        target = SizeAwareCache(default_timeout=300)
+        assert load_snapshot(target, path) == 2
+        assert target.get('news:AAPL') == b'{"news": []}'
+        assert target.get('stock_data:AAPL:2024-01-02:2024-01-06') == {'symbol': 'AAPL'}
+
+    def test_expiry_deadline_is_preserved(self, path):
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'x', timeout=120)
+        deadline = source.export_entries()[0][3]
+        save_snapshot(source, path)
+
+        target = SizeAwareCache()
+        load_snapshot(target, path)
+        assert target.export_entries()[0][3] == pytest.approx(deadline)
+
+    def test_entries_without_expiry_are_kept(self, path):
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'x', timeout=0)
+        save_snapshot(source, path)
+
+        target = SizeAwareCache()
+        assert load_snapshot(target, path) == 1
+        assert target.export_entries()[0][3] is None
+
+    def test_short_lived_entries_are_skipped(self, path):
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'x', timeout=10)
+        source.set('news:MSFT', b'y', timeout=600)
+
+        assert save_snapshot(source, path, min_ttl=30) == 1
+        target = SizeAwareCache()
+        load_snapshot(target, path)
+        assert target.get('news:AAPL') is None
+
+    def test_entries_expiring_before_load_are_skipped(self, path, mocker):
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'x', timeout=60)
+        save_snapshot(source, path, min_ttl=30)
+
+        mocker.patch('utils.cache_snapshot.time.time', return_value=time.time() + 45)
+        assert load_snapshot(SizeAwareCache(), path, min_ttl=30) == 0
+
+    def test_hottest_entries_fill_the_budget(self, path):
+        source = SizeAwareCache()
+        source.set('news:COLD', b'c' * 100)
+        source.set('news:HOT', b'h' * 100)
+        for _ in range(5):
+            source.get('news:HOT')
+
+        assert save_snapshot(source, path, max_bytes=150) == 1
+        target = SizeAwareCache()
+        load_snapshot(target, path)
+        assert target.get('news:HOT') is not None
+        assert target.get('news:COLD') is None
+
+    def test_access_frequency_is_restored(self, path):
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'x')
+        for _ in range(3):
+            source.get('news:AAPL')
+        save_snapshot(source, path)
+
+        target = SizeAwareCache()
+        load_snapshot(target, path)
+        assert target.export_entries()[0][4] == 4
+
+
+class TestSnapshotValidation:
+    """Tests for rejecting unusable snapshot files."""
+
+    def test_missing_file_restores_nothing(self, path):
+        assert load_snapshot(SizeAwareCache(), path) == 0
+
+    def test_foreign_file_is_ignored(self, path):
+        with open(path, 'wb') as f:
+            f.write(b'not a snapshot at all')
+        assert load_snapshot(SizeAwareCache(), path) == 0
+
+    def test_unknown_version_is_ignored(self, path):
+        with open(path, 'wb') as f:
+            f.write(struct.pack('>4sBd', SNAPSHOT_MAGIC, SNAPSHOT_VERSION + 1, time.time()))
+        assert load_snapshot(SizeAwareCache(), path) == 0
+
+    def test_truncated_body_is_ignored(self, path):
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'x' * 1000)
+        save_snapshot(source, path)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        with open(path, 'wb') as f:
+            f.write(raw[:-10])
+
+        assert load_snapshot(SizeAwareCache(), path) == 0
+
+
+class TestInitCacheSnapshots:
+    """Tests for startup wiring."""
+
+    def _make_app(self, **config):
+        app = Flask(__name__)
+        app.config.update(CACHE_SNAPSHOT_INTERVAL=0, **config)
+        cache.init_app(app, config={'CACHE_TYPE': 'utils.size_aware_cache.SizeAwareCache'})
+        return app
+
+    def test_disabled_without_path(self):
+        assert init_cache_snapshots(self._make_app()) is None
+
+    def test_restores_before_serving(self, path, mocker):
+        mocker.patch('utils.cache_snapshot.atexit.register')
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'warm')
+        save_snapshot(source, path)
+
+        app = self._make_app(CACHE_SNAPSHOT_PATH=path)
+        snapshotter = init_cache_snapshots(app)
+
+        assert isinstance(snapshotter, CacheSnapshotter)
+        with app.app_context():
+            assert cache.get('news:AAPL') == b'warm'
+
+    def test_restored_keys_can_be_purged_by_symbol(self, path, mocker):
+        """should re-tag restored keys so symbol purges reach them"""
+        mocker.patch('utils.cache_snapshot.atexit.register')
+        tag_index.clear_local()
+        source = SizeAwareCache()
+        source.set('news:AAPL', b'warm')
+        save_snapshot(source, path)
+
+        app = self._make_app(CACHE_SNAPSHOT_PATH=path)
+        init_cache_snapshots(app)
+
+        with app.app_context():
+            assert tag_index.purge_symbol('AAPL') == 1
+            assert cache.get('news:AAPL') is None
+
+    def test_stop_saves_final_snapshot(self, path, mocker):
+        mocker.patch('utils.cache_snapshot.atexit.register')
+        app = self._make_app(CACHE_SNAPSHOT_PATH=path)
+        snapshotter = init_cache_snapshots(app)
+        with app.app_context():
+            cache.set('news:AAPL', b'fresh')
+
+        snapshotter.stop()
+
+        assert load_snapshot(SizeAwareCache(), path) == 1
+
+    def test_unsupported_backend_is_skipped(self, path):
+        app = Flask(__name__)
+        app.config['CACHE_SNAPSHOT_PATH'] = path
+        cache.init_app(app, config={'CACHE_TYPE': 'NullCache'})
+        assert init_cache_snapshots(app) is None
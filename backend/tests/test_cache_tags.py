@@ -0,0 +1,200 @@
+"""
+Tests for the cache tag index.
+
+This module tests:
+- Tag derivation from CacheKeyBuilder keys
+- Purging by symbol, family and prefix on in-memory backends
+- Redis-backed tag sets and prefix scans
+"""
+
+import fnmatch
+
+import pytest
+from flask import Flask
+from flask_caching.backends.rediscache import RedisCache
+
+from utils.cache import cache
+from utils.cache_keys import CacheKeyBuilder
+from utils.cache_tags import CacheTagIndex
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis with set and scan support."""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def setex(self, name, value, time):
+        self.data[name] = value
+        return True
+
+    def exists(self, name):
+        return int(name in self.data)
+
+    def delete(self, *names):
+        removed = 0
+        for name in names:
+            removed += int(self.data.pop(name, None) is not None)
+            removed += int(self.sets.pop(name, None) is not None)
+        return removed
+
+    def sadd(self, name, *values):
+        self.sets.setdefault(name, set()).update(values)
+
+    def smembers(self, name):
+        return {value.encode('utf-8') for value in self.sets.get(name, ())}
+
+    def expire(self, name, time):
+        return True
+
+    def scan_iter(self, match, count=None):
+        for name in list(self.data):
+            if fnmatch.fnmatchcase(name, match.replace('\\', '')):
+                yield name.encode('utf-8')
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline that applies commands immediately."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def execute(self):
+        return []
+
+
+def _make_app(cache_type):
+    app = Flask(__name__)
+    cache.init_app(app, config={'CACHE_TYPE': cache_type})
+    return app
+
+
+class TestTagsForKey:
+    """Tests for CacheKeyBuilder tag derivation."""
+
+    def test_symbol_keys_tagged_with_symbol(self):
+        key = CacheKeyBuilder.build_stock_key('aapl', '2024-01-01', '2024-02-01')
+        assert CacheKeyBuilder.tags_for_key(key) == ['symbol:AAPL']
+
+    def test_batch_keys_tagged_with_every_symbol(self):
+        key = CacheKeyBuilder.build_batch_key(['MSFT', 'AAPL'], '2024-01-01', '2024-02-01')
+        assert set(CacheKeyBuilder.tags_for_key(key)) == {'symbol:AAPL', 'symbol:MSFT'}
+
+    def test_unknown_keys_have_no_tags(self):
+        assert CacheKeyBuilder.tags_for_key('_health_check_test') == []
+
+
+class TestLocalTagIndex:
+    """Tests for purges on in-memory backends."""
+
+    @pytest.fixture
+    def app(self):
+        app = _make_app('utils.size_aware_cache.SizeAwareCache')
+        with app.app_context():
+            cache.clear()
+            yield app
+
+    @pytest.fixture
+    def index(self):
+        return CacheTagIndex()
+
+    def _write(self, index, *keys):
+        for key in keys:
+            cache.set(key, b'{}')
+            index.tag_key(key)
+
+    def test_purge_symbol_removes_all_families(self, app, index):
+        stock = CacheKeyBuilder.build_stock_key('AAPL', '2024-01-01', '2024-02-01')
+        news = CacheKeyBuilder.build_news_key('AAPL')
+        batch = CacheKeyBuilder.build_batch_key(['AAPL', 'MSFT'], '2024-01-01', '2024-02-01')
+        other = CacheKeyBuilder.build_news_key('MSFT')
+        self._write(index, stock, news, batch, other)
+
+        assert index.purge_symbol('aapl') == 3
+        assert cache.get(stock) is None
+        assert cache.get(news) is None
+        assert cache.get(batch) is None
+        assert cache.get(other) == b'{}'
+        assert index.keys_for_tag('symbol:AAPL') == []
+
+    def test_purge_family(self, app, index):
+        self._write(
+            index,
+            CacheKeyBuilder.build_news_key('AAPL'),
+            CacheKeyBuilder.build_news_key('MSFT'),
+            CacheKeyBuilder.build_stock_key('AAPL', '2024-01-01', '2024-02-01'),
+        )
+
+        assert index.purge_family('news') == 2
+        assert cache.get(CacheKeyBuilder.build_stock_key('AAPL', '2024-01-01', '2024-02-01')) == b'{}'
+
+    def test_purge_prefix_finds_untagged_keys(self, app, index):
+        cache.set('stock_data:AAPL:2024-01-01:2024-02-01', b'{}')
+
+        assert index.purge_prefix('stock_data:AAPL:') == 1
+        assert cache.get('stock_data:AAPL:2024-01-01:2024-02-01') is None
+
+    def test_backend_without_key_listing_uses_index(self, index):
+        app = _make_app('SimpleCache')
+        with app.app_context():
+            key = CacheKeyBuilder.build_news_key('AAPL')
+            self._write(index, key)
+
+            assert index.purge_prefix('news:') == 1
+            assert cache.get(key) is None
+
+    def test_tagging_outside_app_context_is_ignored(self, index):
+        index.tag_key(CacheKeyBuilder.build_news_key('AAPL'))
+        assert index._local == {}
+
+
+class TestRedisTagIndex:
+    """Tests for Redis-backed tag sets."""
+
+    @pytest.fixture
+    def redis_client(self):
+        return FakeRedis()
+
+    @pytest.fixture
+    def app(self, redis_client):
+        app = _make_app('SimpleCache')
+        app.extensions['cache'][cache] = RedisCache(host=redis_client, key_prefix='mv:')
+        with app.app_context():
+            yield app
+
+    def test_tags_stored_as_redis_sets(self, app, redis_client):
+        index = CacheTagIndex()
+        key = CacheKeyBuilder.build_news_key('AAPL')
+        cache.set(key, b'{}')
+        index.tag_key(key)
+
+        assert redis_client.sets['mv:tag:symbol:AAPL'] == {key}
+        assert index._local == {}
+
+    def test_purge_symbol_deletes_keys_and_tag_set(self, app, redis_client):
+        index = CacheTagIndex()
+        key = CacheKeyBuilder.build_news_key('AAPL')
+        cache.set(key, b'{}')
+        index.tag_key(key)
+
+        assert index.purge_symbol('AAPL') == 1
+        assert 'mv:' + key not in redis_client.data
+        assert 'mv:tag:symbol:AAPL' not in redis_client.sets
+
+    def test_purge_prefix_scans_without_key_prefix(self, app, redis_client):
+        cache.set('news:AAPL', b'{}')
+        cache.set('news:MSFT', b'{}')
+        cache.set('stock_data:AAPL:2024-01-01:2024-02-01', b'{}')
+
+        assert CacheTagIndex().purge_family('news') == 2
+        assert list(redis_client.data) == ['mv:stock_data:AAPL:2024-01-01:2024-02-01']
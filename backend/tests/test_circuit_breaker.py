@@ -0,0 +1,91 @@
+"""
+Tests for the circuit breaker.
+"""
+
+import time
+
+from utils.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the breaker."""
+        breaker = CircuitBreaker('test', failure_threshold=3)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        assert breaker.allow_request() is False
+
+    def test_success_resets_failure_count(self):
+        """Test failures must be consecutive."""
+        breaker = CircuitBreaker('test', failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == STATE_CLOSED
+
+    def test_on_open_called_once(self):
+        """Test the on_open callback fires when the breaker opens."""
+        calls = []
+        breaker = CircuitBreaker('test', failure_threshold=1, on_open=lambda: calls.append(1))
+
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert calls == [1]
+
+    def test_reset_closes(self):
+        """Test reset() closes an open breaker."""
+        breaker = CircuitBreaker('test', failure_threshold=1)
+        breaker.record_failure()
+
+        breaker.reset()
+
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow_request() is True
+
+    def test_stays_open_without_reset_timeout(self):
+        """Test the breaker only closes via reset() when no timeout is set."""
+        breaker = CircuitBreaker('test', failure_threshold=1)
+        breaker.record_failure()
+
+        assert breaker.allow_request() is False
+
+    def test_half_open_trial(self):
+        """Test a single trial call is allowed after reset_timeout."""
+        breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.allow_request() is True
+        assert breaker.state == STATE_HALF_OPEN
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Test a failed half-open trial re-opens the breaker."""
+        breaker = CircuitBreaker('test', failure_threshold=5, reset_timeout=0.01)
+        for _ in range(5):
+            breaker.record_failure()
+        time.sleep(0.02)
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        assert breaker.stats()['times_opened'] == 2
@@ -0,0 +1,128 @@
+"""
+Tests for response compression middleware and precompressed cache variants.
+"""
+
+import gzip
+
+import pytest
+from flask import Flask, jsonify
+
+from utils.cache import cache
+from utils.compression import build_encodings, init_compression
+from utils.response_cache import cached_response
+
+LARGE_PAYLOAD = {'data': [{'close': 100.0 + i, 'volume': 1000000 + i} for i in range(200)]}
+
+
+@pytest.fixture
+def app():
+    """Create a Flask app with compression and an in-memory cache."""
+    app = Flask(__name__)
+    app.config.update({
+        'TESTING': True,
+        'COMPRESSION_ENABLED': True,
+        'COMPRESSION_MIN_SIZE': 1024,
+    })
+    cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+    init_compression(app)
+
+    @app.route('/large')
+    def large():
+        return jsonify(LARGE_PAYLOAD)
+
+    @app.route('/small')
+    def small():
+        return jsonify({'ok': True})
+
+    with app.app_context():
+        cache.clear()
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+
+class TestCompressionMiddleware:
+    """Tests for the after_request compression hook."""
+
+    def test_large_response_gzipped_when_accepted(self, client):
+        """Test large JSON is gzipped for clients that accept it."""
+        response = client.get('/large', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert gzip.decompress(response.data).startswith(b'{')
+
+    def test_no_compression_without_accept_encoding(self, client):
+        """Test identity body when the client does not accept gzip."""
+        response = client.get('/large')
+
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_json() == LARGE_PAYLOAD
+
+    def test_refused_encoding_is_respected(self, client):
+        """Test q=0 disables an encoding."""
+        response = client.get('/large', headers={'Accept-Encoding': 'gzip;q=0'})
+
+        assert 'Content-Encoding' not in response.headers
+
+    def test_small_response_below_threshold(self, client):
+        """Test responses under the minimum size are left alone."""
+        response = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+
+        assert 'Content-Encoding' not in response.headers
+
+    def test_disabled_by_config(self, app, client):
+        """Test COMPRESSION_ENABLED=False turns the middleware off."""
+        app.config['COMPRESSION_ENABLED'] = False
+
+        response = client.get('/large', headers={'Accept-Encoding': 'gzip'})
+
+        assert 'Content-Encoding' not in response.headers
+
+
+class TestPrecompressedCacheVariants:
+    """Tests for compressed variants stored with cached payloads."""
+
+    def test_build_encodings_respects_threshold(self, app):
+        """Test small bodies get no variants and large ones get gzip."""
+        with app.app_context():
+            assert build_encodings(b'{}') == {}
+            variants = build_encodings(b'{"a":"' + b'x' * 4096 + b'"}')
+
+        assert 'gzip' in variants
+        assert gzip.decompress(variants['gzip']).startswith(b'{"a"')
+
+    def test_cached_variant_served_without_recompressing(self, app, client):
+        """Test hits reuse the gzip variant stored at fill time."""
+        @app.route('/cached-large')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:cached-large')
+        def cached_large():
+            return jsonify(LARGE_PAYLOAD)
+
+        client.get('/cached-large', headers={'Accept-Encoding': 'gzip'})
+
+        with app.app_context():
+            stored = cache.get('test:cached-large')['encodings']['gzip']
+
+        response = client.get('/cached-large', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['X-Cache'] == 'HIT'
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.data == stored
+
+    def test_cached_identity_for_clients_without_gzip(self, app, client):
+        """Test hits fall back to the identity body."""
+        @app.route('/cached-identity')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:cached-identity')
+        def cached_identity():
+            return jsonify(LARGE_PAYLOAD)
+
+        client.get('/cached-identity')
+        response = client.get('/cached-identity')
+
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_json() == LARGE_PAYLOAD
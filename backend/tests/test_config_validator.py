@@ -37,6 +37,72 @@ class TestConfigValidator:
 
         assert 'Invalid CACHE_TYPE' in str(exc_info.value)
 
+    def test_invalid_cache_compression(self):
+        """Test that an unknown CACHE_COMPRESSION codec raises error."""
+        config = {**self.base_config, 'CACHE_COMPRESSION': 'snappy'}
+        validator = ConfigValidator(config)
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validator.validate()
+
+        assert 'Invalid CACHE_COMPRESSION' in str(exc_info.value)
+
+    def test_cache_snapshot_ignored_with_redis(self):
+        """Test that snapshots configured with Redis produce a warning."""
+        config = {
+            **self.base_config,
+            'CACHE_TYPE': 'redis',
+            'CACHE_REDIS_URL': 'redis://localhost:6379/0',
+            'CACHE_SNAPSHOT_PATH': 'data/cache.snapshot',
+        }
+        validator = ConfigValidator(config)
+        validator.validate()
+
+        assert any('CACHE_SNAPSHOT_PATH' in w for w in validator.warnings)
+
+    def test_invalid_google_news_rate(self):
+        """Test that a non-positive Google News rate raises error."""
+        config = {**self.base_config, 'GOOGLE_NEWS_RATE_LIMIT': 0}
+        validator = ConfigValidator(config)
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validator.validate()
+
+        assert 'GOOGLE_NEWS_RATE_LIMIT' in str(exc_info.value)
+
+    def test_news_poller_lead_below_interval_warns(self):
+        """Test that a poller lead not exceeding its interval warns."""
+        config = {
+            **self.base_config,
+            'NEWS_POLLER_ENABLED': True,
+            'NEWS_POLLER_INTERVAL': 60,
+            'NEWS_POLLER_LEAD': 30,
+        }
+        validator = ConfigValidator(config)
+        validator.validate()
+
+        assert any('NEWS_POLLER_LEAD' in w for w in validator.warnings)
+
+    def test_invalid_news_poller_interval(self):
+        """Test that a non-positive poller interval raises error."""
+        config = {**self.base_config, 'NEWS_POLLER_ENABLED': True, 'NEWS_POLLER_INTERVAL': 0}
+        validator = ConfigValidator(config)
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validator.validate()
+
+        assert 'NEWS_POLLER_INTERVAL' in str(exc_info.value)
+
+    def test_invalid_news_ingestion_mode(self):
+        """Test that an unknown news ingestion mode raises error."""
+        config = {**self.base_config, 'NEWS_INGESTION_MODE': 'firehose'}
+        validator = ConfigValidator(config)
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validator.validate()
+
+        assert 'NEWS_INGESTION_MODE' in str(exc_info.value)
+
     def test_valid_cache_types(self):
         """Test all valid cache types."""
         for cache_type in ['SimpleCache', 'redis', 'RedisCache']:
@@ -7,6 +7,8 @@ Tests cover:
 - HTTP error handling (timeout, request errors)
 - Article validation and filtering
 - Response format transformation
+- Conditional requests (ETag reuse, token kept out of the cache key)
+- Bulk market news (category feed, minId, related symbols)
 """
 
 import pytest
@@ -63,7 +65,7 @@ class TestFinnhubNewsFetcher:
         mock_response.json.return_value = sample_finnhub_response
         mock_response.raise_for_status.return_value = None
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('AAPL')
 
         assert len(articles) == 2
@@ -73,13 +75,28 @@ class TestFinnhubNewsFetcher:
         assert articles[0]['language'] == 'en-US'
         assert articles[0]['url'] == 'https://www.marketwatch.com/story/apple-new-product'
 
+    def test_fetch_not_modified_reuses_articles(self, fetcher, sample_finnhub_response):
+        """should revalidate with the ETag and reuse articles on 304"""
+        fresh = MagicMock(status_code=200, headers={'ETag': '"abc"'})
+        fresh.json.return_value = sample_finnhub_response
+        not_modified = MagicMock(status_code=304, headers={})
+
+        with patch('services.http_client.HttpClient.get', side_effect=[fresh, not_modified]) as mock_get:
+            first = fetcher.fetch('AAPL')
+            second = fetcher.fetch('AAPL')
+
+        assert second == first
+        assert fresh.json.call_count == 1
+        assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"abc"'}
+        assert all('test_key' not in key for key in fetcher._validators._entries)
+
     def test_fetch_returns_all_articles(self, fetcher, sample_finnhub_response):
         """should return all valid articles without truncation"""
         mock_response = MagicMock()
         mock_response.json.return_value = sample_finnhub_response
         mock_response.raise_for_status.return_value = None
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('AAPL')
 
         assert len(articles) == 2
@@ -95,7 +112,7 @@ class TestFinnhubNewsFetcher:
     def test_fetch_timeout(self, fetcher):
         """should return empty list when request times out"""
         import requests as req
-        with patch('services.finnhub_news_fetcher.requests.get',
+        with patch('services.http_client.HttpClient.get',
                    side_effect=req.exceptions.Timeout("Request timed out")):
             articles = fetcher.fetch('AAPL')
 
@@ -104,7 +121,7 @@ class TestFinnhubNewsFetcher:
     def test_fetch_request_error(self, fetcher):
         """should return empty list when request fails"""
         import requests as req
-        with patch('services.finnhub_news_fetcher.requests.get',
+        with patch('services.http_client.HttpClient.get',
                    side_effect=req.exceptions.ConnectionError("Connection failed")):
             articles = fetcher.fetch('AAPL')
 
@@ -116,7 +133,7 @@ class TestFinnhubNewsFetcher:
         mock_response.json.return_value = {'error': 'Invalid symbol'}
         mock_response.raise_for_status.return_value = None
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('INVALID')
 
         assert articles == []
@@ -148,7 +165,7 @@ class TestFinnhubNewsFetcher:
         mock_response.json.return_value = raw_data
         mock_response.raise_for_status.return_value = None
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('AAPL')
 
         assert len(articles) == 1
@@ -160,7 +177,7 @@ class TestFinnhubNewsFetcher:
         mock_response.json.return_value = sample_finnhub_response
         mock_response.raise_for_status.return_value = None
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('AAPL')
 
         article = articles[0]
@@ -184,11 +201,26 @@ class TestFinnhubNewsFetcher:
         mock_response.json.return_value = raw_data
         mock_response.raise_for_status.return_value = None
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('AAPL')
 
         assert articles[0]['published_at'] != ''
         assert 'T' in articles[0]['published_at']
+        assert articles[0]['published_ts'] == 1707465600
+
+    def test_article_without_id_uses_url_hash(self, fetcher):
+        """should derive a stable ID from the URL when Finnhub omits one"""
+        from utils.news_identity import article_id
+
+        raw_data = [{'headline': 'Test', 'url': 'https://example.com/a', 'datetime': 1707465600}]
+        mock_response = MagicMock()
+        mock_response.json.return_value = raw_data
+        mock_response.raise_for_status.return_value = None
+
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
+            articles = fetcher.fetch('AAPL')
+
+        assert articles[0]['id'] == article_id('finnhub', 'https://example.com/a')
 
     def test_fetch_empty_response(self, fetcher):
         """should return empty list when API returns empty array"""
@@ -196,7 +228,7 @@ class TestFinnhubNewsFetcher:
         mock_response.json.return_value = []
         mock_response.raise_for_status.return_value = None
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('AAPL')
 
         assert articles == []
@@ -207,7 +239,52 @@ class TestFinnhubNewsFetcher:
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = req.exceptions.HTTPError("401 Unauthorized")
 
-        with patch('services.finnhub_news_fetcher.requests.get', return_value=mock_response):
+        with patch('services.http_client.HttpClient.get', return_value=mock_response):
             articles = fetcher.fetch('AAPL')
 
         assert articles == []
+
+
+class TestFinnhubMarketNews:
+    """Tests for fetch_market_news"""
+
+    @staticmethod
+    def _response(payload):
+        response = MagicMock()
+        response.json.return_value = payload
+        response.raise_for_status.return_value = None
+        return response
+
+    def test_returns_articles_with_related_symbols(self):
+        """should transform articles and split the related field"""
+        payload = [
+            {'id': 7, 'headline': 'Chip stocks rally', 'url': 'https://e.x/7',
+             'datetime': 1707465600, 'related': 'nvda, AMD'},
+            {'id': 8, 'headline': 'Markets mixed', 'url': 'https://e.x/8',
+             'datetime': 1707465600, 'related': ''},
+            {'id': 9, 'headline': '', 'url': 'https://e.x/9'},
+        ]
+        fetcher = FinnhubNewsFetcher(api_key='test_key')
+
+        with patch('services.http_client.HttpClient.get', return_value=self._response(payload)) as mock_get:
+            tagged = fetcher.fetch_market_news('general', min_id=6)
+
+        assert [(article['id'], related) for article, related in tagged] == [
+            ('finnhub_7', ['NVDA', 'AMD']),
+            ('finnhub_8', []),
+        ]
+        assert mock_get.call_args[0][0].endswith('/news')
+        assert mock_get.call_args[1]['params'] == {'category': 'general', 'token': 'test_key', 'minId': 6}
+
+    def test_no_api_key(self):
+        """should return an empty list without an API key"""
+        assert FinnhubNewsFetcher(api_key=None).fetch_market_news() == []
+
+    def test_request_error_returns_empty(self):
+        """should return an empty list when the request fails"""
+        import requests
+
+        fetcher = FinnhubNewsFetcher(api_key='test_key')
+        with patch('services.http_client.HttpClient.get',
+                   side_effect=requests.exceptions.ConnectionError('down')):
+            assert fetcher.fetch_market_news() == []
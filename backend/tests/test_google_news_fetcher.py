@@ -5,16 +5,36 @@ Tests cover:
 - Successful RSS feed parsing
 - Empty feed handling
 - Invalid entry handling
-- Rate limiting behavior
+- Pacing through the upstream scheduler
 - Language determination
 - Source extraction
+- Feed download over the pooled HTTP client
+- Conditional refreshes (304 reuses articles without parsing)
+- Streaming RSS parsing with feedparser fallback
 """
 
 import pytest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import patch, MagicMock
 import time
 
 from services.google_news_fetcher import GoogleNewsFetcher
+from utils.news_identity import article_id
+from utils.upstream_pacing import PacingOverloadError, PacingScheduler, TokenBucket
+
+
+def _unpaced():
+    """Scheduler that releases calls immediately."""
+    return PacingScheduler('test', TokenBucket(rate=1000, burst=1000))
+
+
+@pytest.fixture(autouse=True)
+def mock_http_get():
+    """Serve every feed download from a stub instead of the network."""
+    response = MagicMock(status_code=200, content=b'<rss></rss>', headers={})
+    with patch('services.http_client.HttpClient.get', return_value=response) as mock_get:
+        yield mock_get
 
 
 class TestGoogleNewsFetcher:
@@ -23,7 +43,7 @@ class TestGoogleNewsFetcher:
     @pytest.fixture
     def fetcher(self):
         """Create a fetcher with no delay for testing."""
-        return GoogleNewsFetcher(request_delay=0)
+        return GoogleNewsFetcher(scheduler=_unpaced())
 
     @pytest.fixture
     def sample_feed(self):
@@ -77,7 +97,7 @@ class TestGoogleNewsFetcher:
             )
 
         assert len(articles) == 2
-        assert articles[0]['id'] == 'google_2330.TW_0'
+        assert articles[0]['id'].startswith('google_')
         assert articles[0]['headline'] == '台積電股價創新高'
         assert articles[0]['language'] == 'zh-TW'
         assert articles[0]['image'] is None
@@ -182,7 +202,7 @@ class TestGoogleNewsFetcher:
             'link': 'https://example.com'
         }.get(key, default)
 
-        result = fetcher._transform_entry(entry, 'TEST', 0, 'en-US')
+        result = fetcher._transform_entry(entry, 'en-US')
         assert result is None
 
     def test_transform_entry_missing_link(self, fetcher):
@@ -193,11 +213,11 @@ class TestGoogleNewsFetcher:
             'link': ''
         }.get(key, default)
 
-        result = fetcher._transform_entry(entry, 'TEST', 0, 'en-US')
+        result = fetcher._transform_entry(entry, 'en-US')
         assert result is None
 
     def test_article_id_format(self, fetcher, sample_feed):
-        """should generate correct article ID format"""
+        """should derive article IDs from the canonical article URL"""
         with patch('services.google_news_fetcher.feedparser.parse', return_value=sample_feed):
             articles = fetcher.fetch(
                 query='test',
@@ -206,12 +226,22 @@ class TestGoogleNewsFetcher:
                 gl='TW'
             )
 
-        assert articles[0]['id'] == 'google_2330.TW_0'
-        assert articles[1]['id'] == 'google_2330.TW_1'
+        assert articles[0]['id'] == article_id('google', 'https://news.google.com/articles/abc123')
+        assert articles[1]['id'] == article_id('google', 'https://news.google.com/articles/def456')
+
+    def test_article_ids_survive_reordering(self, fetcher, sample_feed):
+        """should keep each article's ID when the feed reorders"""
+        with patch('services.google_news_fetcher.feedparser.parse', return_value=sample_feed):
+            first = fetcher.fetch(query='test', symbol='2330.TW')
+        sample_feed.entries.reverse()
+        with patch('services.google_news_fetcher.feedparser.parse', return_value=sample_feed):
+            second = fetcher.fetch(query='test', symbol='2330.TW')
+
+        assert {a['url']: a['id'] for a in first} == {a['url']: a['id'] for a in second}
 
-    def test_rate_limiting(self):
-        """should enforce delay between requests"""
-        fetcher = GoogleNewsFetcher(request_delay=0.1)
+    def test_fetches_are_paced(self):
+        """should space fetches by the scheduler's token bucket"""
+        fetcher = GoogleNewsFetcher(scheduler=PacingScheduler('test', TokenBucket(rate=10, burst=1)))
 
         empty_feed = MagicMock()
         empty_feed.bozo = False
@@ -223,4 +253,131 @@ class TestGoogleNewsFetcher:
             fetcher.fetch(query='test2', symbol='T2')
             elapsed = time.time() - start
 
-        assert elapsed >= 0.1
+        assert elapsed >= 0.09
+
+    def test_overloaded_scheduler_returns_empty(self):
+        """should return an empty list when the pacing queue is full"""
+        scheduler = MagicMock()
+        scheduler.submit.side_effect = PacingOverloadError('full')
+        fetcher = GoogleNewsFetcher(scheduler=scheduler)
+
+        assert fetcher.fetch(query='test', symbol='TEST') == []
+
+
+class TestGoogleNewsFetcherTransport:
+    """Tests for feed download over the pooled HTTP client"""
+
+    def test_parses_downloaded_bytes(self, mock_http_get):
+        """should download with the http client and parse the response body"""
+        fetcher = GoogleNewsFetcher(scheduler=_unpaced())
+        feed = MagicMock(bozo=False, entries=[])
+
+        with patch('services.google_news_fetcher.feedparser.parse', return_value=feed) as mock_parse:
+            fetcher.fetch(query='台積電', symbol='2330.TW', hl='zh-TW', gl='TW')
+
+        url = mock_http_get.call_args[0][0]
+        assert 'hl=zh-TW' in url and 'gl=TW' in url
+        mock_parse.assert_called_once_with(b'<rss></rss>')
+
+    def test_http_error_returns_empty(self):
+        """should return an empty list when the download fails"""
+        import requests
+
+        client = MagicMock()
+        client.get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError('503')
+        fetcher = GoogleNewsFetcher(scheduler=_unpaced(), http_client=client)
+
+        assert fetcher.fetch(query='test', symbol='TEST') == []
+
+    def test_not_modified_reuses_articles(self):
+        """should reuse the previous articles on 304 without parsing"""
+        entry = MagicMock()
+        entry.get = lambda key, default='': {
+            'title': '台積電股價創新高',
+            'link': 'https://news.google.com/articles/abc123',
+            'published': 'Mon, 09 Feb 2026 10:00:00 GMT',
+        }.get(key, default)
+        feed = MagicMock(bozo=False, entries=[entry])
+        fresh = MagicMock(status_code=200, content=b'<rss/>', headers={'ETag': '"v1"'})
+        fetcher = GoogleNewsFetcher(scheduler=_unpaced())
+
+        with patch('services.http_client.HttpClient.get',
+                   side_effect=[fresh, MagicMock(status_code=304, headers={})]) as mock_get, \
+                patch('services.google_news_fetcher.feedparser.parse', return_value=feed) as mock_parse:
+            first = fetcher.fetch(query='台積電', symbol='2330.TW')
+            second = fetcher.fetch(query='台積電', symbol='2330.TW')
+
+        assert second == first
+        assert len(second) == 1
+        assert mock_parse.call_count == 1
+        assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"v1"'}
+
+
+class TestGoogleNewsFetcherStreaming:
+    """Tests for the streaming RSS path and feedparser fallback"""
+
+    @staticmethod
+    def _serve(content):
+        response = MagicMock(status_code=200, content=content, headers={})
+        return patch('services.http_client.HttpClient.get', return_value=response)
+
+    def test_rss_is_parsed_without_feedparser(self):
+        """should read well-formed RSS with the streaming parser"""
+        published = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+        rss = (
+            '<rss version="2.0"><channel><title>feed</title><item>'
+            '<title>台積電股價創新高</title><link>https://news.google.com/articles/abc</link>'
+            f'<pubDate>{published}</pubDate><source url="https://cnyes.com">鉅亨網</source>'
+            '</item></channel></rss>'
+        ).encode('utf-8')
+        fetcher = GoogleNewsFetcher(scheduler=_unpaced())
+
+        with self._serve(rss), \
+                patch('services.google_news_fetcher.feedparser.parse') as mock_parse:
+            articles = fetcher.fetch(query='台積電', symbol='2330.TW', hl='zh-TW')
+
+        mock_parse.assert_not_called()
+        assert len(articles) == 1
+        assert articles[0]['id'] == article_id('google', 'https://news.google.com/articles/abc')
+        assert articles[0]['headline'] == '台積電股價創新高'
+        assert articles[0]['source'] == '鉅亨網'
+        assert articles[0]['language'] == 'zh-TW'
+
+    def test_items_outside_window_are_dropped(self):
+        """should skip items older than the news time window"""
+        old = format_datetime(datetime.now(timezone.utc) - timedelta(days=30), usegmt=True)
+        rss = (
+            '<rss version="2.0"><channel><item><title>Old</title>'
+            f'<link>https://e.x/old</link><pubDate>{old}</pubDate></item></channel></rss>'
+        ).encode('utf-8')
+        fetcher = GoogleNewsFetcher(scheduler=_unpaced())
+
+        with self._serve(rss):
+            assert fetcher.fetch(query='test', symbol='TEST') == []
+
+    def test_publish_time_is_utc_epoch(self):
+        """should carry published_ts and format published_at in UTC"""
+        rss = (
+            '<rss version="2.0"><channel><item><title>Headline</title>'
+            '<link>https://e.x/a</link><pubDate>Mon, 09 Feb 2026 18:00:00 +0800</pubDate>'
+            '</item></channel></rss>'
+        ).encode('utf-8')
+        fetcher = GoogleNewsFetcher(scheduler=_unpaced())
+
+        with self._serve(rss), patch('services.google_news_fetcher.NEWS_TIME_WINDOW_HOURS', 10 ** 6):
+            articles = fetcher.fetch(query='test', symbol='TEST')
+
+        assert articles[0]['published_ts'] == 1770631200
+        assert articles[0]['published_at'] == '2026-02-09T10:00:00Z'
+
+    def test_non_rss_falls_back_to_feedparser(self):
+        """should hand documents the streaming parser rejects to feedparser"""
+        atom = b'<feed xmlns="http://www.w3.org/2005/Atom"></feed>'
+        feed = MagicMock(bozo=False, entries=[])
+        fetcher = GoogleNewsFetcher(scheduler=_unpaced())
+
+        with self._serve(atom), \
+                patch('services.google_news_fetcher.feedparser.parse', return_value=feed) as mock_parse:
+            assert fetcher.fetch(query='test', symbol='TEST') == []
+
+        mock_parse.assert_called_once_with(atom)
@@ -7,6 +7,7 @@ from flask import Flask
 from unittest.mock import patch, MagicMock
 from routes.health_routes import health_bp, get_cache_status, get_uptime
 from utils.cache import cache
+from utils.cache_metrics import cache_metrics
 
 
 @pytest.fixture
@@ -142,6 +143,33 @@ class TestLivenessEndpoint:
         assert 'timestamp' in data
 
 
+class TestCacheMetricsEndpoint:
+    """Tests for /api/v1/health/cache endpoint."""
+
+    def test_cache_metrics_grouped_by_family(self, app, client):
+        """Test cache activity is reported per key family."""
+        cache.init_app(app, config={'CACHE_TYPE': 'utils.size_aware_cache.SizeAwareCache'})
+        cache_metrics.reset()
+        with app.app_context():
+            cache.set('news:AAPL', b'{}')
+            cache.get('news:AAPL')
+            cache.get('news:MSFT')
+
+        response = client.get('/api/v1/health/cache')
+        data = response.get_json()
+
+        assert response.status_code == 200
+        news = data['families']['news']
+        assert news['hits'] == 1
+        assert news['misses'] == 1
+        assert news['sets'] == 1
+        assert news['entries'] == 1
+        assert news['bytes'] == 2
+        assert news['get_latency']['count'] == 2
+        assert data['totals']['hit_ratio'] == 0.5
+        assert 'bytes' in data['stats']
+
+
 class TestGetCacheStatus:
     """Tests for get_cache_status function."""
 
@@ -153,6 +181,17 @@ class TestGetCacheStatus:
             assert status['status'] == 'healthy'
             assert status['backend'] == 'SimpleCache'
 
+    def test_cache_status_includes_backend_stats(self, app):
+        """Test occupancy stats are reported for size-aware backends."""
+        cache.init_app(app, config={'CACHE_TYPE': 'utils.size_aware_cache.SizeAwareCache'})
+
+        with app.app_context():
+            status = get_cache_status()
+
+        assert status['status'] == 'healthy'
+        assert 'bytes' in status['stats']
+        assert 'max_bytes' in status['stats']
+
 
 class TestGetUptime:
     """Tests for get_uptime function."""
@@ -0,0 +1,244 @@
+"""
+Tests for the pooled HTTP client.
+
+This module tests:
+- Connection reuse (keep-alive)
+- Retries on retryable statuses
+- Default and per-call timeouts
+- The shared per-process client
+- Conditional GET (ETag / Last-Modified) and the validator cache
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import http_client as http_client_module
+from services.http_client import ConditionalCache, HttpClient, get_http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.ports.add(self.client_address[1])
+        server.hits += 1
+        server.conditional.append(self.headers.get('If-None-Match'))
+        status = server.statuses.pop(0) if server.statuses else 200
+        if server.etag and self.headers.get('If-None-Match') == server.etag:
+            status = 304
+        body = b'' if status == 304 else server.body
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        if server.etag:
+            self.send_header('ETag', server.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.ports = set()
+    httpd.hits = 0
+    httpd.statuses = []
+    httpd.etag = None
+    httpd.body = b'ok'
+    httpd.conditional = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server):
+    return f'http://127.0.0.1:{server.server_address[1]}/feed'
+
+
+@pytest.fixture
+def client():
+    client = HttpClient(backoff_factor=0, backoff_jitter=0)
+    yield client
+    client.close()
+
+
+class TestHttpClient:
+    """Tests for HttpClient."""
+
+    def test_reuses_connections(self, server, client):
+        """should send sequential requests over one kept-alive connection"""
+        for _ in range(3):
+            assert client.get(_url(server)).status_code == 200
+
+        assert server.hits == 3
+        assert len(server.ports) == 1
+
+    def test_retries_retryable_status(self, server, client):
+        """should retry 503 and 429 and return the eventual success"""
+        server.statuses = [503, 429]
+
+        response = client.get(_url(server))
+
+        assert response.status_code == 200
+        assert server.hits == 3
+
+    def test_returns_last_response_when_retries_exhausted(self, server, client):
+        """should hand back the final error response instead of raising"""
+        server.statuses = [502, 502, 502, 502]
+
+        response = client.get(_url(server))
+
+        assert response.status_code == 502
+        assert server.hits == 3
+
+    def test_does_not_retry_client_errors(self, server, client):
+        """should not retry a 404"""
+        server.statuses = [404]
+
+        assert client.get(_url(server)).status_code == 404
+        assert server.hits == 1
+
+    def test_default_timeout(self):
+        """should pass the (connect, read) timeout unless overridden"""
+        client = HttpClient(connect_timeout=1.5, read_timeout=7)
+
+        with patch.object(client._session, 'get') as mock_get:
+            client.get('https://example.com')
+            assert mock_get.call_args[1]['timeout'] == (1.5, 7)
+
+            client.get('https://example.com', timeout=2)
+            assert mock_get.call_args[1]['timeout'] == 2
+
+    def test_sends_user_agent(self, client):
+        """should identify itself to upstream APIs"""
+        assert client._session.headers['User-Agent'].startswith('MarketVue/')
+
+
+class TestSharedClient:
+    """Tests for get_http_client."""
+
+    @pytest.fixture(autouse=True)
+    def reset_shared(self):
+        with patch.object(http_client_module, '_client', None), \
+                patch.object(http_client_module, '_client_pid', None):
+            yield
+
+    def test_returns_same_client(self):
+        """should share one client per process"""
+        assert get_http_client() is get_http_client()
+
+    def test_recreated_after_fork(self):
+        """should not reuse a client created in another process"""
+        first = get_http_client()
+        with patch('services.http_client.os.getpid', return_value=-1):
+            assert get_http_client() is not first
+
+    def test_timeouts_from_environment(self, monkeypatch):
+        """should read timeout overrides from the environment"""
+        monkeypatch.setenv('HTTP_CONNECT_TIMEOUT', '1')
+        monkeypatch.setenv('HTTP_READ_TIMEOUT', '4')
+
+        assert get_http_client()._timeout == (1.0, 4.0)
+
+
+class TestConditionalGet:
+    """Tests for HttpClient.get_conditional."""
+
+    def test_reuses_result_on_304(self, server, client):
+        """should revalidate with If-None-Match and reuse the parsed result"""
+        server.etag = '"v1"'
+        validators = ConditionalCache()
+        parse = MagicMock(side_effect=lambda response: [{'body': response.text}])
+
+        first, first_cached = client.get_conditional(_url(server), parse, validators)
+        second, second_cached = client.get_conditional(_url(server), parse, validators)
+
+        assert (first_cached, second_cached) == (False, True)
+        assert second == first == [{'body': 'ok'}]
+        assert parse.call_count == 1
+        assert server.conditional == [None, '"v1"']
+
+    def test_changed_resource_is_parsed(self, server, client):
+        """should parse again when the validator no longer matches"""
+        server.etag = '"v1"'
+        validators = ConditionalCache()
+        client.get_conditional(_url(server), lambda r: r.text, validators)
+
+        server.etag, server.body = '"v2"', b'new'
+        value, not_modified = client.get_conditional(_url(server), lambda r: r.text, validators)
+
+        assert (value, not_modified) == ('new', False)
+
+    def test_reused_result_is_a_copy(self, server, client):
+        """should not let callers mutate the stored result"""
+        server.etag = '"v1"'
+        validators = ConditionalCache()
+        client.get_conditional(_url(server), lambda r: [{'n': 1}], validators)
+
+        value, _ = client.get_conditional(_url(server), lambda r: [{'n': 1}], validators)
+        value[0]['n'] = 99
+        again, _ = client.get_conditional(_url(server), lambda r: [{'n': 1}], validators)
+
+        assert again == [{'n': 1}]
+
+    def test_error_status_raises(self, server, client):
+        """should raise for error statuses"""
+        import requests
+
+        server.statuses = [404]
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_conditional(_url(server), lambda r: r.text, ConditionalCache())
+
+
+class TestConditionalCache:
+    """Tests for ConditionalCache."""
+
+    @staticmethod
+    def _response(**headers):
+        return MagicMock(headers=headers)
+
+    def test_builds_conditional_headers(self):
+        """should send both validators when both were returned"""
+        validators = ConditionalCache()
+        validators.store('k', self._response(**{
+            'ETag': '"abc"', 'Last-Modified': 'Mon, 09 Feb 2026 10:00:00 GMT'
+        }), [1])
+
+        assert validators.request_headers('k') == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon, 09 Feb 2026 10:00:00 GMT',
+        }
+
+    def test_skips_responses_without_validators(self):
+        """should not remember responses that cannot be revalidated"""
+        validators = ConditionalCache()
+        validators.store('k', self._response(), [1])
+
+        assert validators.request_headers('k') == {}
+        assert validators.reuse('k') is None
+
+    def test_skips_none_results(self):
+        """should not remember unusable results"""
+        validators = ConditionalCache()
+        validators.store('k', self._response(ETag='"abc"'), None)
+        assert len(validators) == 0
+
+    def test_bounded_lru(self):
+        """should evict the least recently used resource"""
+        validators = ConditionalCache(max_entries=2)
+        for key in ('a', 'b'):
+            validators.store(key, self._response(ETag=f'"{key}"'), key)
+        validators.reuse('a')
+        validators.store('c', self._response(ETag='"c"'), 'c')
+
+        assert validators.reuse('b') is None
+        assert validators.reuse('a') == 'a'
@@ -0,0 +1,39 @@
+"""
+Tests for JSON fragment splicing utilities.
+"""
+
+import json
+
+from utils.json_fragments import encode_fragment, splice_array, splice_object
+
+
+class TestJsonFragments:
+    """Tests for encode/splice helpers."""
+
+    def test_encode_fragment_is_compact_utf8(self):
+        """Test fragments are compact and keep non-ASCII characters."""
+        fragment = encode_fragment({'zh-TW': '台積電', 'price': 1.5})
+
+        assert fragment == '{"zh-TW":"台積電","price":1.5}'.encode('utf-8')
+
+    def test_splice_array(self):
+        """Test fragments are joined into a valid array."""
+        assert json.loads(splice_array([b'{"a":1}', b'{"b":2}'])) == [{'a': 1}, {'b': 2}]
+        assert splice_array([]) == b'[]'
+
+    def test_splice_object_with_raw_and_plain_fields(self):
+        """Test raw fragments and plain values combine into one object."""
+        body = splice_object(
+            {'stocks': splice_array([b'{"symbol":"AAPL"}'])},
+            {'errors': None, 'timestamp': '2024-01-01T00:00:00'}
+        )
+
+        assert json.loads(body) == {
+            'stocks': [{'symbol': 'AAPL'}],
+            'errors': None,
+            'timestamp': '2024-01-01T00:00:00'
+        }
+
+    def test_splice_object_without_plain_fields(self):
+        """Test splicing with only raw fields."""
+        assert json.loads(splice_object({'results': b'{}'})) == {'results': {}}
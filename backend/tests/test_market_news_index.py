@@ -0,0 +1,264 @@
+"""
+Tests for the market news index
+
+Tests cover:
+- Ticker and company-name matching
+- Indexing by Finnhub related symbols and text mentions
+- Refresh interval (upstream calls independent of symbol count) and minId
+- Symbols queried for the first time
+- Expiry and size bound
+- NewsService market ingestion mode
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from routes.news_routes import get_news_service, init_news_service, set_news_service
+from services.market_news_index import MarketNewsIndex, SymbolMatcher
+from services.news_service import NewsService
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+def _article(article_id, headline, summary='', hours_ago=1):
+    return {
+        'id': f'finnhub_{article_id}',
+        'headline': headline,
+        'summary': summary,
+        'url': f'https://e.x/{article_id}',
+        'published_ts': int(time.time() - hours_ago * 3600),
+    }
+
+
+@pytest.fixture
+def name_service():
+    service = MagicMock()
+    names = {'AAPL': 'Apple', 'MSFT': 'Microsoft', '2330.TW': 'TSMC'}
+    service.get_all_mapped_symbols.return_value = list(names)
+    service.get_company_name.side_effect = lambda symbol: {'en-US': names[symbol]}
+    return service
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = MagicMock()
+    fetcher.fetch_market_news.return_value = [
+        (_article(1, 'Apple unveils new iPhone'), []),
+        (_article(2, 'Chip stocks rally', 'Gains led by $NVDA'), ['AMD']),
+        (_article(3, 'Microsoft and Apple settle dispute'), []),
+    ]
+    return fetcher
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def index(fetcher, name_service, clock):
+    return MarketNewsIndex(
+        fetcher=fetcher,
+        name_service=name_service,
+        refresh_interval=300,
+        categories=('general',),
+        clock=clock,
+    )
+
+
+def _ids(articles):
+    return sorted(article['id'] for article in articles)
+
+
+class TestSymbolMatcher:
+    """Tests for SymbolMatcher"""
+
+    def test_matches_tickers_and_names(self):
+        """should match tickers (with or without $) and company names"""
+        matcher = SymbolMatcher({'AAPL': ['Apple'], 'MSFT': ['Microsoft']})
+
+        assert matcher.match('Apple beats; $MSFT slips') == {'AAPL', 'MSFT'}
+        assert matcher.match('AAPL and MSFT') == {'AAPL', 'MSFT'}
+
+    def test_requires_whole_words(self):
+        """should not match inside other words or in lower case"""
+        matcher = SymbolMatcher({'AAPL': ['Apple'], 'META': ['Meta']})
+
+        assert matcher.match('pineapple metadata apple AAPLX') == set()
+
+    def test_longest_name_wins(self):
+        """should prefer longer names sharing a prefix"""
+        matcher = SymbolMatcher({'META': ['Meta'], 'MPLX': ['Meta Platforms']})
+
+        assert matcher.match('Meta Platforms rises') == {'MPLX'}
+
+    def test_added_symbols_are_matched(self):
+        """should match symbols added after construction"""
+        matcher = SymbolMatcher()
+        matcher.add('TSLA', ['Tesla'])
+
+        assert 'TSLA' in matcher
+        assert matcher.match('Tesla deliveries') == {'TSLA'}
+
+
+class TestMarketNewsIndex:
+    """Tests for MarketNewsIndex"""
+
+    def test_indexes_by_name_mentions(self, index):
+        """should index articles under company names from CompanyNameService"""
+        assert _ids(index.articles_for('AAPL')) == ['finnhub_1', 'finnhub_3']
+        assert _ids(index.articles_for('msft')) == ['finnhub_3']
+
+    def test_indexes_by_related_and_tickers(self, index):
+        """should index Finnhub related symbols and ticker mentions"""
+        assert _ids(index.articles_for('AMD')) == ['finnhub_2']
+        assert _ids(index.articles_for('NVDA')) == ['finnhub_2']
+
+    def test_non_us_names_are_not_matched(self, index, fetcher):
+        """should only build name matchers for US symbols"""
+        fetcher.fetch_market_news.return_value = [(_article(4, 'TSMC expands in Arizona'), [])]
+
+        assert index.articles_for('2330.TW') == []
+
+    def test_upstream_calls_scale_with_time(self, index, fetcher, clock):
+        """should pull once per interval however many symbols are queried"""
+        for symbol in ['AAPL', 'MSFT', 'AMD', 'NVDA', 'TSLA']:
+            index.articles_for(symbol)
+        assert fetcher.fetch_market_news.call_count == 1
+
+        clock.now += 301
+        index.articles_for('AAPL')
+        assert fetcher.fetch_market_news.call_count == 2
+
+    def test_refresh_is_incremental(self, index, fetcher, clock):
+        """should pass the highest Finnhub ID seen as minId"""
+        index.articles_for('AAPL')
+        fetcher.fetch_market_news.return_value = [(_article(5, 'Apple opens store'), [])]
+        clock.now += 301
+
+        articles = index.articles_for('AAPL')
+
+        assert fetcher.fetch_market_news.call_args[1]['min_id'] == 3
+        assert _ids(articles) == ['finnhub_1', 'finnhub_3', 'finnhub_5']
+
+    def test_new_symbol_matches_held_articles(self, index):
+        """should tag already indexed articles for a newly queried ticker"""
+        index.refresh()
+        index._articles['finnhub_1']['summary'] = 'Suppliers such as QCOM benefit'
+
+        assert _ids(index.articles_for('QCOM')) == ['finnhub_1']
+
+    def test_concurrent_new_symbols(self, index):
+        """should index symbols queried concurrently for the first time"""
+        index.refresh()
+        symbols = [f'T{i:03d}' for i in range(200)]
+        for symbol in symbols:
+            index._articles['finnhub_1']['summary'] += f' {symbol}'
+        errors = []
+
+        def query(symbol):
+            try:
+                assert _ids(index.articles_for(symbol)) == ['finnhub_1']
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=query, args=(symbol,)) for symbol in symbols]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def test_expired_articles_are_dropped(self, fetcher, name_service, clock):
+        """should drop articles outside the window on refresh"""
+        fetcher.fetch_market_news.return_value = [
+            (_article(1, 'Apple old news', hours_ago=100), []),
+            (_article(2, 'Apple new news'), []),
+        ]
+        index = MarketNewsIndex(fetcher=fetcher, name_service=name_service, clock=clock)
+
+        assert _ids(index.articles_for('AAPL')) == ['finnhub_2']
+        assert len(index) == 1
+
+    def test_size_bound_keeps_newest(self, fetcher, name_service, clock):
+        """should keep only the newest max_articles"""
+        fetcher.fetch_market_news.return_value = [
+            (_article(i, f'Apple story {i}', hours_ago=i), []) for i in range(1, 6)
+        ]
+        index = MarketNewsIndex(fetcher=fetcher, name_service=name_service, max_articles=2, clock=clock)
+
+        assert _ids(index.articles_for('AAPL')) == ['finnhub_1', 'finnhub_2']
+
+
+class TestNewsServiceMarketMode:
+    """Tests for NEWS_INGESTION_MODE=market in NewsService"""
+
+    def test_us_symbols_use_market_index(self, fetcher, name_service):
+        """should answer US symbols from the index without per-symbol calls"""
+        finnhub = MagicMock()
+        finnhub.fetch_market_news = fetcher.fetch_market_news
+        service = NewsService(
+            finnhub_fetcher=finnhub,
+            google_fetcher=MagicMock(),
+            name_service=name_service,
+            ingestion_mode='market',
+        )
+
+        results = service.get_news_batch(['AAPL', 'MSFT', 'AMD'])
+
+        assert results['AAPL']['total'] == 2
+        assert results['AMD']['total'] == 1
+        finnhub.fetch.assert_not_called()
+        assert finnhub.fetch_market_news.call_count == 2  # general + merger, once
+
+    def test_asian_symbols_still_use_google(self, name_service):
+        """should keep routing TW/HK/JP symbols to Google News"""
+        google = MagicMock()
+        google.fetch.return_value = []
+        service = NewsService(
+            finnhub_fetcher=MagicMock(),
+            google_fetcher=google,
+            name_service=name_service,
+            ingestion_mode='market',
+        )
+
+        service.get_news('2330.TW')
+
+        google.fetch.assert_called_once()
+
+    def test_symbol_mode_is_default(self):
+        """should fetch per symbol unless market mode is configured"""
+        finnhub = MagicMock()
+        finnhub.fetch.return_value = []
+        service = NewsService(finnhub_fetcher=finnhub, google_fetcher=MagicMock(), name_service=MagicMock())
+
+        service.get_news('AAPL')
+
+        finnhub.fetch.assert_called_once_with('AAPL')
+
+    def test_mode_comes_from_app_config(self):
+        """should build the routes' NewsService with NEWS_INGESTION_MODE from app.config"""
+        app = Flask(__name__)
+        app.config['NEWS_INGESTION_MODE'] = 'market'
+        try:
+            init_news_service(app)
+            assert get_news_service()._market_index is not None
+
+            app.config['NEWS_INGESTION_MODE'] = 'symbol'
+            init_news_service(app)
+            assert get_news_service()._market_index is None
+        finally:
+            set_news_service(None)
@@ -0,0 +1,198 @@
+"""
+Tests for Prometheus-style metrics.
+
+This module tests:
+- Counter, gauge and histogram rendering
+- Merging worker snapshots through the multiprocess store
+- Upstream and thread-pool instrumentation
+- Request middleware and the /metrics endpoint
+"""
+
+import json
+import os
+
+import pytest
+from flask import Flask
+
+from routes.metrics_routes import metrics_bp
+from utils.metrics import (
+    COUNTER,
+    GAUGE,
+    HISTOGRAM,
+    MetricsRegistry,
+    MultiprocessStore,
+    PROVIDER_FINNHUB,
+    init_metrics,
+    instrument_task,
+    registry,
+    track_upstream,
+)
+
+
+@pytest.fixture
+def local_registry():
+    reg = MetricsRegistry()
+    reg.declare('jobs_total', COUNTER, 'Jobs run')
+    reg.declare('jobs_running', GAUGE, 'Jobs running')
+    reg.declare('job_seconds', HISTOGRAM, 'Job latency', (0.1, 1))
+    return reg
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry rendering."""
+
+    def test_counter_and_gauge(self, local_registry):
+        local_registry.inc('jobs_total', {'kind': 'refresh'})
+        local_registry.inc('jobs_total', {'kind': 'refresh'}, 2)
+        local_registry.add('jobs_running', None, 3)
+        local_registry.add('jobs_running', None, -1)
+
+        text = local_registry.render()
+        assert '# TYPE jobs_total counter' in text
+        assert 'jobs_total{kind="refresh"} 3' in text
+        assert 'jobs_running 2' in text
+
+    def test_histogram_buckets_are_cumulative(self, local_registry):
+        for value in (0.05, 0.5, 5):
+            local_registry.observe('job_seconds', {'kind': 'a'}, value)
+
+        text = local_registry.render()
+        assert 'job_seconds_bucket{kind="a",le="0.1"} 1' in text
+        assert 'job_seconds_bucket{kind="a",le="1"} 2' in text
+        assert 'job_seconds_bucket{kind="a",le="+Inf"} 3' in text
+        assert 'job_seconds_count{kind="a"} 3' in text
+        assert 'job_seconds_sum{kind="a"} 5.55' in text
+
+    def test_label_values_are_escaped(self, local_registry):
+        local_registry.inc('jobs_total', {'kind': 'say "hi"'})
+        assert 'jobs_total{kind="say \\"hi\\""} 1' in local_registry.render()
+
+    def test_snapshots_are_summed(self, local_registry):
+        local_registry.inc('jobs_total')
+        local_registry.observe('job_seconds', None, 0.5)
+        first = local_registry.snapshot()
+        second = json.loads(json.dumps(local_registry.snapshot()))
+
+        text = local_registry.render([first, second])
+        assert 'jobs_total 2' in text
+        assert 'job_seconds_count 2' in text
+
+
+class TestMultiprocessStore:
+    """Tests for the shared snapshot directory."""
+
+    def test_workers_are_aggregated(self, local_registry, tmp_path):
+        store = MultiprocessStore(str(tmp_path))
+        local_registry.inc('jobs_total')
+        store.write(local_registry.snapshot())
+        other = {**local_registry.snapshot(), 'pid': os.getpid() + 1}
+        store.write(other)
+
+        assert 'jobs_total 2' in local_registry.render(store.read_all())
+
+    def test_gauges_of_exited_workers_are_dropped(self, local_registry, tmp_path, mocker):
+        mocker.patch('utils.metrics.os.kill', side_effect=ProcessLookupError)
+        store = MultiprocessStore(str(tmp_path))
+        local_registry.inc('jobs_total')
+        local_registry.add('jobs_running', None, 1)
+        store.write({**local_registry.snapshot(), 'pid': 999999})
+
+        text = local_registry.render(store.read_all())
+        assert 'jobs_total 1' in text
+        assert 'jobs_running' not in text
+
+    def test_unreadable_files_are_skipped(self, tmp_path):
+        (tmp_path / 'metrics_1.json').write_text('{broken')
+        assert MultiprocessStore(str(tmp_path)).read_all() == []
+
+
+class TestInstrumentation:
+    """Tests for upstream and thread-pool helpers."""
+
+    def test_upstream_success(self):
+        with track_upstream(PROVIDER_FINNHUB):
+            pass
+
+        text = registry.render()
+        assert 'upstream_request_duration_seconds_count{provider="finnhub"} 1' in text
+        assert 'upstream_errors_total' not in text
+        assert 'upstream_requests_in_flight{provider="finnhub"} 0' in text
+
+    def test_upstream_exception_counts_error(self):
+        with pytest.raises(RuntimeError):
+            with track_upstream(PROVIDER_FINNHUB):
+                raise RuntimeError('down')
+
+        assert 'upstream_errors_total{provider="finnhub"} 1' in registry.render()
+
+    def test_upstream_soft_failure(self):
+        with track_upstream(PROVIDER_FINNHUB) as call:
+            call.mark_failed()
+
+        assert 'upstream_errors_total{provider="finnhub"} 1' in registry.render()
+
+    def test_upstream_not_modified(self):
+        with track_upstream(PROVIDER_FINNHUB) as call:
+            call.mark_not_modified()
+
+        text = registry.render()
+        assert 'upstream_not_modified_total{provider="finnhub"} 1' in text
+        assert 'upstream_errors_total' not in text
+
+    def test_task_queue_depth(self):
+        task = instrument_task(lambda: registry.render())
+        assert 'thread_pool_tasks{pool="batch",state="queued"} 1' in registry.render()
+
+        inside = task()
+        assert 'thread_pool_tasks{pool="batch",state="running"} 1' in inside
+        assert 'thread_pool_tasks{pool="batch",state="queued"} 0' in registry.render()
+
+
+class TestMetricsEndpoint:
+    """Tests for request middleware and /metrics."""
+
+    def _make_app(self, **config):
+        app = Flask(__name__)
+        app.config.update(config)
+        init_metrics(app)
+        app.register_blueprint(metrics_bp)
+
+        @app.route('/items/<item_id>')
+        def item(item_id):
+            return {'id': item_id}
+
+        return app
+
+    def test_route_latency_by_template_and_status(self):
+        client = self._make_app().test_client()
+        client.get('/items/1')
+        client.get('/items/2')
+        client.get('/missing')
+
+        text = client.get('/metrics').get_data(as_text=True)
+        assert 'http_request_duration_seconds_count{method="GET",route="/items/<item_id>",status="200"} 2' in text
+        assert 'route="unmatched",status="404"' in text
+        assert 'http_requests_in_flight 1' in text  # the scrape itself
+
+    def test_content_type(self):
+        response = self._make_app().test_client().get('/metrics')
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+
+    def test_disabled(self):
+        client = self._make_app(METRICS_ENABLED=False).test_client()
+        assert client.get('/metrics').status_code == 404
+
+    def test_multiprocess_dir_is_used(self, tmp_path):
+        client = self._make_app(METRICS_MULTIPROC_DIR=str(tmp_path)).test_client()
+        client.get('/items/1')
+        client.get('/metrics')
+
+        assert os.path.exists(tmp_path / f'metrics_{os.getpid()}.json')
@@ -0,0 +1,151 @@
+"""
+Tests for near-duplicate news collapsing
+
+Tests cover:
+- Headline token extraction (source suffixes, CJK bigrams)
+- MinHash signatures and Jaccard similarity
+- Collapsing by canonical URL and by headline similarity
+- Representative choice and duplicates counts
+"""
+
+import time
+
+from utils.news_dedup import collapse_duplicates, headline_features, jaccard, minhash
+
+
+def _article(headline, url, source=None):
+    return {'headline': headline, 'url': url, 'source': source}
+
+
+class TestHeadlineFeatures:
+    """Tests for headline_features"""
+
+    def test_strips_source_suffix(self):
+        """should drop the ' - {source}' suffix Google News appends"""
+        features = headline_features('Fed holds rates - Reuters', 'Reuters')
+
+        assert features == {'fed', 'holds', 'rates'}
+
+    def test_keeps_suffix_of_other_source(self):
+        """should only strip the article's own source name"""
+        assert 'cnbc' in headline_features('Fed holds rates - CNBC', 'Reuters')
+
+    def test_cjk_uses_bigrams(self):
+        """should split CJK runs into character bigrams"""
+        assert headline_features('台積電大漲') == {'台積', '積電', '電大', '大漲'}
+
+
+class TestMinHash:
+    """Tests for minhash and jaccard"""
+
+    def test_signature_is_deterministic(self):
+        """should give equal sets equal signatures"""
+        a = frozenset({'apple', 'shares', 'jump'})
+
+        assert minhash(a) == minhash(frozenset(a))
+
+    def test_signature_agreement_tracks_similarity(self):
+        """should agree on more positions for more similar sets"""
+        base = frozenset(f'w{i}' for i in range(20))
+        close = frozenset(list(base)[:18]) | {'x1', 'x2'}
+        far = frozenset(list(base)[:5]) | {f'y{i}' for i in range(15)}
+
+        def agreement(a, b):
+            return sum(x == y for x, y in zip(minhash(a), minhash(b)))
+
+        assert agreement(base, close) > agreement(base, far)
+
+    def test_jaccard(self):
+        """should compute intersection over union"""
+        assert jaccard(frozenset('ab'), frozenset('bc')) == 1 / 3
+        assert jaccard(frozenset(), frozenset()) == 1.0
+
+
+class TestCollapseDuplicates:
+    """Tests for collapse_duplicates"""
+
+    def test_syndicated_headlines_collapse(self):
+        """should collapse one story carried by several outlets"""
+        articles = [
+            _article('Fed holds interest rates steady, signals two cuts - Reuters', 'https://a.x/1', 'Reuters'),
+            _article('Fed holds interest rates steady, signals two cuts - CNBC', 'https://b.x/2', 'CNBC'),
+            _article('Fed holds rates steady, signals two cuts', 'https://c.x/3', 'AP'),
+        ]
+
+        result = collapse_duplicates(articles)
+
+        assert len(result) == 1
+        assert result[0]['url'] == 'https://a.x/1'
+        assert result[0]['duplicates'] == 2
+
+    def test_distinct_stories_are_kept(self):
+        """should keep related but different stories apart"""
+        articles = [
+            _article('Apple shares fall after earnings', 'https://a.x/1'),
+            _article('Apple shares jump after earnings beat', 'https://a.x/2'),
+            _article('Tesla recalls 2 million vehicles over autopilot', 'https://a.x/3'),
+            _article('Ford recalls 2 million vehicles over brakes', 'https://a.x/4'),
+        ]
+
+        result = collapse_duplicates(articles)
+
+        assert len(result) == 4
+        assert all(article['duplicates'] == 0 for article in result)
+
+    def test_same_canonical_url_collapses(self):
+        """should collapse copies of one URL regardless of headline"""
+        articles = [
+            _article('Short', 'https://a.x/story?utm_source=rss'),
+            _article('Different', 'https://A.X/story/'),
+        ]
+
+        result = collapse_duplicates(articles)
+
+        assert len(result) == 1
+        assert result[0]['duplicates'] == 1
+
+    def test_cjk_headlines_collapse(self):
+        """should collapse lightly edited Chinese headlines"""
+        articles = [
+            _article('台積電2奈米試產順利 股價創新高', 'https://a.x/1'),
+            _article('台積電2奈米試產順利，股價再創新高', 'https://b.x/1'),
+        ]
+
+        assert len(collapse_duplicates(articles)) == 1
+
+    def test_short_headlines_only_collapse_by_url(self):
+        """should not cluster headlines with too few tokens"""
+        articles = [_article('Apple news', 'https://a.x/1'), _article('Apple news', 'https://b.x/1')]
+
+        assert len(collapse_duplicates(articles)) == 2
+
+    def test_preserves_order_and_input(self):
+        """should keep input order and leave the input unmodified"""
+        articles = [
+            _article('Nvidia hits record high on AI demand', 'https://a.x/1'),
+            _article('Oil prices slide as supply concerns ease', 'https://a.x/2'),
+            _article('Nvidia hits a record high on AI demand', 'https://b.x/1'),
+        ]
+
+        result = collapse_duplicates(articles)
+
+        assert [a['url'] for a in result] == ['https://a.x/1', 'https://a.x/2']
+        assert 'duplicates' not in articles[0]
+
+    def test_scales_roughly_linearly(self):
+        """should not compare every pair of articles"""
+        def build(n):
+            return [
+                _article(' '.join(f'w{i}x{j}' for j in range(8)), f'https://a.x/{i}')
+                for i in range(n)
+            ]
+
+        collapse_duplicates(build(50))
+        started = time.perf_counter()
+        collapse_duplicates(build(500))
+        small = time.perf_counter() - started
+        started = time.perf_counter()
+        collapse_duplicates(build(2000))
+        large = time.perf_counter() - started
+
+        assert large < small * 10
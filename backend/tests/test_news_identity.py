@@ -0,0 +1,55 @@
+"""
+Tests for news article identity
+
+Tests cover:
+- URL canonicalization (case, ports, fragments, tracking parameters)
+- Stable, prefix-scoped article IDs
+"""
+
+import pytest
+
+from utils.news_identity import article_id, canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    """Tests for canonicalize_url"""
+
+    @pytest.mark.parametrize('url, expected', [
+        ('HTTPS://Example.COM/a', 'https://example.com/a'),
+        ('https://example.com:443/a', 'https://example.com/a'),
+        ('http://example.com:8080/a', 'http://example.com:8080/a'),
+        ('https://example.com/a/', 'https://example.com/a'),
+        ('https://example.com', 'https://example.com/'),
+        ('https://example.com/a#section', 'https://example.com/a'),
+        ('https://example.com/a?b=2&a=1', 'https://example.com/a?a=1&b=2'),
+        ('https://news.google.com/rss/articles/X?oc=5', 'https://news.google.com/rss/articles/X'),
+        ('https://example.com/a?utm_source=rss&UTM_Medium=x&id=7', 'https://example.com/a?id=7'),
+    ])
+    def test_canonical_forms(self, url, expected):
+        """should normalize equivalent URLs to one form"""
+        assert canonicalize_url(url) == expected
+
+    def test_unparseable_url_is_returned_stripped(self):
+        """should leave values that are not absolute URLs alone"""
+        assert canonicalize_url('  not a url ') == 'not a url'
+        assert canonicalize_url('https://example.com:bad/') == 'https://example.com:bad/'
+
+
+class TestArticleId:
+    """Tests for article_id"""
+
+    def test_equivalent_urls_share_id(self):
+        """should give equivalent URLs the same ID"""
+        assert article_id('google', 'https://e.x/a?oc=5') == article_id('google', 'HTTPS://E.X/a/')
+
+    def test_distinct_urls_differ(self):
+        """should give different articles different IDs"""
+        assert article_id('google', 'https://e.x/a') != article_id('google', 'https://e.x/b')
+
+    def test_format(self):
+        """should prefix a fixed-length hex digest"""
+        prefix, digest = article_id('google', 'https://e.x/a').split('_')
+
+        assert prefix == 'google'
+        assert len(digest) == 16
+        int(digest, 16)
@@ -0,0 +1,188 @@
+"""
+Tests for the background news poller
+
+Tests cover:
+- Tracking requested symbols (LRU bound, idle expiry)
+- Refreshing missing and soon-to-expire entries into news:{SYMBOL}
+- Per-source refresh budgets
+- Route integration (requests are recorded, polled entries are cache hits)
+- Enabling through NEWS_POLLER_ENABLED
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from flask import jsonify
+
+from routes.news_routes import set_news_service
+from services.news_poller import NewsPoller, init_news_poller, record_news_request
+from utils.cache import cache
+from utils.response_cache import build_payload
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+def _result(symbol):
+    return {'symbol': symbol, 'news': [], 'total': 0, 'cached_at': '2026-02-09T10:05:00Z'}
+
+
+@pytest.fixture
+def cached_app(app):
+    """App using an in-memory cache."""
+    cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+    with app.app_context():
+        cache.clear()
+    yield app
+    cache.init_app(app, config={'CACHE_TYPE': 'NullCache', 'CACHE_NO_NULL_WARNING': True})
+
+
+@pytest.fixture
+def service():
+    """NewsService stub routing .TW to Google News and the rest to Finnhub."""
+    service = MagicMock()
+    service.source_for_symbol.side_effect = (
+        lambda symbol: 'google_news' if symbol.endswith('.TW') else 'finnhub'
+    )
+    service.get_news_batch.side_effect = lambda symbols: {s: _result(s) for s in symbols}
+    return service
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def poller(cached_app, service, clock):
+    poller = NewsPoller(cached_app, lambda: service, lead=120, idle=600, clock=clock)
+    poller._ensure_running = lambda: None  # drive cycles by hand
+    return poller
+
+
+def _cache_news(app, symbol, timeout):
+    with app.app_context():
+        payload = build_payload(jsonify(_result(symbol)), timeout=timeout)
+        cache.set(f'news:{symbol}', payload)
+
+
+class TestTracking:
+    """Tests for NewsPoller.record / tracked"""
+
+    def test_records_uppercased_symbols(self, poller):
+        """should track requested symbols, uppercased and de-duplicated"""
+        poller.record(['aapl', 'AAPL', '2330.tw'])
+
+        assert poller.tracked() == ['AAPL', '2330.TW']
+
+    def test_idle_symbols_are_dropped(self, poller, clock):
+        """should stop tracking symbols not requested within the idle window"""
+        poller.record(['AAPL'])
+        clock.now += 300
+        poller.record(['MSFT'])
+        clock.now += 400
+
+        assert poller.tracked() == ['MSFT']
+
+    def test_tracking_is_bounded(self, cached_app, service):
+        """should drop the least recently requested symbol past max_symbols"""
+        poller = NewsPoller(cached_app, lambda: service, max_symbols=2)
+        poller._ensure_running = lambda: None
+        poller.record(['AAPL', 'MSFT'])
+        poller.record(['AAPL', 'TSLA'])
+
+        assert poller.tracked() == ['AAPL', 'TSLA']
+
+
+class TestPollOnce:
+    """Tests for NewsPoller.poll_once"""
+
+    def test_refreshes_missing_entries(self, poller, service, cached_app):
+        """should fetch tracked symbols without a cache entry and cache them"""
+        poller.record(['AAPL'])
+
+        assert poller.poll_once() == 1
+
+        service.get_news_batch.assert_called_once_with(['AAPL'])
+        with cached_app.app_context():
+            assert cache.get('news:AAPL')['expires_at'] is not None
+
+    def test_skips_fresh_entries(self, poller, service, cached_app):
+        """should leave entries that outlive the lead window alone"""
+        _cache_news(cached_app, 'AAPL', timeout=900)
+        poller.record(['AAPL'])
+
+        assert poller.poll_once() == 0
+        service.get_news_batch.assert_not_called()
+
+    def test_refreshes_entries_about_to_expire(self, poller, service, cached_app):
+        """should refresh entries expiring within the lead window, soonest first"""
+        _cache_news(cached_app, 'AAPL', timeout=100)
+        _cache_news(cached_app, 'MSFT', timeout=50)
+        poller.record(['AAPL', 'MSFT'])
+
+        poller.poll_once()
+
+        service.get_news_batch.assert_called_once_with(['MSFT', 'AAPL'])
+
+    def test_respects_per_source_budget(self, cached_app, service, clock):
+        """should cap refreshes per source per cycle and defer the rest"""
+        poller = NewsPoller(cached_app, lambda: service, budget={'finnhub': 1, 'google_news': 2}, clock=clock)
+        poller._ensure_running = lambda: None
+        poller.record(['AAPL', 'MSFT', '2330.TW', '2317.TW'])
+
+        assert poller.poll_once() == 3
+
+        refreshed = service.get_news_batch.call_args[0][0]
+        assert sorted(refreshed) == ['2317.TW', '2330.TW', 'AAPL']
+
+    def test_nothing_tracked(self, poller, service):
+        """should do nothing without tracked symbols"""
+        assert poller.poll_once() == 0
+        service.get_news_batch.assert_not_called()
+
+
+class TestRouteIntegration:
+    """Tests for the poller wired into the news routes"""
+
+    @pytest.fixture
+    def enabled(self, cached_app, service):
+        cached_app.config['NEWS_POLLER_ENABLED'] = True
+        poller = init_news_poller(cached_app, lambda: service)
+        poller._ensure_running = lambda: None
+        set_news_service(service)
+        yield poller
+        cached_app.config['NEWS_POLLER_ENABLED'] = False
+        init_news_poller(cached_app, lambda: service)
+        set_news_service(None)
+
+    def test_routes_record_symbols(self, enabled, cached_app):
+        """should track symbols from single and batch news requests"""
+        client = cached_app.test_client()
+        client.get('/api/v1/news/aapl')
+        client.post('/api/v1/news/batch', json={'symbols': ['MSFT', '2330.TW']})
+
+        assert enabled.tracked() == ['AAPL', 'MSFT', '2330.TW']
+
+    def test_polled_entry_is_served_as_hit(self, enabled, cached_app, service):
+        """should let interactive reads hit entries written by the poller"""
+        record_news_request(['AAPL'])
+        enabled.poll_once()
+
+        response = cached_app.test_client().get('/api/v1/news/AAPL')
+
+        assert response.headers['X-Cache'] == 'HIT'
+        service.get_news.assert_not_called()
+
+    def test_disabled_by_default(self, cached_app, service):
+        """should not create a poller unless NEWS_POLLER_ENABLED is set"""
+        assert init_news_poller(cached_app, lambda: service) is None
+        record_news_request(['AAPL'])  # no-op
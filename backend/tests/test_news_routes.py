@@ -5,6 +5,8 @@ Tests cover:
 - GET /api/v1/news/<symbol> success
 - Invalid symbol format
 - Error handling
+- GET /api/v1/news/<symbol>?since_id= deltas
+- POST /api/v1/news/batch per-symbol caching and validation
 """
 
 import pytest
@@ -118,3 +120,182 @@ class TestNewsEndpoint:
         client.get('/api/v1/news/aapl')
         call_kwargs = self.mock_service.get_news.call_args[1]
         assert call_kwargs['symbol'] == 'AAPL'
+
+
+@pytest.fixture
+def cached_client(app):
+    """Client whose app uses an in-memory cache."""
+    from utils.cache import cache
+
+    cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+    with app.app_context():
+        cache.clear()
+    yield app.test_client()
+    cache.init_app(app, config={'CACHE_TYPE': 'NullCache', 'CACHE_NO_NULL_WARNING': True})
+
+
+def _news_result(symbol):
+    return {'symbol': symbol, 'news': [], 'total': 0, 'cached_at': '2026-02-09T10:05:00Z'}
+
+
+class TestNewsBatchEndpoint:
+    """Tests for POST /api/v1/news/batch endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def setup_mock_service(self):
+        """Set up mock news service returning one result per symbol."""
+        self.mock_service = MagicMock()
+        self.mock_service.get_news_batch.side_effect = (
+            lambda symbols: {symbol: _news_result(symbol) for symbol in symbols}
+        )
+        set_news_service(self.mock_service)
+        yield
+        set_news_service(None)
+
+    def test_batch_returns_per_symbol_map(self, client):
+        """should return one entry per symbol, in request order"""
+        response = client.post('/api/v1/news/batch', json={'symbols': ['aapl', '2330.TW']})
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert list(data['news']) == ['AAPL', '2330.TW']
+        assert data['news']['2330.TW']['symbol'] == '2330.TW'
+        assert data['cache_misses'] == 2
+        assert response.headers['X-Cache'] == 'MISS'
+        self.mock_service.get_news_batch.assert_called_once_with(['AAPL', '2330.TW'])
+
+    def test_batch_fetches_only_misses(self, cached_client):
+        """should serve cached symbols and fetch only the rest"""
+        cached_client.post('/api/v1/news/batch', json={'symbols': ['AAPL']})
+        self.mock_service.get_news_batch.reset_mock()
+
+        response = cached_client.post('/api/v1/news/batch', json={'symbols': ['AAPL', 'MSFT']})
+
+        data = response.get_json()
+        assert data['cache_hits'] == 1
+        assert data['cache_misses'] == 1
+        assert data['news']['AAPL']['symbol'] == 'AAPL'
+        assert response.headers['X-Cache'] == 'PARTIAL'
+        self.mock_service.get_news_batch.assert_called_once_with(['MSFT'])
+
+    def test_batch_shares_cache_with_single_endpoint(self, cached_client):
+        """should serve single-symbol requests from entries the batch wrote"""
+        cached_client.post('/api/v1/news/batch', json={'symbols': ['AAPL']})
+
+        response = cached_client.get('/api/v1/news/AAPL')
+
+        assert response.headers['X-Cache'] == 'HIT'
+        self.mock_service.get_news.assert_not_called()
+
+    def test_batch_all_cached(self, cached_client):
+        """should not call the service when every symbol is cached"""
+        cached_client.post('/api/v1/news/batch', json={'symbols': ['AAPL', 'MSFT']})
+        self.mock_service.get_news_batch.reset_mock()
+
+        response = cached_client.post('/api/v1/news/batch', json={'symbols': ['MSFT', 'AAPL']})
+
+        assert response.headers['X-Cache'] == 'HIT'
+        assert list(response.get_json()['news']) == ['MSFT', 'AAPL']
+        self.mock_service.get_news_batch.assert_not_called()
+
+    def test_batch_requires_symbols(self, client):
+        """should return 400 without a symbols list"""
+        response = client.post('/api/v1/news/batch', json={})
+        assert response.status_code == 400
+
+    def test_batch_rejects_invalid_symbol(self, client):
+        """should return 400 for an invalid symbol"""
+        response = client.post('/api/v1/news/batch', json={'symbols': ['AAPL', 'BAD@!']})
+        assert response.status_code == 400
+
+    def test_batch_rejects_duplicates(self, client):
+        """should return 400 for duplicate symbols"""
+        response = client.post('/api/v1/news/batch', json={'symbols': ['AAPL', 'aapl']})
+        assert response.status_code == 400
+
+    def test_batch_too_many_symbols(self, client):
+        """should return 400 above the batch size limit"""
+        symbols = [f'S{i}' for i in range(19)]
+        response = client.post('/api/v1/news/batch', json={'symbols': symbols})
+        assert response.status_code == 400
+
+
+def _article(article_id, published_at):
+    return {
+        'id': article_id, 'headline': article_id, 'summary': None, 'source': None,
+        'url': f'https://example.com/{article_id}', 'image': None,
+        'published_at': published_at, 'language': 'en-US',
+    }
+
+
+class TestNewsDeltaEndpoint:
+    """Tests for GET /api/v1/news/<symbol>?since_id="""
+
+    @pytest.fixture(autouse=True)
+    def setup_mock_service(self):
+        """Set up mock news service with a three-article window."""
+        self.mock_service = MagicMock()
+        news = [
+            _article('finnhub_3', '2026-02-09T12:00:00Z'),
+            _article('finnhub_2', '2026-02-09T11:00:00Z'),
+            _article('finnhub_1', '2026-02-09T10:00:00Z'),
+        ]
+        self.mock_service.get_news.return_value = {
+            'symbol': 'AAPL', 'news': news, 'total': 3, 'cached_at': '2026-02-09T12:05:00Z'
+        }
+        set_news_service(self.mock_service)
+        yield
+        set_news_service(None)
+
+    def test_returns_articles_ahead_of_since_id(self, client):
+        """should return only the articles newer than the last-seen one"""
+        response = client.get('/api/v1/news/AAPL?since_id=finnhub_2')
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['delta'] is True
+        assert data['since_id'] == 'finnhub_2'
+        assert [a['id'] for a in data['news']] == ['finnhub_3']
+        assert data['total'] == 1
+
+    def test_newest_since_id_returns_empty_delta(self, client):
+        """should return an empty delta when the client is up to date"""
+        data = client.get('/api/v1/news/AAPL?since_id=finnhub_3').get_json()
+
+        assert data['delta'] is True
+        assert data['news'] == []
+
+    def test_unknown_since_id_returns_full_window(self, client):
+        """should fall back to the full window for an expired ID"""
+        data = client.get('/api/v1/news/AAPL?since_id=finnhub_0').get_json()
+
+        assert data['delta'] is False
+        assert data['total'] == 3
+
+    def test_delta_reuses_cached_response(self, cached_client):
+        """should cut deltas from the cached full response"""
+        cached_client.get('/api/v1/news/AAPL')
+        self.mock_service.get_news.reset_mock()
+
+        response = cached_client.get('/api/v1/news/AAPL?since_id=finnhub_1')
+
+        assert response.headers['X-Cache'] == 'HIT'
+        assert [a['id'] for a in response.get_json()['news']] == ['finnhub_3', 'finnhub_2']
+        self.mock_service.get_news.assert_not_called()
+
+    def test_delta_miss_fills_cache(self, cached_client):
+        """should cache the full response fetched for a delta"""
+        response = cached_client.get('/api/v1/news/AAPL?since_id=finnhub_1')
+        self.mock_service.get_news.reset_mock()
+
+        full = cached_client.get('/api/v1/news/AAPL')
+
+        assert response.headers['X-Cache'] == 'MISS'
+        assert full.headers['X-Cache'] == 'HIT'
+        assert full.get_json()['total'] == 3
+        self.mock_service.get_news.assert_not_called()
+
+    def test_invalid_since_id(self, client):
+        """should return 400 for a malformed since_id"""
+        response = client.get('/api/v1/news/AAPL?since_id=bad%20id!')
+        assert response.status_code == 400
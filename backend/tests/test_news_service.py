@@ -10,6 +10,8 @@ Tests cover:
 - Company name lookup integration
 - 72h time window filtering
 - Error handling
+- Merging refreshes into the per-symbol news window
+- Near-duplicate collapsing
 """
 
 import pytest
@@ -281,6 +283,66 @@ class TestNewsServiceErrorHandling:
         assert result['symbol'] == 'AAPL'
 
 
+class TestNewsServiceMerge:
+    """Tests for merging refreshes into the news store"""
+
+    @staticmethod
+    def _article(article_id, hours_ago):
+        from datetime import timedelta, timezone
+        published = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+        return {'id': article_id, 'published_at': published.strftime('%Y-%m-%dT%H:%M:%SZ')}
+
+    @pytest.fixture
+    def service(self):
+        return NewsService(
+            finnhub_fetcher=MagicMock(),
+            google_fetcher=MagicMock(),
+            name_service=MagicMock()
+        )
+
+    def test_refresh_keeps_articles_dropped_by_feed(self, service):
+        """should keep recent articles the upstream no longer returns"""
+        service._finnhub_fetcher.fetch.return_value = [self._article('finnhub_1', 2)]
+        service.get_news('AAPL')
+        service._finnhub_fetcher.fetch.return_value = [self._article('finnhub_2', 1)]
+
+        result = service.get_news('AAPL')
+
+        assert [a['id'] for a in result['news']] == ['finnhub_2', 'finnhub_1']
+        assert result['total'] == 2
+
+    def test_failed_refresh_returns_window(self, service):
+        """should return the held window when a refresh raises"""
+        service._finnhub_fetcher.fetch.return_value = [self._article('finnhub_1', 1)]
+        service.get_news('AAPL')
+        service._finnhub_fetcher.fetch.side_effect = RuntimeError('boom')
+
+        result = service.get_news('AAPL')
+
+        assert [a['id'] for a in result['news']] == ['finnhub_1']
+
+
+class TestNewsServiceDedup:
+    """Tests for near-duplicate collapsing in get_news"""
+
+    def test_syndicated_copies_collapse(self):
+        """should return one article per story with a duplicates count"""
+        from datetime import timezone
+        published = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        finnhub = MagicMock()
+        finnhub.fetch.return_value = [
+            {'id': f'finnhub_{i}', 'headline': f'Apple unveils new iPhone lineup at event - {source}',
+             'source': source, 'url': f'https://{source.lower()}.com/{i}', 'published_at': published}
+            for i, source in enumerate(['Reuters', 'CNBC', 'Bloomberg'])
+        ]
+        service = NewsService(finnhub_fetcher=finnhub, google_fetcher=MagicMock(), name_service=MagicMock())
+
+        result = service.get_news('AAPL')
+
+        assert result['total'] == 1
+        assert result['news'][0]['duplicates'] == 2
+
+
 class TestNewsServiceIsUsStock:
     """Tests for is_us_stock static method"""
 
@@ -301,3 +363,78 @@ class TestNewsServiceIsUsStock:
 
     def test_case_insensitive(self):
         assert NewsService.is_us_stock('2330.tw') is False
+
+
+class TestNewsServiceBatch:
+    """Tests for get_news_batch concurrent fan-out"""
+
+    @pytest.fixture
+    def service(self):
+        finnhub = MagicMock()
+        finnhub.fetch.return_value = []
+        google = MagicMock()
+        google.fetch.return_value = []
+        name_service = MagicMock()
+        name_service.get_company_name.return_value = {}
+        return NewsService(
+            finnhub_fetcher=finnhub,
+            google_fetcher=google,
+            name_service=name_service,
+            source_concurrency={'finnhub': 2, 'google_news': 1}
+        )
+
+    def test_source_for_symbol(self, service):
+        """should route by the same suffix rules as get_news"""
+        assert service.source_for_symbol('AAPL') == 'finnhub'
+        assert service.source_for_symbol('2330.tw') == 'google_news'
+        assert service.source_for_symbol('6547.TWO') == 'google_news'
+        assert service.source_for_symbol('0700.HK') == 'google_news'
+        assert service.source_for_symbol('7203.T') == 'google_news'
+
+    def test_batch_returns_results_in_input_order(self, service):
+        """should return one result per symbol in input order"""
+        results = service.get_news_batch(['msft', '2330.TW', 'AAPL'])
+
+        assert list(results) == ['MSFT', '2330.TW', 'AAPL']
+        assert results['2330.TW']['symbol'] == '2330.TW'
+        assert service._finnhub_fetcher.fetch.call_count == 2
+        assert service._google_fetcher.fetch.call_count == 1
+
+    def test_batch_respects_source_concurrency(self, service):
+        """should never run more fetches per source than its budget"""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = {'finnhub': 0, 'google': 0}
+        peak = {'finnhub': 0, 'google': 0}
+
+        def tracked(source):
+            def fetch(*args, **kwargs):
+                with lock:
+                    active[source] += 1
+                    peak[source] = max(peak[source], active[source])
+                time.sleep(0.02)
+                with lock:
+                    active[source] -= 1
+                return []
+            return fetch
+
+        service._finnhub_fetcher.fetch.side_effect = tracked('finnhub')
+        service._google_fetcher.fetch.side_effect = tracked('google')
+
+        service.get_news_batch(['A', 'B', 'C', 'D', '1.TW', '2.TW', '3.HK'])
+
+        assert peak['finnhub'] == 2
+        assert peak['google'] == 1
+
+    def test_batch_isolates_failures(self, service):
+        """should return empty news for a failing symbol without failing the batch"""
+        service._finnhub_fetcher.fetch.side_effect = (
+            lambda symbol: (_ for _ in ()).throw(Exception('boom')) if symbol == 'BAD' else []
+        )
+
+        results = service.get_news_batch(['AAPL', 'BAD'])
+
+        assert results['BAD']['news'] == []
+        assert results['AAPL']['total'] == 0
@@ -9,6 +9,7 @@ Tests cover:
 - Empty input
 - All articles expired
 - Boundary condition at exactly 72h
+- Epoch timestamps (published_ts) used without parsing dates
 """
 
 import pytest
@@ -132,10 +133,7 @@ class TestSortAndFilterBoundaryCondition:
 
         articles = [make_article('boundary', fmt(exact_cutoff))]
 
-        with patch('services.news_service.datetime') as mock_dt:
-            mock_dt.now.return_value = fixed_now
-            mock_dt.strptime.side_effect = datetime.strptime
-            mock_dt.min = datetime.min
+        with patch('services.news_service.time.time', return_value=fixed_now.timestamp()):
             result = NewsService._sort_and_filter(articles)
 
         assert len(result) == 1
@@ -148,10 +146,7 @@ class TestSortAndFilterBoundaryCondition:
 
         articles = [make_article('just_stale', fmt(just_past_cutoff))]
 
-        with patch('services.news_service.datetime') as mock_dt:
-            mock_dt.now.return_value = fixed_now
-            mock_dt.strptime.side_effect = datetime.strptime
-            mock_dt.min = datetime.min
+        with patch('services.news_service.time.time', return_value=fixed_now.timestamp()):
             result = NewsService._sort_and_filter(articles)
 
         assert len(result) == 0
@@ -263,3 +258,33 @@ class TestSortAndFilterDateParseBug:
         result = NewsService._sort_and_filter(articles)
 
         assert result == []
+
+
+class TestSortAndFilterEpochTimestamps:
+    """Filtering and sorting on published_ts"""
+
+    def test_timestamps_are_used_without_parsing(self):
+        """should not parse published_at when published_ts is present"""
+        now = int(datetime.now(timezone.utc).timestamp())
+        articles = [
+            {**make_article('older', 'not-a-date'), 'published_ts': now - 7200},
+            {**make_article('newer', 'not-a-date'), 'published_ts': now - 60},
+            {**make_article('stale', 'not-a-date'), 'published_ts': now - 100 * 3600},
+        ]
+
+        with patch('services.news_service.timestamp_from_news_date') as mock_parse:
+            result = NewsService._sort_and_filter(articles)
+
+        mock_parse.assert_not_called()
+        assert [a['id'] for a in result] == ['newer', 'older']
+
+    def test_missing_timestamp_is_attached(self):
+        """should derive published_ts from published_at once when absent"""
+        published = datetime(2026, 3, 25, 10, 0, 0, tzinfo=timezone.utc)
+        articles = [make_article('a', fmt(published))]
+
+        with patch('services.news_service.time.time', return_value=published.timestamp() + 60):
+            result = NewsService._sort_and_filter(articles)
+
+        assert result[0]['published_ts'] == int(published.timestamp())
+        assert 'published_ts' not in articles[0]
@@ -0,0 +1,110 @@
+"""
+Tests for NewsStore
+
+Tests cover:
+- Merging only new articles into a symbol's window
+- Expiry by published timestamp
+- Ordering and LRU bound on symbols
+- Deltas after a last-seen article ID
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from constants import NEWS_DATE_FORMAT
+from services.news_store import NewsStore, articles_since, timestamp_from_news_date
+
+
+def _article(article_id, hours_ago, headline=None):
+    published = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return {
+        'id': article_id,
+        'headline': headline or article_id,
+        'published_at': published.strftime(NEWS_DATE_FORMAT),
+        'published_ts': int(published.timestamp()),
+    }
+
+
+class TestNewsStoreMerge:
+    """Tests for NewsStore.merge"""
+
+    def test_merge_adds_new_articles(self):
+        """should keep articles from earlier refreshes alongside new ones"""
+        store = NewsStore()
+        store.merge('AAPL', [_article('a', 3)])
+
+        window = store.merge('AAPL', [_article('b', 1)])
+
+        assert [a['id'] for a in window] == ['b', 'a']
+
+    def test_merge_keeps_first_seen_copy(self):
+        """should not replace an article already in the window"""
+        store = NewsStore()
+        store.merge('AAPL', [_article('a', 1, headline='first')])
+
+        window = store.merge('AAPL', [_article('a', 1, headline='second')])
+
+        assert len(window) == 1
+        assert window[0]['headline'] == 'first'
+
+    def test_merge_expires_old_articles(self):
+        """should drop articles that fall outside the window"""
+        store = NewsStore(window_hours=2)
+
+        window = store.merge('AAPL', [_article('old', 5), _article('new', 1)])
+
+        assert [a['id'] for a in window] == ['new']
+
+    def test_window_orders_newest_first(self):
+        """should sort by published_at, newest first"""
+        store = NewsStore()
+
+        window = store.merge('AAPL', [_article('mid', 2), _article('new', 1), _article('old', 3)])
+
+        assert [a['id'] for a in window] == ['new', 'mid', 'old']
+
+    def test_symbols_are_independent(self):
+        """should keep one window per symbol"""
+        store = NewsStore()
+        store.merge('AAPL', [_article('a', 1)])
+
+        assert store.merge('MSFT', []) == []
+        assert [a['id'] for a in store.window('AAPL')] == ['a']
+
+    def test_least_recent_symbol_evicted(self):
+        """should keep at most max_symbols windows"""
+        store = NewsStore(max_symbols=2)
+        store.merge('AAPL', [_article('a', 1)])
+        store.merge('MSFT', [_article('m', 1)])
+        store.merge('AAPL', [])
+        store.merge('TSLA', [_article('t', 1)])
+
+        assert len(store) == 2
+        assert store.window('MSFT') == []
+        assert [a['id'] for a in store.window('AAPL')] == ['a']
+
+
+class TestArticlesSince:
+    """Tests for articles_since"""
+
+    def test_returns_articles_before_since_id(self):
+        """should return the articles ahead of the last-seen one"""
+        window = [{'id': 'c'}, {'id': 'b'}, {'id': 'a'}]
+
+        assert articles_since(window, 'b') == [{'id': 'c'}]
+
+    def test_unknown_id_returns_none(self):
+        """should return None when the ID is not in the window"""
+        assert articles_since([{'id': 'a'}], 'z') is None
+
+
+class TestTimestampFromNewsDate:
+    """Tests for timestamp_from_news_date"""
+
+    def test_parses_news_date(self):
+        """should read NEWS_DATE_FORMAT strings as UTC"""
+        assert timestamp_from_news_date('2026-02-09T10:00:00Z') == 1770631200
+
+    def test_invalid_returns_none(self):
+        """should return None for other formats"""
+        assert timestamp_from_news_date('') is None
+        assert timestamp_from_news_date('2026-02-09 10:00') is None
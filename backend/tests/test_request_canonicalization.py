@@ -0,0 +1,139 @@
+"""
+Tests for request canonicalization and the trading calendar.
+"""
+
+from datetime import date
+
+import pytest
+from flask import Flask
+
+from routes.stock_routes import make_batch_stocks_cache_key, make_stock_data_cache_key
+from utils.request_canonicalization import canonicalize_date_range, canonicalize_symbols
+from utils.trading_calendar import (
+    exchange_for_symbol,
+    is_trading_day,
+    next_trading_day,
+    previous_trading_day,
+)
+
+# Wednesday, so "today" and "tomorrow" are both trading days
+TODAY = date(2024, 1, 10)
+
+
+class TestTradingCalendar:
+    """Tests for trading calendar helpers."""
+
+    @pytest.mark.parametrize('symbol,exchange', [
+        ('AAPL', 'US'),
+        ('2330.TW', 'TWSE'),
+        ('6488.TWO', 'TPEX'),
+        ('0700.hk', 'HKEX'),
+        ('7203.T', 'TSE'),
+    ])
+    def test_exchange_for_symbol(self, symbol, exchange):
+        """Test exchanges are derived from ticker suffixes."""
+        assert exchange_for_symbol(symbol) == exchange
+
+    def test_weekends_are_not_trading_days(self):
+        """Test Saturday and Sunday are closed."""
+        assert is_trading_day(date(2024, 1, 5), ['US'])
+        assert not is_trading_day(date(2024, 1, 6), ['US'])
+        assert not is_trading_day(date(2024, 1, 7), ['TWSE'])
+
+    def test_previous_and_next_trading_day(self):
+        """Test stepping over a weekend."""
+        assert previous_trading_day(date(2024, 1, 8), ['US']) == date(2024, 1, 5)
+        assert next_trading_day(date(2024, 1, 6), ['US']) == date(2024, 1, 8)
+        assert next_trading_day(date(2024, 1, 8), ['US']) == date(2024, 1, 8)
+
+
+class TestCanonicalizeSymbols:
+    """Tests for canonicalize_symbols."""
+
+    def test_normalizes_case_whitespace_and_duplicates(self):
+        """Test symbols are uppercased, stripped, de-duplicated and sorted."""
+        assert canonicalize_symbols(['msft', ' AAPL', 'aapl', '']) == ['AAPL', 'MSFT']
+
+
+class TestCanonicalizeDateRange:
+    """Tests for canonicalize_date_range."""
+
+    @pytest.mark.parametrize('end_date', ['2024-01-06', '2024-01-07', '2024-01-08'])
+    def test_weekend_end_dates_share_one_range(self, end_date):
+        """Test ends on Saturday, Sunday and Monday (exclusive) all select through Friday."""
+        assert canonicalize_date_range('2024-01-02', end_date, ['AAPL'], today=TODAY) == (
+            '2024-01-02', '2024-01-06'
+        )
+
+    def test_weekday_end_is_unchanged(self):
+        """Test a weekday end date already is canonical."""
+        assert canonicalize_date_range('2024-01-02', '2024-01-05', ['AAPL'], today=TODAY) == (
+            '2024-01-02', '2024-01-05'
+        )
+
+    def test_weekend_start_moves_to_next_session(self):
+        """Test a start on Saturday snaps to Monday."""
+        start, _ = canonicalize_date_range('2023-12-30', '2024-01-05', ['AAPL'], today=TODAY)
+
+        assert start == '2024-01-01'
+
+    def test_future_end_clamped_to_tomorrow(self):
+        """Test end dates after tomorrow select the same data as tomorrow."""
+        _, end = canonicalize_date_range('2024-01-02', '2024-03-01', ['AAPL'], today=TODAY)
+
+        assert end == '2024-01-11'
+
+    def test_defaults_match_explicit_dates(self):
+        """Test omitted dates resolve to the same range as explicit defaults."""
+        implicit = canonicalize_date_range(None, None, ['AAPL'], today=TODAY)
+        explicit = canonicalize_date_range('2023-12-11', '2024-01-10', ['AAPL'], today=TODAY)
+
+        assert implicit == explicit
+
+    def test_range_without_sessions_kept_as_sent(self):
+        """Test a weekend-only range is not inverted."""
+        assert canonicalize_date_range('2024-01-06', '2024-01-08', ['AAPL'], today=TODAY) == (
+            '2024-01-06', '2024-01-08'
+        )
+
+    def test_invalid_date_raises(self):
+        """Test malformed dates are rejected."""
+        with pytest.raises(ValueError):
+            canonicalize_date_range('01/02/2024', None, ['AAPL'], today=TODAY)
+
+
+class TestCanonicalCacheKeys:
+    """Tests for route cache keys built from canonical parameters."""
+
+    @pytest.fixture
+    def app(self):
+        return Flask(__name__)
+
+    def _key(self, app, key_func, body):
+        with app.test_request_context(json=body):
+            return key_func()
+
+    def test_equivalent_batch_requests_share_key(self, app):
+        """Test symbol order, case and weekend end dates do not split entries."""
+        first = self._key(app, make_batch_stocks_cache_key, {
+            'symbols': ['MSFT', 'aapl'], 'start_date': '2024-01-02', 'end_date': '2024-01-06',
+        })
+        second = self._key(app, make_batch_stocks_cache_key, {
+            'symbols': ['AAPL', 'MSFT', 'AAPL'], 'start_date': '2024-01-02', 'end_date': '2024-01-07',
+        })
+
+        assert first == second == 'batch_stocks:AAPL,MSFT:2024-01-02:2024-01-06'
+
+    def test_batch_key_resolves_missing_dates(self, app):
+        """Test omitted dates no longer produce a literal 'none' key."""
+        key = self._key(app, make_batch_stocks_cache_key, {'symbols': ['AAPL']})
+
+        assert 'none' not in key
+
+    def test_invalid_dates_bypass_cache(self, app):
+        """Test malformed dates produce no key (validation rejects the request)."""
+        key = self._key(app, make_stock_data_cache_key, {
+            'symbol': 'AAPL', 'start_date': 'bad', 'end_date': '2024-01-05',
+        })
+
+        assert key is None
@@ -0,0 +1,123 @@
+"""
+Tests for runtime failover from Redis to process memory.
+"""
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from utils.resilient_cache import ResilientRedisCache
+from utils.size_aware_cache import SizeAwareCache
+from utils.tiered_cache import CompressedRedisCache
+
+
+class FlakyRedis:
+    """In-memory stand-in for redis.Redis that can be taken down."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+        self.calls = 0
+
+    def _check(self):
+        self.calls += 1
+        if self.down:
+            raise RedisConnectionError('Connection refused')
+
+    def get(self, name):
+        self._check()
+        return self.data.get(name)
+
+    def set(self, name, value):
+        self._check()
+        self.data[name] = value
+        return True
+
+    def setex(self, name, value, time):
+        return self.set(name, value)
+
+    def delete(self, *names):
+        self._check()
+        return sum(1 for name in names if self.data.pop(name, None) is not None)
+
+    def ping(self):
+        self._check()
+        return True
+
+
+@pytest.fixture
+def redis_client():
+    return FlakyRedis()
+
+
+@pytest.fixture
+def resilient(redis_client):
+    backend = ResilientRedisCache(
+        CompressedRedisCache(host=redis_client, key_prefix='test:'),
+        fallback=SizeAwareCache(max_bytes=1024 * 1024),
+        failure_threshold=2,
+        probe_interval=60,
+    )
+    # Probing is exercised directly; keep tests single-threaded
+    backend._start_probe = lambda: None
+    backend._breaker._on_open = None
+    return backend
+
+
+class TestResilientRedisCache:
+    """Tests for ResilientRedisCache."""
+
+    def test_uses_redis_when_healthy(self, resilient, redis_client):
+        """Test values go to Redis while it is up."""
+        resilient.set('news:AAPL', {'total': 1}, timeout=60)
+
+        assert 'test:news:AAPL' in redis_client.data
+        assert resilient.get('news:AAPL') == {'total': 1}
+        assert resilient.failed_over is False
+
+    def test_errors_fall_back_without_raising(self, resilient, redis_client):
+        """Test a Redis error is served by the fallback instead of raising."""
+        redis_client.down = True
+
+        assert resilient.set('k', 'v', timeout=60) is True
+        assert resilient.get('k') == 'v'
+
+    def test_fails_over_after_threshold(self, resilient, redis_client):
+        """Test Redis is no longer called once the breaker opens."""
+        redis_client.down = True
+        resilient.get('a')
+        resilient.get('b')
+        calls = redis_client.calls
+
+        resilient.get('c')
+        resilient.set('d', 1)
+
+        assert resilient.failed_over is True
+        assert redis_client.calls == calls
+
+    def test_recovers_when_probe_succeeds(self, resilient, redis_client):
+        """Test a successful probe switches back to Redis and drops the fallback."""
+        redis_client.down = True
+        resilient.get('a')
+        resilient.get('b')
+        resilient.set('outage-only', 1)
+
+        redis_client.down = False
+        resilient.probe_interval = 0
+        resilient._probe_until_recovered()
+
+        assert resilient.failed_over is False
+        assert resilient.get('outage-only') is None
+        resilient.set('k', 'v')
+        assert 'test:k' in redis_client.data
+
+    def test_stats_report_circuit(self, resilient, redis_client):
+        """Test circuit state and fallback occupancy are reported."""
+        redis_client.down = True
+        resilient.get('a')
+        resilient.get('b')
+
+        stats = resilient.stats()
+
+        assert stats['circuit']['state'] == 'open'
+        assert 'bytes' in stats['fallback']
+        assert 'compression' in stats
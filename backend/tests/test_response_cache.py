@@ -0,0 +1,222 @@
+"""
+Tests for the pre-serialized response cache.
+
+This module tests:
+- Payload building and validation
+- Cache hit/miss behaviour of the cached_response decorator
+- Skipping non-200 responses and bypassing on missing keys
+- Stampede protection (XFetch early refresh and the refresh lock)
+"""
+
+import time
+
+import pytest
+from flask import Flask, jsonify
+
+from utils.cache import cache
+from utils.response_cache import (
+    PAYLOAD_VERSION,
+    build_payload,
+    cached_response,
+    is_valid_payload,
+    should_refresh,
+)
+
+
+@pytest.fixture
+def app():
+    """Create a Flask app with an in-memory cache."""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+    with app.app_context():
+        cache.clear()
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+
+class TestPayload:
+    """Tests for payload helpers."""
+
+    def test_build_payload_holds_bytes_and_headers(self, app):
+        """Test payload contains raw body bytes and content type."""
+        with app.test_request_context():
+            payload = build_payload(jsonify({'symbol': 'AAPL'}))
+
+        assert payload['v'] == PAYLOAD_VERSION
+        assert isinstance(payload['body'], bytes)
+        assert b'AAPL' in payload['body']
+        assert ('Content-Type', 'application/json') in payload['headers']
+        assert all(name != 'Content-Length' for name, _ in payload['headers'])
+
+    def test_legacy_values_are_rejected(self):
+        """Test values written by older code are not replayed."""
+        assert not is_valid_payload(None)
+        assert not is_valid_payload(({'symbol': 'AAPL'}, 200))
+        assert not is_valid_payload({'v': PAYLOAD_VERSION + 1, 'body': b'{}'})
+
+
+class TestCachedResponse:
+    """Tests for cached_response decorator."""
+
+    def test_hit_replays_bytes_without_calling_view(self, app, client):
+        """Test second request is served from the cached body."""
+        calls = {'count': 0}
+
+        @app.route('/test/cached')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:cached')
+        def cached_endpoint():
+            calls['count'] += 1
+            return jsonify({'call': calls['count']}), 200
+
+        first = client.get('/test/cached')
+        second = client.get('/test/cached')
+
+        assert first.headers['X-Cache'] == 'MISS'
+        assert second.headers['X-Cache'] == 'HIT'
+        assert second.get_json() == {'call': 1}
+        assert second.content_type == 'application/json'
+        assert calls['count'] == 1
+
+    def test_error_responses_are_not_cached(self, app, client):
+        """Test non-200 responses are recomputed on every request."""
+        calls = {'count': 0}
+
+        @app.route('/test/error')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:error')
+        def error_endpoint():
+            calls['count'] += 1
+            return jsonify({'error': 'bad'}), 400
+
+        client.get('/test/error')
+        response = client.get('/test/error')
+
+        assert response.status_code == 400
+        assert calls['count'] == 2
+
+    def test_none_key_bypasses_cache(self, app, client):
+        """Test a None cache key skips caching entirely."""
+        calls = {'count': 0}
+
+        @app.route('/test/bypass')
+        @cached_response(timeout=300, make_cache_key=lambda: None)
+        def bypass_endpoint():
+            calls['count'] += 1
+            return jsonify({'call': calls['count']})
+
+        client.get('/test/bypass')
+        client.get('/test/bypass')
+
+        assert calls['count'] == 2
+
+    def test_view_kwargs_passed_to_key_function(self, app, client):
+        """Test the key function receives the view arguments."""
+        @app.route('/test/item/<symbol>')
+        @cached_response(timeout=300, make_cache_key=lambda symbol: f"item:{symbol}")
+        def item_endpoint(symbol):
+            return jsonify({'symbol': symbol})
+
+        client.get('/test/item/AAPL')
+
+        with app.app_context():
+            assert is_valid_payload(cache.get('item:AAPL'))
+
+
+def _stored_payload(app, key, body=b'{"call": 0}', expires_in=-1.0):
+    """Write a payload whose logical expiry is ``expires_in`` seconds away."""
+    with app.test_request_context():
+        payload = build_payload(jsonify({}))
+    payload.update(body=body, encodings={}, expires_at=time.time() + expires_in)
+    with app.app_context():
+        cache.set(key, payload, timeout=300)
+    return payload
+
+
+class TestStampedeProtection:
+    """Tests for XFetch early refresh and the per-key refresh lock."""
+
+    def test_should_refresh_only_near_expiry(self):
+        """Test fresh values are kept and expired ones refreshed."""
+        now = time.time()
+
+        assert not should_refresh({'expires_at': now + 3600, 'delta': 0.01}, now=now)
+        assert should_refresh({'expires_at': now - 1, 'delta': 0.0}, now=now)
+        assert not should_refresh({'expires_at': None, 'delta': 1.0}, now=now)
+
+    def test_expensive_values_refresh_earlier(self):
+        """Test a large recompute delta triggers refresh before expiry."""
+        now = time.time()
+        payload = {'expires_at': now + 1, 'delta': 1000.0}
+
+        assert any(should_refresh(payload, now=now) for _ in range(20))
+
+    def test_entries_outlive_logical_expiry(self, app, client, mocker):
+        """Test the backend TTL includes the stale grace period."""
+        set_spy = mocker.spy(cache, 'set')
+
+        @app.route('/test/grace')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:grace', grace=60)
+        def grace_endpoint():
+            return jsonify({'ok': True})
+
+        client.get('/test/grace')
+
+        assert set_spy.call_args.kwargs['timeout'] == 360
+        with app.app_context():
+            payload = cache.get('test:grace')
+        assert payload['expires_at'] == pytest.approx(time.time() + 300, abs=5)
+
+    def test_expired_value_recomputed_by_lock_holder(self, app, client):
+        """Test the request that takes the lock recomputes and releases it."""
+        _stored_payload(app, 'test:expired')
+
+        @app.route('/test/expired')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:expired')
+        def expired_endpoint():
+            return jsonify({'call': 1})
+
+        response = client.get('/test/expired')
+
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json() == {'call': 1}
+        with app.app_context():
+            assert cache.get('test:expired:refresh-lock') is None
+
+    def test_other_requests_serve_stale_while_refreshing(self, app, client):
+        """Test only the lock holder recomputes; others get the stale value."""
+        calls = {'count': 0}
+        _stored_payload(app, 'test:busy')
+        with app.app_context():
+            cache.add('test:busy:refresh-lock', 1, timeout=30)
+
+        @app.route('/test/busy')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:busy')
+        def busy_endpoint():
+            calls['count'] += 1
+            return jsonify({'call': calls['count']})
+
+        response = client.get('/test/busy')
+
+        assert response.headers['X-Cache'] == 'STALE'
+        assert response.get_json() == {'call': 0}
+        assert calls['count'] == 0
+
+    def test_failed_refresh_serves_cached_value(self, app, client):
+        """Test an error during refresh does not replace the cached value."""
+        _stored_payload(app, 'test:failing')
+
+        @app.route('/test/failing')
+        @cached_response(timeout=300, make_cache_key=lambda: 'test:failing')
+        def failing_endpoint():
+            return jsonify({'error': 'upstream'}), 503
+
+        response = client.get('/test/failing')
+
+        assert response.status_code == 200
+        assert response.headers['X-Cache'] == 'STALE'
+        assert response.get_json() == {'call': 0}
@@ -0,0 +1,160 @@
+"""
+Tests for the streaming RSS parser
+
+Tests cover:
+- Field extraction (title, link, pubDate, source)
+- Cutoff filtering and early stop on stale runs
+- Rejection of malformed and non-RSS documents
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from utils.rss_parser import RssParseError, iter_rss_items, parse_rfc822_timestamp, parse_rss_items
+
+
+NOW = datetime(2026, 2, 9, 12, 0, tzinfo=timezone.utc)
+
+
+def _item(title, hours_ago=None, source=None):
+    pub = ''
+    if hours_ago is not None:
+        pub = f'<pubDate>{format_datetime(NOW - timedelta(hours=hours_ago), usegmt=True)}</pubDate>'
+    src = f'<source url="https://e.x">{source}</source>' if source else ''
+    return f'<item><title>{title}</title><link>https://e.x/{title}</link>{pub}{src}</item>'
+
+
+def _feed(*items):
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        '<title>feed</title>' + ''.join(items) + '</channel></rss>'
+    ).encode('utf-8')
+
+
+class TestFieldExtraction:
+    """Tests for the extracted item fields"""
+
+    def test_extracts_used_fields(self):
+        """should return title, link, pubDate and source name"""
+        items = parse_rss_items(_feed(_item('a', hours_ago=1, source='Reuters')))
+
+        assert items == [{
+            'title': 'a',
+            'link': 'https://e.x/a',
+            'published': 'Mon, 09 Feb 2026 11:00:00 GMT',
+            'source': {'title': 'Reuters'},
+            'published_ts': int((NOW - timedelta(hours=1)).timestamp()),
+        }]
+
+    def test_missing_fields_default_empty(self):
+        """should default absent fields to empty values"""
+        items = parse_rss_items(_feed('<item><description>x</description></item>'))
+
+        assert items == [{'title': '', 'link': '', 'published': '', 'source': {}, 'published_ts': None}]
+
+    def test_preserves_feed_order_and_unicode(self):
+        """should keep feed order and decode declared encodings"""
+        items = parse_rss_items(_feed(_item('台積電'), _item('鴻海')))
+
+        assert [i['title'] for i in items] == ['台積電', '鴻海']
+
+    def test_items_are_released(self):
+        """should clear each item once it has been read"""
+        iterator = iter_rss_items(_feed(_item('a'), _item('b'), _item('c')))
+
+        assert [i['title'] for i in iterator] == ['a', 'b', 'c']
+
+
+class TestCutoff:
+    """Tests for time-window filtering"""
+
+    def test_skips_items_before_cutoff(self):
+        """should drop items published before the cutoff"""
+        content = _feed(_item('new', hours_ago=1), _item('old', hours_ago=100), _item('newer', hours_ago=2))
+
+        items = parse_rss_items(content, cutoff=NOW - timedelta(hours=72))
+
+        assert [i['title'] for i in items] == ['new', 'newer']
+
+    def test_keeps_items_without_dates(self):
+        """should keep items whose date is missing or unparseable"""
+        content = _feed(_item('undated'), '<item><title>bad</title><pubDate>soon</pubDate></item>')
+
+        items = parse_rss_items(content, cutoff=NOW)
+
+        assert [i['title'] for i in items] == ['undated', 'bad']
+
+    def test_stops_after_stale_run(self):
+        """should stop reading after a run of consecutive stale items"""
+        stale = [_item(f'old{i}', hours_ago=100) for i in range(3)]
+        content = _feed(_item('new', hours_ago=1), *stale, _item('late', hours_ago=1))
+
+        items = parse_rss_items(content, cutoff=NOW - timedelta(hours=72), stale_run_limit=3)
+
+        assert [i['title'] for i in items] == ['new']
+
+    def test_short_stale_run_does_not_stop(self):
+        """should keep reading when a fresh item interrupts the stale run"""
+        content = _feed(_item('old', hours_ago=100), _item('new', hours_ago=1))
+
+        items = parse_rss_items(content, cutoff=NOW - timedelta(hours=72), stale_run_limit=3)
+
+        assert [i['title'] for i in items] == ['new']
+
+    def test_stops_before_reading_malformed_tail(self):
+        """should not reach data after an early stop"""
+        content = _feed(_item('old', hours_ago=100)).replace(b'</channel></rss>', b'<item><title>')
+
+        assert parse_rss_items(content, cutoff=NOW, stale_run_limit=1) == []
+
+
+class TestRejection:
+    """Tests for documents that need the feedparser fallback"""
+
+    @pytest.mark.parametrize('content', [
+        b'<rss><channel><item><title>x</title>',
+        b'not xml at all',
+        b'',
+    ])
+    def test_malformed_raises(self, content):
+        """should raise RssParseError on malformed XML"""
+        with pytest.raises(RssParseError):
+            parse_rss_items(content)
+
+    def test_atom_raises(self):
+        """should raise RssParseError for Atom feeds"""
+        with pytest.raises(RssParseError):
+            parse_rss_items(b'<feed xmlns="http://www.w3.org/2005/Atom"><entry/></feed>')
+
+    def test_missing_channel_raises(self):
+        """should raise RssParseError when there is no <channel>"""
+        with pytest.raises(RssParseError):
+            parse_rss_items(b'<rss version="2.0"></rss>')
+
+    def test_entities_are_not_expanded(self):
+        """should not resolve external entities"""
+        content = (
+            b'<?xml version="1.0"?><!DOCTYPE rss [<!ENTITY x SYSTEM "file:///etc/passwd">]>'
+            b'<rss><channel><item><title>&x;</title><link>https://e.x</link></item></channel></rss>'
+        )
+
+        try:
+            items = parse_rss_items(content)
+        except RssParseError:
+            return
+        assert 'root:' not in items[0]['title']
+
+
+class TestParseRfc822Timestamp:
+    """Tests for parse_rfc822_timestamp"""
+
+    def test_offsets_are_normalized(self):
+        """should return the same instant for different zone offsets"""
+        assert parse_rfc822_timestamp('Mon, 09 Feb 2026 18:00:00 +0800') == \
+            parse_rfc822_timestamp('Mon, 09 Feb 2026 10:00:00 GMT')
+
+    def test_unparseable_returns_none(self):
+        """should return None for missing or invalid dates"""
+        assert parse_rfc822_timestamp('') is None
+        assert parse_rfc822_timestamp('yesterday') is None
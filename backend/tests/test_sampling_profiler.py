@@ -0,0 +1,176 @@
+"""
+Tests for the sampling profiler.
+
+This module tests:
+- Sampling of other threads' stacks
+- Duration and interval bounds
+- One profile at a time per process
+- Background sampling
+- Collapsed stack and pstats exports
+"""
+
+import marshal
+import pstats
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from utils.sampling_profiler import ProfileResult, ProfilerBusyError, SamplingProfiler
+
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=_busy_loop, args=(stop,), name='busy-worker')
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def _result():
+    outer = ('app.py', 10, 'handler')
+    inner = ('svc.py', 20, 'fetch')
+    leaf = ('svc.py', 40, 'parse')
+    samples = Counter({
+        ('worker-1', outer, inner): 3,
+        ('worker-1', outer, inner, leaf): 1,
+    })
+    return ProfileResult(samples, interval=0.01, duration=0.05, sample_count=4)
+
+
+class TestSamplingProfiler:
+    """Tests for SamplingProfiler.run."""
+
+    def test_samples_other_threads(self, busy_thread):
+        """should record stacks of running threads under their names"""
+        result = SamplingProfiler().run(duration=0.2, interval_ms=5)
+
+        assert result.sample_count > 0
+        collapsed = result.to_collapsed()
+        assert 'busy-worker;' in collapsed
+        assert '_busy_loop' in collapsed
+
+    def test_excludes_own_thread(self):
+        """should not sample the thread running the profile"""
+        result = SamplingProfiler().run(duration=0.05, interval_ms=5)
+
+        assert 'SamplingProfiler' not in result.to_collapsed()
+        assert '_sample' not in result.to_collapsed()
+
+    def test_interval_has_lower_bound(self):
+        """should clamp the interval to the minimum"""
+        result = SamplingProfiler().run(duration=0.05, interval_ms=0.001)
+        assert result.interval == pytest.approx(0.005)
+
+    def test_duration_is_capped(self):
+        """should cap the duration at the maximum"""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('utils.sampling_profiler.PROFILER_MAX_DURATION_SECONDS', 0.05)
+            started = time.perf_counter()
+            SamplingProfiler().run(duration=30, interval_ms=5)
+        assert time.perf_counter() - started < 1
+
+    def test_limits_stack_depth(self, busy_thread):
+        """should keep at most max_depth frames per stack"""
+        result = SamplingProfiler(max_depth=2).run(duration=0.05, interval_ms=5)
+        assert all(len(stack) <= 3 for stack in result.samples)
+
+    def test_one_profile_at_a_time(self):
+        """should refuse a second concurrent profile"""
+        first = threading.Thread(target=SamplingProfiler().run, args=(0.3, 5))
+        first.start()
+        time.sleep(0.05)
+        try:
+            with pytest.raises(ProfilerBusyError):
+                SamplingProfiler().run(duration=0.05)
+        finally:
+            first.join()
+
+        SamplingProfiler().run(duration=0.01)
+
+
+class TestBackgroundProfile:
+    """Tests for SamplingProfiler.start."""
+
+    def test_samples_in_background(self, busy_thread):
+        """should return at once and sample the calling thread too"""
+        started = time.perf_counter()
+        profile = SamplingProfiler().start(duration=0.2, interval_ms=5)
+
+        assert time.perf_counter() - started < 0.1
+        assert not profile.done()
+        assert SamplingProfiler.latest() is profile
+        assert profile.wait(5)
+        collapsed = profile.result.to_collapsed()
+        assert 'busy-worker;' in collapsed
+        assert 'MainThread;' in collapsed
+        assert 'sampling-profiler;' not in collapsed
+
+    def test_blocks_concurrent_profiles(self):
+        """should refuse a second profile until the background one finishes"""
+        profile = SamplingProfiler().start(duration=0.2, interval_ms=5)
+        try:
+            with pytest.raises(ProfilerBusyError):
+                SamplingProfiler().run(duration=0.01)
+        finally:
+            profile.wait(5)
+
+        assert profile.remaining() == 0
+        SamplingProfiler().run(duration=0.01)
+
+
+class TestProfileResult:
+    """Tests for ProfileResult exports."""
+
+    def test_to_collapsed(self):
+        """should emit heaviest stacks first"""
+        lines = _result().to_collapsed().splitlines()
+
+        assert lines == [
+            'worker-1;app.py:handler:10;svc.py:fetch:20 3',
+            'worker-1;app.py:handler:10;svc.py:fetch:20;svc.py:parse:40 1',
+        ]
+
+    def test_to_collapsed_empty(self):
+        """should emit nothing for an empty profile"""
+        assert ProfileResult(Counter(), 0.01, 0.0, 0).to_collapsed() == ''
+
+    def test_to_pstats_loads(self, tmp_path):
+        """should produce a dump pstats can load"""
+        path = tmp_path / 'profile.pstats'
+        path.write_bytes(_result().to_pstats())
+
+        stats = pstats.Stats(str(path))
+        assert stats.total_calls == 9
+
+    def test_to_pstats_times(self):
+        """should derive self and cumulative time from sample counts"""
+        stats = marshal.loads(_result().to_pstats())
+
+        cc, nc, tt, ct, callers = stats[('svc.py', 20, 'fetch')]
+        assert nc == 4
+        assert tt == pytest.approx(0.03)
+        assert ct == pytest.approx(0.04)
+        assert ('app.py', 10, 'handler') in callers
+
+        _cc, _nc, tt, ct, _callers = stats[('app.py', 10, 'handler')]
+        assert tt == 0
+        assert ct == pytest.approx(0.04)
+
+    def test_to_pstats_recursion_counted_once(self):
+        """should count recursive frames once towards cumulative time"""
+        frame = ('r.py', 1, 'recurse')
+        result = ProfileResult(Counter({('t', frame, frame, frame): 2}), 0.01, 0.02, 2)
+
+        _cc, nc, tt, ct, _callers = marshal.loads(result.to_pstats())[frame]
+        assert nc == 2
+        assert ct == pytest.approx(0.02)
+        assert tt == pytest.approx(0.02)
@@ -0,0 +1,103 @@
+"""
+Tests for Server-Timing stage timers.
+
+This module tests:
+- Header formatting
+- Stage collection inside and outside requests
+- The Server-Timing middleware and its off switch
+- Stage coverage of StockService.get_stock_data
+"""
+
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, g
+
+from services.stock_service import StockService
+from utils.server_timing import _NOOP, format_server_timing, init_server_timing, stage
+
+
+def _make_app(**config):
+    app = Flask(__name__)
+    app.config.update(config)
+    init_server_timing(app)
+
+    @app.route('/work')
+    def work():
+        with stage('fetch_history'):
+            pass
+        with stage('fetch_history'):
+            pass
+        with stage('serialize'):
+            pass
+        return {'ok': True}
+
+    return app
+
+
+class TestFormatServerTiming:
+    """Tests for format_server_timing."""
+
+    def test_single_and_repeated_stages(self):
+        value = format_server_timing({'fetch_history': [412.31, 2], 'serialize': [1.04, 1]}, 455.0)
+        assert value == 'fetch_history;desc="2 calls";dur=412.3, serialize;dur=1.0, total;dur=455.0'
+
+    def test_without_total(self):
+        assert format_server_timing({'cache_lookup': [0.5, 1]}) == 'cache_lookup;dur=0.5'
+
+
+class TestStage:
+    """Tests for stage collection."""
+
+    def test_noop_outside_request(self):
+        assert stage('fetch_history') is _NOOP
+
+    def test_noop_when_disabled(self):
+        app = _make_app(SERVER_TIMING_ENABLED=False)
+        with app.test_request_context('/work'):
+            assert stage('fetch_history') is _NOOP
+
+    def test_exceptions_still_recorded(self):
+        app = _make_app()
+        with app.test_request_context('/work'):
+            g.server_timings = {}
+            with pytest.raises(ValueError):
+                with stage('fetch_history'):
+                    raise ValueError('boom')
+            assert g.server_timings['fetch_history'][1] == 1
+
+
+class TestServerTimingMiddleware:
+    """Tests for the response header."""
+
+    def test_header_lists_stages_and_total(self):
+        response = _make_app().test_client().get('/work')
+        header = response.headers['Server-Timing']
+
+        assert 'fetch_history;desc="2 calls";dur=' in header
+        assert 'serialize;dur=' in header
+        assert 'total;dur=' in header
+
+    def test_no_header_when_disabled(self):
+        response = _make_app(SERVER_TIMING_ENABLED=False).test_client().get('/work')
+        assert 'Server-Timing' not in response.headers
+
+
+class TestStockServiceStages:
+    """Tests for stage coverage of StockService."""
+
+    def test_get_stock_data_stages(self, mock_yfinance_ticker):
+        app = _make_app()
+        service = StockService()
+        with app.test_request_context('/stock-data'):
+            g.server_timings = {}
+            with patch('yfinance.Ticker', return_value=mock_yfinance_ticker):
+                service.get_stock_data('AAPL', '2025-11-01', '2025-11-06')
+
+            assert set(g.server_timings) == {
+                'fetch_history',
+                'fetch_ticker_info',
+                'convert_to_data_points',
+                'calculate_price_info',
+                'company_name',
+            }
@@ -0,0 +1,182 @@
+"""
+Tests for the GDSF store and the size-aware Flask-Caching backend.
+"""
+
+import time
+
+import pytest
+
+from utils.local_cache import GDSFCache
+from utils.size_aware_cache import SizeAwareCache
+
+
+class TestGDSFCache:
+    """Tests for GDSFCache."""
+
+    def test_set_and_get(self):
+        """Test basic round trip and byte accounting."""
+        store = GDSFCache(max_bytes=1000)
+
+        assert store.set('a', 'value', size=100)
+        assert store.get('a') == 'value'
+        assert store.stats()['bytes'] == 100
+
+    def test_rejects_entry_larger_than_budget(self):
+        """Test oversized entries are not stored."""
+        store = GDSFCache(max_bytes=100)
+
+        assert store.set('big', 'x', size=101) is False
+        assert store.get('big') is None
+
+    def test_evicts_large_cold_entry_before_small_hot_one(self):
+        """Test eviction weighs size and frequency, not recency."""
+        store = GDSFCache(max_bytes=1000)
+        store.set('small-hot', 's', size=50)
+        for _ in range(5):
+            store.get('small-hot')
+        store.set('large-cold', 'l', size=800)
+
+        # The large entry was written last, yet it is the one evicted
+        store.set('incoming', 'i', size=300)
+
+        assert store.get('small-hot') == 's'
+        assert store.get('large-cold') is None
+        assert store.get('incoming') == 'i'
+        assert store.stats()['evictions'] == 1
+
+    def test_clock_ages_out_unused_entries(self):
+        """Test entries not re-accessed eventually lose to new ones."""
+        store = GDSFCache(max_bytes=300)
+        store.set('old', 'o', size=100)
+        for i in range(10):
+            store.set(f'new{i}', i, size=100)
+            store.get(f'new{i}')
+
+        assert store.get('old') is None
+
+    def test_entry_cap(self):
+        """Test max_entries bounds the number of entries."""
+        store = GDSFCache(max_bytes=10_000, max_entries=2)
+        store.set('a', 1, size=10)
+        store.set('b', 2, size=10)
+        store.set('c', 3, size=10)
+
+        assert len(store) == 2
+
+    def test_expired_entries_are_misses(self):
+        """Test entries past their deadline are dropped on read."""
+        store = GDSFCache(max_bytes=1000)
+        store.set_with_deadline('a', 1, size=10, expires_at=time.time() - 1)
+
+        assert store.get('a') is None
+        assert store.stats()['expirations'] == 1
+
+    def test_add_only_when_absent(self):
+        """Test add does not overwrite live entries."""
+        store = GDSFCache(max_bytes=1000)
+
+        assert store.add('a', 1, size=10)
+        assert store.add('a', 2, size=10) is False
+        assert store.get('a') == 1
+
+    def test_replacing_entry_updates_bytes(self):
+        """Test overwriting a key releases the old size."""
+        store = GDSFCache(max_bytes=1000)
+        store.set('a', 1, size=400)
+        store.set('a', 2, size=100)
+
+        assert store.stats()['bytes'] == 100
+
+    def test_stats_report_utilization(self):
+        """Test occupancy stats."""
+        store = GDSFCache(max_bytes=1000)
+        store.set('a', 1, size=250)
+        store.get('a')
+        store.get('missing')
+
+        stats = store.stats()
+        assert stats['entries'] == 1
+        assert stats['utilization'] == 0.25
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+
+class TestSizeAwareCache:
+    """Tests for the SizeAwareCache Flask-Caching backend."""
+
+    @pytest.fixture
+    def backend(self):
+        """Create a backend with a small budget."""
+        return SizeAwareCache(max_bytes=10_000, default_timeout=300)
+
+    def test_values_are_copied(self, backend):
+        """Test cached objects cannot be mutated through returned values."""
+        backend.set('k', {'items': [1, 2]})
+        backend.get('k')['items'].append(3)
+
+        assert backend.get('k') == {'items': [1, 2]}
+
+    def test_bytes_stored_verbatim(self, backend):
+        """Test bytes values are sized by length and returned as-is."""
+        backend.set('k', b'x' * 500)
+
+        assert backend.get('k') == b'x' * 500
+        assert backend.stats()['bytes'] == 500
+
+    def test_respects_byte_budget(self, backend):
+        """Test total stored bytes never exceed the budget."""
+        for i in range(50):
+            backend.set(f'k{i}', b'x' * 1000)
+
+        assert backend.stats()['bytes'] <= 10_000
+
+    def test_zero_timeout_never_expires(self, backend):
+        """Test timeout=0 stores without expiry."""
+        backend.set('k', 'v', timeout=0)
+
+        assert backend._store._entries['k'].expires_at is None
+
+    def test_inc_and_dec(self, backend):
+        """Test counters."""
+        assert backend.inc('counter') == 1
+        assert backend.inc('counter', 5) == 6
+        assert backend.dec('counter', 2) == 4
+
+    def test_negative_timeout_expires_immediately(self, backend):
+        """Test a negative timeout stores nothing and drops the old value, like SimpleCache."""
+        backend.set('k', 'old')
+
+        assert backend.set('k', 'new', timeout=-1)
+        assert backend.get('k') is None
+        assert backend.add('other', 'v', timeout=-1)
+        assert not backend.has('other')
+
+    def test_delete_and_has(self, backend):
+        """Test delete and has."""
+        backend.set('k', 'v')
+        assert backend.has('k')
+
+        assert backend.delete('k')
+        assert not backend.has('k')
+
+    def test_factory_reads_config(self):
+        """Test the Flask-Caching factory applies byte and entry limits."""
+        backend = SizeAwareCache.factory(
+            None,
+            {'CACHE_MAX_BYTES': 2048, 'CACHE_MAX_ENTRIES': 10},
+            [],
+            {'default_timeout': 60},
+        )
+
+        assert backend.stats()['max_bytes'] == 2048
+        assert backend._store.max_entries == 10
+        assert backend.default_timeout == 60
+
+    def test_factory_ignores_entry_count_threshold(self):
+        """Test Flask-Caching's CACHE_THRESHOLD default does not cap entries."""
+        backend = SizeAwareCache.factory(None, {'CACHE_THRESHOLD': 500}, [], {})
+
+        for i in range(1000):
+            backend.set(f'k{i}', b'v')
+
+        assert backend.stats()['entries'] == 1000
@@ -3,6 +3,7 @@ Tests for StockService batch operations
 
 Tests the batch stock data fetching functionality.
 """
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from services.stock_service import StockService
@@ -148,3 +149,108 @@ class TestBatchOperations:
             assert 'symbol' in error
             assert 'error' in error
             assert error['symbol'] == 'INVALID'
+
+
+class InMemoryFragmentCache:
+    """Dict-backed stand-in for FragmentCache."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get_many(self, keys):
+        return {key: self.store[key] for key in keys if key in self.store}
+
+    def set_many(self, fragments):
+        self.store.update(fragments)
+
+
+class TestEncodedBatchOperations:
+    """Test cases for fragment-spliced batch responses"""
+
+    @pytest.fixture
+    def fragment_cache(self):
+        return InMemoryFragmentCache()
+
+    @pytest.fixture
+    def encoded_service(self, fragment_cache):
+        return StockService(fragment_cache=fragment_cache)
+
+    def test_encoded_batch_matches_dict_shape(self, encoded_service, mock_yfinance_ticker):
+        """Test encoded body decodes to the same structure as the dict API"""
+        with patch('yfinance.Ticker', return_value=mock_yfinance_ticker):
+            body = encoded_service.get_batch_stocks_parallel_encoded(
+                ['MSFT', 'AAPL'], '2025-11-05', '2025-11-10'
+            )
+
+        result = json.loads(body)
+        assert [stock['symbol'] for stock in result['stocks']] == ['MSFT', 'AAPL']
+        assert result['errors'] is None
+        assert 'timestamp' in result
+        assert 'processing_time_ms' in result
+
+    def test_cached_fragments_are_spliced_without_fetching(
+        self, encoded_service, fragment_cache
+    ):
+        """Test a fully cached batch performs no fetches"""
+        fragment_cache.store['stock_fragment:AAPL:2025-11-05:2025-11-10'] = b'{"symbol":"AAPL"}'
+        fragment_cache.store['stock_fragment:MSFT:2025-11-05:2025-11-10'] = b'{"symbol":"MSFT"}'
+
+        with patch.object(encoded_service, 'get_stock_data') as mock_get:
+            body = encoded_service.get_batch_stocks_encoded(
+                ['AAPL', 'MSFT'], '2025-11-05', '2025-11-10'
+            )
+
+        mock_get.assert_not_called()
+        assert body.startswith(b'{"stocks":[{"symbol":"AAPL"},{"symbol":"MSFT"}]')
+
+    def test_only_misses_are_fetched_and_stored(
+        self, encoded_service, fragment_cache, mock_yfinance_ticker
+    ):
+        """Test partial hits fetch and cache only the missing symbols"""
+        fragment_cache.store['stock_fragment:AAPL:2025-11-05:2025-11-10'] = b'{"symbol":"AAPL"}'
+
+        with patch('yfinance.Ticker', return_value=mock_yfinance_ticker) as mock_ticker:
+            body = encoded_service.get_batch_stocks_encoded(
+                ['AAPL', 'MSFT'], '2025-11-05', '2025-11-10'
+            )
+
+        mock_ticker.assert_called_once_with('MSFT')
+        assert 'stock_fragment:MSFT:2025-11-05:2025-11-10' in fragment_cache.store
+        assert len(json.loads(body)['stocks']) == 2
+
+    def test_single_stock_reuses_fragment(self, encoded_service, fragment_cache):
+        """Test a single-stock request is served from a batch-filled fragment"""
+        fragment_cache.store['stock_fragment:AAPL:2025-11-05:2025-11-10'] = b'{"symbol":"AAPL"}'
+
+        with patch.object(encoded_service, 'get_stock_data') as mock_get:
+            body = encoded_service.get_stock_data_encoded('AAPL', '2025-11-05', '2025-11-10')
+
+        mock_get.assert_not_called()
+        assert body == b'{"symbol":"AAPL"}'
+
+    def test_single_stock_does_not_store_fragment(
+        self, encoded_service, fragment_cache, mock_yfinance_ticker
+    ):
+        """Test a single-stock miss is left to the route cache, not duplicated as a fragment"""
+        with patch('yfinance.Ticker', return_value=mock_yfinance_ticker):
+            body = encoded_service.get_stock_data_encoded('AAPL', '2025-11-05', '2025-11-10')
+
+        assert json.loads(body)['symbol'] == 'AAPL'
+        assert fragment_cache.store == {}
+
+    def test_encoded_batch_reports_errors(
+        self, encoded_service, fragment_cache, mock_yfinance_ticker, mock_empty_ticker
+    ):
+        """Test failed symbols are reported and not cached"""
+        def ticker_side_effect(symbol):
+            return mock_empty_ticker if symbol == 'INVALID' else mock_yfinance_ticker
+
+        with patch('yfinance.Ticker', side_effect=ticker_side_effect):
+            body = encoded_service.get_batch_stocks_encoded(
+                ['AAPL', 'INVALID'], '2025-11-05', '2025-11-10'
+            )
+
+        result = json.loads(body)
+        assert len(result['stocks']) == 1
+        assert result['errors'][0]['symbol'] == 'INVALID'
+        assert not any('INVALID' in key for key in fragment_cache.store)
@@ -0,0 +1,209 @@
+"""
+Tests for the two-tier (in-process LRU + Redis) cache backend.
+
+Redis is replaced by a small in-memory fake implementing the commands the
+backend uses, so these tests run without a Redis server.
+"""
+
+import time
+
+import pytest
+
+from utils.local_cache import LocalLRUCache
+from utils.tiered_cache import TieredRedisCache
+
+
+class FakePipeline:
+    """Minimal pipeline that buffers commands for FakeRedis."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def set(self, name, value):
+        self._commands.append(lambda: self._redis.set(name, value))
+
+    def setex(self, name, value, time):
+        self._commands.append(lambda: self._redis.setex(name, value, time))
+
+    def execute(self):
+        return [command() for command in self._commands]
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis."""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+        self.reads = 0
+
+    def get(self, name):
+        self.reads += 1
+        return self.data.get(name)
+
+    def mget(self, names):
+        self.reads += 1
+        return [self.data.get(name) for name in names]
+
+    def set(self, name, value):
+        self.data[name] = value
+        return True
+
+    def setex(self, name, value, time):
+        self.data[name] = value
+        return True
+
+    def setnx(self, name, value):
+        if name in self.data:
+            return False
+        self.data[name] = value
+        return True
+
+    def expire(self, name, time):
+        return True
+
+    def exists(self, name):
+        return int(name in self.data)
+
+    def delete(self, *names):
+        return sum(1 for name in names if self.data.pop(name, None) is not None)
+
+    def keys(self, pattern):
+        prefix = pattern.rstrip('*')
+        return [key for key in self.data if key.startswith(prefix)]
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def tiered(redis_client):
+    cache = TieredRedisCache(
+        host=redis_client, key_prefix='test:', l1_max_bytes=1024 * 1024, l1_ttl=10
+    )
+    # Listener threads are exercised separately; keep tests single-threaded
+    cache._ensure_listener = lambda: None
+    return cache
+
+
+class TestLocalLRUCache:
+    """Tests for the byte-budgeted LRU tier."""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Test the byte budget evicts the coldest entries first."""
+        l1 = LocalLRUCache(max_bytes=100, default_ttl=60)
+        l1.set('a', 'A', size=40)
+        l1.set('b', 'B', size=40)
+        l1.get('a')
+        l1.set('c', 'C', size=40)
+
+        assert l1.get('a') == 'A'
+        assert l1.get('b') is None
+        assert l1.stats()['bytes'] == 80
+        assert l1.stats()['evictions'] == 1
+
+    def test_entries_expire(self):
+        """Test entries past their TTL are dropped."""
+        l1 = LocalLRUCache(max_bytes=100, default_ttl=0.01)
+        l1.set('a', 'A', size=1)
+        time.sleep(0.02)
+
+        assert l1.get('a') is None
+        assert len(l1) == 0
+
+    def test_oversized_entries_not_stored(self):
+        """Test entries larger than the budget are rejected."""
+        l1 = LocalLRUCache(max_bytes=10, default_ttl=60)
+
+        assert l1.set('big', 'x', size=11) is False
+        assert l1.get('big') is None
+
+
+class TestTieredRedisCache:
+    """Tests for TieredRedisCache."""
+
+    def test_hot_key_served_from_l1(self, tiered, redis_client):
+        """Test repeated reads do not touch Redis."""
+        tiered.set('news:AAPL', {'total': 3}, timeout=60)
+        reads_before = redis_client.reads
+
+        assert tiered.get('news:AAPL') == {'total': 3}
+        assert tiered.get('news:AAPL') == {'total': 3}
+        assert redis_client.reads == reads_before
+
+    def test_l1_miss_falls_back_to_redis(self, tiered, redis_client):
+        """Test values written by another worker are read from Redis once."""
+        tiered.set('news:AAPL', {'total': 3}, timeout=60)
+        tiered._l1.clear()
+
+        assert tiered.get('news:AAPL') == {'total': 3}
+        reads_after_fill = redis_client.reads
+        assert tiered.get('news:AAPL') == {'total': 3}
+        assert redis_client.reads == reads_after_fill
+
+    def test_get_many_reads_only_misses(self, tiered, redis_client):
+        """Test get_many serves L1 hits and fetches the rest in one call."""
+        tiered.set_many({'a': b'1', 'b': b'2'}, timeout=60)
+        tiered._l1.delete('b')
+
+        assert tiered.get_many('a', 'b', 'c') == [b'1', b'2', None]
+
+    def test_writes_publish_invalidation(self, tiered, redis_client):
+        """Test set and delete broadcast the key to other workers."""
+        tiered.set('news:AAPL', 1, timeout=60)
+        tiered.delete('news:AAPL')
+
+        assert len(redis_client.published) == 2
+        assert all(msg.endswith('|news:AAPL') for _, msg in redis_client.published)
+
+    def test_pubsub_disabled(self, redis_client):
+        """Test no messages are published when pub/sub is off."""
+        cache = TieredRedisCache(host=redis_client, key_prefix='test:', l1_pubsub=False)
+        cache.set('news:AAPL', 1, timeout=60)
+
+        assert redis_client.published == []
+
+    def test_remote_invalidation_drops_l1_entry(self, tiered):
+        """Test messages from other workers evict the local copy."""
+        tiered.set('news:AAPL', 1, timeout=60)
+
+        tiered._handle_invalidation(b'other-worker|news:AAPL')
+
+        assert tiered._l1.get('news:AAPL') is None
+
+    def test_own_invalidation_ignored(self, tiered):
+        """Test a worker does not evict entries it just wrote."""
+        tiered.set('news:AAPL', 1, timeout=60)
+
+        tiered._handle_invalidation(f"{tiered._sender_id()}|news:AAPL")
+
+        assert tiered._l1.get('news:AAPL') == 1
+
+    def test_remote_clear_empties_l1(self, tiered):
+        """Test a clear broadcast empties the local tier."""
+        tiered.set('a', 1, timeout=60)
+        tiered.set('b', 2, timeout=60)
+
+        tiered._handle_invalidation('other-worker|*')
+
+        assert tiered.l1_stats()['entries'] == 0
+
+    def test_large_values_compressed_in_redis(self, tiered, redis_client):
+        """Test values above the threshold are stored compressed."""
+        value = {'data': [1.5] * 2000}
+        tiered.set('stock:AAPL', value, timeout=60)
+        tiered._l1.clear()
+
+        assert redis_client.data['test:stock:AAPL'].startswith(b'\xfe')
+        assert tiered.get('stock:AAPL') == value
+        assert tiered.stats()['compression']['compressed'] == 1
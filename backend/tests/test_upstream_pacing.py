@@ -0,0 +1,238 @@
+"""
+Tests for upstream pacing.
+
+This module tests:
+- Token bucket reservations (burst, spacing, thread safety)
+- The Redis-backed bucket and its local fallback
+- PacingScheduler futures, ordering and overload rejection
+- init_upstream_pacing configuration
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from utils.metrics import PROVIDER_GOOGLE_RSS, registry
+from utils import upstream_pacing
+from utils.upstream_pacing import (
+    PacingOverloadError,
+    PacingScheduler,
+    RedisTokenBucket,
+    TokenBucket,
+    get_pacing_scheduler,
+    init_upstream_pacing,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_spaced(self):
+        """should allow a burst, then space calls by the interval"""
+        clock = _Clock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0, 0, 0.1, 0.2])
+
+    def test_refills_while_idle(self):
+        """should hand out free tokens again after an idle period"""
+        clock = _Clock()
+        bucket = TokenBucket(rate=10, burst=1, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 1
+        assert bucket.reserve() == 0
+
+    def test_rejected_reservation_is_not_kept(self):
+        """should not advance the bucket for waits beyond max_wait"""
+        clock = _Clock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+        bucket.reserve()
+
+        assert bucket.reserve(max_wait=0.5) == 1.0
+        assert bucket.reserve(max_wait=0.5) == 1.0
+        clock.now += 1
+        assert bucket.reserve(max_wait=0.5) == 0
+
+    def test_concurrent_reservations_never_share_a_slot(self):
+        """should give every concurrent caller its own slot"""
+        clock = _Clock()
+        bucket = TokenBucket(rate=100, burst=1, clock=clock)
+        delays = []
+        lock = threading.Lock()
+
+        def reserve():
+            delay = bucket.reserve()
+            with lock:
+                delays.append(round(delay, 6))
+
+        threads = [threading.Thread(target=reserve) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(delays) == [round(i * 0.01, 6) for i in range(50)]
+
+
+class TestRedisTokenBucket:
+    """Tests for RedisTokenBucket."""
+
+    def test_reserves_through_script(self):
+        """should pass the bucket parameters to the Lua script"""
+        client = MagicMock()
+        script = client.register_script.return_value
+        script.return_value = b'0.25'
+
+        bucket = RedisTokenBucket(client, 'google_rss', rate=4, burst=3)
+
+        assert bucket.reserve() == 0.25
+        kwargs = script.call_args[1]
+        assert kwargs['keys'] == ['marketvue:pacing:google_rss']
+        assert kwargs['args'] == pytest.approx([0.25, 0.5, -1])
+
+    def test_passes_max_wait_to_script(self):
+        """should let the script skip reservations beyond max_wait"""
+        client = MagicMock()
+        script = client.register_script.return_value
+        script.return_value = b'0'
+
+        RedisTokenBucket(client, 'google_rss', rate=4, burst=3).reserve(max_wait=10)
+
+        assert script.call_args[1]['args'][2] == 10
+
+    def test_falls_back_to_local_bucket(self):
+        """should pace locally while Redis is unreachable"""
+        client = MagicMock()
+        client.register_script.return_value.side_effect = ConnectionError('down')
+
+        bucket = RedisTokenBucket(client, 'google_rss', rate=10, burst=1)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+class TestPacingScheduler:
+    """Tests for PacingScheduler."""
+
+    def test_resolves_future(self):
+        """should run the call and resolve its future"""
+        scheduler = PacingScheduler('test', TokenBucket(rate=1000, burst=10))
+
+        assert scheduler.submit(lambda a, b=0: a + b, 1, b=2).result(timeout=2) == 3
+
+    def test_propagates_exceptions(self):
+        """should set the call's exception on the future"""
+        scheduler = PacingScheduler('test', TokenBucket(rate=1000, burst=10))
+
+        def fail():
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            scheduler.submit(fail).result(timeout=2)
+
+    def test_submit_does_not_block(self):
+        """should return immediately even when the call must wait"""
+        scheduler = PacingScheduler('test', TokenBucket(rate=5, burst=1))
+        scheduler.submit(lambda: None)
+
+        start = time.perf_counter()
+        future = scheduler.submit(time.perf_counter)
+        assert time.perf_counter() - start < 0.05
+
+        assert future.result(timeout=2) - start >= 0.15
+
+    def test_releases_calls_at_the_bucket_pace(self):
+        """should start queued calls in order, one interval apart"""
+        scheduler = PacingScheduler('test', TokenBucket(rate=20, burst=1))
+
+        futures = [scheduler.submit(time.perf_counter) for _ in range(4)]
+        starts = [future.result(timeout=2) for future in futures]
+
+        assert starts == sorted(starts)
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    def test_rejects_calls_beyond_max_wait(self):
+        """should raise instead of queueing past max_wait"""
+        scheduler = PacingScheduler('test', TokenBucket(rate=1, burst=1), max_wait=0.5)
+        scheduler.submit(lambda: None)
+
+        with pytest.raises(PacingOverloadError):
+            scheduler.submit(lambda: None)
+
+    def test_accepts_calls_after_overload_drains(self):
+        """should accept calls again once the backlog has drained"""
+        clock = _Clock()
+        scheduler = PacingScheduler('test', TokenBucket(rate=5, burst=2, clock=clock), max_wait=1)
+
+        outcomes = []
+        for _ in range(100):
+            try:
+                scheduler.submit(lambda: None)
+                outcomes.append(True)
+            except PacingOverloadError:
+                outcomes.append(False)
+        assert 0 < outcomes.count(True) <= 7
+
+        clock.now += 5
+        assert scheduler.submit(lambda: None).result(timeout=5) is None
+
+    def test_queue_gauge(self):
+        """should track queued calls in upstream_pacing_queued"""
+        scheduler = PacingScheduler('gauge_test', TokenBucket(rate=1000, burst=10))
+        scheduler.submit(lambda: None).result(timeout=2)
+
+        assert 'upstream_pacing_queued{provider="gauge_test"} 0' in registry.render()
+
+
+class TestInitUpstreamPacing:
+    """Tests for scheduler configuration."""
+
+    @pytest.fixture(autouse=True)
+    def restore_schedulers(self):
+        with patch.dict(upstream_pacing._schedulers, clear=True):
+            yield
+
+    def test_default_scheduler_is_local(self):
+        """should create a per-process scheduler when none is configured"""
+        scheduler = get_pacing_scheduler(PROVIDER_GOOGLE_RSS)
+
+        assert isinstance(scheduler._bucket, TokenBucket)
+        assert get_pacing_scheduler(PROVIDER_GOOGLE_RSS) is scheduler
+
+    def test_configures_rate(self):
+        """should build the Google News bucket from the app config"""
+        app = Flask(__name__)
+        app.config.update(GOOGLE_NEWS_RATE_LIMIT=2.0, GOOGLE_NEWS_BURST=3)
+
+        init_upstream_pacing(app)
+
+        bucket = get_pacing_scheduler(PROVIDER_GOOGLE_RSS)._bucket
+        assert bucket.interval == pytest.approx(0.5)
+        assert bucket.tolerance == pytest.approx(1.0)
+
+    def test_shared_bucket_with_redis(self):
+        """should share the bucket via Redis when UPSTREAM_PACING_REDIS is set"""
+        app = Flask(__name__)
+        app.config.update(UPSTREAM_PACING_REDIS=True, CACHE_REDIS_URL='redis://localhost:6379/0')
+
+        with patch('redis.Redis.from_url', return_value=MagicMock()) as from_url:
+            init_upstream_pacing(app)
+
+        from_url.assert_called_once()
+        assert isinstance(get_pacing_scheduler(PROVIDER_GOOGLE_RSS)._bucket, RedisTokenBucket)
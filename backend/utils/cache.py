@@ -10,11 +10,74 @@ from flask import request
 import hashlib
 import json
 import logging
+import time
+
+from utils.cache_metrics import cache_metrics
 
 logger = logging.getLogger(__name__)
 
+
+class InstrumentedCache(Cache):
+    """
+    Flask-Caching extension that records per-family metrics for every call.
+
+    Hits, misses, writes and deletes, plus get/set latency, are recorded in
+    ``cache_metrics`` regardless of the configured backend. ``has`` is not
+    recorded: it is an existence probe (tag pruning, health checks) that
+    reads no value, and counting it would skew the hit ratios.
+    """
+
+    def get(self, key, *args, **kwargs):
+        """Get a value and record a hit or miss."""
+        start = time.perf_counter()
+        value = super().get(key, *args, **kwargs)
+        cache_metrics.record_get(key, value is not None, time.perf_counter() - start)
+        return value
+
+    def get_many(self, *keys, **kwargs):
+        """Get several values and record hits and misses per key."""
+        start = time.perf_counter()
+        values = super().get_many(*keys, **kwargs)
+        cache_metrics.record_get_many(keys, values, time.perf_counter() - start)
+        return values
+
+    def set(self, key, *args, **kwargs):
+        """Store a value and record the write."""
+        start = time.perf_counter()
+        result = super().set(key, *args, **kwargs)
+        cache_metrics.record_set([key], time.perf_counter() - start)
+        return result
+
+    def add(self, key, *args, **kwargs):
+        """Store a value if the key is absent and record the write."""
+        start = time.perf_counter()
+        result = super().add(key, *args, **kwargs)
+        if result:
+            cache_metrics.record_set([key], time.perf_counter() - start)
+        return result
+
+    def set_many(self, mapping, *args, **kwargs):
+        """Store several values and record the writes."""
+        start = time.perf_counter()
+        result = super().set_many(mapping, *args, **kwargs)
+        cache_metrics.record_set(list(mapping), time.perf_counter() - start)
+        return result
+
+    def delete(self, key, *args, **kwargs):
+        """Delete a key and record it."""
+        result = super().delete(key, *args, **kwargs)
+        cache_metrics.record_delete([key])
+        return result
+
+    def delete_many(self, *keys, **kwargs):
+        """Delete several keys and record them."""
+        result = super().delete_many(*keys, **kwargs)
+        cache_metrics.record_delete(keys)
+        return result
+
+
 # Initialize cache instance - will be configured by app.py
-cache = Cache()
+cache = InstrumentedCache()
 
 
 def make_cache_key(*args, **kwargs):
@@ -2,8 +2,11 @@
 Cache factory module for creating cache instances.
 
 Supports multiple cache backends:
-- SimpleCache: In-memory cache for development
-- Redis: Distributed cache for production
+- SimpleCache: In-memory cache for development, served by the byte-budgeted
+  SizeAwareCache backend
+- Redis: Distributed cache for production, optionally fronted by an
+  in-process L1 tier (TieredRedisCache) and wrapped in a circuit breaker
+  that fails over to process memory during outages (ResilientRedisCache)
 
 The factory pattern allows seamless switching between backends
 based on environment configuration.
@@ -13,6 +16,16 @@ from typing import Dict, Any, Optional
 from flask import Flask
 from flask_caching import Cache
 
+from constants import (
+    CACHE_COMPRESSION_MIN_SIZE_BYTES,
+    CACHE_FAILOVER_FAILURE_THRESHOLD,
+    CACHE_FAILOVER_PROBE_INTERVAL_SECONDS,
+    CACHE_L1_MAX_BYTES,
+    CACHE_L1_TTL_SECONDS,
+    CACHE_LOCAL_MAX_BYTES,
+    CACHE_LOCAL_MAX_ENTRIES,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +43,18 @@ class CacheFactory:
 
     SUPPORTED_BACKENDS = ['SimpleCache', 'redis', 'RedisCache']
 
+    # Flask-Caching import path of the two-tier Redis backend
+    TIERED_REDIS_BACKEND = 'utils.tiered_cache.TieredRedisCache'
+
+    # Flask-Caching import path of the Redis backend without the L1 tier
+    REDIS_BACKEND = 'utils.tiered_cache.CompressedRedisCache'
+
+    # Flask-Caching import path of the Redis failover wrapper
+    RESILIENT_REDIS_BACKEND = 'utils.resilient_cache.ResilientRedisCache'
+
+    # Flask-Caching import path of the byte-budgeted in-memory backend
+    LOCAL_BACKEND = 'utils.size_aware_cache.SizeAwareCache'
+
     def __init__(self):
         """Initialize cache factory."""
         self._cache: Optional[Cache] = None
@@ -98,17 +123,28 @@ class CacheFactory:
         """
         Build Redis cache configuration.
 
+        Values are compressed in Redis above CACHE_COMPRESSION_MIN_SIZE with
+        the CACHE_COMPRESSION codec. When CACHE_L1_ENABLED (default), the
+        TieredRedisCache backend is used so hot keys are served from process
+        memory before hitting Redis. When CACHE_FAILOVER_ENABLED (default),
+        the Redis backend is wrapped in ResilientRedisCache so a Redis outage
+        at runtime degrades to process memory instead of socket timeouts.
+
         Args:
             app: Flask application instance
 
         Returns:
             Redis cache configuration dictionary
         """
-        return {
-            'CACHE_TYPE': 'RedisCache',
+        config = {
+            'CACHE_TYPE': self.REDIS_BACKEND,
             'CACHE_REDIS_URL': app.config.get('CACHE_REDIS_URL', 'redis://localhost:6379/0'),
             'CACHE_DEFAULT_TIMEOUT': app.config.get('CACHE_DEFAULT_TIMEOUT', 300),
             'CACHE_KEY_PREFIX': app.config.get('CACHE_KEY_PREFIX', 'marketvue:'),
+            'CACHE_COMPRESSION': app.config.get('CACHE_COMPRESSION', 'zlib'),
+            'CACHE_COMPRESSION_MIN_SIZE': app.config.get(
+                'CACHE_COMPRESSION_MIN_SIZE', CACHE_COMPRESSION_MIN_SIZE_BYTES
+            ),
             'CACHE_OPTIONS': {
                 'socket_timeout': 5,
                 'socket_connect_timeout': 5,
@@ -116,10 +152,36 @@ class CacheFactory:
             }
         }
 
+        if app.config.get('CACHE_L1_ENABLED', True):
+            config.update({
+                'CACHE_TYPE': self.TIERED_REDIS_BACKEND,
+                'CACHE_L1_MAX_BYTES': app.config.get('CACHE_L1_MAX_BYTES', CACHE_L1_MAX_BYTES),
+                'CACHE_L1_TTL': app.config.get('CACHE_L1_TTL', CACHE_L1_TTL_SECONDS),
+                'CACHE_L1_PUBSUB': app.config.get('CACHE_L1_PUBSUB', True),
+            })
+
+        if app.config.get('CACHE_FAILOVER_ENABLED', True):
+            config.update({
+                'CACHE_TYPE': self.RESILIENT_REDIS_BACKEND,
+                'CACHE_REDIS_BACKEND': config['CACHE_TYPE'],
+                'CACHE_FAILOVER_THRESHOLD': app.config.get(
+                    'CACHE_FAILOVER_THRESHOLD', CACHE_FAILOVER_FAILURE_THRESHOLD
+                ),
+                'CACHE_FAILOVER_PROBE_INTERVAL': app.config.get(
+                    'CACHE_FAILOVER_PROBE_INTERVAL', CACHE_FAILOVER_PROBE_INTERVAL_SECONDS
+                ),
+                'CACHE_MAX_BYTES': app.config.get('CACHE_MAX_BYTES', CACHE_LOCAL_MAX_BYTES),
+            })
+
+        return config
+
     def _build_simple_cache_config(self, app: Flask) -> Dict[str, Any]:
         """
         Build SimpleCache configuration.
 
+        Uses the SizeAwareCache backend, which bounds memory by bytes and
+        evicts by size and access frequency rather than entry count.
+
         Args:
             app: Flask application instance
 
@@ -127,9 +189,11 @@ class CacheFactory:
             SimpleCache configuration dictionary
         """
         return {
-            'CACHE_TYPE': 'SimpleCache',
+            'CACHE_TYPE': self.LOCAL_BACKEND,
             'CACHE_DEFAULT_TIMEOUT': app.config.get('CACHE_DEFAULT_TIMEOUT', 300),
-            'CACHE_THRESHOLD': 1000,  # Maximum number of items
+            'CACHE_MAX_BYTES': app.config.get('CACHE_MAX_BYTES', CACHE_LOCAL_MAX_BYTES),
+            # Safety cap only; the byte budget decides what is evicted
+            'CACHE_MAX_ENTRIES': app.config.get('CACHE_MAX_ENTRIES', CACHE_LOCAL_MAX_ENTRIES),
         }
 
     def _test_redis_connection(self, cache: Cache) -> None:
@@ -9,6 +9,17 @@ Single responsibility: Generate standardized cache keys for various stock data r
 
 from typing import List
 
+# Key families, i.e. the first segment of every key built here
+FAMILY_STOCK_DATA = 'stock_data'
+FAMILY_STOCK_FRAGMENT = 'stock_fragment'
+FAMILY_BATCH_STOCKS = 'batch_stocks'
+FAMILY_NEWS = 'news'
+
+KEY_FAMILIES = (FAMILY_STOCK_DATA, FAMILY_STOCK_FRAGMENT, FAMILY_BATCH_STOCKS, FAMILY_NEWS)
+
+# Family reported for keys not built by CacheKeyBuilder (health checks, etc.)
+FAMILY_OTHER = 'other'
+
 
 class CacheKeyBuilder:
     """
@@ -49,6 +60,28 @@ class CacheKeyBuilder:
         """
         return f"stock_data:{symbol.upper()}:{start_date}:{end_date}"
 
+    @staticmethod
+    def build_stock_fragment_key(symbol: str, start_date: str, end_date: str) -> str:
+        """
+        Generate cache key for a single stock's pre-encoded JSON fragment.
+
+        Fragments are shared between the single-stock and batch endpoints,
+        so a symbol fetched by either one is reused by the other.
+
+        Args:
+            symbol: Stock ticker symbol (will be uppercased)
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+
+        Returns:
+            Cache key string in format "stock_fragment:{SYMBOL}:{start_date}:{end_date}"
+
+        Examples:
+            >>> CacheKeyBuilder.build_stock_fragment_key('aapl', '2024-01-01', '2024-01-31')
+            'stock_fragment:AAPL:2024-01-01:2024-01-31'
+        """
+        return f"stock_fragment:{symbol.upper()}:{start_date}:{end_date}"
+
     @staticmethod
     def build_batch_key(
         symbols: List[str],
@@ -131,3 +164,68 @@ class CacheKeyBuilder:
             'news:AAPL'
         """
         return f"news:{symbol.upper()}"
+
+    @staticmethod
+    def build_symbol_tag(symbol: str) -> str:
+        """
+        Generate the invalidation tag shared by every key of a symbol.
+
+        Args:
+            symbol: Stock ticker symbol (will be uppercased)
+
+        Returns:
+            Tag string in format "symbol:{SYMBOL}"
+
+        Examples:
+            >>> CacheKeyBuilder.build_symbol_tag('aapl')
+            'symbol:AAPL'
+        """
+        return f"symbol:{symbol.upper()}"
+
+    @staticmethod
+    def family_for_key(key: str) -> str:
+        """
+        Get the family of a key (used to group cache metrics).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            One of KEY_FAMILIES, or FAMILY_OTHER
+
+        Examples:
+            >>> CacheKeyBuilder.family_for_key('news:AAPL')
+            'news'
+            >>> CacheKeyBuilder.family_for_key('_health_check_test')
+            'other'
+        """
+        family = key.split(':', 1)[0]
+        return family if family in KEY_FAMILIES else FAMILY_OTHER
+
+    @staticmethod
+    def tags_for_key(key: str) -> List[str]:
+        """
+        Derive the invalidation tags of a key built by this class.
+
+        Batch keys are tagged with every symbol they contain, so purging one
+        symbol also drops the batches that include it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            List of tags (empty for keys outside the known families)
+
+        Examples:
+            >>> CacheKeyBuilder.tags_for_key('batch_stocks:AAPL,GOOGL:2024-01-01:2024-01-31')
+            ['symbol:AAPL', 'symbol:GOOGL']
+        """
+        parts = key.split(':')
+        if len(parts) < 2 or parts[0] not in KEY_FAMILIES or not parts[1]:
+            return []
+
+        if parts[0] == FAMILY_BATCH_STOCKS:
+            symbols = parts[1].split(',')
+        else:
+            symbols = [parts[1]]
+        return [CacheKeyBuilder.build_symbol_tag(symbol) for symbol in symbols if symbol]
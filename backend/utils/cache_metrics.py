@@ -0,0 +1,272 @@
+"""
+Cache metrics grouped by key family.
+
+Counts hits, misses, sets, deletes and evictions and records get/set
+latency histograms for each CacheKeyBuilder family (``stock_data``,
+``stock_fragment``, ``batch_stocks``, ``news``; anything else is
+``other``), so TTLs and memory budgets can be sized from real traffic.
+Multi-key calls (``get_many`` / ``set_many``) can span families, so their
+latency is kept in separate ``batch`` histograms; their keys are still
+counted per family.
+
+Recording happens in InstrumentedCache (utils/cache.py), which every cache
+call goes through, and in SizeAwareCache for evictions. Metrics are kept per
+process; bytes currently stored are read from backends that can list their
+entries (the in-memory SizeAwareCache).
+
+Single responsibility: Aggregate cache activity per key family.
+"""
+import bisect
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from constants import CACHE_LATENCY_BUCKETS_MS
+from utils.cache_keys import CacheKeyBuilder
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (milliseconds).
+
+    Examples:
+        >>> histogram = LatencyHistogram()
+        >>> histogram.observe(0.7)
+        >>> histogram.snapshot()['count']
+        1
+    """
+
+    def __init__(self, bounds: Sequence[float] = CACHE_LATENCY_BUCKETS_MS):
+        """
+        Initialize LatencyHistogram.
+
+        Args:
+            bounds: Ascending bucket upper bounds in milliseconds
+        """
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)  # last bucket is +Inf
+        self._sum = 0.0
+
+    def observe(self, millis: float) -> None:
+        """Record one observation (the caller holds the registry lock)."""
+        self._counts[bisect.bisect_left(self.bounds, millis)] += 1
+        self._sum += millis
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the histogram as cumulative bucket counts.
+
+        Returns:
+            Dictionary with count, sum_ms, avg_ms and buckets (upper bound
+            label -> observations at or below it)
+        """
+        buckets = {}
+        cumulative = 0
+        for label, count in zip([*map(str, self.bounds), '+Inf'], self._counts):
+            cumulative += count
+            buckets[label] = cumulative
+        return {
+            'count': cumulative,
+            'sum_ms': round(self._sum, 3),
+            'avg_ms': round(self._sum / cumulative, 3) if cumulative else 0.0,
+            'buckets': buckets,
+        }
+
+
+class FamilyMetrics:
+    """Counters and latency histograms for one key family."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.evictions = 0
+        self.get_latency = LatencyHistogram()
+        self.set_latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the family's metrics as a dictionary."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            'sets': self.sets,
+            'deletes': self.deletes,
+            'evictions': self.evictions,
+            'get_latency': self.get_latency.snapshot(),
+            'set_latency': self.set_latency.snapshot(),
+        }
+
+
+class CacheMetrics:
+    """
+    Thread-safe registry of per-family cache metrics.
+
+    Examples:
+        >>> cache_metrics.record_get('news:AAPL', hit=True, seconds=0.0004)
+        >>> cache_metrics.snapshot()['families']['news']['hits']
+        1
+    """
+
+    def __init__(self):
+        """Initialize CacheMetrics."""
+        self._lock = threading.Lock()
+        self._families: Dict[str, FamilyMetrics] = {}
+        self._batch_get_latency = LatencyHistogram()
+        self._batch_set_latency = LatencyHistogram()
+        self._since = time.time()
+
+    def record_get(self, key: str, hit: bool, seconds: float) -> None:
+        """
+        Record a single-key lookup.
+
+        Args:
+            key: Cache key
+            hit: Whether a value was found
+            seconds: Call duration
+        """
+        with self._lock:
+            family = self._family(key)
+            if hit:
+                family.hits += 1
+            else:
+                family.misses += 1
+            family.get_latency.observe(seconds * 1000)
+
+    def record_get_many(self, keys: Sequence[str], values: Sequence[Any], seconds: float) -> None:
+        """
+        Record a multi-key lookup.
+
+        Hits and misses are counted per key; the call's latency is recorded
+        once, in the batch get histogram (or the family's, for a single key).
+
+        Args:
+            keys: Cache keys
+            values: Values returned (None for misses)
+            seconds: Call duration
+        """
+        if not keys:
+            return
+        with self._lock:
+            for key, value in zip(keys, values):
+                family = self._family(key)
+                if value is None:
+                    family.misses += 1
+                else:
+                    family.hits += 1
+            histogram = self._family(keys[0]).get_latency if len(keys) == 1 else self._batch_get_latency
+            histogram.observe(seconds * 1000)
+
+    def record_set(self, keys: Sequence[str], seconds: float) -> None:
+        """
+        Record a write of one or more keys.
+
+        A single-key write's latency goes to its family; a multi-key write's
+        latency is recorded once, in the batch set histogram.
+
+        Args:
+            keys: Cache keys written
+            seconds: Call duration
+        """
+        if not keys:
+            return
+        with self._lock:
+            for key in keys:
+                self._family(key).sets += 1
+            histogram = self._family(keys[0]).set_latency if len(keys) == 1 else self._batch_set_latency
+            histogram.observe(seconds * 1000)
+
+    def record_delete(self, keys: Iterable[str]) -> None:
+        """Record deleted keys."""
+        with self._lock:
+            for key in keys:
+                self._family(key).deletes += 1
+
+    def record_eviction(self, key: str, size: int = 0) -> None:
+        """
+        Record a key evicted to make room (called by in-memory backends).
+
+        Args:
+            key: Evicted cache key
+            size: Size of the evicted value in bytes
+        """
+        with self._lock:
+            self._family(key).evictions += 1
+
+    def snapshot(self, backend: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Get all metrics.
+
+        Args:
+            backend: Active cache backend; when it can list entry sizes
+                (``entry_sizes()``), bytes and entries stored per family are
+                included
+
+        Returns:
+            Dictionary with pid, since (unix time), families, batch
+            (multi-key call latency) and totals
+        """
+        stored = self._stored_by_family(backend)
+
+        with self._lock:
+            families = {name: metrics.snapshot() for name, metrics in self._families.items()}
+            batch = {
+                'get_latency': self._batch_get_latency.snapshot(),
+                'set_latency': self._batch_set_latency.snapshot(),
+            }
+
+        for name, (entries, size) in stored.items():
+            families.setdefault(name, FamilyMetrics().snapshot())
+            families[name]['entries'] = entries
+            families[name]['bytes'] = size
+
+        totals = {
+            field: sum(family[field] for family in families.values())
+            for field in ('hits', 'misses', 'sets', 'deletes', 'evictions')
+        }
+        lookups = totals['hits'] + totals['misses']
+        totals['hit_ratio'] = round(totals['hits'] / lookups, 4) if lookups else None
+
+        return {
+            'pid': os.getpid(),
+            'since': self._since,
+            'families': dict(sorted(families.items())),
+            'batch': batch,
+            'totals': totals,
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._families.clear()
+            self._batch_get_latency = LatencyHistogram()
+            self._batch_set_latency = LatencyHistogram()
+            self._since = time.time()
+
+    def _family(self, key: str) -> FamilyMetrics:
+        """Get (or create) the metrics of a key's family; the lock must be held."""
+        name = CacheKeyBuilder.family_for_key(key)
+        metrics = self._families.get(name)
+        if metrics is None:
+            metrics = self._families[name] = FamilyMetrics()
+        return metrics
+
+    @staticmethod
+    def _stored_by_family(backend: Optional[Any]) -> Dict[str, tuple]:
+        """Sum (entries, bytes) per family from a backend that lists entry sizes."""
+        entry_sizes = getattr(backend, 'entry_sizes', None)
+        if not callable(entry_sizes):
+            return {}
+        stored: Dict[str, list] = {}
+        for key, size in entry_sizes():
+            totals = stored.setdefault(CacheKeyBuilder.family_for_key(key), [0, 0])
+            totals[0] += 1
+            totals[1] += size
+        return {name: tuple(totals) for name, totals in stored.items()}
+
+
+# Shared registry used by InstrumentedCache and the in-memory backend
+cache_metrics = CacheMetrics()
@@ -0,0 +1,178 @@
+"""
+Compressing serializer for the Redis cache backends.
+
+Stock payloads are numeric JSON that compresses very well, but cachelib's
+RedisSerializer stores plain pickles. This serializer compresses pickles
+above a size threshold with a stdlib codec (zlib or lzma) so Redis memory
+and network transfer shrink on every hit.
+
+Wire format:
+    b'\\xfe' + version (1 byte) + codec (1 byte) + compressed pickle
+
+Values below the threshold, or that do not shrink, are written in
+cachelib's own format (b'!' + pickle). Reads accept both formats, so
+entries written before this serializer was enabled stay readable, and
+integers written by ``inc``/``dec`` are still decoded.
+"""
+import lzma
+import pickle
+import threading
+import zlib
+from typing import Any, Dict, Optional
+
+from cachelib.serializers import RedisSerializer
+
+from constants import CACHE_COMPRESSION_LEVEL, CACHE_COMPRESSION_MIN_SIZE_BYTES
+
+# First byte of compressed values; never produced by RedisSerializer
+COMPRESSED_MAGIC = b'\xfe'
+
+# Bump when the compressed layout changes
+FORMAT_VERSION = 1
+
+CODEC_ZLIB = 'zlib'
+CODEC_LZMA = 'lzma'
+CODEC_NONE = 'none'
+
+_CODEC_IDS = {CODEC_ZLIB: b'z', CODEC_LZMA: b'x'}
+_CODEC_NAMES = {codec_id: name for name, codec_id in _CODEC_IDS.items()}
+
+
+class CompressionStats:
+    """
+    Thread-safe counters describing how well cached values compress.
+
+    Examples:
+        >>> stats = CompressionStats()
+        >>> stats.record(raw_size=10_000, stored_size=2_000, compressed=True)
+        >>> stats.snapshot()['ratio']
+        0.2
+    """
+
+    def __init__(self):
+        """Initialize CompressionStats."""
+        self._lock = threading.Lock()
+        self._values = 0
+        self._compressed = 0
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+
+    def record(self, raw_size: int, stored_size: int, compressed: bool) -> None:
+        """
+        Record one serialized value.
+
+        Args:
+            raw_size: Size of the uncompressed pickle
+            stored_size: Size written to Redis
+            compressed: Whether the value was stored compressed
+        """
+        with self._lock:
+            self._values += 1
+            self._compressed += int(compressed)
+            self._raw_bytes += raw_size
+            self._stored_bytes += stored_size
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current counters.
+
+        Returns:
+            Dictionary with values, compressed, raw_bytes, stored_bytes and
+            ratio (stored / raw; lower is better)
+        """
+        with self._lock:
+            ratio = self._stored_bytes / self._raw_bytes if self._raw_bytes else 1.0
+            return {
+                'values': self._values,
+                'compressed': self._compressed,
+                'raw_bytes': self._raw_bytes,
+                'stored_bytes': self._stored_bytes,
+                'ratio': round(ratio, 4),
+            }
+
+
+class CompressingSerializer(RedisSerializer):
+    """
+    Redis serializer that transparently compresses large values.
+
+    Attributes:
+        codec: Codec name used for new values ('zlib', 'lzma' or 'none')
+        threshold: Minimum pickle size in bytes before compression is tried
+        stats: Compression ratio counters
+
+    Examples:
+        >>> serializer = CompressingSerializer(codec='zlib', threshold=1024)
+        >>> data = serializer.dumps({'data': [1.0] * 1000})
+        >>> serializer.loads(data)['data'][0]
+        1.0
+    """
+
+    def __init__(
+        self,
+        codec: str = CODEC_ZLIB,
+        threshold: int = CACHE_COMPRESSION_MIN_SIZE_BYTES,
+        level: int = CACHE_COMPRESSION_LEVEL,
+    ):
+        """
+        Initialize CompressingSerializer.
+
+        Args:
+            codec: 'zlib', 'lzma' or 'none'
+            threshold: Minimum pickle size in bytes before compression is tried
+            level: zlib compression level (lzma uses its default preset)
+
+        Raises:
+            ValueError: If the codec is unknown
+        """
+        if codec not in _CODEC_IDS and codec != CODEC_NONE:
+            raise ValueError(
+                f"Unsupported cache compression codec: {codec}. "
+                f"Supported codecs: {', '.join([*_CODEC_IDS, CODEC_NONE])}"
+            )
+        self.codec = codec
+        self.threshold = threshold
+        self.level = level
+        self.stats = CompressionStats()
+
+    def dumps(self, value: Any, protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
+        """Serialize a value, compressing it when large enough to benefit."""
+        data = pickle.dumps(value, protocol)
+
+        if self.codec != CODEC_NONE and len(data) >= self.threshold:
+            stored = (
+                COMPRESSED_MAGIC
+                + bytes([FORMAT_VERSION])
+                + _CODEC_IDS[self.codec]
+                + self._compress(data)
+            )
+            if len(stored) <= len(data):
+                self.stats.record(len(data), len(stored), compressed=True)
+                return stored
+
+        self.stats.record(len(data), len(data) + 1, compressed=False)
+        return b'!' + data
+
+    def loads(self, value: Optional[bytes]) -> Any:
+        """Deserialize a value in either the compressed or cachelib format."""
+        if value is None or not value.startswith(COMPRESSED_MAGIC):
+            return super().loads(value)
+
+        if len(value) < 3 or value[1] != FORMAT_VERSION:
+            # Written by a newer format; treat as a miss so it is recomputed
+            return None
+
+        codec = _CODEC_NAMES.get(value[2:3])
+        try:
+            if codec == CODEC_ZLIB:
+                return pickle.loads(zlib.decompress(value[3:]))
+            if codec == CODEC_LZMA:
+                return pickle.loads(lzma.decompress(value[3:]))
+        except (zlib.error, lzma.LZMAError, pickle.PickleError):
+            return None
+        return None
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress bytes with the configured codec."""
+        if self.codec == CODEC_LZMA:
+            return lzma.compress(data)
+        return zlib.compress(data, self.level)
@@ -0,0 +1,314 @@
+"""
+Warm cache snapshots for the in-memory backend.
+
+With ``CACHE_TYPE=SimpleCache`` every restart starts with an empty cache, so
+the first requests after a deploy pay for full upstream fetches. When
+``CACHE_SNAPSHOT_PATH`` is set, the hottest entries of the SizeAwareCache
+are written to disk periodically and at shutdown, and loaded back when the
+app is created, before the worker accepts traffic.
+
+File format (version 1)::
+
+    header  '>4sBd'  magic b'MVCS', format version, created_at (unix time)
+    body    zlib-compressed sequence of records:
+            '>HBdII' key length, encoding, expires_at (0 = never),
+                     frequency, data length
+            key (UTF-8), data
+
+Values are stored in the backend's own encoding (raw bytes or pickles), so
+no value is deserialized while saving or loading. Entries with less than
+``CACHE_SNAPSHOT_MIN_TTL`` seconds left are skipped on both ends, and files
+with an unknown magic or version are ignored.
+
+Snapshots are loaded with the same trust as the cache itself: keep the
+snapshot directory writable only by the service user.
+
+Single responsibility: Save and restore in-memory cache entries.
+"""
+import atexit
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, List, Optional, Tuple
+
+from constants import (
+    CACHE_SNAPSHOT_INTERVAL_SECONDS,
+    CACHE_SNAPSHOT_MAX_BYTES,
+    CACHE_SNAPSHOT_MIN_TTL_SECONDS,
+)
+from utils.cache import cache
+from utils.cache_tags import tag_index
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b'MVCS'
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct('>4sBd')
+_RECORD = struct.Struct('>HBdII')
+
+# (key, encoding, data, expires_at, frequency), as exported by SizeAwareCache
+Entry = Tuple[str, int, bytes, Optional[float], int]
+
+
+def save_snapshot(
+    backend: Any,
+    path: str,
+    min_ttl: float = CACHE_SNAPSHOT_MIN_TTL_SECONDS,
+    max_bytes: int = CACHE_SNAPSHOT_MAX_BYTES,
+) -> int:
+    """
+    Write the hottest live entries of a backend to a snapshot file.
+
+    Entries are ranked by access frequency and kept until ``max_bytes`` of
+    values are selected. The file is replaced atomically, so readers never
+    see a partial snapshot.
+
+    Args:
+        backend: Backend with export_entries() (SizeAwareCache)
+        path: Snapshot file path
+        min_ttl: Minimum remaining lifetime in seconds for an entry to be saved
+        max_bytes: Maximum total size of saved values
+
+    Returns:
+        Number of entries written
+
+    Examples:
+        >>> save_snapshot(cache.cache, 'data/cache.snapshot')
+        128
+    """
+    now = time.time()
+    entries = [
+        entry for entry in backend.export_entries()
+        if _remaining(entry, now) >= min_ttl
+    ]
+    entries.sort(key=lambda entry: entry[4], reverse=True)
+
+    selected: List[Entry] = []
+    total = 0
+    for entry in entries:
+        if total + len(entry[2]) > max_bytes:
+            continue
+        selected.append(entry)
+        total += len(entry[2])
+
+    body = zlib.compress(b''.join(_encode_record(entry) for entry in selected))
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, now))
+        f.write(body)
+    os.replace(tmp_path, path)
+
+    logger.info(f"Saved cache snapshot: {len(selected)} entries, {total} bytes -> {path}")
+    return len(selected)
+
+
+def load_snapshot(
+    backend: Any,
+    path: str,
+    min_ttl: float = CACHE_SNAPSHOT_MIN_TTL_SECONDS,
+) -> int:
+    """
+    Restore entries from a snapshot file into a backend.
+
+    Entries keep their original expiry deadline and access frequency. A
+    missing, unreadable or incompatible file restores nothing.
+
+    Args:
+        backend: Backend with import_entry() (SizeAwareCache)
+        path: Snapshot file path
+        min_ttl: Minimum remaining lifetime in seconds for an entry to be restored
+
+    Returns:
+        Number of entries restored
+    """
+    return len(_restore_entries(backend, path, min_ttl))
+
+
+def _restore_entries(backend: Any, path: str, min_ttl: float) -> List[str]:
+    """Restore a snapshot file into a backend and return the restored keys."""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return []
+    except OSError as e:
+        logger.warning(f"Could not read cache snapshot {path}: {e}")
+        return []
+
+    try:
+        entries = _decode_snapshot(raw)
+    except (ValueError, struct.error, zlib.error, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring cache snapshot {path}: {e}")
+        return []
+
+    now = time.time()
+    restored: List[str] = []
+    # Coldest first, so the hottest entries win if the budget is smaller now
+    for key, encoding, data, expires_at, frequency in reversed(entries):
+        if _remaining((key, encoding, data, expires_at, frequency), now) < min_ttl:
+            continue
+        if backend.import_entry(key, encoding, data, expires_at, frequency):
+            restored.append(key)
+
+    logger.info(f"Restored {len(restored)} cache entries from snapshot {path}")
+    return restored
+
+
+def init_cache_snapshots(app) -> Optional['CacheSnapshotter']:
+    """
+    Restore the in-memory cache from disk and schedule snapshots.
+
+    Does nothing unless CACHE_SNAPSHOT_PATH is set and the active backend
+    supports snapshots (the SizeAwareCache used for SimpleCache mode).
+
+    Args:
+        app: Flask application instance (cache already initialized)
+
+    Returns:
+        The running CacheSnapshotter, or None when snapshots are disabled
+    """
+    path = app.config.get('CACHE_SNAPSHOT_PATH')
+    if not path:
+        return None
+
+    with app.app_context():
+        backend = cache.cache
+    if not callable(getattr(backend, 'export_entries', None)):
+        logger.info("Cache snapshots skipped: backend does not support them")
+        return None
+
+    snapshotter = CacheSnapshotter(
+        backend,
+        path,
+        interval=app.config.get('CACHE_SNAPSHOT_INTERVAL', CACHE_SNAPSHOT_INTERVAL_SECONDS),
+        min_ttl=app.config.get('CACHE_SNAPSHOT_MIN_TTL', CACHE_SNAPSHOT_MIN_TTL_SECONDS),
+        max_bytes=app.config.get('CACHE_SNAPSHOT_MAX_BYTES', CACHE_SNAPSHOT_MAX_BYTES),
+    )
+    restored = snapshotter.restore()
+    # The in-memory tag index starts empty, so re-tag restored keys for
+    # symbol purges
+    with app.app_context():
+        tag_index.tag_keys(restored)
+    snapshotter.start()
+    return snapshotter
+
+
+class CacheSnapshotter:
+    """
+    Periodically snapshots a backend and saves a final snapshot at exit.
+
+    Attributes:
+        path: Snapshot file path
+        interval: Seconds between snapshots (0 = only at exit)
+
+    Examples:
+        >>> snapshotter = CacheSnapshotter(cache.cache, 'data/cache.snapshot')
+        >>> snapshotter.restore()
+        >>> snapshotter.start()
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        path: str,
+        interval: float = CACHE_SNAPSHOT_INTERVAL_SECONDS,
+        min_ttl: float = CACHE_SNAPSHOT_MIN_TTL_SECONDS,
+        max_bytes: int = CACHE_SNAPSHOT_MAX_BYTES,
+    ):
+        """
+        Initialize CacheSnapshotter.
+
+        Args:
+            backend: Backend supporting export_entries()/import_entry()
+            path: Snapshot file path
+            interval: Seconds between snapshots (0 = only at exit)
+            min_ttl: Minimum remaining lifetime of saved/restored entries
+            max_bytes: Maximum total size of saved values
+        """
+        self._backend = backend
+        self.path = path
+        self.interval = interval
+        self._min_ttl = min_ttl
+        self._max_bytes = max_bytes
+        self._stop = threading.Event()
+        self._save_lock = threading.Lock()
+
+    def restore(self) -> List[str]:
+        """Load the snapshot file into the backend and return the restored keys."""
+        return _restore_entries(self._backend, self.path, self._min_ttl)
+
+    def save(self) -> int:
+        """Write a snapshot now (errors are logged, not raised)."""
+        with self._save_lock:
+            try:
+                return save_snapshot(
+                    self._backend, self.path, min_ttl=self._min_ttl, max_bytes=self._max_bytes
+                )
+            except OSError as e:
+                logger.warning(f"Could not save cache snapshot {self.path}: {e}")
+                return 0
+
+    def start(self) -> None:
+        """Start periodic snapshots and register the shutdown snapshot."""
+        atexit.register(self.stop)
+        if self.interval > 0:
+            thread = threading.Thread(target=self._run, name='cache-snapshot', daemon=True)
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop periodic snapshots and save a final one."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self.save()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.save()
+
+
+def _remaining(entry: Entry, now: float) -> float:
+    """Seconds an entry has left to live (infinite without expiry)."""
+    expires_at = entry[3]
+    return float('inf') if expires_at is None else expires_at - now
+
+
+def _encode_record(entry: Entry) -> bytes:
+    key, encoding, data, expires_at, frequency = entry
+    key_bytes = key.encode('utf-8')
+    return _RECORD.pack(
+        len(key_bytes), encoding, expires_at or 0.0, min(frequency, 0xFFFFFFFF), len(data)
+    ) + key_bytes + data
+
+
+def _decode_snapshot(raw: bytes) -> List[Entry]:
+    """Parse a snapshot file; raises ValueError for foreign or corrupt files."""
+    if len(raw) < _HEADER.size:
+        raise ValueError("truncated header")
+    magic, version, _created_at = _HEADER.unpack_from(raw)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not a cache snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+
+    body = zlib.decompress(raw[_HEADER.size:])
+    entries: List[Entry] = []
+    offset = 0
+    while offset < len(body):
+        key_len, encoding, expires_at, frequency, data_len = _RECORD.unpack_from(body, offset)
+        offset += _RECORD.size
+        end = offset + key_len + data_len
+        if end > len(body):
+            raise ValueError("truncated record")
+        key = body[offset:offset + key_len].decode('utf-8')
+        data = body[offset + key_len:end]
+        offset = end
+        entries.append((key, encoding, data, expires_at or None, frequency))
+    return entries
@@ -0,0 +1,256 @@
+"""
+Cache tag index and targeted purges.
+
+Keys for one symbol are spread across several CacheKeyBuilder families
+(per-range stock keys, fragments, batch keys containing the symbol, news).
+This module records which keys belong to each symbol tag when they are
+written, so they can be evicted together without flushing the whole cache.
+
+Storage:
+- Redis backends: one Redis set per tag (``{key_prefix}tag:{tag}``), shared
+  by every worker
+- in-memory backends: a per-process dictionary of tag -> keys
+
+Purges go through the regular cache API (``cache.delete_many``), so the
+in-process L1 tier and pub/sub invalidation stay coherent.
+
+Single responsibility: Track tag membership and purge keys by tag, family
+or prefix.
+"""
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Set
+
+from flask import has_app_context
+
+from constants import CACHE_TAG_TTL_SECONDS
+from utils.cache import cache
+from utils.cache_keys import CacheKeyBuilder
+
+logger = logging.getLogger(__name__)
+
+# Local tag sets are pruned of evicted keys once they grow past this size
+_LOCAL_PRUNE_THRESHOLD = 1000
+
+
+class CacheTagIndex:
+    """
+    Index of cache keys by invalidation tag.
+
+    Examples:
+        >>> tag_index.tag_key('batch_stocks:AAPL,MSFT:2024-01-02:2024-01-06')
+        >>> tag_index.purge_symbol('AAPL')  # also drops the batch key
+        3
+    """
+
+    def __init__(self, tag_ttl: int = CACHE_TAG_TTL_SECONDS):
+        """
+        Initialize CacheTagIndex.
+
+        Args:
+            tag_ttl: Lifetime in seconds of Redis tag sets (refreshed on write)
+        """
+        self._tag_ttl = tag_ttl
+        self._local: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def tag_key(self, key: str) -> None:
+        """
+        Record a freshly written key under the tags derived from it.
+
+        Failures are logged and ignored: a missing tag only means a later
+        purge may miss the key until it expires.
+
+        Args:
+            key: Cache key that was just written
+        """
+        self.tag_keys([key])
+
+    def tag_keys(self, keys: Iterable[str]) -> None:
+        """
+        Record several freshly written keys (one Redis round trip).
+
+        Args:
+            keys: Cache keys that were just written
+        """
+        if not has_app_context():
+            return
+
+        members: Dict[str, List[str]] = {}
+        for key in keys:
+            for tag in CacheKeyBuilder.tags_for_key(key):
+                members.setdefault(tag, []).append(key)
+        if not members:
+            return
+
+        try:
+            redis_client, key_prefix = self._redis()
+            if redis_client is not None:
+                pipe = redis_client.pipeline(transaction=False)
+                for tag, tag_keys in members.items():
+                    pipe.sadd(self._tag_set_name(key_prefix, tag), *tag_keys)
+                    pipe.expire(self._tag_set_name(key_prefix, tag), self._tag_ttl)
+                pipe.execute()
+            else:
+                self._tag_local(members)
+        except Exception as e:
+            logger.warning(f"Failed to record cache tags: {e}")
+
+    def keys_for_tag(self, tag: str) -> List[str]:
+        """
+        List keys recorded under a tag (some may have expired since).
+
+        Args:
+            tag: Tag name, e.g. 'symbol:AAPL'
+
+        Returns:
+            Sorted list of cache keys
+        """
+        redis_client, key_prefix = self._redis()
+        if redis_client is not None:
+            members = redis_client.smembers(self._tag_set_name(key_prefix, tag))
+            return sorted(_decode(member) for member in members)
+
+        with self._lock:
+            return sorted(self._local.get(tag, ()))
+
+    def purge_symbol(self, symbol: str) -> int:
+        """
+        Delete every key tagged with a symbol.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Number of keys purged
+        """
+        tag = CacheKeyBuilder.build_symbol_tag(symbol)
+        keys = self.keys_for_tag(tag)
+        deleted = self._delete(keys)
+
+        redis_client, key_prefix = self._redis()
+        if redis_client is not None:
+            redis_client.delete(self._tag_set_name(key_prefix, tag))
+        else:
+            with self._lock:
+                self._local.pop(tag, None)
+
+        logger.info(f"Purged {deleted} cache keys for {tag}")
+        return deleted
+
+    def purge_family(self, family: str) -> int:
+        """
+        Delete every key of a CacheKeyBuilder family.
+
+        Args:
+            family: Key family, e.g. 'news' or 'stock_data'
+
+        Returns:
+            Number of keys purged
+        """
+        return self.purge_prefix(f"{family}:")
+
+    def purge_prefix(self, prefix: str) -> int:
+        """
+        Delete every key starting with a prefix.
+
+        Args:
+            prefix: Key prefix (without the backend's CACHE_KEY_PREFIX)
+
+        Returns:
+            Number of keys purged
+        """
+        keys = set()
+
+        redis_client, key_prefix = self._redis()
+        if redis_client is not None:
+            pattern = _escape_glob(key_prefix + prefix) + '*'
+            for name in redis_client.scan_iter(match=pattern, count=500):
+                keys.add(_decode(name)[len(key_prefix):])
+
+        for backend in self._local_backends():
+            keys.update(key for key in backend.keys() if key.startswith(prefix))
+
+        # Backends that cannot list keys are covered by the local tag index
+        with self._lock:
+            for tag_keys in self._local.values():
+                keys.update(key for key in tag_keys if key.startswith(prefix))
+
+        deleted = self._delete(sorted(keys))
+        logger.info(f"Purged {deleted} cache keys with prefix '{prefix}'")
+        return deleted
+
+    def clear_local(self) -> None:
+        """Drop the in-memory tag index."""
+        with self._lock:
+            self._local.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _delete(keys: List[str]) -> int:
+        """Delete keys through the cache API so every tier is invalidated."""
+        if keys:
+            cache.delete_many(*keys)
+        return len(keys)
+
+    @staticmethod
+    def _tag_set_name(key_prefix: str, tag: str) -> str:
+        return f"{key_prefix}tag:{tag}"
+
+    def _tag_local(self, members: Dict[str, List[str]]) -> None:
+        """Record tag membership in the per-process index."""
+        with self._lock:
+            for tag, keys in members.items():
+                tag_set = self._local.setdefault(tag, set())
+                tag_set.update(keys)
+                if len(tag_set) > _LOCAL_PRUNE_THRESHOLD:
+                    tag_set.intersection_update(
+                        key for key in tag_set if cache.has(key)
+                    )
+
+    @staticmethod
+    def _backend() -> Any:
+        """Get the active backend, unwrapping the failover wrapper."""
+        backend = cache.cache
+        return getattr(backend, '_primary', backend)
+
+    def _redis(self) -> tuple:
+        """
+        Get (redis client, key prefix), or (None, '') for in-memory backends.
+
+        While the failover wrapper serves from memory, the local index is
+        used too, so tagging never waits on an unreachable Redis.
+        """
+        if getattr(cache.cache, 'failed_over', False):
+            return None, ''
+        backend = self._backend()
+        client = getattr(backend, '_write_client', None)
+        if client is None:
+            return None, ''
+        return client, backend.key_prefix or ''
+
+    @staticmethod
+    def _local_backends() -> List[Any]:
+        """Get in-memory stores whose keys can be listed (incl. the failover tier)."""
+        backend = cache.cache
+        candidates = [backend, getattr(backend, '_fallback', None)]
+        return [c for c in candidates if c is not None and callable(getattr(c, 'keys', None))]
+
+
+def _decode(value: Any) -> str:
+    """Decode a Redis reply to str."""
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def _escape_glob(value: str) -> str:
+    """Escape Redis glob metacharacters so a prefix is matched literally."""
+    for char in '\\*?[]':
+        value = value.replace(char, '\\' + char)
+    return value
+
+
+# Shared index used by the response and fragment caches
+tag_index = CacheTagIndex()
@@ -0,0 +1,143 @@
+"""
+Circuit breaker module.
+
+Stops calling a failing dependency after repeated errors so callers fail
+fast (or take a fallback path) instead of waiting on timeouts.
+
+States:
+- closed: calls go through; consecutive failures are counted
+- open: calls are rejected until the breaker is reset, either by a caller
+  probing the dependency (``reset()``) or, when ``reset_timeout`` is set,
+  by letting a single trial call through (half-open)
+- half_open: one trial call is in flight; success closes, failure re-opens
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+
+    Attributes:
+        name: Name used in log messages
+        failure_threshold: Consecutive failures before opening
+        reset_timeout: Seconds before a half-open trial (None: only reset())
+
+    Examples:
+        >>> breaker = CircuitBreaker('redis', failure_threshold=3)
+        >>> if breaker.allow_request():
+        ...     try:
+        ...         value = client.get(key)
+        ...         breaker.record_success()
+        ...     except RedisError:
+        ...         breaker.record_failure()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: Optional[float] = None,
+        on_open: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            name: Name used in log messages
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds before a half-open trial (None: only reset())
+            on_open: Callback invoked (outside the lock) when the breaker opens
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._on_open = on_open
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._open_count = 0
+
+    @property
+    def state(self) -> str:
+        """Get the current state."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go to the dependency.
+
+        Returns:
+            True when closed, or for the single half-open trial call
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+            if (
+                self._state == STATE_OPEN
+                and self.reset_timeout is not None
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = STATE_HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            self._failures = 0
+            if self._state == STATE_HALF_OPEN:
+                self._state = STATE_CLOSED
+                logger.info(f"Circuit '{self.name}' closed after successful trial")
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            should_open = self._state == STATE_HALF_OPEN or (
+                self._state == STATE_CLOSED and self._failures >= self.failure_threshold
+            )
+            if should_open:
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._open_count += 1
+                logger.warning(
+                    f"Circuit '{self.name}' opened after {self._failures} consecutive failures"
+                )
+
+        if should_open and self._on_open is not None:
+            self._on_open()
+
+    def reset(self) -> None:
+        """Close the breaker (e.g. after an out-of-band health probe succeeded)."""
+        with self._lock:
+            was_open = self._state != STATE_CLOSED
+            self._state = STATE_CLOSED
+            self._failures = 0
+        if was_open:
+            logger.info(f"Circuit '{self.name}' closed")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker state for health reporting.
+
+        Returns:
+            Dictionary with state, consecutive_failures and times_opened
+        """
+        with self._lock:
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'times_opened': self._open_count,
+            }
@@ -0,0 +1,161 @@
+"""
+Response compression utilities.
+
+Provides gzip (and brotli, when the optional ``brotli`` package is
+installed) compression negotiated through the ``Accept-Encoding`` header.
+
+Two entry points:
+- ``init_compression(app)`` registers an after_request hook that compresses
+  uncached JSON responses above a minimum size.
+- ``build_encodings(body)`` produces precompressed variants for the response
+  cache, so cached payloads are compressed once per cache fill rather than
+  once per request.
+"""
+import gzip
+import logging
+from typing import Dict, Optional
+
+from flask import current_app, has_app_context, request
+
+from constants import BROTLI_QUALITY, COMPRESSION_MIN_SIZE_BYTES, GZIP_COMPRESSION_LEVEL
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on optional package
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Mimetypes worth compressing (binary formats are usually already compressed)
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html', 'text/plain', 'text/csv'}
+
+
+def supported_encodings() -> tuple:
+    """
+    List the encodings this server can produce, in order of preference.
+
+    Returns:
+        Tuple of encoding names, e.g. ('br', 'gzip')
+    """
+    if brotli is not None:
+        return ('br', 'gzip')
+    return ('gzip',)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a body with the given encoding.
+
+    Args:
+        body: Raw response bytes
+        encoding: 'gzip' or 'br'
+
+    Returns:
+        Compressed bytes
+
+    Raises:
+        ValueError: If the encoding is not supported
+    """
+    if encoding == 'gzip':
+        # mtime=0 keeps output deterministic, so identical bodies compress identically
+        return gzip.compress(body, compresslevel=GZIP_COMPRESSION_LEVEL, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def _min_size() -> int:
+    """Get the configured minimum body size for compression."""
+    if has_app_context():
+        return current_app.config.get('COMPRESSION_MIN_SIZE', COMPRESSION_MIN_SIZE_BYTES)
+    return COMPRESSION_MIN_SIZE_BYTES
+
+
+def _enabled() -> bool:
+    """Check whether compression is enabled for the current app."""
+    if has_app_context():
+        return current_app.config.get('COMPRESSION_ENABLED', True)
+    return True
+
+
+def build_encodings(body: bytes) -> Dict[str, bytes]:
+    """
+    Build precompressed variants of a body for caching.
+
+    Bodies below the minimum size are not worth compressing and yield an
+    empty mapping. Variants that do not shrink the body are dropped.
+
+    Args:
+        body: Raw response bytes
+
+    Returns:
+        Mapping of encoding name to compressed bytes
+    """
+    if not _enabled() or len(body) < _min_size():
+        return {}
+
+    encodings = {}
+    for encoding in supported_encodings():
+        compressed = compress(body, encoding)
+        if len(compressed) < len(body):
+            encodings[encoding] = compressed
+    return encodings
+
+
+def negotiate_encoding() -> Optional[str]:
+    """
+    Pick the preferred encoding accepted by the current request.
+
+    Returns:
+        Encoding name or None if the client accepts none we support
+    """
+    accepted = request.accept_encodings
+    for encoding in supported_encodings():
+        if accepted.quality(encoding) > 0:
+            return encoding
+    return None
+
+
+def init_compression(app):
+    """
+    Register response compression middleware.
+
+    Compresses responses that are:
+    - not already encoded (cached hits carry precompressed variants)
+    - of a compressible mimetype
+    - at least COMPRESSION_MIN_SIZE bytes long
+
+    Args:
+        app: Flask application instance
+    """
+    @app.after_request
+    def compress_response(response):
+        """Compress the response body if the client accepts it."""
+        if not app.config.get('COMPRESSION_ENABLED', True):
+            return response
+
+        if (
+            response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or not 200 <= response.status_code < 300
+        ):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        body = response.get_data()
+        if len(body) < app.config.get('COMPRESSION_MIN_SIZE', COMPRESSION_MIN_SIZE_BYTES):
+            return response
+
+        encoding = negotiate_encoding()
+        if encoding is None:
+            return response
+
+        compressed = compress(body, encoding)
+        if len(compressed) >= len(body):
+            return response
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        return response
@@ -25,7 +25,9 @@ class ConfigValidator:
     """
 
     VALID_CACHE_TYPES = ['SimpleCache', 'redis', 'RedisCache']
+    VALID_CACHE_COMPRESSION = ['zlib', 'lzma', 'none']
     VALID_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+    VALID_NEWS_INGESTION_MODES = ['symbol', 'market']
 
     def __init__(self, app_config: dict):
         """
@@ -57,6 +59,11 @@ class ConfigValidator:
         # Run all validators
         self._validate_cache_type()
         self._validate_redis_url()
+        self._validate_cache_compression()
+        self._validate_cache_snapshot()
+        self._validate_upstream_pacing()
+        self._validate_news_poller()
+        self._validate_news_ingestion()
         self._validate_cors_origins()
         self._validate_log_level()
         self._validate_rate_limit()
@@ -120,6 +127,76 @@ class ConfigValidator:
             except Exception as e:
                 self.errors.append(f"Invalid Redis URL format: {e}")
 
+    def _validate_cache_compression(self):
+        """Validate CACHE_COMPRESSION codec for Redis values."""
+        codec = self.config.get('CACHE_COMPRESSION', 'zlib')
+
+        if codec not in self.VALID_CACHE_COMPRESSION:
+            self.errors.append(
+                f"Invalid CACHE_COMPRESSION '{codec}'. "
+                f"Valid options: {', '.join(self.VALID_CACHE_COMPRESSION)}"
+            )
+
+    def _validate_cache_snapshot(self):
+        """Validate warm cache snapshot settings."""
+        if not self.config.get('CACHE_SNAPSHOT_PATH'):
+            return
+
+        cache_type = self.config.get('CACHE_TYPE', 'SimpleCache')
+        if cache_type.lower() in ['redis', 'rediscache']:
+            self.warnings.append(
+                "CACHE_SNAPSHOT_PATH is ignored when CACHE_TYPE is 'redis' "
+                "(Redis already survives restarts)"
+            )
+
+        interval = self.config.get('CACHE_SNAPSHOT_INTERVAL', 300)
+        if interval < 0:
+            self.errors.append(
+                f"CACHE_SNAPSHOT_INTERVAL must be non-negative, got {interval}"
+            )
+
+    def _validate_upstream_pacing(self):
+        """Validate Google News pacing settings."""
+        rate = self.config.get('GOOGLE_NEWS_RATE_LIMIT', 5)
+        if rate <= 0:
+            self.errors.append(
+                f"GOOGLE_NEWS_RATE_LIMIT must be positive, got {rate}"
+            )
+
+        burst = self.config.get('GOOGLE_NEWS_BURST', 2)
+        if burst < 1:
+            self.errors.append(
+                f"GOOGLE_NEWS_BURST must be at least 1, got {burst}"
+            )
+
+    def _validate_news_ingestion(self):
+        """Validate the US news ingestion mode."""
+        mode = self.config.get('NEWS_INGESTION_MODE', 'symbol')
+        if mode not in self.VALID_NEWS_INGESTION_MODES:
+            self.errors.append(
+                f"Invalid NEWS_INGESTION_MODE: '{mode}'. "
+                f"Valid options: {', '.join(self.VALID_NEWS_INGESTION_MODES)}"
+            )
+
+    def _validate_news_poller(self):
+        """Validate background news poller settings."""
+        if not self.config.get('NEWS_POLLER_ENABLED', False):
+            return
+
+        interval = self.config.get('NEWS_POLLER_INTERVAL', 60)
+        if interval <= 0:
+            self.errors.append(
+                f"NEWS_POLLER_INTERVAL must be positive, got {interval}"
+            )
+            return
+
+        lead = self.config.get('NEWS_POLLER_LEAD', 180)
+        if lead <= interval:
+            self.warnings.append(
+                f"NEWS_POLLER_LEAD ({lead}s) should exceed NEWS_POLLER_INTERVAL "
+                f"({interval}s), or entries can expire between poller cycles"
+            )
+
     def _validate_cors_origins(self):
         """Validate CORS_ORIGINS configuration."""
         cors_origins = self.config.get('CORS_ORIGINS', [])
@@ -2,8 +2,9 @@
 Decorators for route error handling and logging
 """
 from functools import wraps
-from flask import jsonify
+from flask import current_app, jsonify, request
 from marshmallow import ValidationError
+import hmac
 import logging
 
 logger = logging.getLogger(__name__)
@@ -67,3 +68,42 @@ def log_request(f):
         return f(*args, **kwargs)
 
     return decorated_function
+
+
+def require_admin_token(f):
+    """
+    Decorator to restrict a route to holders of the admin API token
+
+    Expects an ``Authorization: Bearer <ADMIN_API_TOKEN>`` header. The token
+    is compared in constant time. When ADMIN_API_TOKEN is not configured the
+    route answers 404, so admin endpoints are disabled (and undiscoverable)
+    by default.
+
+    Args:
+        f: Flask route function to wrap
+
+    Returns:
+        Wrapped function that rejects unauthenticated requests
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        expected = current_app.config.get('ADMIN_API_TOKEN') or ''
+        if not expected:
+            return jsonify({
+                'error': 'Not found',
+                'message': 'Resource not found'
+            }), 404
+
+        scheme, _, provided = request.headers.get('Authorization', '').partition(' ')
+        if scheme.lower() != 'bearer' or not hmac.compare_digest(
+            provided.strip().encode('utf-8'), expected.encode('utf-8')
+        ):
+            logger.warning(f"Rejected admin request to {request.path} from {request.remote_addr}")
+            return jsonify({
+                'error': 'Unauthorized',
+                'message': 'A valid admin token is required'
+            }), 401
+
+        return f(*args, **kwargs)
+
+    return decorated_function
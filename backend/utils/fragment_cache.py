@@ -0,0 +1,85 @@
+"""
+Fragment cache module.
+
+Stores per-symbol stock payloads as pre-encoded JSON fragments so batch
+responses can be assembled by splicing bytes instead of re-encoding every
+element.
+
+The cache is only reachable from inside a Flask application context. Calls
+made elsewhere (worker threads, unit tests without an app) behave as an
+always-empty cache, so callers should read and write fragments from the
+request thread.
+"""
+import logging
+from typing import Dict, List
+
+from flask import has_app_context
+
+from constants import CACHE_TIMEOUT_SECONDS
+from utils.cache import cache
+from utils.cache_tags import tag_index
+
+logger = logging.getLogger(__name__)
+
+
+class FragmentCache:
+    """
+    Cache of pre-encoded JSON fragments keyed by cache key.
+
+    Attributes:
+        _timeout: Timeout in seconds applied to stored fragments
+
+    Examples:
+        >>> fragments = FragmentCache()
+        >>> hits = fragments.get_many(['stock_fragment:AAPL:2024-01-01:2024-01-31'])
+        >>> fragments.set_many({'stock_fragment:AAPL:2024-01-01:2024-01-31': b'{...}'})
+    """
+
+    def __init__(self, timeout: int = CACHE_TIMEOUT_SECONDS):
+        """
+        Initialize FragmentCache.
+
+        Args:
+            timeout: Timeout in seconds for stored fragments
+        """
+        self._timeout = timeout
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Look up fragments for several keys with a single backend call.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Mapping of key to fragment for keys that were found
+        """
+        if not keys or not has_app_context():
+            return {}
+
+        try:
+            values = cache.get_many(*keys)
+        except Exception as e:
+            logger.warning(f"Fragment cache read failed: {e}")
+            return {}
+
+        return {
+            key: value for key, value in zip(keys, values)
+            if isinstance(value, bytes)
+        }
+
+    def set_many(self, fragments: Dict[str, bytes]) -> None:
+        """
+        Store several fragments with a single backend call.
+
+        Args:
+            fragments: Mapping of cache key to fragment bytes
+        """
+        if not fragments or not has_app_context():
+            return
+
+        try:
+            cache.set_many(fragments, timeout=self._timeout)
+            tag_index.tag_keys(fragments.keys())
+        except Exception as e:
+            logger.warning(f"Fragment cache write failed: {e}")
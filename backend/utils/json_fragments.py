@@ -0,0 +1,77 @@
+"""
+JSON fragment utilities.
+
+Helpers for working with pre-encoded JSON fragments. A fragment is the UTF-8
+bytes of a single JSON value. Composite documents (e.g. batch responses) are
+assembled by splicing fragments together with byte joins, so cached elements
+never go through the encoder a second time.
+"""
+import json
+from typing import Any, Dict, List, Optional
+
+
+def encode_fragment(value: Any) -> bytes:
+    """
+    Encode a value as a compact JSON fragment.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded JSON bytes
+
+    Examples:
+        >>> encode_fragment({'symbol': 'AAPL', 'change': 1.5})
+        b'{"symbol":"AAPL","change":1.5}'
+    """
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def splice_array(fragments: List[bytes]) -> bytes:
+    """
+    Join pre-encoded fragments into a JSON array.
+
+    Args:
+        fragments: List of JSON fragments
+
+    Returns:
+        JSON array bytes
+
+    Examples:
+        >>> splice_array([b'1', b'{"a":2}'])
+        b'[1,{"a":2}]'
+    """
+    return b'[' + b','.join(fragments) + b']'
+
+
+def splice_object(
+    raw_fields: Dict[str, bytes],
+    fields: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Build a JSON object from pre-encoded and plain fields.
+
+    Values in ``raw_fields`` are inserted verbatim; values in ``fields`` are
+    encoded normally (they are expected to be small, e.g. timestamps).
+
+    Args:
+        raw_fields: Mapping of key to pre-encoded JSON fragment
+        fields: Optional mapping of key to plain JSON-serializable value
+
+    Returns:
+        JSON object bytes
+
+    Examples:
+        >>> splice_object({'stocks': b'[]'}, {'errors': None})
+        b'{"stocks":[],"errors":null}'
+    """
+    members = [
+        encode_fragment(key) + b':' + fragment
+        for key, fragment in raw_fields.items()
+    ]
+    if fields:
+        members.extend(
+            encode_fragment(key) + b':' + encode_fragment(value)
+            for key, value in fields.items()
+        )
+    return b'{' + b','.join(members) + b'}'
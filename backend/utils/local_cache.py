@@ -0,0 +1,460 @@
+"""
+In-process cache structures.
+
+Provides byte-budgeted, thread-safe caches that live inside a single worker
+process. They hold Python objects directly (no serialization on read), so a
+hit costs a dictionary lookup under a lock.
+
+Callers must treat returned values as immutable: the same object is handed
+to every reader.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class LocalLRUCache:
+    """
+    Thread-safe LRU cache bounded by total byte size and per-entry TTL.
+
+    Sizes are supplied by the caller (typically the length of the value's
+    serialized form), so the budget tracks real memory pressure rather than
+    entry counts.
+
+    Attributes:
+        max_bytes: Maximum total size of stored entries
+        default_ttl: Default time-to-live in seconds for entries
+
+    Examples:
+        >>> l1 = LocalLRUCache(max_bytes=1024 * 1024, default_ttl=10)
+        >>> l1.set('news:AAPL', payload, size=2048)
+        >>> l1.get('news:AAPL')
+    """
+
+    def __init__(self, max_bytes: int, default_ttl: float):
+        """
+        Initialize LocalLRUCache.
+
+        Args:
+            max_bytes: Maximum total size of stored entries in bytes
+            default_ttl: Default time-to-live in seconds
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value, refreshing its recency.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> bool:
+        """
+        Store a value, evicting least recently used entries if needed.
+
+        Entries larger than the whole budget are not stored.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size of the value in bytes
+            ttl: Time-to-live in seconds (default: default_ttl)
+
+        Returns:
+            True if the value was stored
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if size > self.max_bytes or ttl <= 0:
+                return False
+
+            while self._bytes + size > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+            self._entries[key] = (value, size, time.monotonic() + ttl)
+            self._bytes += size
+            return True
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was present
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get occupancy and hit statistics.
+
+        Returns:
+            Dictionary with entries, bytes, max_bytes, hits, misses, evictions
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its bytes (lock must be held)."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+class _GDSFEntry:
+    """Bookkeeping for a single GDSFCache entry."""
+
+    __slots__ = ('value', 'size', 'expires_at', 'frequency', 'priority', 'seq')
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.frequency = 1
+        self.priority = 0.0
+        self.seq = 0
+
+
+class GDSFCache:
+    """
+    Thread-safe cache with a byte budget and Greedy-Dual-Size-Frequency eviction.
+
+    Each entry gets a priority ``H = L + frequency / size``. The entry with
+    the lowest H is evicted first and ``L`` (the inflation clock) is raised to
+    its H, so entries that are not re-accessed age out over time. Small, hot
+    entries therefore outlive large, cold ones, instead of everything being
+    evicted by recency alone.
+
+    Expiry uses absolute ``time.time()`` deadlines so entries can be
+    snapshotted and restored across processes.
+
+    Attributes:
+        max_bytes: Maximum total size of stored entries
+        max_entries: Maximum number of stored entries
+
+    Examples:
+        >>> store = GDSFCache(max_bytes=64 * 1024 * 1024)
+        >>> store.set('news:AAPL', b'...', size=2048, ttl=900)
+        >>> store.get('news:AAPL')
+    """
+
+    # Minimum seconds between full sweeps for expired entries
+    SWEEP_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: Optional[int] = None,
+        on_evict: Optional[Callable[[str, int], None]] = None
+    ):
+        """
+        Initialize GDSFCache.
+
+        Args:
+            max_bytes: Maximum total size of stored entries in bytes
+            max_entries: Optional cap on the number of entries
+            on_evict: Optional callback(key, size) for each entry evicted to
+                make room; called with the lock held, so it must be cheap
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._on_evict = on_evict
+        self._entries: Dict[str, _GDSFEntry] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._clock = 0.0
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._last_sweep = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value and record the access.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if self._is_expired(entry, time.time()):
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            entry.frequency += 1
+            self._prioritize(key, entry)
+            self._hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> bool:
+        """
+        Store a value, evicting the lowest-priority entries if needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size of the value in bytes
+            ttl: Time-to-live in seconds; None or 0 means no expiry
+
+        Returns:
+            True if the value was stored
+        """
+        expires_at = time.time() + ttl if ttl else None
+        return self.set_with_deadline(key, value, size, expires_at)
+
+    def set_with_deadline(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        expires_at: Optional[float],
+        frequency: Optional[int] = None
+    ) -> bool:
+        """
+        Store a value with an absolute expiry deadline.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size of the value in bytes
+            expires_at: Unix timestamp of expiry, or None for no expiry
+            frequency: Access count to start from (used when restoring a
+                snapshot); by default a refreshed key keeps its history
+
+        Returns:
+            True if the value was stored
+        """
+        size = max(size, 1)
+        with self._lock:
+            previous = 1
+            if key in self._entries:
+                # Keep the access history when a key is refreshed
+                previous = self._entries[key].frequency
+                self._remove(key)
+            frequency = max(frequency or previous, 1)
+
+            if size > self.max_bytes:
+                return False
+
+            self._make_room(size)
+
+            entry = _GDSFEntry(value, size, expires_at)
+            entry.frequency = frequency
+            self._entries[key] = entry
+            self._bytes += size
+            self._prioritize(key, entry)
+            return True
+
+    def add(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> bool:
+        """
+        Store a value only if the key is absent (or expired).
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size of the value in bytes
+            ttl: Time-to-live in seconds; None or 0 means no expiry
+
+        Returns:
+            True if the value was stored
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_expired(entry, time.time()):
+                return False
+            return self.set(key, value, size, ttl)
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was present
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def has(self, key: str) -> bool:
+        """Check whether a key is present and not expired (no access recorded)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry, time.time())
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._bytes = 0
+
+    def keys(self) -> List[str]:
+        """List keys (including expired entries not yet dropped)."""
+        with self._lock:
+            return list(self._entries)
+
+    def items(self) -> List[Tuple[str, Any, int, Optional[float], int]]:
+        """
+        List live entries.
+
+        Returns:
+            List of (key, value, size, expires_at, frequency) tuples
+        """
+        now = time.time()
+        with self._lock:
+            return [
+                (key, entry.value, entry.size, entry.expires_at, entry.frequency)
+                for key, entry in self._entries.items()
+                if not self._is_expired(entry, now)
+            ]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get occupancy and eviction statistics.
+
+        Returns:
+            Dictionary with entries, bytes, max_bytes, utilization, hits,
+            misses, evictions and expirations
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'utilization': round(self._bytes / self.max_bytes, 4) if self.max_bytes else 0,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Internals (the lock must be held)
+
+    @staticmethod
+    def _is_expired(entry: _GDSFEntry, now: float) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _prioritize(self, key: str, entry: _GDSFEntry) -> None:
+        """Recompute an entry's priority and push it on the heap."""
+        entry.priority = self._clock + entry.frequency / entry.size
+        entry.seq = next(self._counter)
+        heapq.heappush(self._heap, (entry.priority, entry.seq, key))
+
+        # Stale heap items accumulate on every access; compact occasionally
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (e.priority, e.seq, k) for k, e in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def _make_room(self, size: int) -> None:
+        """Evict entries until ``size`` more bytes (and one more entry) fit."""
+        if self._over_budget(size):
+            self._sweep_expired()
+
+        while self._entries and self._over_budget(size):
+            priority, seq, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is None or entry.seq != seq:
+                continue  # stale heap item
+            self._clock = priority
+            self._remove(key)
+            self._evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, entry.size)
+
+    def _over_budget(self, size: int) -> bool:
+        if self._bytes + size > self.max_bytes:
+            return True
+        return self.max_entries is not None and len(self._entries) >= self.max_entries
+
+    def _sweep_expired(self) -> None:
+        """Drop expired entries before evicting live ones (rate limited)."""
+        now = time.time()
+        if now - self._last_sweep < self.SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        for key in [k for k, e in self._entries.items() if self._is_expired(e, now)]:
+            self._remove(key)
+            self._expirations += 1
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its bytes (heap items go stale)."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
@@ -0,0 +1,540 @@
+"""
+Prometheus-style application metrics.
+
+Records:
+- ``http_request_duration_seconds`` histogram by method, route template
+  and status, and ``http_requests_in_flight``
+- ``upstream_request_duration_seconds`` histogram, ``upstream_errors_total``,
+  ``upstream_not_modified_total`` and ``upstream_requests_in_flight`` per
+  provider (yfinance history, yfinance info, Finnhub, Google News RSS)
+- ``thread_pool_tasks`` gauge of queued and running batch fetch tasks
+- ``upstream_pacing_queued`` gauge of calls waiting for a pacing slot
+- ``news_poller_refreshes_total`` and ``news_poller_deferred_total``
+  counters of background news refreshes
+- cache counters per key family, read from ``cache_metrics``
+
+Metrics are kept in a per-process registry. With gunicorn each worker has
+its own registry, so when ``METRICS_MULTIPROC_DIR`` is set every worker
+writes its values to ``<dir>/metrics_<pid>.json`` every
+``METRICS_FLUSH_INTERVAL`` seconds, and ``/metrics`` merges all files:
+counters and histograms are summed across workers (including workers that
+have exited), gauges across live workers only. Point the directory at an
+empty location per deployment, as with prometheus_client's multiprocess
+mode. Without a directory, ``/metrics`` reports the answering process.
+
+Single responsibility: Record metrics and render them in the Prometheus
+text exposition format.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flask import g, request
+
+from constants import (
+    METRICS_FLUSH_INTERVAL_SECONDS,
+    REQUEST_LATENCY_BUCKETS_SECONDS,
+    UPSTREAM_LATENCY_BUCKETS_SECONDS,
+)
+from utils.cache_metrics import cache_metrics
+
+logger = logging.getLogger(__name__)
+
+COUNTER = 'counter'
+GAUGE = 'gauge'
+HISTOGRAM = 'histogram'
+
+# Upstream providers
+PROVIDER_YFINANCE_HISTORY = 'yfinance_history'
+PROVIDER_YFINANCE_INFO = 'yfinance_info'
+PROVIDER_FINNHUB = 'finnhub'
+PROVIDER_GOOGLE_RSS = 'google_rss'
+
+# Sorted (name, value) label pairs; hashable and JSON-friendly
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Optional[Dict[str, Any]]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in (labels or {}).items()))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters, gauges and histograms.
+
+    Metric names, types, help texts and buckets are declared once at import
+    time; only values are recorded, snapshotted and merged.
+
+    Examples:
+        >>> registry = MetricsRegistry()
+        >>> registry.declare('jobs_total', COUNTER, 'Jobs run')
+        >>> registry.inc('jobs_total', {'kind': 'refresh'})
+        >>> print(registry.render())
+    """
+
+    def __init__(self):
+        """Initialize MetricsRegistry."""
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str, Tuple[float, ...]]] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._gauges: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], List[float]] = {}
+        self._collectors: List[Callable[[], List[Tuple[str, Dict[str, Any], float]]]] = []
+
+    def declare(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        buckets: Sequence[float] = ()
+    ) -> None:
+        """
+        Declare a metric.
+
+        Args:
+            name: Metric name (counters should end in ``_total``)
+            kind: COUNTER, GAUGE or HISTOGRAM
+            help_text: One-line description
+            buckets: Ascending upper bounds (histograms only)
+        """
+        self._meta[name] = (kind, help_text, tuple(buckets))
+
+    def add_collector(self, collector: Callable[[], List[Tuple[str, Dict[str, Any], float]]]) -> None:
+        """
+        Register a callable returning (name, labels, value) samples of
+        counters maintained elsewhere (read at snapshot time).
+        """
+        self._collectors.append(collector)
+
+    def inc(self, name: str, labels: Optional[Dict[str, Any]] = None, value: float = 1) -> None:
+        """Increment a counter."""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def add(self, name: str, labels: Optional[Dict[str, Any]] = None, delta: float = 1) -> None:
+        """Add to (or, with a negative delta, subtract from) a gauge."""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0) + delta
+
+    def observe(self, name: str, labels: Optional[Dict[str, Any]], value: float) -> None:
+        """Record a histogram observation."""
+        bounds = self._meta[name][2]
+        key = (name, _labels(labels))
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                # Per-bucket counts (last is +Inf), then the sum
+                series = self._histograms[key] = [0] * (len(bounds) + 2)
+            for i, bound in enumerate(bounds):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(bounds)] += 1
+            series[-1] += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current values in a JSON-serializable form.
+
+        Returns:
+            Dictionary with pid, counters, gauges and histograms
+        """
+        with self._lock:
+            counters = [[name, list(labels), value] for (name, labels), value in self._counters.items()]
+            gauges = [[name, list(labels), value] for (name, labels), value in self._gauges.items()]
+            histograms = [[name, list(labels), list(series)] for (name, labels), series in self._histograms.items()]
+
+        for collector in self._collectors:
+            for name, labels, value in collector():
+                counters.append([name, list(_labels(labels)), value])
+
+        return {'pid': os.getpid(), 'counters': counters, 'gauges': gauges, 'histograms': histograms}
+
+    def render(self, snapshots: Optional[List[Dict[str, Any]]] = None) -> str:
+        """
+        Render metrics in the Prometheus text exposition format (0.0.4).
+
+        Args:
+            snapshots: Snapshots to merge (default: this process only)
+
+        Returns:
+            Exposition text
+        """
+        counters, gauges, histograms = _merge(snapshots or [self.snapshot()])
+        series_by_name: Dict[str, List[str]] = {}
+
+        for (name, labels), value in counters.items():
+            series_by_name.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_num(value)}")
+        for (name, labels), value in gauges.items():
+            series_by_name.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_num(value)}")
+        for (name, labels), series in histograms.items():
+            bounds = self._meta.get(name, (HISTOGRAM, '', ()))[2]
+            lines = series_by_name.setdefault(name, [])
+            cumulative = 0
+            for bound, count in zip([*map(_num, bounds), '+Inf'], series[:-1]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {_num(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_num(series[-1])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_num(cumulative)}")
+
+        output = []
+        for name in sorted(series_by_name):
+            kind, help_text, _ = self._meta.get(name, (GAUGE, '', ()))
+            output.append(f"# HELP {name} {help_text}")
+            output.append(f"# TYPE {name} {kind}")
+            output.extend(sorted(series_by_name[name]))
+        return '\n'.join(output) + '\n'
+
+    def reset(self) -> None:
+        """Drop all recorded values (declarations and collectors are kept)."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+
+class MultiprocessStore:
+    """
+    Directory of per-process metric snapshots shared by gunicorn workers.
+
+    Examples:
+        >>> store = MultiprocessStore('/tmp/marketvue-metrics')
+        >>> store.write(registry.snapshot())
+        >>> registry.render(store.read_all())
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize MultiprocessStore.
+
+        Args:
+            directory: Directory shared by all workers of one deployment
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        """Atomically replace this process's snapshot file."""
+        path = os.path.join(self.directory, f"metrics_{snapshot['pid']}.json")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """
+        Read every worker's snapshot.
+
+        Gauges of processes that are no longer running are dropped, since
+        their in-flight values are meaningless.
+
+        Returns:
+            List of snapshots
+        """
+        snapshots = []
+        for filename in os.listdir(self.directory):
+            if not (filename.startswith('metrics_') and filename.endswith('.json')):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename)) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable metrics file {filename}: {e}")
+                continue
+            if not _pid_alive(snapshot.get('pid')):
+                snapshot['gauges'] = []
+            snapshots.append(snapshot)
+        return snapshots
+
+
+class UpstreamCall:
+    """Handle yielded by track_upstream; call mark_failed() for soft failures."""
+
+    def __init__(self):
+        self.failed = False
+        self.not_modified = False
+
+    def mark_failed(self) -> None:
+        """Count the call as an error without raising."""
+        self.failed = True
+
+    def mark_not_modified(self) -> None:
+        """Count the call as answered 304 Not Modified (previous result reused)."""
+        self.not_modified = True
+
+
+# Shared registry for the application
+registry = MetricsRegistry()
+
+registry.declare(
+    'http_request_duration_seconds', HISTOGRAM,
+    'HTTP request latency by method, route and status',
+    REQUEST_LATENCY_BUCKETS_SECONDS,
+)
+registry.declare('http_requests_in_flight', GAUGE, 'HTTP requests being processed')
+registry.declare(
+    'upstream_request_duration_seconds', HISTOGRAM,
+    'Latency of calls to upstream data providers',
+    UPSTREAM_LATENCY_BUCKETS_SECONDS,
+)
+registry.declare('upstream_errors_total', COUNTER, 'Failed calls to upstream data providers')
+registry.declare(
+    'upstream_not_modified_total', COUNTER,
+    'Conditional upstream calls answered 304 Not Modified',
+)
+registry.declare('upstream_requests_in_flight', GAUGE, 'Upstream calls in progress')
+registry.declare('upstream_pacing_queued', GAUGE, 'Upstream calls waiting for a pacing slot')
+registry.declare('thread_pool_tasks', GAUGE, 'Batch fetch tasks by state (queued, running)')
+registry.declare('cache_requests_total', COUNTER, 'Cache lookups by key family and result')
+registry.declare('cache_sets_total', COUNTER, 'Cache writes by key family')
+registry.declare('cache_evictions_total', COUNTER, 'In-memory cache evictions by key family')
+registry.declare('news_poller_refreshes_total', COUNTER, 'Background news refreshes by source')
+registry.declare(
+    'news_poller_deferred_total', COUNTER,
+    'Due news refreshes deferred to a later cycle by the per-source budget',
+)
+
+
+def _cache_samples() -> List[Tuple[str, Dict[str, Any], float]]:
+    """Export per-family cache counters (see utils/cache_metrics.py)."""
+    samples = []
+    for family, metrics in cache_metrics.snapshot()['families'].items():
+        samples.append(('cache_requests_total', {'family': family, 'result': 'hit'}, metrics['hits']))
+        samples.append(('cache_requests_total', {'family': family, 'result': 'miss'}, metrics['misses']))
+        samples.append(('cache_sets_total', {'family': family}, metrics['sets']))
+        samples.append(('cache_evictions_total', {'family': family}, metrics['evictions']))
+    return samples
+
+
+registry.add_collector(_cache_samples)
+
+
+@contextmanager
+def track_upstream(provider: str) -> Iterator[UpstreamCall]:
+    """
+    Time a call to an upstream provider and count it as an error if it raises.
+
+    Args:
+        provider: One of the PROVIDER_* names
+
+    Yields:
+        UpstreamCall, for marking failures that do not raise
+
+    Examples:
+        >>> with track_upstream(PROVIDER_FINNHUB):
+        ...     response = requests.get(url, timeout=10)
+    """
+    call = UpstreamCall()
+    labels = {'provider': provider}
+    registry.add('upstream_requests_in_flight', labels, 1)
+    start = time.perf_counter()
+    try:
+        yield call
+    except Exception:
+        call.failed = True
+        raise
+    finally:
+        registry.add('upstream_requests_in_flight', labels, -1)
+        registry.observe('upstream_request_duration_seconds', labels, time.perf_counter() - start)
+        if call.failed:
+            registry.inc('upstream_errors_total', labels)
+        elif call.not_modified:
+            registry.inc('upstream_not_modified_total', labels)
+
+
+def instrument_task(fn: Callable, pool: str = 'batch') -> Callable:
+    """
+    Wrap a function submitted to a thread pool so queue depth is tracked.
+
+    The task counts as queued from this call until a worker picks it up, and
+    as running until it returns.
+
+    Args:
+        fn: Task function
+        pool: Pool name label
+
+    Returns:
+        Wrapped task function
+    """
+    queued = {'pool': pool, 'state': 'queued'}
+    running = {'pool': pool, 'state': 'running'}
+    registry.add('thread_pool_tasks', queued, 1)
+
+    def task(*args, **kwargs):
+        registry.add('thread_pool_tasks', queued, -1)
+        registry.add('thread_pool_tasks', running, 1)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            registry.add('thread_pool_tasks', running, -1)
+
+    return task
+
+
+class MetricsExporter:
+    """
+    Flushes this process's registry to a MultiprocessStore periodically.
+
+    The flush thread is started lazily in each process (so it also runs in
+    workers forked after the app was created).
+    """
+
+    def __init__(self, store: MultiprocessStore, interval: float = METRICS_FLUSH_INTERVAL_SECONDS):
+        """
+        Initialize MetricsExporter.
+
+        Args:
+            store: Shared snapshot directory
+            interval: Seconds between flushes
+        """
+        self.store = store
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+
+    def ensure_started(self) -> None:
+        """Start the flush thread for the current process if needed."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+        thread = threading.Thread(target=self._run, name='metrics-flush', daemon=True)
+        thread.start()
+
+    def flush(self) -> None:
+        """Write this process's snapshot now."""
+        try:
+            self.store.write(registry.snapshot())
+        except OSError as e:
+            logger.warning(f"Could not write metrics snapshot: {e}")
+
+    def collect(self) -> List[Dict[str, Any]]:
+        """Flush this process and read every worker's snapshot."""
+        self.flush()
+        return self.store.read_all()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+
+def init_metrics(app) -> None:
+    """
+    Register request metrics middleware and the multiprocess exporter.
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    directory = app.config.get('METRICS_MULTIPROC_DIR')
+    exporter = None
+    if directory:
+        exporter = MetricsExporter(
+            MultiprocessStore(directory),
+            interval=app.config.get('METRICS_FLUSH_INTERVAL', METRICS_FLUSH_INTERVAL_SECONDS),
+        )
+    app.extensions['metrics'] = exporter
+
+    @app.before_request
+    def start_request_metrics():
+        """Count the request as in flight and start its timer."""
+        if exporter is not None:
+            exporter.ensure_started()
+        g.metrics_start = time.perf_counter()
+        g.metrics_in_flight = True
+        registry.add('http_requests_in_flight')
+
+    @app.after_request
+    def record_request_metrics(response):
+        """Record the request's latency by route template and status."""
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+            registry.observe(
+                'http_request_duration_seconds',
+                {'method': request.method, 'route': route, 'status': response.status_code},
+                time.perf_counter() - start,
+            )
+        return response
+
+    @app.teardown_request
+    def end_request_metrics(exc=None):
+        """Release the in-flight slot (runs even when the view raised)."""
+        if g.pop('metrics_in_flight', False):
+            registry.add('http_requests_in_flight', delta=-1)
+
+
+def render_metrics(app) -> str:
+    """
+    Render metrics for all workers (or this process without a shared directory).
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        Prometheus exposition text
+    """
+    exporter = app.extensions.get('metrics')
+    snapshots = exporter.collect() if exporter is not None else None
+    return registry.render(snapshots)
+
+
+def _merge(snapshots: List[Dict[str, Any]]) -> Tuple[dict, dict, dict]:
+    """Sum counters, gauges and histogram series across snapshots."""
+    counters: Dict[Tuple[str, Labels], float] = {}
+    gauges: Dict[Tuple[str, Labels], float] = {}
+    histograms: Dict[Tuple[str, Labels], List[float]] = {}
+    for snapshot in snapshots:
+        for target, entries in ((counters, snapshot.get('counters', [])), (gauges, snapshot.get('gauges', []))):
+            for name, labels, value in entries:
+                key = (name, tuple(tuple(pair) for pair in labels))
+                target[key] = target.get(key, 0) + value
+        for name, labels, series in snapshot.get('histograms', []):
+            key = (name, tuple(tuple(pair) for pair in labels))
+            merged = histograms.get(key)
+            histograms[key] = list(series) if merged is None else [a + b for a, b in zip(merged, series)]
+    return counters, gauges, histograms
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return '{' + pairs + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _num(value: float) -> str:
+    """Format a sample value (integers without a trailing .0)."""
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
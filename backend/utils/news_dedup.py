@@ -0,0 +1,180 @@
+"""
+Near-duplicate news collapsing.
+
+Syndicated stories reach the news list several times: the same URL under
+different tracking parameters, or the same headline republished by other
+outlets with small edits. Articles are clustered when their canonical URLs
+match or their headline token sets have a Jaccard similarity of at least
+``min_similarity``, and each cluster is returned as its first article with
+a ``duplicates`` count.
+
+Headline candidates are found with MinHash banding (locality-sensitive
+hashing): only articles whose signatures agree on a whole band are
+compared, and each candidate pair is confirmed on its exact Jaccard
+similarity. Clustering therefore stays roughly linear in the number of
+articles instead of comparing every pair.
+
+Single responsibility: Collapse near-duplicate news articles.
+"""
+import hashlib
+import re
+import struct
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from constants import (
+    NEWS_DEDUP_MIN_FEATURES,
+    NEWS_DEDUP_MIN_SIMILARITY,
+    NEWS_MINHASH_BANDS,
+    NEWS_MINHASH_ROWS,
+    NEWS_MINHASH_TOKEN_CACHE_SIZE,
+)
+from utils.news_identity import canonicalize_url
+
+_WORD = re.compile(r'\w+', re.UNICODE)
+_CJK = re.compile(r'[぀-ヿ㐀-䶿一-鿿가-힯]')
+
+_SIGNATURE_SIZE = NEWS_MINHASH_BANDS * NEWS_MINHASH_ROWS
+_DIGEST_WORDS = 8  # 64-bit values per 64-byte BLAKE2b digest
+_DIGESTS = -(-_SIGNATURE_SIZE // _DIGEST_WORDS)
+_UNPACK = struct.Struct(f'<{_DIGEST_WORDS}Q').unpack
+
+
+def headline_features(headline: str, source: Optional[str] = None) -> FrozenSet[str]:
+    """
+    Extract the token set of a headline.
+
+    A trailing " - {source}" (Google News appends the outlet name) is
+    removed. Words are lowercased; runs of CJK characters, which are not
+    space-separated, contribute their character bigrams instead.
+
+    Args:
+        headline: Article headline
+        source: Outlet name, if known
+
+    Returns:
+        Set of tokens
+
+    Examples:
+        >>> sorted(headline_features('Apple beats estimates - Reuters', 'Reuters'))
+        ['apple', 'beats', 'estimates']
+    """
+    text = headline or ''
+    if source and text.endswith(f" - {source}"):
+        text = text[:-len(source) - 3]
+
+    features = set()
+    for token in _WORD.findall(text.lower()):
+        if _CJK.search(token) and len(token) > 1:
+            features.update(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            features.add(token)
+    return frozenset(features)
+
+
+def minhash(features: FrozenSet[str]) -> Tuple[int, ...]:
+    """
+    Compute the MinHash signature of a non-empty token set.
+
+    Each signature position uses an independent hash function (a slice of
+    salted BLAKE2b digests), so signatures are the same in every worker.
+
+    Args:
+        features: Token set
+
+    Returns:
+        NEWS_MINHASH_BANDS * NEWS_MINHASH_ROWS minimum hash values; two
+        sets agree on each position with probability equal to their
+        Jaccard similarity
+    """
+    return tuple(map(min, zip(*map(_token_hashes, features))))
+
+
+@lru_cache(maxsize=NEWS_MINHASH_TOKEN_CACHE_SIZE)
+def _token_hashes(token: str) -> Tuple[int, ...]:
+    """Hash a token under every signature position (tokens recur across refreshes)."""
+    data = token.encode('utf-8')
+    values = []
+    for salt in range(_DIGESTS):
+        values.extend(_UNPACK(hashlib.blake2b(data, salt=salt.to_bytes(16, 'little')).digest()))
+    return tuple(values[:_SIGNATURE_SIZE])
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two token sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def collapse_duplicates(
+    articles: List[Dict],
+    min_similarity: float = NEWS_DEDUP_MIN_SIMILARITY
+) -> List[Dict]:
+    """
+    Collapse near-duplicate articles.
+
+    Args:
+        articles: Articles in display order
+        min_similarity: Smallest headline Jaccard similarity still treated
+            as the same story
+
+    Returns:
+        One article per cluster, in input order: copies of each cluster's
+        first article with a ``duplicates`` count of the articles collapsed
+        into it (0 for unique articles). The input is not modified.
+
+    Examples:
+        >>> collapse_duplicates([
+        ...     {'headline': 'Fed holds rates steady - Reuters', 'source': 'Reuters', 'url': 'https://a.x/1'},
+        ...     {'headline': 'Fed holds rates steady - CNBC', 'source': 'CNBC', 'url': 'https://b.x/2'},
+        ... ])[0]['duplicates']
+        1
+    """
+    parent = list(range(len(articles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # Keep the earliest article as the root, i.e. the representative
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    by_url: Dict[str, int] = {}
+    by_band: Dict[Tuple, List[int]] = {}
+    features: List[FrozenSet[str]] = []
+
+    for index, article in enumerate(articles):
+        url = canonicalize_url(article.get('url', ''))
+        if url:
+            if url in by_url:
+                union(by_url[url], index)
+            else:
+                by_url[url] = index
+
+        tokens = headline_features(article.get('headline', ''), article.get('source'))
+        features.append(tokens)
+        if len(tokens) < NEWS_DEDUP_MIN_FEATURES:
+            continue
+
+        signature = minhash(tokens)
+        for band in range(NEWS_MINHASH_BANDS):
+            rows = signature[band * NEWS_MINHASH_ROWS:(band + 1) * NEWS_MINHASH_ROWS]
+            bucket = by_band.setdefault((band, rows), [])
+            for other in bucket:
+                if find(other) != find(index) and jaccard(features[other], tokens) >= min_similarity:
+                    union(other, index)
+            bucket.append(index)
+
+    counts = Counter(find(i) for i in range(len(articles)))
+    return [
+        {**article, 'duplicates': counts[index] - 1}
+        for index, article in enumerate(articles)
+        if find(index) == index
+    ]
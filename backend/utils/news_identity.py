@@ -0,0 +1,79 @@
+"""
+News article identity.
+
+Derives article IDs from the article's canonical URL instead of its position
+in a feed, so an article keeps its ID when the feed reorders and the same
+story fetched twice is recognized as one article:
+
+- scheme and host are lowercased, default ports and fragments dropped
+- tracking query parameters (``utm_*``, ``oc``, ``fbclid``...) are removed
+  and the remaining parameters sorted
+- a trailing slash on the path is removed
+
+Single responsibility: Map article URLs to canonical URLs and stable IDs.
+"""
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from constants import NEWS_ID_HASH_LENGTH, NEWS_URL_TRACKING_PARAMS
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL.
+
+    Args:
+        url: Article URL as published by the source
+
+    Returns:
+        Canonical URL (the stripped input if it cannot be parsed)
+
+    Examples:
+        >>> canonicalize_url('HTTPS://News.Example.com:443/a/?utm_source=x&b=2&a=1#top')
+        'https://news.example.com/a?a=1&b=2'
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    netloc = host if port in (None, _DEFAULT_PORTS.get(scheme)) else f"{host}:{port}"
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(key)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def article_id(prefix: str, url: str) -> str:
+    """
+    Build a stable article ID from a URL.
+
+    Args:
+        prefix: Source prefix (e.g. 'google')
+        url: Article URL
+
+    Returns:
+        ID in the form "{prefix}_{hash}" where hash is a hex digest prefix
+        of the canonical URL
+
+    Examples:
+        >>> article_id('google', 'https://e.x/a?utm_medium=rss') == article_id('google', 'https://e.x/a')
+        True
+    """
+    digest = hashlib.sha1(canonicalize_url(url).encode('utf-8')).hexdigest()
+    return f"{prefix}_{digest[:NEWS_ID_HASH_LENGTH]}"
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key.startswith('utm_') or key in NEWS_URL_TRACKING_PARAMS
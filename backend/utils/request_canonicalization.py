@@ -0,0 +1,97 @@
+"""
+Request canonicalization for stock data endpoints.
+
+Rewrites request parameters into one canonical form before cache keys are
+built and before data is fetched, so equivalent requests share one cache
+entry:
+
+- symbols are stripped, uppercased, de-duplicated and sorted
+- missing dates are resolved to the default range
+- dates are snapped to trading sessions. yfinance treats ``end`` as
+  exclusive, so every end date between the day after the last session and
+  that session's next trading day selects the same data; the canonical end
+  is the day after the last trading day before ``end``. Future end dates are
+  clamped to tomorrow, and a start date on a non-trading day moves to the
+  next session.
+
+Single responsibility: Map request parameters to canonical values.
+"""
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from constants import DEFAULT_DATE_RANGE_DAYS
+from utils.trading_calendar import exchange_for_symbol, next_trading_day, previous_trading_day
+
+DATE_FORMAT = '%Y-%m-%d'
+
+
+def canonicalize_symbols(symbols: Iterable[str]) -> List[str]:
+    """
+    Normalize a set of symbols.
+
+    Args:
+        symbols: Ticker symbols as sent by the client
+
+    Returns:
+        Sorted list of unique, uppercased symbols
+
+    Examples:
+        >>> canonicalize_symbols(['msft', ' AAPL', 'aapl'])
+        ['AAPL', 'MSFT']
+    """
+    return sorted({symbol.strip().upper() for symbol in symbols if symbol and symbol.strip()})
+
+
+def canonicalize_date_range(
+    start_date: Optional[str],
+    end_date: Optional[str],
+    symbols: Iterable[str],
+    today: Optional[date] = None
+) -> Tuple[str, str]:
+    """
+    Resolve and snap a date range to the trading sessions it covers.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format, or None for the default
+        end_date: Exclusive end date in YYYY-MM-DD format, or None for today
+        symbols: Symbols in the request (selects the exchanges' calendars)
+        today: Current date (default: today's local date)
+
+    Returns:
+        Tuple of canonical (start_date, end_date) strings
+
+    Raises:
+        ValueError: If a date is not in YYYY-MM-DD format
+
+    Examples:
+        >>> # Saturday and Sunday end dates both select data through Friday
+        >>> canonicalize_date_range('2024-01-01', '2024-01-06', ['AAPL'])
+        ('2024-01-01', '2024-01-06')
+        >>> canonicalize_date_range('2024-01-01', '2024-01-07', ['AAPL'])
+        ('2024-01-01', '2024-01-06')
+    """
+    today = today or datetime.now().date()
+    exchanges = {exchange_for_symbol(symbol) for symbol in symbols} or {'US'}
+
+    end = _parse(end_date) if end_date else today
+    start = (
+        _parse(start_date) if start_date
+        else today - timedelta(days=DEFAULT_DATE_RANGE_DAYS)
+    )
+
+    # Nothing after tomorrow can exist yet
+    end = min(end, today + timedelta(days=1))
+    canonical_end = previous_trading_day(end, exchanges) + timedelta(days=1)
+
+    canonical_start = next_trading_day(start, exchanges)
+
+    if canonical_start >= canonical_end:
+        # The range holds no session; keep it as sent rather than inverting it
+        return start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)
+
+    return canonical_start.strftime(DATE_FORMAT), canonical_end.strftime(DATE_FORMAT)
+
+
+def _parse(value: str) -> date:
+    """Parse a YYYY-MM-DD date string."""
+    return datetime.strptime(value, DATE_FORMAT).date()
@@ -0,0 +1,223 @@
+"""
+Resilient Redis cache backend.
+
+CacheFactory.create_cache only falls back to an in-memory cache when Redis
+is unreachable at startup. At runtime, a Redis outage made every cache call
+wait for the socket timeout. This backend wraps the Redis backend in a
+circuit breaker:
+
+- after CACHE_FAILOVER_THRESHOLD consecutive Redis errors the breaker opens
+  and all cache calls go straight to a local SizeAwareCache, with no network
+  wait
+- a background thread pings Redis every CACHE_FAILOVER_PROBE_INTERVAL
+  seconds while the breaker is open
+- once Redis answers, the breaker closes, the local fallback is dropped, and
+  calls go back to Redis
+
+Used by Flask-Caching via ``CACHE_TYPE='utils.resilient_cache.ResilientRedisCache'``
+(see CacheFactory._build_redis_config). The wrapped backend is named by
+``CACHE_REDIS_BACKEND``.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from flask_caching.backends.base import BaseCache
+from redis.exceptions import RedisError
+from werkzeug.utils import import_string
+
+from constants import (
+    CACHE_FAILOVER_FAILURE_THRESHOLD,
+    CACHE_FAILOVER_PROBE_INTERVAL_SECONDS,
+    CACHE_LOCAL_MAX_BYTES,
+)
+from utils.circuit_breaker import STATE_OPEN, CircuitBreaker
+from utils.size_aware_cache import SizeAwareCache
+
+logger = logging.getLogger(__name__)
+
+# Errors that indicate Redis itself is unavailable (not bad input)
+REDIS_ERRORS = (RedisError, OSError)
+
+
+class ResilientRedisCache(BaseCache):
+    """
+    Cache backend that fails over from Redis to process memory.
+
+    Attributes:
+        _primary: Wrapped Redis backend
+        _fallback: Local cache used while the breaker is open
+        _breaker: Circuit breaker guarding the primary
+        probe_interval: Seconds between Redis probes while open
+
+    Examples:
+        >>> backend = ResilientRedisCache(primary=TieredRedisCache(host=client))
+        >>> backend.get('news:AAPL')  # Redis, or local memory during an outage
+    """
+
+    def __init__(
+        self,
+        primary: BaseCache,
+        fallback: Optional[BaseCache] = None,
+        failure_threshold: int = CACHE_FAILOVER_FAILURE_THRESHOLD,
+        probe_interval: float = CACHE_FAILOVER_PROBE_INTERVAL_SECONDS,
+        default_timeout: int = 300,
+    ):
+        """
+        Initialize ResilientRedisCache.
+
+        Args:
+            primary: Redis backend to wrap
+            fallback: Local backend used during outages (default: SizeAwareCache)
+            failure_threshold: Consecutive Redis errors before failing over
+            probe_interval: Seconds between Redis probes while failed over
+            default_timeout: Default timeout in seconds
+        """
+        super().__init__(default_timeout=default_timeout)
+        self._primary = primary
+        self._fallback = fallback or SizeAwareCache(
+            max_bytes=CACHE_LOCAL_MAX_BYTES, default_timeout=default_timeout
+        )
+        self.probe_interval = probe_interval
+        self._breaker = CircuitBreaker(
+            'redis-cache',
+            failure_threshold=failure_threshold,
+            on_open=self._start_probe,
+        )
+        self._probe_lock = threading.Lock()
+        self._probe_pid: Optional[int] = None
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        """Create the backend, building the wrapped Redis backend from config."""
+        primary_cls = import_string(config['CACHE_REDIS_BACKEND'])
+        primary = primary_cls.factory(app, config, list(args), dict(kwargs))
+        default_timeout = kwargs.get('default_timeout', 300)
+        fallback = SizeAwareCache(
+            max_bytes=config.get('CACHE_MAX_BYTES', CACHE_LOCAL_MAX_BYTES),
+            default_timeout=default_timeout,
+        )
+        return cls(
+            primary,
+            fallback=fallback,
+            failure_threshold=config.get(
+                'CACHE_FAILOVER_THRESHOLD', CACHE_FAILOVER_FAILURE_THRESHOLD
+            ),
+            probe_interval=config.get(
+                'CACHE_FAILOVER_PROBE_INTERVAL', CACHE_FAILOVER_PROBE_INTERVAL_SECONDS
+            ),
+            default_timeout=default_timeout,
+        )
+
+    @property
+    def failed_over(self) -> bool:
+        """Check whether calls are currently served by the local fallback."""
+        return self._breaker.state == STATE_OPEN
+
+    def get(self, key: str) -> Any:
+        """Get a value."""
+        return self._call('get', key)
+
+    def get_many(self, *keys: str) -> List[Any]:
+        """Get several values."""
+        return self._call('get_many', *keys)
+
+    def has(self, key: str) -> bool:
+        """Check whether a key exists."""
+        return self._call('has', key)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> Any:
+        """Store a value."""
+        return self._call('set', key, value, timeout)
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None) -> List[Any]:
+        """Store several values."""
+        return self._call('set_many', mapping, timeout)
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Store a value only if the key is absent."""
+        return self._call('add', key, value, timeout)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key."""
+        return self._call('delete', key)
+
+    def delete_many(self, *keys: str) -> List[Any]:
+        """Delete several keys."""
+        return self._call('delete_many', *keys)
+
+    def inc(self, key: str, delta: int = 1) -> Any:
+        """Increment a counter."""
+        return self._call('inc', key, delta)
+
+    def dec(self, key: str, delta: int = 1) -> Any:
+        """Decrement a counter."""
+        return self._call('dec', key, delta)
+
+    def clear(self) -> bool:
+        """Clear Redis and the local fallback."""
+        self._fallback.clear()
+        return self._call('clear')
+
+    def stats(self) -> Dict[str, Any]:
+        """Get backend statistics (reported by the health endpoint)."""
+        primary_stats = getattr(self._primary, 'stats', None)
+        return {
+            **(primary_stats() if callable(primary_stats) else {}),
+            'circuit': self._breaker.stats(),
+            'fallback': self._fallback.stats(),
+        }
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Run an operation on Redis, or on the fallback when Redis is down."""
+        if self._breaker.allow_request():
+            try:
+                result = getattr(self._primary, method)(*args)
+            except REDIS_ERRORS as e:
+                logger.warning(f"Redis cache {method} failed: {e}")
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+                return result
+        return getattr(self._fallback, method)(*args)
+
+    def _start_probe(self) -> None:
+        """Start the background Redis probe for this process, if not running."""
+        with self._probe_lock:
+            if self._probe_pid == os.getpid():
+                return
+            self._probe_pid = os.getpid()
+        thread = threading.Thread(
+            target=self._probe_until_recovered,
+            name='cache-redis-probe',
+            daemon=True,
+        )
+        thread.start()
+
+    def _probe_until_recovered(self) -> None:
+        """Ping Redis until it answers, then switch back to it."""
+        try:
+            while True:
+                time.sleep(self.probe_interval)
+                try:
+                    self._primary._write_client.ping()
+                except REDIS_ERRORS as e:
+                    logger.debug(f"Redis probe failed: {e}")
+                    continue
+                self._recover()
+                return
+        finally:
+            with self._probe_lock:
+                self._probe_pid = None
+
+    def _recover(self) -> None:
+        """Close the breaker and drop state that may have gone stale."""
+        # Invalidations published while Redis was down were lost
+        reset_local = getattr(self._primary, 'reset_local_tier', None)
+        if callable(reset_local):
+            reset_local()
+        self._fallback.clear()
+        self._breaker.reset()
+        logger.info("Redis cache recovered; leaving local fallback")
@@ -0,0 +1,370 @@
+"""
+Response cache module.
+
+Caches ready-to-send response bodies instead of Flask ``Response`` objects.
+
+``@cache.cached`` pickles the whole view return value (a ``Response`` plus
+status tuple) into the backend, so every hit pays for unpickling a Response
+object. The ``cached_response`` decorator stores a small versioned payload
+holding only the encoded body bytes and the headers needed to replay it. A
+warm hit is a single cache read followed by a socket write: no JSON work and
+no Response unpickling.
+
+Stampede protection: when a popular key expires, every in-flight request
+would miss together and recompute it. Instead, entries are kept in the
+backend for a grace period past their logical expiry, and:
+
+- XFetch: each read may decide to refresh early, with a probability that
+  grows as the logical expiry approaches and with how long the value took
+  to compute (``delta``), so recomputation is spread out before expiry
+- a per-key refresh lock (``cache.add``) ensures exactly one request
+  recomputes; the others keep serving the current value (``X-Cache: STALE``
+  once it is past its logical expiry)
+
+Payload format (version 2):
+    {
+        'v': 2,
+        'body': b'{"symbol": "AAPL", ...}',
+        'headers': [('Content-Type', 'application/json')],
+        'encodings': {'gzip': b'...'},  # optional precompressed variants
+        'expires_at': 1718000000.0,     # logical expiry (epoch seconds)
+        'delta': 0.42                   # seconds it took to compute
+    }
+"""
+import logging
+import math
+import random
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+from flask import Response, make_response, request
+
+from constants import CACHE_REFRESH_LOCK_SECONDS, CACHE_STALE_GRACE_SECONDS, XFETCH_BETA
+from utils.cache import cache
+from utils.cache_tags import tag_index
+from utils.compression import build_encodings
+from utils.server_timing import stage
+
+logger = logging.getLogger(__name__)
+
+# Bump when the payload layout changes; older payloads are treated as misses
+PAYLOAD_VERSION = 2
+
+# Headers that must be recomputed for every response rather than replayed
+_EXCLUDED_HEADERS = {'content-length', 'content-encoding', 'vary'}
+
+
+def build_payload(
+    response: Response,
+    timeout: Optional[int] = None,
+    delta: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Build a cacheable payload from a fully rendered response.
+
+    Compressed variants are produced here, once per cache fill, so hits
+    never pay for compression.
+
+    Args:
+        response: Flask response produced by a view
+        timeout: Logical lifetime in seconds (None: never refreshed early)
+        delta: Seconds it took to compute the response
+
+    Returns:
+        Versioned payload dictionary with body bytes and replayable headers
+    """
+    headers = [
+        (name, value) for name, value in response.headers.items()
+        if name.lower() not in _EXCLUDED_HEADERS
+    ]
+    body = response.get_data()
+    return {
+        'v': PAYLOAD_VERSION,
+        'body': body,
+        'headers': headers,
+        'encodings': build_encodings(body),
+        'expires_at': time.time() + timeout if timeout else None,
+        'delta': delta,
+    }
+
+
+def is_valid_payload(payload: Any) -> bool:
+    """
+    Check whether a cached value is a payload this module can replay.
+
+    Entries written by older code (e.g. pickled Response tuples) are
+    rejected so they are simply recomputed and overwritten.
+
+    Args:
+        payload: Value returned from the cache backend
+
+    Returns:
+        True if the payload matches the current format
+    """
+    return (
+        isinstance(payload, dict)
+        and payload.get('v') == PAYLOAD_VERSION
+        and isinstance(payload.get('body'), bytes)
+    )
+
+
+def should_refresh(payload: Dict[str, Any], now: Optional[float] = None) -> bool:
+    """
+    Decide whether this read should recompute the value (XFetch).
+
+    Returns True once the logical expiry has passed, and before that with a
+    probability that rises as expiry approaches. Expensive values (large
+    ``delta``) start refreshing earlier.
+
+    Args:
+        payload: Cached payload dictionary
+        now: Current epoch time (default: time.time())
+
+    Returns:
+        True if the caller should try to refresh the value
+    """
+    expires_at = payload.get('expires_at')
+    if expires_at is None:
+        return False
+
+    now = time.time() if now is None else now
+    # -ln(U) for U in (0, 1] is an Exp(1) sample
+    early = payload.get('delta', 0.0) * XFETCH_BETA * -math.log(1.0 - random.random())
+    return now + early >= expires_at
+
+
+def select_encoding(payload: Dict[str, Any]) -> Optional[str]:
+    """
+    Pick a precompressed variant acceptable to the current client.
+
+    Args:
+        payload: Cached payload dictionary
+
+    Returns:
+        Encoding name (e.g. 'br', 'gzip') or None for the identity body
+    """
+    encodings = payload.get('encodings') or {}
+    if not encodings:
+        return None
+
+    accepted = request.accept_encodings
+    for encoding in ('br', 'gzip'):
+        if encoding in encodings and accepted.quality(encoding) > 0:
+            return encoding
+    return None
+
+
+def payload_to_response(payload: Dict[str, Any]) -> Response:
+    """
+    Replay a cached payload as a response without any serialization work.
+
+    Args:
+        payload: Cached payload dictionary
+
+    Returns:
+        Flask response carrying the cached bytes
+    """
+    encoding = select_encoding(payload)
+    body = payload['encodings'][encoding] if encoding else payload['body']
+
+    response = Response(body, status=200, headers=payload['headers'])
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if payload.get('encodings'):
+        response.vary.add('Accept-Encoding')
+    return response
+
+
+def get_fresh_payloads(keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up several cached payloads with one backend call.
+
+    Used by batch endpoints that assemble their response from the entries
+    of a per-item route. Payloads past their logical expiry are left out,
+    so the caller refreshes them.
+
+    Args:
+        keys: Cache keys of per-item responses
+
+    Returns:
+        Mapping of key to payload for valid, unexpired entries
+    """
+    if not keys:
+        return {}
+
+    try:
+        with stage('cache_lookup'):
+            values = cache.get_many(*keys)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {len(keys)} keys: {e}")
+        return {}
+
+    now = time.time()
+    return {
+        key: payload for key, payload in zip(keys, values)
+        if is_valid_payload(payload)
+        and (payload['expires_at'] is None or payload['expires_at'] > now)
+    }
+
+
+def store_responses(
+    responses: Dict[str, Response],
+    timeout: int,
+    grace: int = CACHE_STALE_GRACE_SECONDS
+) -> None:
+    """
+    Cache several rendered responses as payloads with one backend call.
+
+    Entries are written exactly as ``cached_response`` would write them, so
+    the per-item route serves them as hits.
+
+    Args:
+        responses: Mapping of cache key to a 200 response
+        timeout: Logical cache lifetime in seconds
+        grace: Seconds a value may be served stale while it is refreshed
+    """
+    if not responses:
+        return
+
+    with stage('serialize'):
+        payloads = {
+            key: build_payload(response, timeout=timeout)
+            for key, response in responses.items()
+        }
+    try:
+        cache.set_many(payloads, timeout=timeout + grace)
+        tag_index.tag_keys(payloads.keys())
+    except Exception as e:
+        logger.warning(f"Cache write failed for {len(payloads)} keys: {e}")
+
+
+def cached_response(
+    timeout: int,
+    make_cache_key: Callable[..., Optional[str]],
+    grace: int = CACHE_STALE_GRACE_SECONDS
+):
+    """
+    Decorator caching a route's encoded response body.
+
+    Only successful (200) responses are cached. If ``make_cache_key``
+    returns None the cache is bypassed for that request.
+
+    Entries live in the backend for ``timeout + grace`` seconds. Between
+    the logical expiry and the end of the grace period, one request holding
+    the refresh lock recomputes while concurrent requests serve the stale
+    value.
+
+    Args:
+        timeout: Logical cache lifetime in seconds
+        make_cache_key: Callable receiving the view args and returning a key
+        grace: Seconds a value may be served stale while it is refreshed
+
+    Returns:
+        Decorated function with response caching enabled
+
+    Examples:
+        >>> @stock_bp.route('/stock-data', methods=['POST'])
+        ... @cached_response(timeout=300, make_cache_key=make_stock_data_cache_key)
+        ... def get_stock_data():
+        ...     return jsonify(result), 200
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            cache_key = make_cache_key(*args, **kwargs)
+            if cache_key is None:
+                return f(*args, **kwargs)
+
+            try:
+                with stage('cache_lookup'):
+                    payload = cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Cache read failed for key {cache_key}: {e}")
+                payload = None
+
+            refresh_lock = None
+            current = payload if is_valid_payload(payload) else None
+            if current is not None:
+                if not should_refresh(current):
+                    logger.debug(f"Cache hit for key: {cache_key}")
+                    return _replay(current, 'HIT')
+
+                refresh_lock = _acquire_refresh_lock(cache_key)
+                if refresh_lock is None:
+                    # Another request is recomputing; keep serving this value
+                    return _replay(current, _hit_status(current))
+
+            try:
+                started = time.perf_counter()
+                response = make_response(f(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough:
+                    with stage('serialize'):
+                        payload = build_payload(
+                            response, timeout=timeout, delta=time.perf_counter() - started
+                        )
+                    try:
+                        cache.set(cache_key, payload, timeout=timeout + grace)
+                        tag_index.tag_key(cache_key)
+                        logger.debug(f"Cached response for key: {cache_key}")
+                    except Exception as e:
+                        logger.warning(f"Cache write failed for key {cache_key}: {e}")
+                    # Serve the filling request from the payload too, so its
+                    # precompressed variant is reused instead of compressing again
+                    response = payload_to_response(payload)
+                elif current is not None:
+                    # A failed refresh should not replace a value we still hold
+                    logger.warning(f"Refresh failed for key {cache_key}; serving cached value")
+                    return _replay(current, _hit_status(current))
+            finally:
+                if refresh_lock is not None:
+                    _release_refresh_lock(refresh_lock)
+
+            response.headers['X-Cache'] = 'MISS'
+            return response
+
+        return decorated_function
+    return decorator
+
+
+def _replay(payload: Dict[str, Any], status: str) -> Response:
+    """Replay a cached payload with an X-Cache status header."""
+    response = payload_to_response(payload)
+    response.headers['X-Cache'] = status
+    return response
+
+
+def _hit_status(payload: Dict[str, Any]) -> str:
+    """Get the X-Cache status for a payload served from cache."""
+    if payload['expires_at'] is not None and payload['expires_at'] <= time.time():
+        return 'STALE'
+    return 'HIT'
+
+
+def _acquire_refresh_lock(cache_key: str) -> Optional[str]:
+    """
+    Try to become the single request refreshing a key.
+
+    Args:
+        cache_key: Key of the cached payload
+
+    Returns:
+        Lock key if acquired, None if another request holds it
+    """
+    lock_key = f"{cache_key}:refresh-lock"
+    try:
+        if cache.add(lock_key, 1, timeout=CACHE_REFRESH_LOCK_SECONDS):
+            return lock_key
+        return None
+    except Exception as e:
+        # Without a working lock, refreshing is better than serving stale forever
+        logger.warning(f"Refresh lock failed for key {cache_key}: {e}")
+        return lock_key
+
+
+def _release_refresh_lock(lock_key: str) -> None:
+    """Release a refresh lock acquired by _acquire_refresh_lock."""
+    try:
+        cache.delete(lock_key)
+    except Exception as e:
+        logger.warning(f"Refresh lock release failed for {lock_key}: {e}")
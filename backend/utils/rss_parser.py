@@ -0,0 +1,189 @@
+"""
+Streaming RSS parser.
+
+Reads RSS 2.0 ``<item>`` elements incrementally with ``iterparse`` and
+extracts only the fields the news fetchers use (title, link, pubDate,
+source). Unlike feedparser it builds no universal feed object, does no HTML
+sanitizing, and frees each item once read, so large feeds parse in a
+fraction of the time with flat memory use.
+
+Items published before ``cutoff`` are skipped, and parsing stops after
+``stale_run_limit`` consecutive stale items: feeds list newest first, give
+or take a few relevance-ranked items, so a long run of stale items means
+the rest of the feed is stale too.
+
+Documents that are not well-formed RSS 2.0 (syntax errors, Atom, no
+``<channel>``) raise ``RssParseError`` so callers can fall back to
+feedparser.
+
+Single responsibility: Extract news items from RSS bytes.
+"""
+import io
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional
+
+from constants import RSS_STALE_RUN_LIMIT
+
+try:
+    from lxml import etree
+
+    def _iterparse(content: bytes):
+        # No entity expansion or network access for untrusted feeds
+        return etree.iterparse(
+            io.BytesIO(content), events=('start', 'end'),
+            resolve_entities=False, no_network=True, huge_tree=False,
+        )
+
+    _SYNTAX_ERRORS = (etree.XMLSyntaxError,)
+except ImportError:  # pragma: no cover - lxml is in requirements.txt
+    import xml.etree.ElementTree as etree
+
+    def _iterparse(content: bytes):
+        return etree.iterparse(io.BytesIO(content), events=('start', 'end'))
+
+    _SYNTAX_ERRORS = (etree.ParseError,)
+
+
+class RssParseError(ValueError):
+    """Raised when a document cannot be read as RSS 2.0."""
+
+
+def iter_rss_items(
+    content: bytes,
+    cutoff: Optional[datetime] = None,
+    stale_run_limit: int = RSS_STALE_RUN_LIMIT
+) -> Iterator[Dict]:
+    """
+    Yield the items of an RSS 2.0 document.
+
+    Items have the keys used by feedparser entries: ``title``, ``link``,
+    ``published`` (raw pubDate string) and ``source`` (``{'title': name}``),
+    plus ``published_ts``: the pubDate as epoch seconds, parsed once here
+    (None if missing or unparseable).
+
+    Args:
+        content: Raw feed bytes
+        cutoff: Skip items published before this time (None keeps all)
+        stale_run_limit: Stop after this many consecutive stale items
+
+    Yields:
+        Item dictionaries, in feed order
+
+    Raises:
+        RssParseError: If the document is not well-formed RSS 2.0
+    """
+    seen_channel = False
+    stale_run = 0
+
+    try:
+        for event, elem in _iterparse(content):
+            if event == 'start':
+                if elem.tag == 'channel':
+                    seen_channel = True
+                elif not seen_channel and elem.tag not in ('rss',):
+                    raise RssParseError(f"Not an RSS 2.0 document (root <{elem.tag}>)")
+                continue
+
+            if elem.tag != 'item':
+                continue
+
+            item = _read_item(elem)
+            _release(elem)
+
+            if cutoff is not None and _is_stale(item['published_ts'], cutoff):
+                stale_run += 1
+                if stale_run >= stale_run_limit:
+                    return
+                continue
+            stale_run = 0
+            yield item
+    except _SYNTAX_ERRORS as e:
+        raise RssParseError(f"Malformed feed: {e}") from e
+
+    if not seen_channel:
+        raise RssParseError("Not an RSS 2.0 document (no <channel>)")
+
+
+def parse_rss_items(
+    content: bytes,
+    cutoff: Optional[datetime] = None,
+    stale_run_limit: int = RSS_STALE_RUN_LIMIT
+) -> List[Dict]:
+    """
+    Parse the items of an RSS 2.0 document.
+
+    Args:
+        content: Raw feed bytes
+        cutoff: Skip items published before this time (None keeps all)
+        stale_run_limit: Stop after this many consecutive stale items
+
+    Returns:
+        List of item dictionaries (see iter_rss_items)
+
+    Raises:
+        RssParseError: If the document is not well-formed RSS 2.0
+
+    Examples:
+        >>> parse_rss_items(b'<rss><channel><item><title>T</title>'
+        ...                 b'<link>https://e.x/a</link></item></channel></rss>')
+        [{'title': 'T', 'link': 'https://e.x/a', 'published': '', 'source': {}, 'published_ts': None}]
+    """
+    return list(iter_rss_items(content, cutoff, stale_run_limit))
+
+
+def _read_item(elem) -> Dict:
+    """Extract the used fields of an <item> element."""
+    item = {'title': '', 'link': '', 'published': '', 'source': {}}
+    for child in elem:
+        tag = child.tag
+        if tag == 'title':
+            item['title'] = (child.text or '').strip()
+        elif tag == 'link':
+            item['link'] = (child.text or '').strip()
+        elif tag == 'pubDate':
+            item['published'] = (child.text or '').strip()
+        elif tag == 'source':
+            item['source'] = {'title': (child.text or '').strip() or None}
+    item['published_ts'] = parse_rfc822_timestamp(item['published'])
+    return item
+
+
+def _release(elem) -> None:
+    """Free a processed item (and, with lxml, the siblings before it)."""
+    elem.clear()
+    getprevious = getattr(elem, 'getprevious', None)
+    if getprevious is not None:
+        parent = elem.getparent()
+        while parent is not None and getprevious() is not None:
+            del parent[0]
+
+
+def parse_rfc822_timestamp(published: str) -> Optional[int]:
+    """
+    Parse an RSS (RFC 822) date into epoch seconds.
+
+    Args:
+        published: pubDate text; dates without a zone are taken as UTC
+
+    Returns:
+        Epoch seconds, or None if the date is missing or unparseable
+
+    Examples:
+        >>> parse_rfc822_timestamp('Mon, 09 Feb 2026 10:00:00 GMT')
+        1770631200
+    """
+    if not published:
+        return None
+    try:
+        dt = parsedate_to_datetime(published)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _is_stale(published_ts: Optional[int], cutoff: datetime) -> bool:
+    """Check whether a publish time is before the cutoff (unknown times are kept)."""
+    return published_ts is not None and published_ts < cutoff.timestamp()
@@ -0,0 +1,305 @@
+"""
+Sampling profiler for a running worker process.
+
+Periodically captures the Python stack of every thread in the process via
+``sys._current_frames()`` and aggregates identical stacks. No tracing hooks
+are installed, so the profiled code runs at full speed; the cost is one
+stack walk per thread per sample, bounded by a minimum interval, a maximum
+duration, a stack depth limit and a single concurrent profile per process.
+
+``SamplingProfiler.start`` samples from a background daemon thread, so the
+worker thread that started the profile is free to serve the load being
+profiled (a gunicorn sync worker has only that one thread); the finished
+result is picked up later from ``SamplingProfiler.latest()``.
+
+Results are exported as:
+- collapsed stacks (``thread;module:function;... count``), the input format
+  of flamegraph.pl and speedscope
+- a ``pstats`` dump, loadable with ``pstats.Stats`` / snakeviz, where call
+  counts are sample counts and times are samples multiplied by the interval
+
+Single responsibility: Collect and export stack samples.
+"""
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from constants import (
+    PROFILER_DEFAULT_INTERVAL_MS,
+    PROFILER_MAX_DURATION_SECONDS,
+    PROFILER_MAX_STACK_DEPTH,
+    PROFILER_MIN_INTERVAL_MS,
+)
+
+# (filename, first line, function name), the pstats function key
+FrameKey = Tuple[str, int, str]
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is already running in this process."""
+
+
+class ProfileResult:
+    """
+    Aggregated stack samples of one profiling run.
+
+    Attributes:
+        samples: Stack (root first, including the thread name) -> sample count
+        interval: Sampling interval in seconds
+        duration: Wall-clock duration of the run in seconds
+        sample_count: Number of sampling rounds taken
+    """
+
+    def __init__(
+        self,
+        samples: Counter,
+        interval: float,
+        duration: float,
+        sample_count: int
+    ):
+        self.samples = samples
+        self.interval = interval
+        self.duration = duration
+        self.sample_count = sample_count
+
+    def to_collapsed(self) -> str:
+        """
+        Export as collapsed stacks, one ``frame;frame;... count`` per line.
+
+        Returns:
+            Collapsed stack text (heaviest stacks first)
+        """
+        lines = []
+        for stack, count in self.samples.most_common():
+            thread_name, frames = stack[0], stack[1:]
+            names = [thread_name] + [_frame_label(frame) for frame in frames]
+            lines.append(f"{';'.join(names)} {count}")
+        return '\n'.join(lines) + ('\n' if lines else '')
+
+    def to_pstats(self) -> bytes:
+        """
+        Export as a marshalled pstats dump (the format of ``Stats.dump_stats``).
+
+        Returns:
+            Bytes loadable with ``pstats.Stats(path)``
+        """
+        # func -> [primitive calls, calls, self time, cumulative time, callers]
+        stats: Dict[FrameKey, list] = {}
+        for stack, count in self.samples.items():
+            frames = stack[1:]
+            if not frames:
+                continue
+            seconds = count * self.interval
+            seen = set()
+            for depth, frame in enumerate(frames):
+                entry = stats.setdefault(frame, [0, 0, 0.0, 0.0, {}])
+                if frame not in seen:
+                    # Recursive frames count once towards cumulative time
+                    seen.add(frame)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += seconds
+                if depth > 0:
+                    caller = frames[depth - 1]
+                    edge = entry[4].setdefault(caller, [0, 0, 0.0, 0.0])
+                    edge[0] += count
+                    edge[1] += count
+                    edge[3] += seconds
+                    if depth == len(frames) - 1:
+                        edge[2] += seconds
+            stats[frames[-1]][2] += seconds
+
+        return marshal.dumps({
+            func: (cc, nc, tt, ct, {caller: tuple(edge) for caller, edge in callers.items()})
+            for func, (cc, nc, tt, ct, callers) in stats.items()
+        })
+
+
+class BackgroundProfile:
+    """
+    A profile sampled by a background thread.
+
+    Attributes:
+        duration: Requested sampling time in seconds
+        interval: Sampling interval in seconds
+        started_at: Unix time the sampling started
+        result: ProfileResult once sampling has finished, else None
+    """
+
+    def __init__(self, duration: float, interval: float):
+        self.duration = duration
+        self.interval = interval
+        self.started_at = time.time()
+        self.result: Optional[ProfileResult] = None
+        self._done = threading.Event()
+
+    def done(self) -> bool:
+        """Check whether sampling has finished."""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until sampling has finished; returns done()."""
+        return self._done.wait(timeout)
+
+    def remaining(self) -> float:
+        """Seconds of sampling left (0 once finished)."""
+        if self.done():
+            return 0.0
+        return max(self.started_at + self.duration - time.time(), 0.0)
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads in this process for a bounded time.
+
+    Examples:
+        >>> result = SamplingProfiler().run(duration=10, interval_ms=10)
+        >>> print(result.to_collapsed())
+        >>> profile = SamplingProfiler().start(duration=10)
+        >>> profile.wait(); profile.result.to_pstats()
+    """
+
+    # One profile at a time per process keeps overhead bounded
+    _running = threading.Lock()
+
+    # Most recent background profile in this process
+    _latest: Optional[BackgroundProfile] = None
+
+    def __init__(self, max_depth: int = PROFILER_MAX_STACK_DEPTH):
+        """
+        Initialize SamplingProfiler.
+
+        Args:
+            max_depth: Maximum frames kept per stack (deepest frames are kept)
+        """
+        self.max_depth = max_depth
+
+    def run(
+        self,
+        duration: float,
+        interval_ms: float = PROFILER_DEFAULT_INTERVAL_MS
+    ) -> ProfileResult:
+        """
+        Sample all other threads for ``duration`` seconds (blocking).
+
+        Args:
+            duration: Seconds to sample (capped at PROFILER_MAX_DURATION_SECONDS)
+            interval_ms: Milliseconds between samples (at least PROFILER_MIN_INTERVAL_MS)
+
+        Returns:
+            ProfileResult with the aggregated samples
+
+        Raises:
+            ProfilerBusyError: If another profile is running in this process
+        """
+        duration, interval = self._bounds(duration, interval_ms)
+
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusyError('A profile is already running in this process')
+        try:
+            return self._sample(duration, interval)
+        finally:
+            self._running.release()
+
+    def start(
+        self,
+        duration: float,
+        interval_ms: float = PROFILER_DEFAULT_INTERVAL_MS
+    ) -> BackgroundProfile:
+        """
+        Sample all other threads for ``duration`` seconds from a daemon thread.
+
+        Returns immediately; the profile also becomes ``latest()``.
+
+        Args:
+            duration: Seconds to sample (capped at PROFILER_MAX_DURATION_SECONDS)
+            interval_ms: Milliseconds between samples (at least PROFILER_MIN_INTERVAL_MS)
+
+        Returns:
+            BackgroundProfile whose result is set when sampling finishes
+
+        Raises:
+            ProfilerBusyError: If another profile is running in this process
+        """
+        duration, interval = self._bounds(duration, interval_ms)
+
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusyError('A profile is already running in this process')
+        profile = BackgroundProfile(duration, interval)
+        SamplingProfiler._latest = profile
+
+        def sample() -> None:
+            try:
+                profile.result = self._sample(duration, interval)
+            finally:
+                self._running.release()
+                profile._done.set()
+
+        try:
+            threading.Thread(target=sample, name='sampling-profiler', daemon=True).start()
+        except RuntimeError:
+            self._running.release()
+            raise
+        return profile
+
+    @classmethod
+    def latest(cls) -> Optional[BackgroundProfile]:
+        """Get the most recent background profile of this process, if any."""
+        return cls._latest
+
+    @staticmethod
+    def _bounds(duration: float, interval_ms: float) -> Tuple[float, float]:
+        """Clamp the duration and interval (seconds) to the configured limits."""
+        duration = min(max(duration, 0.0), PROFILER_MAX_DURATION_SECONDS)
+        interval = max(interval_ms, PROFILER_MIN_INTERVAL_MS) / 1000
+        return duration, interval
+
+    def _sample(self, duration: float, interval: float) -> ProfileResult:
+        samples: Counter = Counter()
+        code_keys: Dict[object, FrameKey] = {}
+        own_thread = threading.get_ident()
+        rounds = 0
+
+        started = time.perf_counter()
+        deadline = started + duration
+        next_sample = started
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_sample:
+                time.sleep(next_sample - now)
+                continue
+            next_sample += interval
+
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                samples[self._stack(frame, names.get(thread_id, str(thread_id)), code_keys)] += 1
+            rounds += 1
+
+        return ProfileResult(samples, interval, time.perf_counter() - started, rounds)
+
+    def _stack(self, frame, thread_name: str, code_keys: Dict[object, FrameKey]) -> tuple:
+        """Build a root-first stack of frame keys for one thread."""
+        frames = []
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            key = code_keys.get(code)
+            if key is None:
+                key = code_keys[code] = (code.co_filename, code.co_firstlineno, code.co_name)
+            frames.append(key)
+            frame = frame.f_back
+        frames.reverse()
+        return (thread_name, *frames)
+
+
+def _frame_label(frame: FrameKey) -> str:
+    """Render a frame as ``module.py:function:line`` for collapsed stacks."""
+    filename, line, name = frame
+    return f"{os.path.basename(filename)}:{name}:{line}"
@@ -0,0 +1,143 @@
+"""
+Per-request stage timers reported as a Server-Timing header.
+
+Services wrap their expensive steps in ``stage()``::
+
+    with stage('fetch_history'):
+        hist = self._fetcher.fetch_history(...)
+
+When SERVER_TIMING_ENABLED is on, each request collects the total duration
+and call count of every stage; ``init_server_timing`` emits them as a
+``Server-Timing`` header (visible in browser devtools) and logs them with
+the request. Stages run outside a request (batch worker threads, background
+jobs) or with timing disabled get a shared no-op context manager, so a
+disabled timer costs one context lookup.
+
+Single responsibility: Collect and report request stage durations.
+"""
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+from flask import g, has_request_context
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_NOOP = nullcontext()
+
+
+class _Stage:
+    """Context manager adding its duration to a request's stage totals."""
+
+    __slots__ = ('_timings', '_name', '_start')
+
+    def __init__(self, timings: Dict[str, List[float]], name: str):
+        self._timings = timings
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self._start) * 1000
+        totals = self._timings.get(self._name)
+        if totals is None:
+            self._timings[self._name] = [elapsed, 1]
+        else:
+            totals[0] += elapsed
+            totals[1] += 1
+        return False
+
+
+def stage(name: str):
+    """
+    Time a stage of the current request.
+
+    Args:
+        name: Stage name (a Server-Timing metric name: letters, digits, '_')
+
+    Returns:
+        Context manager recording the stage, or a no-op when timing is off
+
+    Examples:
+        >>> with stage('convert_to_data_points'):
+        ...     data_points = transformer.convert_to_data_points(hist, symbol)
+    """
+    timings = _current_timings()
+    if timings is None:
+        return _NOOP
+    return _Stage(timings, name)
+
+
+def format_server_timing(timings: Dict[str, List[float]], total_ms: Optional[float] = None) -> str:
+    """
+    Format stage totals as a Server-Timing header value.
+
+    Args:
+        timings: Stage name -> [total milliseconds, call count]
+        total_ms: Whole-request duration, reported as ``total``
+
+    Returns:
+        Header value, e.g. 'fetch_history;dur=412.3, total;dur=455.0'
+
+    Examples:
+        >>> format_server_timing({'fetch_history': [412.31, 2]}, 455.0)
+        'fetch_history;desc="2 calls";dur=412.3, total;dur=455.0'
+    """
+    entries = []
+    for name, (duration, count) in timings.items():
+        desc = f';desc="{count} calls"' if count > 1 else ''
+        entries.append(f"{name}{desc};dur={duration:.1f}")
+    if total_ms is not None:
+        entries.append(f"total;dur={total_ms:.1f}")
+    return ', '.join(entries)
+
+
+def init_server_timing(app) -> None:
+    """
+    Register the Server-Timing middleware.
+
+    Does nothing when SERVER_TIMING_ENABLED is false, leaving every
+    ``stage()`` call a no-op.
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('SERVER_TIMING_ENABLED', True):
+        return
+
+    @app.before_request
+    def start_server_timing():
+        """Start collecting stage timings for this request."""
+        g.server_timings = {}
+        g.server_timing_start = time.perf_counter()
+
+    @app.after_request
+    def add_server_timing(response):
+        """Emit collected stage timings as a header and a log entry."""
+        timings = g.pop('server_timings', None)
+        start = g.pop('server_timing_start', None)
+        if timings is None or start is None:
+            return response
+
+        total_ms = (time.perf_counter() - start) * 1000
+        response.headers['Server-Timing'] = format_server_timing(timings, total_ms)
+
+        if timings:
+            breakdown = {name: round(duration, 1) for name, (duration, _count) in timings.items()}
+            logger.info(
+                f"Server timing: {format_server_timing(timings, total_ms)}",
+                extra={'server_timing': breakdown, 'duration_ms': round(total_ms, 1)},
+            )
+        return response
+
+
+def _current_timings() -> Optional[Dict[str, List[float]]]:
+    """Get the current request's stage totals, or None when not collecting."""
+    if not has_request_context():
+        return None
+    return g.get('server_timings')
@@ -0,0 +1,201 @@
+"""
+Size-aware in-memory cache backend.
+
+Replaces Flask-Caching's SimpleCache for single-node deployments. SimpleCache
+bounds the number of entries and evicts without regard to size, so one large
+batch response costs the same "slot" as a tiny per-symbol fragment. This
+backend bounds the total number of bytes instead and evicts with GDSF
+(Greedy-Dual-Size-Frequency), which keeps small, frequently read entries and
+drops large, cold ones first.
+
+Values are stored pickled (like SimpleCache) so callers cannot mutate cached
+objects and sizes reflect real memory use. ``bytes`` values are stored as-is
+since they are already immutable and sized.
+
+Used by Flask-Caching via ``CACHE_TYPE='utils.size_aware_cache.SizeAwareCache'``
+(see CacheFactory._build_simple_cache_config).
+"""
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask_caching.backends.base import BaseCache
+
+from constants import CACHE_LOCAL_MAX_BYTES, CACHE_LOCAL_MAX_ENTRIES
+from utils.cache_metrics import cache_metrics
+from utils.local_cache import GDSFCache
+
+# Value encodings stored alongside each entry
+_RAW = 0
+_PICKLED = 1
+
+
+class SizeAwareCache(BaseCache):
+    """
+    Flask-Caching backend with a byte budget and GDSF eviction.
+
+    Attributes:
+        _store: Underlying GDSF store holding (encoding, data) tuples
+
+    Examples:
+        >>> backend = SizeAwareCache(max_bytes=64 * 1024 * 1024, default_timeout=300)
+        >>> backend.set('stock_fragment:AAPL:2024-01-01:2024-02-01', b'{...}')
+        >>> backend.stats()['bytes']
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = CACHE_LOCAL_MAX_BYTES,
+        max_entries: Optional[int] = CACHE_LOCAL_MAX_ENTRIES,
+        default_timeout: int = 300,
+    ):
+        """
+        Initialize SizeAwareCache.
+
+        Args:
+            max_bytes: Maximum total size of stored values in bytes
+            max_entries: Safety cap on the number of entries, set well above
+                what the byte budget holds so eviction stays size-driven
+                (None for no cap)
+            default_timeout: Default timeout in seconds (0 means no expiry)
+        """
+        super().__init__(default_timeout=default_timeout)
+        self._store = GDSFCache(
+            max_bytes=max_bytes,
+            max_entries=max_entries,
+            on_evict=cache_metrics.record_eviction,
+        )
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        """
+        Create the backend from Flask-Caching configuration.
+
+        CACHE_THRESHOLD is ignored: Flask-Caching defaults it to 500, which
+        would bring back count-based eviction of small hot entries.
+        """
+        kwargs.update(
+            max_bytes=config.get('CACHE_MAX_BYTES', CACHE_LOCAL_MAX_BYTES),
+            max_entries=config.get('CACHE_MAX_ENTRIES', CACHE_LOCAL_MAX_ENTRIES),
+        )
+        return cls(*args, **kwargs)
+
+    def get(self, key: str) -> Any:
+        """Get a value, or None if missing or expired."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        return self._decode(entry)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Store a value, evicting low-priority entries if needed."""
+        ttl = self._normalize_timeout(timeout)
+        if ttl < 0:
+            # Already expired (as in SimpleCache): drop any previous value
+            self._store.delete(key)
+            return True
+        entry, size = self._encode(value)
+        return self._store.set(key, entry, size=size, ttl=ttl)
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Store a value only if the key is absent."""
+        ttl = self._normalize_timeout(timeout)
+        if ttl < 0:
+            return not self._store.has(key)
+        entry, size = self._encode(value)
+        return self._store.add(key, entry, size=size, ttl=ttl)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key."""
+        return self._store.delete(key)
+
+    def has(self, key: str) -> bool:
+        """Check whether a key exists (does not count as an access)."""
+        return self._store.has(key)
+
+    def clear(self) -> bool:
+        """Remove all entries."""
+        self._store.clear()
+        return True
+
+    def inc(self, key: str, delta: int = 1) -> Optional[int]:
+        """Increment a counter atomically with respect to other callers."""
+        with self._store._lock:
+            value = (self.get(key) or 0) + delta
+            return value if self.set(key, value) else None
+
+    def dec(self, key: str, delta: int = 1) -> Optional[int]:
+        """Decrement a counter."""
+        return self.inc(key, -delta)
+
+    def keys(self) -> List[str]:
+        """List stored keys (used for prefix purges)."""
+        return self._store.keys()
+
+    def entry_sizes(self) -> List[Tuple[str, int]]:
+        """List (key, size) of live entries (used for per-family metrics)."""
+        return [(key, size) for key, _entry, size, _expires_at, _frequency in self._store.items()]
+
+    def export_entries(self) -> List[Tuple[str, int, bytes, Optional[float], int]]:
+        """
+        List live entries in their stored encoding (used for snapshots).
+
+        Returns:
+            List of (key, encoding, data, expires_at, frequency) tuples
+        """
+        return [
+            (key, entry[0], entry[1], expires_at, frequency)
+            for key, entry, _size, expires_at, frequency in self._store.items()
+        ]
+
+    def import_entry(
+        self,
+        key: str,
+        encoding: int,
+        data: bytes,
+        expires_at: Optional[float],
+        frequency: int = 1,
+    ) -> bool:
+        """
+        Restore an entry exported by export_entries (used for snapshots).
+
+        Args:
+            key: Cache key
+            encoding: Stored encoding (raw bytes or pickled)
+            data: Stored bytes
+            expires_at: Unix timestamp of expiry, or None for no expiry
+            frequency: Access count, so restored hot entries keep their priority
+
+        Returns:
+            True if the entry was stored
+        """
+        if encoding not in (_RAW, _PICKLED):
+            return False
+        return self._store.set_with_deadline(
+            key, (encoding, data), size=len(data), expires_at=expires_at, frequency=frequency
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get occupancy and eviction statistics."""
+        return self._store.stats()
+
+    def _normalize_timeout(self, timeout: Optional[int]) -> int:
+        """Resolve None to the default timeout; 0 means no expiry, negative already expired."""
+        if timeout is None:
+            timeout = self.default_timeout
+        return timeout
+
+    @staticmethod
+    def _encode(value: Any) -> Tuple[Tuple[int, bytes], int]:
+        """Encode a value for storage and return it with its size."""
+        if type(value) is bytes:
+            return (_RAW, value), len(value)
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        return (_PICKLED, data), len(data)
+
+    @staticmethod
+    def _decode(entry: Tuple[int, bytes]) -> Any:
+        """Decode a stored entry."""
+        encoding, data = entry
+        if encoding == _RAW:
+            return data
+        return pickle.loads(data)
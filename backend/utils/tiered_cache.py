@@ -0,0 +1,353 @@
+"""
+Redis cache backends.
+
+CompressedRedisCache stores values through CompressingSerializer, so large
+payloads are zlib/lzma-compressed in Redis.
+
+TieredRedisCache additionally puts an in-process LRU (L1) with a byte budget and short
+TTL in front of Redis (L2). Hot keys are served from process memory without a network round
+trip or unpickling; everything else falls through to Redis.
+
+Coherence across gunicorn workers is kept by:
+- a short L1 TTL, which bounds staleness even without coordination
+- optional Redis pub/sub invalidation: every write or delete publishes the
+  key, and each worker drops it from its own L1
+
+Used by Flask-Caching via ``CACHE_TYPE='utils.tiered_cache.TieredRedisCache'``
+or ``'utils.tiered_cache.CompressedRedisCache'`` (see
+CacheFactory._build_redis_config).
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from flask_caching.backends.rediscache import RedisCache
+
+from constants import (
+    CACHE_COMPRESSION_MIN_SIZE_BYTES,
+    CACHE_L1_MAX_BYTES,
+    CACHE_L1_TTL_SECONDS,
+)
+from utils.cache_serializer import CODEC_ZLIB, CompressingSerializer
+from utils.local_cache import LocalLRUCache
+
+logger = logging.getLogger(__name__)
+
+# Published in place of a key to drop every L1 entry (cache.clear())
+_CLEAR_ALL = '*'
+
+
+class CompressedRedisCache(RedisCache):
+    """
+    Redis cache backend that compresses large values.
+
+    Attributes:
+        serializer: CompressingSerializer used for every value
+
+    Examples:
+        >>> cache = CompressedRedisCache(host=redis_client, compression='zlib',
+        ...                              compression_min_size=1024)
+        >>> cache.set('stock_fragment:AAPL:2024-01-01:2024-02-01', fragment)
+    """
+
+    def __init__(
+        self,
+        *args,
+        compression: str = CODEC_ZLIB,
+        compression_min_size: int = CACHE_COMPRESSION_MIN_SIZE_BYTES,
+        **kwargs
+    ):
+        """
+        Initialize CompressedRedisCache.
+
+        Args:
+            *args: Positional arguments for RedisCache
+            compression: Codec for new values ('zlib', 'lzma' or 'none')
+            compression_min_size: Minimum value size in bytes before compressing
+            **kwargs: Keyword arguments for RedisCache
+        """
+        super().__init__(*args, **kwargs)
+        self.serializer = CompressingSerializer(
+            codec=compression, threshold=compression_min_size
+        )
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        """Create the backend from Flask-Caching configuration."""
+        kwargs.update(
+            compression=config.get('CACHE_COMPRESSION', CODEC_ZLIB),
+            compression_min_size=config.get(
+                'CACHE_COMPRESSION_MIN_SIZE', CACHE_COMPRESSION_MIN_SIZE_BYTES
+            ),
+        )
+        return super().factory(app, config, args, kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get backend statistics (reported by the health endpoint)."""
+        return {'compression': self.serializer.stats.snapshot()}
+
+
+class TieredRedisCache(CompressedRedisCache):
+    """
+    Redis cache backend with an in-process L1 tier.
+
+    Attributes:
+        _l1: In-process LRU tier
+        _pubsub_enabled: Whether invalidations are broadcast over Redis pub/sub
+        _channel: Pub/sub channel used for invalidation messages
+        _instance_id: Identifier (with the pid) used to ignore our own messages
+
+    Examples:
+        >>> cache = TieredRedisCache(host=redis_client, key_prefix='marketvue:',
+        ...                          l1_max_bytes=32 * 1024 * 1024, l1_ttl=10)
+        >>> cache.set('news:AAPL', payload, timeout=900)
+        >>> cache.get('news:AAPL')  # served from L1
+    """
+
+    def __init__(
+        self,
+        *args,
+        l1_max_bytes: int = CACHE_L1_MAX_BYTES,
+        l1_ttl: float = CACHE_L1_TTL_SECONDS,
+        l1_pubsub: bool = True,
+        **kwargs
+    ):
+        """
+        Initialize TieredRedisCache.
+
+        Args:
+            *args: Positional arguments for CompressedRedisCache
+            l1_max_bytes: Byte budget of the in-process tier
+            l1_ttl: Maximum lifetime of an L1 entry in seconds
+            l1_pubsub: Broadcast invalidations to other workers via pub/sub
+            **kwargs: Keyword arguments for CompressedRedisCache
+        """
+        super().__init__(*args, **kwargs)
+        self._l1 = LocalLRUCache(max_bytes=l1_max_bytes, default_ttl=l1_ttl)
+        self._pubsub_enabled = l1_pubsub
+        self._channel = f"{self.key_prefix}cache-invalidate"
+        self._instance_id = uuid.uuid4().hex
+        self._listener_pid: Optional[int] = None
+        self._listener_lock = threading.Lock()
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        """Create the backend from Flask-Caching configuration."""
+        kwargs.update(
+            l1_max_bytes=config.get('CACHE_L1_MAX_BYTES', CACHE_L1_MAX_BYTES),
+            l1_ttl=config.get('CACHE_L1_TTL', CACHE_L1_TTL_SECONDS),
+            l1_pubsub=config.get('CACHE_L1_PUBSUB', True),
+        )
+        return super().factory(app, config, args, kwargs)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Any:
+        """Get a value from L1, falling back to Redis."""
+        self._ensure_listener()
+        value = self._l1.get(key)
+        if value is not None:
+            return value
+
+        raw = self._read_client.get(self.key_prefix + key)
+        value = self.serializer.loads(raw)
+        if value is not None:
+            self._l1.set(key, value, size=len(raw))
+        return value
+
+    def get_many(self, *keys: str) -> List[Any]:
+        """Get several values, fetching only L1 misses from Redis."""
+        self._ensure_listener()
+        results: Dict[str, Any] = {}
+        missing = []
+        for key in keys:
+            value = self._l1.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                results[key] = value
+
+        if missing:
+            raws = self._read_client.mget([self.key_prefix + key for key in missing])
+            for key, raw in zip(missing, raws):
+                value = self.serializer.loads(raw)
+                if value is not None:
+                    self._l1.set(key, value, size=len(raw))
+                results[key] = value
+
+        return [results.get(key) for key in keys]
+
+    def has(self, key: str) -> bool:
+        """Check whether a key exists in either tier."""
+        return self._l1.get(key) is not None or super().has(key)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> Any:
+        """Write a value to Redis and populate L1."""
+        timeout = self._normalize_timeout(timeout)
+        dump = self.serializer.dumps(value)
+        if timeout == -1:
+            result = self._write_client.set(name=self.key_prefix + key, value=dump)
+        else:
+            result = self._write_client.setex(
+                name=self.key_prefix + key, value=dump, time=timeout
+            )
+        self._fill_l1(key, value, len(dump), timeout)
+        self._publish_invalidation(key)
+        return result
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None) -> List[Any]:
+        """Write several values in one pipeline and populate L1."""
+        timeout = self._normalize_timeout(timeout)
+        pipe = self._write_client.pipeline(transaction=False)
+        sizes = {}
+        for key, value in mapping.items():
+            dump = self.serializer.dumps(value)
+            sizes[key] = len(dump)
+            if timeout == -1:
+                pipe.set(name=self.key_prefix + key, value=dump)
+            else:
+                pipe.setex(name=self.key_prefix + key, value=dump, time=timeout)
+        results = pipe.execute()
+
+        for key, value in mapping.items():
+            self._fill_l1(key, value, sizes[key], timeout)
+        self._publish_invalidation(*mapping.keys())
+        return [key for key, ok in zip(mapping.keys(), results) if ok]
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Add a value only if absent (atomic in Redis)."""
+        created = super().add(key, value, timeout)
+        if created:
+            self._l1.delete(key)
+            self._publish_invalidation(key)
+        return created
+
+    def delete(self, key: str) -> bool:
+        """Delete a key from both tiers."""
+        self._l1.delete(key)
+        self._publish_invalidation(key)
+        return super().delete(key)
+
+    def delete_many(self, *keys: str) -> List[Any]:
+        """Delete several keys from both tiers."""
+        for key in keys:
+            self._l1.delete(key)
+        self._publish_invalidation(*keys)
+        return super().delete_many(*keys)
+
+    def clear(self) -> bool:
+        """Clear both tiers."""
+        self._l1.clear()
+        self._publish_invalidation(_CLEAR_ALL)
+        return super().clear()
+
+    def inc(self, key: str, delta: int = 1) -> Any:
+        """Increment a counter (always in Redis)."""
+        self._l1.delete(key)
+        return super().inc(key, delta)
+
+    def dec(self, key: str, delta: int = 1) -> Any:
+        """Decrement a counter (always in Redis)."""
+        self._l1.delete(key)
+        return super().dec(key, delta)
+
+    def l1_stats(self) -> Dict[str, int]:
+        """Get occupancy and hit statistics of the in-process tier."""
+        return self._l1.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get backend statistics (reported by the health endpoint)."""
+        return {**super().stats(), 'l1': self.l1_stats()}
+
+    def reset_local_tier(self) -> None:
+        """Drop every L1 entry (e.g. after invalidations may have been missed)."""
+        self._l1.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _fill_l1(self, key: str, value: Any, size: int, timeout: int) -> None:
+        """Populate L1 without outliving the Redis entry."""
+        ttl = self._l1.default_ttl if timeout <= 0 else min(self._l1.default_ttl, timeout)
+        self._l1.set(key, value, size=size, ttl=ttl)
+
+    def _sender_id(self) -> str:
+        """Identify this worker; includes the pid since workers fork from one instance."""
+        return f"{self._instance_id}-{os.getpid()}"
+
+    def _publish_invalidation(self, *keys: str) -> None:
+        """Tell other workers to drop keys from their L1 (one message per call)."""
+        if not self._pubsub_enabled or not keys:
+            return
+        try:
+            self._write_client.publish(
+                self._channel, f"{self._sender_id()}|" + '\n'.join(keys)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def _ensure_listener(self) -> None:
+        """
+        Start the invalidation listener in this process if needed.
+
+        Started lazily (and re-started after fork) because threads created
+        before gunicorn forks its workers do not survive into them.
+        """
+        if not self._pubsub_enabled or self._listener_pid == os.getpid():
+            return
+
+        with self._listener_lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            # Entries inherited from the parent process may already be stale
+            self._l1.clear()
+            thread = threading.Thread(
+                target=self._listen_for_invalidations,
+                name='cache-l1-invalidation',
+                daemon=True,
+            )
+            thread.start()
+
+    def _listen_for_invalidations(self) -> None:
+        """Consume invalidation messages, reconnecting on errors."""
+        backoff = 1.0
+        while True:
+            try:
+                pubsub = self._write_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                backoff = 1.0
+                for message in pubsub.listen():
+                    self._handle_invalidation(message.get('data'))
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}. Retrying in {backoff}s")
+                # Anything may have changed while disconnected
+                self._l1.clear()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _handle_invalidation(self, data: Any) -> None:
+        """Apply a single invalidation message to L1."""
+        if isinstance(data, bytes):
+            data = data.decode('utf-8', errors='replace')
+        if not isinstance(data, str) or '|' not in data:
+            return
+
+        sender, keys = data.split('|', 1)
+        if sender == self._sender_id():
+            return
+        for key in keys.split('\n'):
+            if key == _CLEAR_ALL:
+                self._l1.clear()
+            else:
+                self._l1.delete(key)
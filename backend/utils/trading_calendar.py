@@ -0,0 +1,104 @@
+"""
+Trading calendar utilities.
+
+Maps ticker symbols to their exchange and answers which days an exchange
+trades. Used to canonicalize request date ranges, so requests covering the
+same trading sessions share cache entries.
+
+Only weekends are modeled; exchange holidays are not, so a holiday is
+treated as a (data-less) trading day. This keeps canonicalization
+conservative: it never merges two ranges that could return different data.
+"""
+from datetime import date, timedelta
+from typing import Iterable
+
+# Exchange by ticker suffix (symbols without a known suffix trade in the US)
+EXCHANGE_SUFFIXES = {
+    '.TWO': 'TPEX',
+    '.TW': 'TWSE',
+    '.HK': 'HKEX',
+    '.T': 'TSE',
+}
+DEFAULT_EXCHANGE = 'US'
+
+# Weekdays (Monday=0) on which each exchange is closed
+EXCHANGE_WEEKENDS = {
+    'US': {5, 6},
+    'TWSE': {5, 6},
+    'TPEX': {5, 6},
+    'HKEX': {5, 6},
+    'TSE': {5, 6},
+}
+
+
+def exchange_for_symbol(symbol: str) -> str:
+    """
+    Get the exchange a symbol trades on.
+
+    Args:
+        symbol: Ticker symbol (e.g., 'AAPL', '2330.TW')
+
+    Returns:
+        Exchange code (e.g., 'US', 'TWSE')
+
+    Examples:
+        >>> exchange_for_symbol('2330.TW')
+        'TWSE'
+    """
+    upper = symbol.upper()
+    for suffix, exchange in EXCHANGE_SUFFIXES.items():
+        if upper.endswith(suffix):
+            return exchange
+    return DEFAULT_EXCHANGE
+
+
+def is_trading_day(day: date, exchanges: Iterable[str]) -> bool:
+    """
+    Check whether any of the given exchanges trades on a day.
+
+    Args:
+        day: Calendar day
+        exchanges: Exchange codes
+
+    Returns:
+        True if at least one exchange is open
+    """
+    return any(
+        day.weekday() not in EXCHANGE_WEEKENDS.get(exchange, EXCHANGE_WEEKENDS[DEFAULT_EXCHANGE])
+        for exchange in exchanges
+    )
+
+
+def previous_trading_day(day: date, exchanges: Iterable[str]) -> date:
+    """
+    Get the last trading day strictly before a day.
+
+    Args:
+        day: Calendar day
+        exchanges: Exchange codes
+
+    Returns:
+        Closest earlier trading day
+    """
+    exchanges = list(exchanges)
+    day -= timedelta(days=1)
+    while not is_trading_day(day, exchanges):
+        day -= timedelta(days=1)
+    return day
+
+
+def next_trading_day(day: date, exchanges: Iterable[str]) -> date:
+    """
+    Get the first trading day on or after a day.
+
+    Args:
+        day: Calendar day
+        exchanges: Exchange codes
+
+    Returns:
+        The day itself if it is a trading day, otherwise the next one
+    """
+    exchanges = list(exchanges)
+    while not is_trading_day(day, exchanges):
+        day += timedelta(days=1)
+    return day
@@ -0,0 +1,335 @@
+"""
+Upstream pacing module.
+
+Spaces outbound calls to rate-limited upstreams (Google News RSS) with a
+token bucket, without parking request threads in ``time.sleep``.
+
+Callers submit a fetch to the provider's ``PacingScheduler`` and get a
+``Future``. The scheduler reserves a slot in the bucket, queues the call
+until its slot comes up, and a single dispatcher thread hands due calls to a
+small worker pool. Reservations are atomic, so concurrent callers can never
+race past the limit, and batch fan-outs submit everything at once and only
+wait on the futures.
+
+Buckets (GCRA, i.e. a token bucket expressed as a theoretical arrival time):
+- ``TokenBucket``: per process
+- ``RedisTokenBucket``: one bucket shared by every gunicorn worker, updated
+  by a Lua script; falls back to the local bucket while Redis is unreachable
+
+Single responsibility: Pace calls to upstream providers.
+"""
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from constants import (
+    GOOGLE_NEWS_BURST,
+    GOOGLE_NEWS_RATE_PER_SECOND,
+    UPSTREAM_PACING_KEY_PREFIX,
+    UPSTREAM_PACING_MAX_WAIT_SECONDS,
+    UPSTREAM_PACING_WORKERS,
+)
+from utils.metrics import PROVIDER_GOOGLE_RSS, registry
+
+logger = logging.getLogger(__name__)
+
+
+class PacingOverloadError(RuntimeError):
+    """Raised when a call would wait longer than the scheduler's max_wait."""
+
+
+class TokenBucket:
+    """
+    Thread-safe per-process token bucket.
+
+    Examples:
+        >>> bucket = TokenBucket(rate=5, burst=2)
+        >>> bucket.reserve()  # seconds until this call may start
+        0.0
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize TokenBucket.
+
+        Args:
+            rate: Sustained calls per second
+            burst: Calls allowed back to back after an idle period
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.interval = 1.0 / rate
+        self.tolerance = (max(burst, 1) - 1) * self.interval
+        self._clock = clock
+        self._tat = 0.0  # theoretical arrival time of the next call
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve the next slot.
+
+        Args:
+            max_wait: Longest acceptable wait; a longer one is reported but
+                not reserved, so rejected calls do not push the bucket forward
+
+        Returns:
+            Seconds the caller must wait before starting (0 if a token is free)
+        """
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            delay = max(tat - now - self.tolerance, 0.0)
+            if max_wait is None or delay <= max_wait:
+                self._tat = tat + self.interval
+            return delay
+
+
+# GCRA reservation on Redis server time; returns the wait in seconds.
+# A wait above max_wait (ARGV[3], negative for unlimited) is not reserved.
+_RESERVE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat < now then tat = now end
+local delay = tat - now - tolerance
+if delay < 0 then delay = 0 end
+if max_wait >= 0 and delay > max_wait then
+    return tostring(delay)
+end
+tat = tat + interval
+redis.call('SET', KEYS[1], tostring(tat), 'PX', math.ceil((tat - now) * 1000) + 1000)
+return tostring(delay)
+"""
+
+
+class RedisTokenBucket:
+    """
+    Token bucket shared across processes through Redis.
+
+    Examples:
+        >>> bucket = RedisTokenBucket(redis_client, 'google_rss', rate=5, burst=2)
+        >>> bucket.reserve()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        rate: float,
+        burst: int = 1,
+        key_prefix: str = UPSTREAM_PACING_KEY_PREFIX
+    ):
+        """
+        Initialize RedisTokenBucket.
+
+        Args:
+            client: Redis client
+            name: Bucket name (one Redis key per name)
+            rate: Sustained calls per second across all processes
+            burst: Calls allowed back to back after an idle period
+            key_prefix: Prefix of the Redis key
+        """
+        self._client = client
+        self._key = f"{key_prefix}{name}"
+        # Used while Redis is unreachable, so pacing degrades to per-process
+        self._fallback = TokenBucket(rate, burst)
+        self._script = client.register_script(_RESERVE_SCRIPT)
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve the next slot in the shared bucket.
+
+        Args:
+            max_wait: Longest acceptable wait; a longer one is not reserved
+
+        Returns:
+            Seconds the caller must wait before starting
+        """
+        try:
+            return float(self._script(
+                keys=[self._key],
+                args=[
+                    self._fallback.interval,
+                    self._fallback.tolerance,
+                    -1 if max_wait is None else max_wait,
+                ],
+            ))
+        except Exception as e:
+            logger.warning(f"Shared pacing unavailable for {self._key}, pacing locally: {e}")
+            return self._fallback.reserve(max_wait)
+
+
+class PacingScheduler:
+    """
+    Queue of calls released at the pace of a token bucket.
+
+    Attributes:
+        name: Provider name (metric label and thread name)
+
+    Examples:
+        >>> scheduler = PacingScheduler('google_rss', TokenBucket(rate=5))
+        >>> future = scheduler.submit(fetch_feed, url)
+        >>> feed = future.result(timeout=15)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        bucket: Any,
+        max_workers: int = UPSTREAM_PACING_WORKERS,
+        max_wait: float = UPSTREAM_PACING_MAX_WAIT_SECONDS
+    ):
+        """
+        Initialize PacingScheduler.
+
+        Args:
+            name: Provider name
+            bucket: TokenBucket or RedisTokenBucket
+            max_workers: Threads running released calls
+            max_wait: Longest queueing delay accepted before rejecting a call
+        """
+        self.name = name
+        self._bucket = bucket
+        self._max_workers = max_workers
+        self._max_wait = max_wait
+        self._queue: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._pid: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a call for its next free slot.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future resolved with fn's result or exception
+
+        Raises:
+            PacingOverloadError: If the call would wait longer than max_wait
+        """
+        delay = self._bucket.reserve(self._max_wait)
+        if delay > self._max_wait:
+            raise PacingOverloadError(
+                f"{self.name} pacing queue is full ({delay:.1f}s wait > {self._max_wait}s)"
+            )
+
+        future: Future = Future()
+        with self._cond:
+            self._ensure_started()
+            heapq.heappush(
+                self._queue,
+                (time.monotonic() + delay, next(self._seq), fn, args, kwargs, future),
+            )
+            self._cond.notify()
+        registry.add('upstream_pacing_queued', {'provider': self.name}, 1)
+        return future
+
+    def _ensure_started(self) -> None:
+        """Start the dispatcher and workers in this process (called under _cond)."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        # Threads do not survive fork(); drop anything queued by the parent
+        self._queue = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix=f'pacing-{self.name}'
+        )
+        threading.Thread(
+            target=self._dispatch, name=f'pacing-{self.name}-dispatcher', daemon=True
+        ).start()
+        self._pid = pid
+
+    def _dispatch(self) -> None:
+        """Release queued calls to the worker pool as their slots come up."""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._queue:
+                        self._cond.wait()
+                        continue
+                    wait = self._queue[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                _due, _seq, fn, args, kwargs, future = heapq.heappop(self._queue)
+                executor = self._executor
+
+            registry.add('upstream_pacing_queued', {'provider': self.name}, -1)
+            executor.submit(self._run, fn, args, kwargs, future)
+
+    @staticmethod
+    def _run(fn: Callable, args: tuple, kwargs: Dict, future: Future) -> None:
+        """Run a released call and resolve its future."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+
+_schedulers: Dict[str, PacingScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_pacing_scheduler(provider: str) -> PacingScheduler:
+    """
+    Get the scheduler of a provider, creating a per-process one if needed.
+
+    Args:
+        provider: One of the PROVIDER_* names
+
+    Returns:
+        Shared PacingScheduler for the provider
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(provider)
+        if scheduler is None:
+            scheduler = _schedulers[provider] = PacingScheduler(
+                provider, TokenBucket(GOOGLE_NEWS_RATE_PER_SECOND, GOOGLE_NEWS_BURST)
+            )
+        return scheduler
+
+
+def init_upstream_pacing(app) -> None:
+    """
+    Configure upstream schedulers from the app config.
+
+    With UPSTREAM_PACING_REDIS set (and a reachable REDIS_URL), the Google
+    News budget is shared by every worker; otherwise each worker paces on
+    its own.
+
+    Args:
+        app: Flask application
+    """
+    rate = app.config.get('GOOGLE_NEWS_RATE_LIMIT', GOOGLE_NEWS_RATE_PER_SECOND)
+    burst = app.config.get('GOOGLE_NEWS_BURST', GOOGLE_NEWS_BURST)
+
+    bucket: Any = TokenBucket(rate, burst)
+    if app.config.get('UPSTREAM_PACING_REDIS', False):
+        try:
+            import redis
+
+            client = redis.Redis.from_url(
+                app.config['CACHE_REDIS_URL'], socket_timeout=1, socket_connect_timeout=1
+            )
+            bucket = RedisTokenBucket(client, PROVIDER_GOOGLE_RSS, rate, burst)
+            logger.info(f"Google News pacing shared via Redis at {rate}/s (burst {burst})")
+        except Exception as e:
+            logger.warning(f"Shared upstream pacing unavailable, pacing per worker: {e}")
+
+    with _schedulers_lock:
+        _schedulers[PROVIDER_GOOGLE_RSS] = PacingScheduler(PROVIDER_GOOGLE_RSS, bucket)